@@ -0,0 +1,15 @@
+from port_ocean.benchmarks.resync import (
+    SCALE_TIERS,
+    ResyncBenchmarkResult,
+    ResyncScenario,
+    compare_to_baseline,
+    run_resync_benchmark,
+)
+
+__all__ = [
+    "SCALE_TIERS",
+    "ResyncBenchmarkResult",
+    "ResyncScenario",
+    "compare_to_baseline",
+    "run_resync_benchmark",
+]
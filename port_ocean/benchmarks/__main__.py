@@ -0,0 +1,110 @@
+"""Run the end-to-end resync benchmarks and compare them with a baseline.
+
+python -m port_ocean.benchmarks --tier 1k --tier 100k
+python -m port_ocean.benchmarks --tier 1k --latency-ms 50 --rate-limit-every 10
+python -m port_ocean.benchmarks --tier 100k --update-baseline
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+from loguru import logger
+
+from port_ocean.benchmarks.resync import (
+    SCALE_TIERS,
+    ResyncScenario,
+    compare_to_baseline,
+    load_baseline,
+    run_resync_benchmark,
+    save_baseline,
+)
+
+DEFAULT_BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m port_ocean.benchmarks",
+        description="End-to-end resync benchmarks over fake-integration.",
+    )
+    parser.add_argument(
+        "--tier",
+        action="append",
+        choices=list(SCALE_TIERS),
+        help="Scale tier to run, may be repeated (default: 1k)",
+    )
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--entity-kb-size", type=int, default=1)
+    parser.add_argument(
+        "--latency-ms", type=float, default=0.0, help="Third-party response latency"
+    )
+    parser.add_argument(
+        "--rate-limit-every",
+        type=int,
+        default=0,
+        help="Answer every Nth third-party request with a 429 (0 disables it)",
+    )
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store the results as the new baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed regression against the baseline, as a fraction",
+    )
+    parser.add_argument(
+        "--output", type=Path, help="Write the results of this run as JSON"
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="Keep the integration logs"
+    )
+    return parser.parse_args()
+
+
+async def _main(args: argparse.Namespace) -> int:
+    baseline = load_baseline(args.baseline)
+    results = {}
+    regressed = False
+
+    for tier in args.tier or ["1k"]:
+        scenario = ResyncScenario.from_tier(
+            tier,
+            batch_size=args.batch_size,
+            entity_kb_size=args.entity_kb_size,
+            latency_ms=args.latency_ms,
+            rate_limit_every=args.rate_limit_every,
+        )
+        result = (await run_resync_benchmark(scenario)).to_dict()
+        results[tier] = result
+        print(json.dumps({tier: result}, indent=2))
+
+        if args.update_baseline or tier not in baseline:
+            continue
+        for regression in compare_to_baseline(result, baseline[tier], args.tolerance):
+            regressed = True
+            print(f"REGRESSION [{tier}] {regression}", file=sys.stderr)
+
+    if args.output:
+        save_baseline(args.output, results)
+    if args.update_baseline:
+        save_baseline(args.baseline, baseline | results)
+    return 1 if regressed else 0
+
+
+def main() -> None:
+    args = _parse_args()
+    if not args.verbose:
+        logger.remove()
+        logger.add(sys.stderr, level="WARNING")
+    sys.exit(asyncio.run(_main(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,348 @@
+"""Micro-benchmarks of the JQ mapping engine.
+
+Loads the default ``port-app-config`` mappings of real integrations, pairs every
+resource with synthetic raw items shaped after the fields its JQ patterns read,
+and measures how many items per second ``JQEntityProcessor`` maps through:
+
+* ``sync``: ``JQEntityProcessorSync`` in the current process, which is what every
+  worker of the multiprocess path runs, without the fork and IPC overhead.
+* ``multiprocess``: ``JQEntityProcessor._parse_items`` with the mapping as is, so
+  every pattern compiles and runs in the process pool.
+* ``mixed``: ``_parse_items`` with a search relation added to the mapping, so
+  part of the patterns cannot be compiled and run on the event loop, and both
+  results are merged.
+
+    python -m port_ocean.benchmarks.jq_mapping --integration github --batch-size 1000
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Iterator
+
+import yaml
+from loguru import logger
+
+from port_ocean.context.ocean import ocean
+from port_ocean.core.handlers.entity_processor.jq_entity_processor import (
+    JQEntityProcessor,
+)
+from port_ocean.core.handlers.entity_processor.jq_entity_processor_sync import (
+    JQEntityProcessorSync,
+)
+from port_ocean.core.handlers.port_app_config.models import (
+    IngestSearchQuery,
+    ResourceConfig,
+    Rule,
+)
+
+INTEGRATIONS_PATH = Path(__file__).resolve().parents[2] / "integrations"
+MAPPING_INTEGRATIONS = ("github", "gitlab-v2", "jira", "azure-devops", "snyk")
+BATCH_SIZES = (10, 100, 1_000, 10_000)
+PARSE_PATHS = ("sync", "multiprocess", "mixed")
+
+# A path read from the input, e.g. `.owner.login`, `.assignees[].login` or
+# `.__includedFiles["README.md"]`. Variables (`$x.y`) and paths that continue an
+# expression (`(.a).b`, `.a[0].b`) are not matched at their continuation.
+_PATH = re.compile(
+    r'(?<![\w$\])"])\.(?:[A-Za-z_]\w*|\["[^"]+"\])'
+    r'(?:\.[A-Za-z_]\w*|\.?\["[^"]+"\]|\[\d*\]\??)*'
+)
+_SEGMENT = re.compile(
+    r'\.?(?:(?P<key>[A-Za-z_]\w*)|\["(?P<quoted>[^"]+)"\])(?P<list>\[\d*\]\??)?'
+)
+# Filters after a path that only make sense when it holds an array.
+_ARRAY_FILTER = re.compile(
+    r"\s*\|\s*(?:map|join|length|first|last|sort|sort_by|unique|any|all|add"
+    r"|flatten|min|max|group_by|to_entries)\b"
+)
+_DATE_KEY = re.compile(r"(?i:date|created|updated|resolved)|_at$|At$|On$")
+
+
+@dataclass(frozen=True)
+class MappingCase:
+    integration: str
+    resource: ResourceConfig
+
+    @property
+    def kind(self) -> str:
+        return self.resource.kind
+
+
+def load_mapping_cases(
+    integrations: tuple[str, ...] = MAPPING_INTEGRATIONS,
+    integrations_path: str | Path = INTEGRATIONS_PATH,
+) -> list[MappingCase]:
+    """Load the resources of each integration's default port-app-config."""
+    cases = []
+    for integration in integrations:
+        resources_path = Path(integrations_path) / integration / ".port" / "resources"
+        config_path = next(resources_path.glob("port-app-config.y*ml"), None)
+        if config_path is None:
+            continue
+        config = yaml.safe_load(config_path.read_text())
+        for resource in config.get("resources", []):
+            cases.append(MappingCase(integration, ResourceConfig.parse_obj(resource)))
+    return cases
+
+
+def _patterns(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _patterns(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _patterns(item)
+
+
+def _add_path(shape: dict[str, Any], path: str, is_array: bool) -> None:
+    """Add a JQ path to a shape, where a leaf is None, an object is a dict and
+    an array is a list holding the shape of its items."""
+    node = shape
+    segments = list(_SEGMENT.finditer(path))
+    for position, segment in enumerate(segments):
+        key = segment.group("key") or segment.group("quoted")
+        is_last = position == len(segments) - 1
+        if segment.group("list") or (is_last and is_array):
+            items = node.get(key)
+            if not isinstance(items, list):
+                items = node[key] = [{}]
+            node = items[0]
+        elif is_last:
+            node.setdefault(key, None)
+        else:
+            child = node.get(key)
+            if not isinstance(child, dict):
+                child = node[key] = {}
+            node = child
+
+
+def infer_raw_item_shape(resource: ResourceConfig) -> dict[str, Any]:
+    """Infer the fields a resource's selector and mappings read from a raw item."""
+    shape: dict[str, Any] = {}
+    mappings = resource.port.entity.mappings.dict(exclude_unset=True)
+    for pattern in [resource.selector.query, *_patterns(mappings)]:
+        for match in _PATH.finditer(pattern):
+            is_array = bool(_ARRAY_FILTER.match(pattern, match.end()))
+            _add_path(shape, match.group(), is_array)
+    return shape
+
+
+def _synthesize(shape: dict[str, Any], index: int) -> dict[str, Any]:
+    item: dict[str, Any] = {}
+    for key, value in shape.items():
+        if isinstance(value, dict):
+            item[key] = _synthesize(value, index)
+        elif isinstance(value, list):
+            element = value[0]
+            item[key] = [
+                (
+                    _synthesize(element, index * 2 + offset)
+                    if element
+                    else f"{key}-{offset}"
+                )
+                for offset in range(2)
+            ]
+        elif _DATE_KEY.search(key):
+            item[key] = f"2024-01-{index % 28 + 1:02d}T10:30:00.000Z"
+        else:
+            item[key] = f"{key}-{index}"
+    return item
+
+
+def synthesize_raw_items(resource: ResourceConfig, count: int) -> list[dict[str, Any]]:
+    shape = infer_raw_item_shape(resource)
+    return [_synthesize(shape, index) for index in range(count)]
+
+
+def with_search_relation(resource: ResourceConfig) -> ResourceConfig:
+    """Copy a resource with a search relation on its identifier. Search queries
+    cannot be compiled as a single JQ program, so they take the async path."""
+    resource = resource.copy(deep=True)
+    mappings = resource.port.entity.mappings
+    identifier = mappings.identifier
+    value = identifier if isinstance(identifier, str) else ".id"
+    mappings.relations["benchmarkSearch"] = IngestSearchQuery(
+        combinator='"and"',
+        rules=[Rule(property='"$identifier"', operator='"="', value=value)],
+    )
+    return resource
+
+
+@dataclass
+class JQBenchmarkResult:
+    integration: str
+    kind: str
+    path: str
+    batch_size: int
+    seconds: float
+    entities: int
+    misconfigured_fields: int
+
+    @property
+    def items_per_second(self) -> float:
+        return self.batch_size / self.seconds if self.seconds else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "items_per_second": self.items_per_second}
+
+
+@contextmanager
+def benchmark_context(max_workers: int = 4, timeout: int = 120) -> Iterator[None]:
+    """Provide the configuration the entity processor reads from the ocean
+    context, without starting an Ocean app."""
+    previous_app = ocean._app
+    ocean._app = SimpleNamespace(  # type: ignore[assignment]
+        config=SimpleNamespace(
+            allow_environment_variables_jq_access=True,
+            process_in_queue_max_workers=max_workers,
+            process_in_queue_timeout=timeout,
+        )
+    )
+    try:
+        yield
+    finally:
+        ocean._app = previous_app
+
+
+async def _parse_sync(
+    processor: JQEntityProcessor,
+    resource: ResourceConfig,
+    raw_items: list[dict[str, Any]],
+) -> tuple[int, int]:
+    mappings = resource.port.entity.mappings.dict(exclude_unset=True)
+    compileable, _ = (
+        await processor.separate_compileable_and_uncompileable_patterns_and_warmup_cache(
+            mappings, [resource.selector.query]
+        )
+    )
+    entities = 0
+    misconfigured: set[str] = set()
+    for raw in raw_items:
+        mapped = JQEntityProcessorSync._get_mapped_entity(
+            raw, compileable, resource.selector.query
+        )
+        entities += bool(mapped.entity.get("identifier"))
+        misconfigured.update(mapped.misconfigurations)
+    return entities, len(misconfigured)
+
+
+async def run_jq_benchmark(
+    case: MappingCase,
+    path: str,
+    batch_size: int,
+    raw_items: list[dict[str, Any]] | None = None,
+) -> JQBenchmarkResult:
+    """Map one batch of a case's synthetic items through one parse path.
+
+    Must run inside ``benchmark_context`` (or an initialized Ocean app).
+    """
+    if path not in PARSE_PATHS:
+        raise ValueError(f"Unknown parse path {path!r}, expected one of {PARSE_PATHS}")
+    resource = with_search_relation(case.resource) if path == "mixed" else case.resource
+    if raw_items is None:
+        raw_items = synthesize_raw_items(case.resource, batch_size)
+    processor = JQEntityProcessor(ocean)
+
+    started_at = time.perf_counter()
+    if path == "sync":
+        entities, misconfigured = await _parse_sync(processor, resource, raw_items)
+    else:
+        result = await processor._parse_items(resource, raw_items)
+        entities = len(result.entity_selector_diff.passed)
+        misconfigured = len(result.misconfigured_entity_keys)
+    seconds = time.perf_counter() - started_at
+
+    return JQBenchmarkResult(
+        integration=case.integration,
+        kind=case.kind,
+        path=path,
+        batch_size=len(raw_items),
+        seconds=seconds,
+        entities=entities,
+        misconfigured_fields=misconfigured,
+    )
+
+
+async def run_jq_benchmarks(
+    cases: list[MappingCase],
+    paths: tuple[str, ...] = PARSE_PATHS,
+    batch_sizes: tuple[int, ...] = BATCH_SIZES,
+    max_workers: int = 4,
+) -> list[JQBenchmarkResult]:
+    results = []
+    with benchmark_context(max_workers=max_workers):
+        for case in cases:
+            items = synthesize_raw_items(case.resource, max(batch_sizes))
+            # Warm the compiled pattern caches so the first batch size is not
+            # charged for them.
+            for path in paths:
+                await run_jq_benchmark(case, path, 1, items[:1])
+            for batch_size in batch_sizes:
+                for path in paths:
+                    results.append(
+                        await run_jq_benchmark(
+                            case, path, batch_size, items[:batch_size]
+                        )
+                    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m port_ocean.benchmarks.jq_mapping",
+        description="Micro-benchmarks of the JQ mapping engine.",
+    )
+    parser.add_argument(
+        "--integration",
+        action="append",
+        help="Integration whose mappings to load, may be repeated "
+        f"(default: {', '.join(MAPPING_INTEGRATIONS)})",
+    )
+    parser.add_argument("--kind", action="append", help="Only run these kinds")
+    parser.add_argument("--path", action="append", choices=PARSE_PATHS)
+    parser.add_argument("--batch-size", action="append", type=int)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--output", type=Path, help="Write the results as JSON")
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="ERROR")
+    cases = [
+        case
+        for case in load_mapping_cases(tuple(args.integration or MAPPING_INTEGRATIONS))
+        if not args.kind or case.kind in args.kind
+    ]
+    results = asyncio.run(
+        run_jq_benchmarks(
+            cases,
+            tuple(args.path or PARSE_PATHS),
+            tuple(args.batch_size or BATCH_SIZES),
+            args.workers,
+        )
+    )
+
+    print(f"{'mapping':<40} {'path':<13} {'batch':>6} {'items/s':>10} {'misconf':>7}")
+    for result in results:
+        print(
+            f"{result.integration + '/' + result.kind:<40} {result.path:<13} "
+            f"{result.batch_size:>6} {result.items_per_second:>10,.0f} "
+            f"{result.misconfigured_fields:>7}"
+        )
+    if args.output:
+        args.output.write_text(
+            json.dumps([result.to_dict() for result in results], indent=2) + "\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,409 @@
+"""End-to-end resync benchmarks.
+
+Runs an integration (``fake-integration`` by default) through
+``IntegrationTestHarness`` against a synthetic third-party API and the Port mock,
+and records throughput per ETL phase, peak RSS, event-loop lag and the requests
+made to Port.
+"""
+
+import asyncio
+import functools
+import json
+import re
+import statistics
+import time
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+from unittest.mock import patch
+from urllib.parse import parse_qs
+
+import httpx
+import psutil
+
+from port_ocean.core.handlers.entities_state_applier.port.applier import (
+    HttpEntitiesStateApplier,
+)
+from port_ocean.core.integrations.mixins.sync_raw import SyncRawMixin
+from port_ocean.integration_testing import InterceptTransport, IntegrationTestHarness
+
+FAKE_INTEGRATION_PATH = (
+    Path(__file__).resolve().parents[2] / "integrations" / "fake-integration"
+)
+
+SCALE_TIERS: dict[str, int] = {
+    "1k": 1_000,
+    "100k": 100_000,
+    "1m": 1_000_000,
+}
+
+_EMPLOYEES_PATH = re.compile(r"/department/(?P<department>[^/]+)/employees$")
+_UUID = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+
+FAKE_PERSON_MAPPING: dict[str, Any] = {
+    "deleteDependentEntities": True,
+    "createMissingRelatedEntities": True,
+    "enableMergeEntity": True,
+    "resources": [
+        {
+            "kind": "fake-person",
+            "selector": {"query": "true"},
+            "port": {
+                "entity": {
+                    "mappings": {
+                        "identifier": ".id",
+                        "title": ".name",
+                        "blueprint": '"fakePerson"',
+                        "properties": {
+                            "email": ".email",
+                            "age": ".age",
+                            "status": ".status",
+                            "bio": ".bio",
+                        },
+                        "relations": {"department": ".department.id"},
+                    }
+                }
+            },
+        }
+    ],
+}
+
+
+@dataclass(frozen=True)
+class ResyncScenario:
+    """A resync workload.
+
+    ``rate_limit_every`` answers every Nth third-party request with a 429 (0
+    disables it), and ``latency_ms`` delays every third-party response.
+    """
+
+    name: str
+    raw_items: int
+    batch_size: int = 1000
+    entity_kb_size: int = 1
+    latency_ms: float = 0.0
+    rate_limit_every: int = 0
+
+    @classmethod
+    def from_tier(cls, tier: str, **overrides: Any) -> "ResyncScenario":
+        return cls(name=tier, raw_items=SCALE_TIERS[tier], **overrides)
+
+
+@dataclass
+class PhaseStats:
+    items: int = 0
+    seconds: float = 0.0
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items / self.seconds if self.seconds else 0.0
+
+
+@dataclass
+class ResyncBenchmarkResult:
+    scenario: ResyncScenario
+    wall_seconds: float
+    phases: dict[str, PhaseStats]
+    peak_rss_bytes: int
+    event_loop_lag_max_ms: float
+    event_loop_lag_p99_ms: float
+    port_requests: dict[str, int]
+    third_party_requests: int
+    injected_rate_limits: int
+    upserted_entities: int
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def items_per_second(self) -> float:
+        return self.scenario.raw_items / self.wall_seconds if self.wall_seconds else 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "scenario": asdict(self.scenario),
+            "wall_seconds": self.wall_seconds,
+            "items_per_second": self.items_per_second,
+            "phases": {
+                name: {**asdict(stats), "items_per_second": stats.items_per_second}
+                for name, stats in self.phases.items()
+            },
+            "peak_rss_bytes": self.peak_rss_bytes,
+            "event_loop_lag_max_ms": self.event_loop_lag_max_ms,
+            "event_loop_lag_p99_ms": self.event_loop_lag_p99_ms,
+            "port_requests": self.port_requests,
+            "port_requests_total": sum(self.port_requests.values()),
+            "third_party_requests": self.third_party_requests,
+            "injected_rate_limits": self.injected_rate_limits,
+            "upserted_entities": self.upserted_entities,
+            "errors": self.errors,
+        }
+
+
+class SyntheticThirdPartyTransport(InterceptTransport):
+    """Serves the fake-integration employees API from generated data.
+
+    Nothing is recorded per request, so memory stays flat at any scale.
+    """
+
+    def __init__(self, scenario: ResyncScenario) -> None:
+        super().__init__(strict=False)
+        self.scenario = scenario
+        self.phase = PhaseStats()
+        self.requests = 0
+        self.injected_rate_limits = 0
+        self._next_id = 0
+
+    def _person(self, department: str, bio: str) -> dict[str, Any]:
+        person_id = self._next_id
+        self._next_id += 1
+        return {
+            "id": f"person-{person_id}",
+            "email": f"person-{person_id}@example.com",
+            "name": f"Person {person_id}",
+            "status": "WORKING" if person_id % 2 else "NOPE",
+            "age": 20 + person_id % 60,
+            "department": {"id": department, "name": department},
+            "bio": bio,
+        }
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started_at = time.perf_counter()
+        self.requests += 1
+        try:
+            if self.scenario.latency_ms:
+                await asyncio.sleep(self.scenario.latency_ms / 1000)
+
+            every = self.scenario.rate_limit_every
+            if every and self.requests % every == 0:
+                self.injected_rate_limits += 1
+                return httpx.Response(
+                    429, headers={"Retry-After": "0"}, request=request
+                )
+
+            match = _EMPLOYEES_PATH.search(request.url.path)
+            if match is None:
+                return httpx.Response(404, request=request)
+
+            query = parse_qs(request.url.query.decode())
+            limit = int(query.get("limit", ["0"])[0])
+            kb_size = max(int(query.get("entity_kb_size", ["1"])[0]), 1)
+            bio = "x" * (kb_size * 1024)
+            department = match.group("department")
+            results = [self._person(department, bio) for _ in range(limit)]
+            self.phase.items += len(results)
+            return httpx.Response(
+                200,
+                content=json.dumps({"results": results}).encode(),
+                headers={"content-type": "application/json"},
+                request=request,
+            )
+        finally:
+            self.phase.seconds += time.perf_counter() - started_at
+
+
+class _RuntimeSampler:
+    """Samples event-loop lag and RSS while a benchmark runs."""
+
+    def __init__(self, interval: float = 0.05) -> None:
+        self.interval = interval
+        self.lags_ms: list[float] = []
+        self.peak_rss_bytes = 0
+        self._process = psutil.Process()
+        self._task: asyncio.Task[None] | None = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.lags_ms.append(max(loop.time() - expected, 0) * 1000)
+            self._sample_rss()
+
+    def _sample_rss(self) -> None:
+        self.peak_rss_bytes = max(self.peak_rss_bytes, self._process.memory_info().rss)
+
+    def start(self) -> None:
+        self._sample_rss()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._sample_rss()
+
+    @property
+    def lag_max_ms(self) -> float:
+        return max(self.lags_ms, default=0.0)
+
+    @property
+    def lag_p99_ms(self) -> float:
+        if len(self.lags_ms) < 2:
+            return self.lag_max_ms
+        return statistics.quantiles(self.lags_ms, n=100, method="inclusive")[98]
+
+
+def _timed(
+    method: Callable[..., Awaitable[Any]],
+    stats: PhaseStats,
+    count_items: Callable[..., int] | None = None,
+) -> Callable[..., Awaitable[Any]]:
+    @functools.wraps(method)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        started_at = time.perf_counter()
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            stats.seconds += time.perf_counter() - started_at
+            if count_items is not None:
+                stats.items += count_items(*args, **kwargs)
+
+    return wrapper
+
+
+def _count_raw_items(
+    self: Any, raw_diff: list[tuple[Any, list[Any]]], *args: Any, **kwargs: Any
+) -> int:
+    return sum(len(results) for _, results in raw_diff)
+
+
+class _PortRequestCounter:
+    """Counts requests to the Port mock per endpoint and drops what the mock
+    captures, so memory does not grow with the number of entities."""
+
+    def __init__(self, harness: IntegrationTestHarness) -> None:
+        self.requests: dict[str, int] = {}
+        self.upserted_entities = 0
+        self._port_mock = harness.port_mock
+        self._handle = harness.port_mock.transport.handle_async_request
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        endpoint = f"{request.method} {_UUID.sub('{id}', request.url.path)}"
+        self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+        response = await self._handle(request)
+        self.upserted_entities += len(self._port_mock.upserted_entities)
+        self._port_mock.upserted_entities.clear()
+        self._port_mock.transport.reset()
+        return response
+
+
+async def run_resync_benchmark(
+    scenario: ResyncScenario,
+    integration_path: str | Path = FAKE_INTEGRATION_PATH,
+    mapping_config: dict[str, Any] | None = None,
+) -> ResyncBenchmarkResult:
+    """Run one full resync of the scenario and collect its measurements."""
+    third_party = SyntheticThirdPartyTransport(scenario)
+    harness = IntegrationTestHarness(
+        integration_path=str(integration_path),
+        port_mapping_config=mapping_config or FAKE_PERSON_MAPPING,
+        third_party_transport=third_party,
+        config_overrides={
+            "processing_mode": "ocean-core",
+            "integration": {
+                "identifier": "benchmark-integration",
+                "type": "fake-integration",
+                "config": {
+                    "entity_amount": scenario.raw_items,
+                    "entity_kb_size": scenario.entity_kb_size,
+                    "third_party_batch_size": scenario.batch_size,
+                    "single_department_run": True,
+                },
+            },
+        },
+    )
+    port_counter = _PortRequestCounter(harness)
+    harness.port_mock.transport.handle_async_request = (  # type: ignore[method-assign]
+        port_counter.handle_async_request
+    )
+    transform, load = PhaseStats(), PhaseStats()
+    sampler = _RuntimeSampler()
+
+    with ExitStack() as patches:
+        patches.enter_context(
+            patch.object(
+                SyncRawMixin,
+                "_calculate_raw",
+                _timed(SyncRawMixin._calculate_raw, transform, _count_raw_items),
+            )
+        )
+        for owner, name in (
+            (SyncRawMixin, "_map_entities_compared_with_port"),
+            (HttpEntitiesStateApplier, "upsert"),
+        ):
+            patches.enter_context(
+                patch.object(owner, name, _timed(getattr(owner, name), load))
+            )
+
+        await harness.start()
+        try:
+            sampler.start()
+            started_at = time.perf_counter()
+            result = await harness.trigger_resync()
+            wall_seconds = time.perf_counter() - started_at
+            await sampler.stop()
+        finally:
+            await harness.shutdown()
+
+    load.items = port_counter.upserted_entities
+    return ResyncBenchmarkResult(
+        scenario=scenario,
+        wall_seconds=wall_seconds,
+        phases={"extract": third_party.phase, "transform": transform, "load": load},
+        peak_rss_bytes=sampler.peak_rss_bytes,
+        event_loop_lag_max_ms=sampler.lag_max_ms,
+        event_loop_lag_p99_ms=sampler.lag_p99_ms,
+        port_requests=dict(sorted(port_counter.requests.items())),
+        third_party_requests=third_party.requests,
+        injected_rate_limits=third_party.injected_rate_limits,
+        upserted_entities=port_counter.upserted_entities,
+        errors=[str(error) for error in result.errors],
+    )
+
+
+# Measurements where a higher value is a regression; the rest are throughputs.
+_LOWER_IS_BETTER = ("peak_rss_bytes", "event_loop_lag_p99_ms", "port_requests_total")
+
+
+def compare_to_baseline(
+    result: dict[str, Any], baseline: dict[str, Any], tolerance: float = 0.2
+) -> list[str]:
+    """Return the measurements of ``result`` that regressed by more than
+    ``tolerance`` (a fraction) against the baseline of the same scenario."""
+    regressions = []
+    throughputs = {"items_per_second": result["items_per_second"]} | {
+        f"{phase}.items_per_second": stats["items_per_second"]
+        for phase, stats in result["phases"].items()
+    }
+    baseline_throughputs = {"items_per_second": baseline["items_per_second"]} | {
+        f"{phase}.items_per_second": stats["items_per_second"]
+        for phase, stats in baseline["phases"].items()
+    }
+    for name, value in throughputs.items():
+        expected = baseline_throughputs.get(name)
+        if expected and value < expected * (1 - tolerance):
+            regressions.append(
+                f"{name}: {value:,.0f} is below the baseline of {expected:,.0f}"
+            )
+
+    for name in _LOWER_IS_BETTER:
+        value, expected = result[name], baseline.get(name)
+        if expected is not None and value > expected * (1 + tolerance):
+            regressions.append(
+                f"{name}: {value:,.1f} is above the baseline of {expected:,.1f}"
+            )
+    return regressions
+
+
+def load_baseline(path: str | Path) -> dict[str, Any]:
+    baseline_path = Path(path)
+    if not baseline_path.exists():
+        return {}
+    return json.loads(baseline_path.read_text())
+
+
+def save_baseline(path: str | Path, baseline: dict[str, Any]) -> None:
+    Path(path).write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
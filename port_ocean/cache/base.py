@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from contextlib import AbstractAsyncContextManager
+from typing import Any, AsyncGenerator, Optional
 
 from port_ocean.core.models import CachingStorageMode
 
@@ -23,3 +24,53 @@ class CacheProvider(ABC):
     async def clear(self) -> None:
         """Clear all values from the cache."""
         pass
+
+
+class CacheChunkWriter(ABC):
+    """Persists the chunks of a single cached iterator as they are produced."""
+
+    @abstractmethod
+    async def append(self, chunk: Any) -> None:
+        """Append a chunk to the entry being written."""
+        pass
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """Publish the entry once the iterator is exhausted."""
+        pass
+
+    @abstractmethod
+    async def abort(self) -> None:
+        """Drop a partially written entry."""
+        pass
+
+
+class ChunkedCacheProvider(CacheProvider):
+    """Cache provider that can store iterator results chunk by chunk.
+
+    Writers append each chunk as it is produced and readers stream the chunks back
+    lazily, so neither side has to hold the whole result in memory.
+    """
+
+    @abstractmethod
+    async def open_chunk_writer(self, key: str) -> CacheChunkWriter:
+        """Start writing a chunked entry for the key."""
+        pass
+
+    @abstractmethod
+    async def read_chunks(self, key: str) -> Optional[AsyncGenerator[Any, None]]:
+        """Return an iterator over the chunks of the key, or None if it is not cached."""
+        pass
+
+
+class SingleFlightCacheProvider(CacheProvider):
+    """Cache provider shared between processes that can serialize cache misses.
+
+    While a caller holds ``single_flight`` for a key, callers in other processes
+    wait for it, so concurrent misses result in a single upstream call.
+    """
+
+    @abstractmethod
+    def single_flight(self, key: str) -> AbstractAsyncContextManager[None]:
+        """Hold the key while its value is computed and stored."""
+        pass
@@ -0,0 +1,199 @@
+import heapq
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from loguru import logger
+
+from port_ocean.cache.base import CacheProvider
+from port_ocean.context.ocean import ocean
+from port_ocean.core.models import CachingStorageMode
+from port_ocean.helpers.metric.metric import MetricType
+
+
+def approximate_size(value: Any) -> int:
+    """Approximate the memory held by a value, following containers and object
+    attributes. Shared objects are only counted once."""
+    size = 0
+    seen: set[int] = set()
+    pending = [value]
+    while pending:
+        current = pending.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+
+        if isinstance(current, (str, bytes, bytearray, int, float, bool)):
+            continue
+        if isinstance(current, dict):
+            pending.extend(current.keys())
+            pending.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            pending.extend(current)
+        elif hasattr(current, "__dict__"):
+            pending.append(vars(current))
+    return size
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    expires_at: float | None
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+class BoundedMemoryCacheProvider(CacheProvider):
+    """In-memory cache with a per-entry TTL and LRU eviction by approximate size.
+
+    Every operation runs without awaiting, so concurrent tasks always see a
+    consistent cache without any locking.
+    """
+
+    STORAGE_TYPE = CachingStorageMode.bounded_memory
+
+    def __init__(
+        self,
+        max_size_bytes: int = 256 * 1024 * 1024,
+        ttl_seconds: float | None = 3600.0,
+        name: str = "memory",
+    ) -> None:
+        if max_size_bytes <= 0:
+            raise ValueError("max_size_bytes must be positive")
+        self.max_size_bytes = max_size_bytes
+        self.ttl_seconds = ttl_seconds
+        self.name = name
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        # Expiry times by key, soonest first. Entries that were overwritten or
+        # removed since are left in place and skipped when they come up.
+        self._expiries: list[tuple[float, str]] = []
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is not None and self._is_expired(entry, time.monotonic()):
+            self._remove(key)
+            self.stats.expirations += 1
+            self._report_eviction("expired")
+            entry = None
+
+        if entry is None:
+            self.stats.misses += 1
+            self._report_request("miss")
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        self._report_request("hit")
+        return entry.value
+
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        ttl = ttl if ttl is not None else self.ttl_seconds
+        size = approximate_size(value)
+        if key in self._entries:
+            self._remove(key)
+
+        if size > self.max_size_bytes:
+            logger.debug(
+                f"Not caching {key} in {self.name} cache: {size} bytes exceeds the "
+                f"cache size of {self.max_size_bytes} bytes"
+            )
+            self._report_size()
+            return
+
+        now = time.monotonic()
+        expires_at = now + ttl if ttl is not None else None
+        self._entries[key] = _Entry(value=value, size=size, expires_at=expires_at)
+        self._size += size
+        if expires_at is not None:
+            heapq.heappush(self._expiries, (expires_at, key))
+            self._compact_expiries()
+        self._evict(now)
+        self._report_size()
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self._expiries.clear()
+        self._size = 0
+        self._report_size()
+
+    def _is_expired(self, entry: _Entry, now: float) -> bool:
+        return entry.expires_at is not None and entry.expires_at <= now
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._size -= entry.size
+
+    def _evict(self, now: float) -> None:
+        if self._size <= self.max_size_bytes:
+            return
+
+        # Expired entries go first, then the least recently used ones.
+        while self._expiries and self._expiries[0][0] <= now:
+            expires_at, key = heapq.heappop(self._expiries)
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at != expires_at:
+                continue
+            self._remove(key)
+            self.stats.expirations += 1
+            self._report_eviction("expired")
+
+        while self._size > self.max_size_bytes:
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.stats.evictions += 1
+            self._report_eviction("size")
+
+    def _compact_expiries(self) -> None:
+        # Drop the skipped expiry times once they outnumber the live ones, so the
+        # heap stays proportional to the cache.
+        if len(self._expiries) <= 2 * len(self._entries) + 16:
+            return
+        self._expiries = [
+            (entry.expires_at, key)
+            for key, entry in self._entries.items()
+            if entry.expires_at is not None
+        ]
+        heapq.heapify(self._expiries)
+
+    def _report_request(self, result: str) -> None:
+        self._report(MetricType.CACHE_REQUESTS_NAME, [self.name, result])
+
+    def _report_eviction(self, reason: str) -> None:
+        self._report(MetricType.CACHE_EVICTIONS_NAME, [self.name, reason])
+
+    def _report(self, name: str, labels: list[str]) -> None:
+        if not ocean.initialized:
+            return
+        try:
+            ocean.metrics.inc_metric(name, labels, 1)
+        except Exception as e:
+            logger.debug(f"Failed to report cache metrics: {e}")
+
+    def _report_size(self) -> None:
+        if not ocean.initialized:
+            return
+        try:
+            ocean.metrics.set_metric(
+                MetricType.CACHE_SIZE_NAME, [self.name], self._size
+            )
+        except Exception as e:
+            logger.debug(f"Failed to report cache metrics: {e}")
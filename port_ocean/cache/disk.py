@@ -1,8 +1,11 @@
+import asyncio
+import os
 import pickle
+import uuid
 from pathlib import Path
-from typing import Any, Optional
+from typing import IO, Any, AsyncGenerator, Optional
 
-from port_ocean.cache.base import CacheProvider
+from port_ocean.cache.base import CacheChunkWriter, ChunkedCacheProvider
 from port_ocean.cache.errors import FailedToReadCacheError, FailedToWriteCacheError
 from port_ocean.core.models import CachingStorageMode
 
@@ -15,7 +18,77 @@ class FailedToWriteCacheFileError(FailedToWriteCacheError):
     pass
 
 
-class DiskCacheProvider(CacheProvider):
+class _ChunkedEntry:
+    """A chunked entry that is still being written, shared with its readers."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.chunks_written = 0
+        self.done = False
+        self.failed = False
+        self.changed = asyncio.Condition()
+
+    async def notify(self) -> None:
+        async with self.changed:
+            self.changed.notify_all()
+
+
+class _DiskChunkWriter(CacheChunkWriter):
+    """Appends each chunk as a pickle record to a temporary file, which is renamed
+    into place on commit."""
+
+    def __init__(
+        self,
+        provider: "DiskCacheProvider",
+        key: str,
+        entry: _ChunkedEntry,
+        file: IO[bytes],
+    ) -> None:
+        self._provider = provider
+        self._key = key
+        self._entry = entry
+        self._file = file
+
+    def _write(self, chunk: Any) -> None:
+        pickle.dump(chunk, self._file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._file.flush()
+
+    async def append(self, chunk: Any) -> None:
+        try:
+            await asyncio.to_thread(self._write, chunk)
+        except (pickle.PickleError, TypeError, AttributeError, OSError) as e:
+            raise FailedToWriteCacheFileError(
+                f"Failed to write cache file: {self._entry.path}: {str(e)}"
+            )
+        self._entry.chunks_written += 1
+        await self._entry.notify()
+
+    async def commit(self) -> None:
+        try:
+            self._file.close()
+            os.replace(self._entry.path, self._provider._get_chunks_path(self._key))
+        except OSError as e:
+            await self._finish(failed=True)
+            raise FailedToWriteCacheFileError(
+                f"Failed to write cache file: {self._entry.path}: {str(e)}"
+            )
+        await self._finish(failed=False)
+
+    async def abort(self) -> None:
+        self._file.close()
+        self._entry.path.unlink(missing_ok=True)
+        await self._finish(failed=True)
+
+    async def _finish(self, failed: bool) -> None:
+        if self._entry.done:
+            return
+        self._entry.done = True
+        self._entry.failed = failed
+        self._provider._writing.pop(self._key, None)
+        await self._entry.notify()
+
+
+class DiskCacheProvider(ChunkedCacheProvider):
     STORAGE_TYPE = CachingStorageMode.disk
 
     def __init__(self, cache_dir: str | None = None) -> None:
@@ -23,10 +96,14 @@ class DiskCacheProvider(CacheProvider):
             cache_dir = "/tmp/ocean/.ocean_cache"
         self._cache_dir = Path(cache_dir)
         self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._writing: dict[str, _ChunkedEntry] = {}
 
     def _get_cache_path(self, key: str) -> Path:
         return self._cache_dir / f"{key}.pkl"
 
+    def _get_chunks_path(self, key: str) -> Path:
+        return self._cache_dir / f"{key}.chunks"
+
     async def get(self, key: str) -> Optional[Any]:
         cache_path = self._get_cache_path(key)
         if not cache_path.exists():
@@ -50,12 +127,84 @@ class DiskCacheProvider(CacheProvider):
                 f"Failed to write cache file: {cache_path}: {str(e)}"
             )
 
+    async def open_chunk_writer(self, key: str) -> CacheChunkWriter:
+        if key in self._writing:
+            raise FailedToWriteCacheFileError(f"Cache entry {key} is already written")
+
+        path = self._cache_dir / f"{key}.chunks.{uuid.uuid4().hex}.tmp"
+        try:
+            file = open(path, "wb")
+        except OSError as e:
+            raise FailedToWriteCacheFileError(
+                f"Failed to write cache file: {path}: {str(e)}"
+            )
+        entry = _ChunkedEntry(path)
+        self._writing[key] = entry
+        return _DiskChunkWriter(self, key, entry, file)
+
+    async def read_chunks(self, key: str) -> Optional[AsyncGenerator[Any, None]]:
+        # Opening the file before any await keeps it from being renamed or
+        # removed by the writer in between.
+        entry = self._writing.get(key)
+        path = entry.path if entry else self._get_chunks_path(key)
+        try:
+            file = open(path, "rb")
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            raise FailedToReadCacheFileError(
+                f"Failed to read cache file: {path}: {str(e)}"
+            )
+
+        if entry is not None:
+            return self._follow_chunks(file, entry)
+        return self._read_chunks(file, path)
+
+    async def _read_chunks(
+        self, file: IO[bytes], path: Path
+    ) -> AsyncGenerator[Any, None]:
+        with file:
+            size = os.fstat(file.fileno()).st_size
+            while file.tell() < size:
+                yield await self._load_chunk(file, path)
+
+    async def _follow_chunks(
+        self, file: IO[bytes], entry: _ChunkedEntry
+    ) -> AsyncGenerator[Any, None]:
+        """Read the chunks of an entry while it is written, waiting for new ones."""
+        with file:
+            chunks_read = 0
+            while True:
+                async with entry.changed:
+                    await entry.changed.wait_for(
+                        lambda: entry.chunks_written > chunks_read or entry.done
+                    )
+                if entry.failed:
+                    raise FailedToReadCacheFileError(
+                        f"Cache file {entry.path} was dropped while being read"
+                    )
+                if entry.chunks_written == chunks_read:
+                    return
+                yield await self._load_chunk(file, entry.path)
+                chunks_read += 1
+
+    async def _load_chunk(self, file: IO[bytes], path: Path) -> Any:
+        try:
+            return await asyncio.to_thread(pickle.load, file)
+        except (pickle.PickleError, EOFError, ValueError, AttributeError) as e:
+            # Drop the broken entry so the next call fetches it again.
+            path.unlink(missing_ok=True)
+            raise FailedToReadCacheFileError(
+                f"Failed to read cache file: {path}: {str(e)}"
+            )
+
     async def clear(self) -> None:
         try:
-            for cache_file in self._cache_dir.glob("*.pkl"):
-                try:
-                    cache_file.unlink()
-                except OSError:
-                    pass
+            for pattern in ("*.pkl", "*.chunks"):
+                for cache_file in self._cache_dir.glob(pattern):
+                    try:
+                        cache_file.unlink()
+                    except OSError:
+                        pass
         except OSError:
             pass
@@ -0,0 +1,187 @@
+import asyncio
+import pickle
+import zlib
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+from loguru import logger
+from redis.exceptions import LockError, RedisError
+
+from port_ocean.cache.base import SingleFlightCacheProvider
+from port_ocean.cache.errors import FailedToReadCacheError, FailedToWriteCacheError
+from port_ocean.cache.serialization import deserialize, serialize
+from port_ocean.consumers.redis_client import RedisClient, create_redis_client
+from port_ocean.core.models import CachingStorageMode
+
+_RAW = b"r"
+_ZLIB = b"z"
+
+
+class FailedToReadCacheRedisError(FailedToReadCacheError):
+    pass
+
+
+class FailedToWriteCacheRedisError(FailedToWriteCacheError):
+    pass
+
+
+def compress(data: bytes, threshold: int) -> bytes:
+    if len(data) < threshold:
+        return _RAW + data
+    return _ZLIB + zlib.compress(data, level=1)
+
+
+def decompress(data: bytes) -> bytes:
+    compression, payload = data[:1], data[1:]
+    if compression == _ZLIB:
+        return zlib.decompress(payload)
+    if compression == _RAW:
+        return payload
+    raise ValueError(f"Unknown cache entry compression: {compression!r}")
+
+
+class RedisCacheProvider(SingleFlightCacheProvider):
+    """Cache shared by every replica of an integration through Redis.
+
+    Entries are compressed above ``compression_threshold_bytes`` and expire after
+    ``ttl_seconds``. Keys live under a generation that ``clear`` bumps, so a clear
+    is a single INCR and the old entries age out through their TTL. Cache misses
+    are serialized across replicas with a Redis lock per key, which is kept for
+    as long as its holder runs. Waiters give up after ``lock_wait_seconds`` and
+    compute the entry themselves rather than waiting out a long listing.
+    """
+
+    STORAGE_TYPE = CachingStorageMode.redis
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379",
+        *,
+        client: RedisClient | None = None,
+        key_prefix: str = "ocean:cache",
+        ttl_seconds: float | None = 3600.0,
+        compression_threshold_bytes: int = 1024,
+        lock_timeout_seconds: float = 60.0,
+        lock_wait_seconds: float = 10.0,
+        **client_kwargs: Any,
+    ) -> None:
+        self._url = url
+        self._client_kwargs = client_kwargs
+        self._redis = client
+        self._connect_lock = asyncio.Lock()
+        self.key_prefix = key_prefix
+        self.ttl_seconds = ttl_seconds
+        self.compression_threshold_bytes = compression_threshold_bytes
+        self.lock_timeout_seconds = lock_timeout_seconds
+        self.lock_wait_seconds = lock_wait_seconds
+
+    async def _client(self) -> RedisClient:
+        if self._redis is None:
+            async with self._connect_lock:
+                if self._redis is None:
+                    self._redis = await create_redis_client(
+                        self._url, **self._client_kwargs
+                    )
+        return self._redis
+
+    @property
+    def _generation_key(self) -> str:
+        return f"{self.key_prefix}:generation"
+
+    async def _entry_key(self, redis: RedisClient, key: str) -> str:
+        generation = await redis.get(self._generation_key)
+        return f"{self.key_prefix}:{int(generation or 0)}:{key}"
+
+    async def get(self, key: str) -> Optional[Any]:
+        try:
+            redis = await self._client()
+            data = await redis.get(await self._entry_key(redis, key))
+            if data is None:
+                return None
+            return deserialize(decompress(data))
+        except (RedisError, OSError, zlib.error, pickle.PickleError, ValueError) as e:
+            raise FailedToReadCacheRedisError(
+                f"Failed to read cache entry {key} from Redis: {str(e)}"
+            )
+
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        ttl = ttl if ttl is not None else self.ttl_seconds
+        try:
+            data = compress(serialize(value), self.compression_threshold_bytes)
+            redis = await self._client()
+            await redis.set(
+                await self._entry_key(redis, key),
+                data,
+                px=int(ttl * 1000) if ttl is not None else None,
+            )
+        except (
+            RedisError,
+            OSError,
+            pickle.PickleError,
+            TypeError,
+            AttributeError,
+        ) as e:
+            raise FailedToWriteCacheRedisError(
+                f"Failed to write cache entry {key} to Redis: {str(e)}"
+            )
+
+    async def clear(self) -> None:
+        try:
+            redis = await self._client()
+            await redis.incr(self._generation_key)
+        except (RedisError, OSError) as e:
+            logger.warning(f"Failed to clear Redis cache {self.key_prefix}: {str(e)}")
+
+    async def _keep_lock(self, lock: Any, key: str) -> None:
+        """Reset the lock's timeout while it is held, so a slow iterator keeps it
+        for as long as it runs."""
+        while True:
+            await asyncio.sleep(self.lock_timeout_seconds / 3)
+            try:
+                await lock.reacquire()
+            except (LockError, RedisError, OSError) as e:
+                logger.debug(f"Failed to extend the cache lock of {key}: {e}")
+                return
+
+    @asynccontextmanager
+    async def single_flight(self, key: str) -> AsyncIterator[None]:
+        """Hold a Redis lock on the key, extended every third of
+        ``lock_timeout_seconds`` while held. If Redis is unavailable or the lock
+        is not acquired within ``lock_wait_seconds``, the caller proceeds
+        without it."""
+        lock = None
+        try:
+            redis = await self._client()
+            lock = redis.lock(
+                f"{self.key_prefix}:lock:{key}",
+                timeout=self.lock_timeout_seconds,
+                sleep=0.05,
+            )
+            if not await lock.acquire(blocking_timeout=self.lock_wait_seconds):
+                logger.debug(f"Timed out waiting for the cache lock of {key}")
+                lock = None
+        except (RedisError, OSError) as e:
+            logger.debug(f"Failed to acquire the cache lock of {key}: {str(e)}")
+            lock = None
+
+        keep_lock = (
+            asyncio.create_task(self._keep_lock(lock, key))
+            if lock is not None
+            else None
+        )
+        try:
+            yield
+        finally:
+            if keep_lock is not None:
+                keep_lock.cancel()
+                await asyncio.gather(keep_lock, return_exceptions=True)
+            if lock is not None:
+                try:
+                    await lock.release()
+                except (LockError, RedisError, OSError) as e:
+                    logger.debug(f"Failed to release the cache lock of {key}: {e}")
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
@@ -0,0 +1,17 @@
+import pickle
+from typing import Any
+
+_PICKLE_FORMAT = b"p"
+
+
+def serialize(value: Any) -> bytes:
+    """Serialize with pickle, so callers get back the types they cached. The
+    first byte records the format."""
+    return _PICKLE_FORMAT + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def deserialize(data: bytes) -> Any:
+    serialization_format, payload = data[:1], data[1:]
+    if serialization_format == _PICKLE_FORMAT:
+        return pickle.loads(payload)
+    raise ValueError(f"Unknown cache entry format: {serialization_format!r}")
@@ -0,0 +1,152 @@
+import asyncio
+import pickle
+import sqlite3
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar
+
+from loguru import logger
+
+from port_ocean.cache.base import CacheProvider
+from port_ocean.cache.errors import FailedToReadCacheError, FailedToWriteCacheError
+from port_ocean.cache.serialization import deserialize, serialize
+from port_ocean.core.models import CachingStorageMode
+
+T = TypeVar("T")
+
+
+class FailedToReadCacheDatabaseError(FailedToReadCacheError):
+    pass
+
+
+class FailedToWriteCacheDatabaseError(FailedToWriteCacheError):
+    pass
+
+
+class SQLiteCacheProvider(CacheProvider):
+    """Disk cache kept in a single SQLite database in WAL mode.
+
+    All database work runs on one dedicated thread, so the event loop never waits
+    on disk. ``clear`` only bumps the cache generation; entries of older
+    generations are invisible right away and are purged in the background.
+    """
+
+    STORAGE_TYPE = CachingStorageMode.sqlite
+
+    def __init__(
+        self,
+        path: str | None = None,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        if path is None:
+            path = "/tmp/ocean/.ocean_cache/cache.sqlite3"
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ocean-sqlite-cache"
+        )
+        self._connection: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(self._path, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA busy_timeout=5000")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache_meta "
+                "(name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+            )
+            connection.execute(
+                "INSERT OR IGNORE INTO cache_meta VALUES ('generation', 0)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "key TEXT PRIMARY KEY, generation INTEGER NOT NULL, "
+                "expires_at REAL, value BLOB NOT NULL)"
+            )
+            self._connection = connection
+        return self._connection
+
+    async def _run(self, func: Callable[[], T]) -> T:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func)
+
+    def _get(self, key: str) -> Optional[Any]:
+        connection = self._connect()
+        row = connection.execute(
+            "SELECT value, expires_at FROM cache_entries WHERE key = ? AND "
+            "generation = (SELECT value FROM cache_meta WHERE name = 'generation')",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        value, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            connection.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+            return None
+        return deserialize(value)
+
+    def _set(self, key: str, value: Any, ttl: float | None) -> None:
+        data = serialize(value)
+        expires_at = time.time() + ttl if ttl is not None else None
+        self._connect().execute(
+            "INSERT OR REPLACE INTO cache_entries VALUES (?, "
+            "(SELECT value FROM cache_meta WHERE name = 'generation'), ?, ?)",
+            (key, expires_at, data),
+        )
+
+    def _bump_generation(self) -> None:
+        self._connect().execute(
+            "UPDATE cache_meta SET value = value + 1 WHERE name = 'generation'"
+        )
+
+    def _purge_stale(self) -> None:
+        self._connect().execute(
+            "DELETE FROM cache_entries WHERE generation < "
+            "(SELECT value FROM cache_meta WHERE name = 'generation') "
+            "OR expires_at <= ?",
+            (time.time(),),
+        )
+
+    async def get(self, key: str) -> Optional[Any]:
+        try:
+            return await self._run(lambda: self._get(key))
+        except (sqlite3.Error, pickle.PickleError, EOFError, ValueError) as e:
+            raise FailedToReadCacheDatabaseError(
+                f"Failed to read cache entry {key} from {self._path}: {str(e)}"
+            )
+
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        ttl = ttl if ttl is not None else self.ttl_seconds
+        try:
+            await self._run(lambda: self._set(key, value, ttl))
+        except (sqlite3.Error, pickle.PickleError, TypeError, AttributeError) as e:
+            raise FailedToWriteCacheDatabaseError(
+                f"Failed to write cache entry {key} to {self._path}: {str(e)}"
+            )
+
+    async def clear(self) -> None:
+        try:
+            await self._run(self._bump_generation)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to clear cache {self._path}: {str(e)}")
+            return
+        self._executor.submit(self._purge_stale).add_done_callback(
+            self._log_purge_failure
+        )
+
+    def _log_purge_failure(self, future: Future[None]) -> None:
+        if (error := future.exception()) is not None:
+            logger.debug(f"Failed to purge stale cache entries: {error}")
+
+    async def close(self) -> None:
+        def _close() -> None:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+        await self._run(_close)
+        self._executor.shutdown(wait=False)
@@ -39,6 +39,7 @@ class PortClient(
         integration_version: str,
         feature_flags_cache_ttl_seconds: float = 300.0,
         blueprint_cache_ttl_seconds: float = 120.0,
+        entities_concurrency: int | None = None,
     ):
         self.api_url = f"{base_url}/v1"
         self.client = get_internal_http_client(self)
@@ -51,7 +52,7 @@ class PortClient(
             integration_type,
             integration_version,
         )
-        EntityClientMixin.__init__(self, self.auth, self.client)
+        EntityClientMixin.__init__(self, self.auth, self.client, entities_concurrency)
         IntegrationClientMixin.__init__(
             self, integration_identifier, integration_version, self.auth, self.client
         )
@@ -21,6 +21,7 @@ from port_ocean.core.models import (
     PortAPIErrorMessage,
 )
 from port_ocean.helpers.metric.metric import MetricPhase, MetricType
+from port_ocean.helpers.tracing import SpanKind, current_span, traced
 
 ENTITIES_BULK_SAMPLES_SIZE = 10
 ENTITIES_BULK_ESTIMATED_SIZE_MULTIPLIER = 1.5
@@ -31,15 +32,20 @@ DATASOURCE_ENTITIES_PAGE_SIZE = 5000
 
 
 class EntityClientMixin:
-    def __init__(self, auth: PortAuthentication, client: httpx.AsyncClient):
+    def __init__(
+        self,
+        auth: PortAuthentication,
+        client: httpx.AsyncClient,
+        concurrency: int | None = None,
+    ):
         self.auth = auth
         self.client = client
         # Semaphore is used to limit the number of concurrent requests to port, to avoid overloading it.
-        # The number of concurrent requests is set to 90% of the max connections limit, to leave some room for other
-        # requests that are not related to entities.
+        # By default the number of concurrent requests is set to 50% of the max connections limit, to leave some
+        # room for other requests that are not related to entities (see `get_entities_concurrency`).
         self.semaphore = asyncio.Semaphore(
-            round(0.5 * PORT_HTTP_MAX_CONNECTIONS_LIMIT)
-        )  # 50% of the max connections limit in order to avoid overloading port
+            concurrency or round(0.5 * PORT_HTTP_MAX_CONNECTIONS_LIMIT)
+        )
 
     def calculate_entities_batch_size(self, entities: list[Entity]) -> int:
         """
@@ -174,6 +180,7 @@ class EntityClientMixin:
             return None
         return self._reduce_entity(result_entity)
 
+    @traced("port.upsert_entities_bulk", SpanKind.CLIENT)
     async def upsert_entities_bulk(
         self,
         blueprint: str,
@@ -205,6 +212,9 @@ class EntityClientMixin:
         :return: httpx.HTTPStatusError if there was an HTTP error and should_raise is False
         """
         validation_only = request_options["validation_only"]
+        current_span().set_attributes(
+            {"port.blueprint": blueprint, "port.entities": len(entities)}
+        )
         bulk_semaphore = asyncio.Semaphore(ENTITIES_BULK_UPSERT_CONCURRENCY)
         async with bulk_semaphore:
             logger.debug(
@@ -232,6 +242,7 @@ class EntityClientMixin:
                 params=params,
                 extensions={"retryable": True},
             )
+        self._report_bulk_size(len(entities), response)
         if response.is_error:
             logger.error(
                 f"Error {'Validating' if validation_only else 'Upserting'} "
@@ -249,6 +260,21 @@ class EntityClientMixin:
 
         return self._parse_upsert_entities_batch_response(entities, result)
 
+    @staticmethod
+    def _report_bulk_size(entities_count: int, response: httpx.Response) -> None:
+        try:
+            kind = ocean.metrics.current_resource_kind()
+            ocean.metrics.observe_metric(
+                MetricType.BULK_UPSERT_ENTITIES_NAME, [kind], entities_count
+            )
+            ocean.metrics.observe_metric(
+                MetricType.BULK_UPSERT_BYTES_NAME,
+                [kind],
+                len(response.request.content),
+            )
+        except Exception as e:
+            logger.debug(f"Failed to report bulk upsert size: {e}")
+
     def _parse_upsert_entities_batch_response(
         self,
         entities: list[Entity],
@@ -599,6 +625,7 @@ class EntityClientMixin:
 
         return deleted_entity_identifiers
 
+    @traced("port.search_entities", SpanKind.CLIENT)
     async def search_entities(
         self,
         user_agent_type: UserAgentType,
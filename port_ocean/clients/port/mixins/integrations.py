@@ -342,19 +342,23 @@ class IntegrationClientMixin:
         handle_port_status_code(response, should_log=False)
         logger.debug("Finished PUT metrics request")
 
-    async def ingest_integration_logs(self, logs: list[dict[str, Any]]) -> None:
-        logger.debug("Ingesting logs")
+    async def ingest_integration_logs_batch(
+        self, body: bytes, content_encoding: str | None = None
+    ) -> None:
+        """Ingest an already encoded `{"logs": [...]}` body, optionally compressed
+        with `content_encoding`."""
+        logger.debug("Ingesting logs batch")
         log_attributes = await self.get_log_attributes()
-        headers = await self.auth.headers()
+        headers = {**await self.auth.headers(), "Content-Type": "application/json"}
+        if content_encoding:
+            headers["Content-Encoding"] = content_encoding
         response = await self.client.post(
             log_attributes["ingestUrl"],
             headers=headers,
-            json={
-                "logs": logs,
-            },
+            content=body,
         )
         handle_port_status_code(response, should_log=False)
-        logger.debug("Logs successfully ingested")
+        logger.debug("Logs batch successfully ingested")
 
     async def ingest_integration_kind_examples(
         self, kind: str, data: list[dict[str, Any]], should_log: bool = True
@@ -1,3 +1,5 @@
+import functools
+import importlib.util
 from typing import TYPE_CHECKING
 
 import httpx
@@ -8,28 +10,25 @@ from loguru import logger
 from werkzeug.local import LocalStack, LocalProxy
 
 from port_ocean.clients.port.retry_transport import TokenRetryTransport
+from port_ocean.config.settings import (
+    PORT_HTTP_MAX_CONNECTIONS_LIMIT as PORT_HTTP_MAX_CONNECTIONS_LIMIT,
+    PORT_HTTP_MAX_KEEP_ALIVE_CONNECTIONS as PORT_HTTP_MAX_KEEP_ALIVE_CONNECTIONS,
+)
 from port_ocean.context.ocean import ocean
 from port_ocean.helpers.async_client import OceanAsyncClient
+from port_ocean.helpers.request_metrics import PORT_REQUEST_DURATION
 from port_ocean.helpers.ssl import resolve_verify_param
 
 if TYPE_CHECKING:
     from port_ocean.clients.port.client import PortClient
+    from port_ocean.config.settings import PortSettings
 
-# In case the framework sends more requests to port in parallel than allowed by the limits, a PoolTimeout exception will
-# be raised.
-# Raising defaults for the timeout, in addition to the limits, will allow request to wait for a connection for a longer
-# period of time, before raising an exception.
-# The max_connections value can't be too high, as it will cause the application to run out of memory.
-# The max_keepalive_connections can't be too high, as it will cause the application to run out of available connections.
-PORT_HTTP_MAX_CONNECTIONS_LIMIT = 100
-PORT_HTTP_MAX_KEEP_ALIVE_CONNECTIONS = 50
 PORT_HTTP_TIMEOUT = 60.0
 
+# Raising the timeout lets requests wait longer for a free connection of the
+# pool (see the `port.http_*` settings) before a PoolTimeout is raised.
 PORT_HTTPX_TIMEOUT = httpx.Timeout(PORT_HTTP_TIMEOUT)
-PORT_HTTPX_LIMITS = httpx.Limits(
-    max_connections=PORT_HTTP_MAX_CONNECTIONS_LIMIT,
-    max_keepalive_connections=PORT_HTTP_MAX_KEEP_ALIVE_CONNECTIONS,
-)
+PORT_HTTP_POOL_METRICS_NAME = "port"
 
 _http_client: LocalStack[httpx.AsyncClient] = LocalStack()
 
@@ -39,9 +38,49 @@ FIVE_MINUETS = 60 * 5
 OCEAN_INFO_PREFIX = "ocean_info_"
 
 
+def is_http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+@functools.cache
+def _warn_http2_unavailable() -> None:
+    logger.warning(
+        "HTTP/2 is enabled for the Port client but the `h2` package is not "
+        "installed, falling back to HTTP/1.1. Install `httpx[http2]` to use it."
+    )
+
+
+def resolve_http2_enabled(port_settings: "PortSettings") -> bool:
+    # Resolved both for the entities concurrency and for the client itself,
+    # so the fallback is only reported the first time.
+    if port_settings.http2_enabled and not is_http2_available():
+        _warn_http2_unavailable()
+        return False
+    return port_settings.http2_enabled
+
+
+def get_port_http_limits(port_settings: "PortSettings") -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=port_settings.http_max_connections,
+        max_keepalive_connections=port_settings.http_max_keepalive_connections,
+        keepalive_expiry=port_settings.http_keepalive_expiry_seconds,
+    )
+
+
+def get_entities_concurrency(port_settings: "PortSettings") -> int:
+    if port_settings.entities_concurrency is not None:
+        return port_settings.entities_concurrency
+    # Over HTTP/2 requests are multiplexed as streams over a few connections, so
+    # concurrency no longer has to leave half of the pool free.
+    if resolve_http2_enabled(port_settings):
+        return port_settings.http_max_connections
+    return round(0.5 * port_settings.http_max_connections)
+
+
 def _get_http_client_context(port_client: "PortClient") -> httpx.AsyncClient:
     client = _http_client.top
     if client is None:
+        port_settings = ocean.config.port
         client = OceanAsyncClient(
             TokenRetryTransport,
             transport_kwargs={
@@ -49,8 +88,11 @@ def _get_http_client_context(port_client: "PortClient") -> httpx.AsyncClient:
                 "max_backoff_wait": FIVE_MINUETS,
                 "base_delay": 0.3,
             },
+            pool_metrics_name=PORT_HTTP_POOL_METRICS_NAME,
+            request_duration_metric=PORT_REQUEST_DURATION,
             timeout=PORT_HTTPX_TIMEOUT,
-            limits=PORT_HTTPX_LIMITS,
+            limits=get_port_http_limits(port_settings),
+            http2=resolve_http2_enabled(port_settings),
             verify=resolve_verify_param(ocean.config.ssl.port),
         )
         _http_client.push(client)
@@ -2,6 +2,7 @@ from typing import Any, Literal, Optional, Type
 from urllib.parse import urlparse
 
 import os
+import tempfile
 
 from loguru import logger
 from pydantic.v1 import AnyHttpUrl, Extra, Field, parse_obj_as, parse_raw_as
@@ -30,7 +31,18 @@ from port_ocean.utils.misc import (
 from port_ocean.utils.time import parse_interval_to_minutes
 
 LogLevelType = Literal["ERROR", "WARNING", "INFO", "DEBUG", "CRITICAL"]
+# encrypted: spool the response to disk with a ChaCha20 stream cipher, then parse.
+# plain: spool to disk unencrypted, e.g. when `location` is a tmpfs.
+# passthrough: parse while the response arrives, nothing touches the disk.
+StreamingSpoolMode = Literal["encrypted", "plain", "passthrough"]
 ALLOWED_INCREMENTAL_SYNC_INTERVALS = (15, 30, 60)
+# Defaults of the Port client's connection pool. If the framework sends more
+# requests to Port in parallel than the pool allows, they wait for a connection
+# until a PoolTimeout is raised.
+# The max_connections value can't be too high, as it will cause the application to run out of memory.
+# The max_keepalive_connections can't be too high, as it will cause the application to run out of available connections.
+PORT_HTTP_MAX_CONNECTIONS_LIMIT = 100
+PORT_HTTP_MAX_KEEP_ALIVE_CONNECTIONS = 50
 
 
 class SslX509Settings(BaseOceanModel):
@@ -52,6 +64,7 @@ class SslSettings(BaseOceanModel):
 class ApplicationSettings(BaseSettings):
     log_level: LogLevelType = "INFO"
     enable_http_logging: bool = True
+    http_logging_compression: bool = False
     port: int = 8000
 
     class Config:
@@ -77,6 +90,16 @@ class PortSettings(BaseOceanModel, extra=Extra.allow):
     port_app_config_cache_ttl: int = 60
     feature_flags_cache_ttl_seconds: float = 300.0  # 5 minutes
     blueprint_cache_ttl_seconds: float = 120.0
+    # Requires the `h2` package (`httpx[http2]`), falls back to HTTP/1.1 without it.
+    http2_enabled: bool = False
+    http_max_connections: int = Field(default=PORT_HTTP_MAX_CONNECTIONS_LIMIT, ge=1)
+    http_max_keepalive_connections: int = Field(
+        default=PORT_HTTP_MAX_KEEP_ALIVE_CONNECTIONS, ge=0
+    )
+    http_keepalive_expiry_seconds: float = Field(default=5.0, ge=0)
+    # Concurrent entity upserts/deletes. Defaults to half the connection pool over
+    # HTTP/1.1 and to the full pool over HTTP/2, where requests share connections.
+    entities_concurrency: int | None = Field(default=None, ge=1)
 
 
 class IntegrationSettings(BaseOceanModel, extra=Extra.allow):
@@ -119,11 +142,104 @@ class MetricsSettings(BaseOceanModel, extra=Extra.allow):
     webhook_url: str | None = Field(default=None)
 
 
+class ProfilerSettings(BaseOceanModel, extra=Extra.allow):
+    # Serves the sampling profiler on /debug/profile.
+    enabled: bool = Field(default=False)
+    max_seconds: float = Field(default=120, gt=0)
+    sampling_interval_ms: float = Field(default=10, ge=1)
+    # When set, the performance monitor profiles the process on its own when it
+    # measures an event loop latency above the threshold, and writes the
+    # collapsed stacks to output_dir. Works with the endpoint disabled.
+    latency_threshold_ms: float | None = Field(default=None, gt=0)
+    latency_capture_seconds: float = Field(default=10, gt=0)
+    latency_capture_cooldown_seconds: float = Field(default=600, ge=0)
+    output_dir: str = Field(
+        default_factory=lambda: os.path.join(tempfile.gettempdir(), "ocean-profiles")
+    )
+
+
+class EventLoopWatchdogSettings(BaseOceanModel, extra=Extra.allow):
+    enabled: bool = Field(default=False)
+    # How long the event loop may go without running a callback before the
+    # code running on it is reported as blocking it.
+    threshold_ms: float = Field(default=200, gt=0)
+    report_interval_seconds: float = Field(default=60, gt=0)
+    top_offenders: int = Field(default=10, gt=0)
+
+
+class TracingSettings(BaseOceanModel, extra=Extra.allow):
+    # Writes spans of the resync and webhook pipelines to output_path as OTLP
+    # JSON lines.
+    enabled: bool = Field(default=False)
+    output_path: str = Field(
+        default_factory=lambda: os.path.join(
+            tempfile.gettempdir(), "ocean-traces", "traces.jsonl"
+        )
+    )
+    batch_size: int = Field(default=256, ge=1)
+
+
+class ResyncRecorderSettings(BaseOceanModel, extra=Extra.allow):
+    # Records the third-party calls of each resync to output_dir, for replay
+    # with IntegrationTestHarness.from_recording.
+    enabled: bool = Field(default=False)
+    output_dir: str = Field(
+        default_factory=lambda: os.path.join(tempfile.gettempdir(), "ocean-recordings")
+    )
+    # Compressed size after which a recording stops recording calls.
+    max_size_bytes: int = Field(default=1024 * 1024 * 1024, gt=0)  # 1 gb
+    # Bodies waiting for the writer thread; past it the recording stops rather
+    # than let memory grow when the writer falls behind.
+    max_queued_bytes: int = Field(default=64 * 1024 * 1024, gt=0)  # 64 mb
+    # Larger request and response bodies are recorded without their content.
+    max_body_bytes: int = Field(default=8 * 1024 * 1024, gt=0)  # 8 mb
+
+
+class SharedRateLimitSettings(BaseOceanModel, extra=Extra.allow):
+    # Shares rate-limit and circuit-breaker state between all requests to a
+    # host. Applies to clients whose RetryTransport gets no RetryConfig, from
+    # the caller or register_retry_config_callback; those decide for themselves.
+    enabled: bool = Field(default=False)
+    requests_per_second: float | None = Field(default=None, gt=0)
+    burst: float | None = Field(default=None, gt=0)
+    circuit_breaker_failure_threshold: int = Field(default=5, ge=1)
+    circuit_breaker_recovery_timeout: float = Field(default=30.0, gt=0)
+
+
 class StreamingSettings(BaseOceanModel, extra=Extra.allow):
     enabled: bool = Field(default=False)
+    # Despite the name this is a byte count: the JSON size of the items in a batch.
     max_buffer_size_mb: int = Field(default=1024 * 1024 * 20)  # 20 mb
+    max_batch_items: int = Field(default=1000, ge=1)
     chunk_size: int = Field(default=1024 * 64)  # 64 kb
     location: str = Field(default="/tmp/ocean/streaming")
+    spool_mode: StreamingSpoolMode = Field(default="encrypted")
+
+
+class MemoryCacheSettings(BaseOceanModel, extra=Extra.allow):
+    max_size_bytes: int = Field(default=256 * 1024 * 1024, ge=1)  # 256 mb
+    ttl_seconds: float | None = Field(default=3600.0, gt=0)
+
+
+class SQLiteCacheSettings(BaseOceanModel, extra=Extra.allow):
+    path: str = Field(default="/tmp/ocean/.ocean_cache/cache.sqlite3")
+    ttl_seconds: float | None = Field(default=None, gt=0)
+
+
+class RedisCacheSettings(BaseOceanModel, extra=Extra.allow):
+    url: str = Field(default="redis://localhost:6379")
+    username: str | None = None
+    password: str | None = Field(default=None, sensitive=True)
+    key_prefix: str | None = Field(
+        default=None,
+        description="Defaults to ocean:cache:<integration identifier>.",
+    )
+    ttl_seconds: float | None = Field(default=3600.0, gt=0)
+    compression_threshold_bytes: int = Field(default=1024, ge=0)
+    lock_timeout_seconds: float = Field(default=60.0, gt=0)
+    # The lock is extended while held; a replica waits this long for it before
+    # computing the entry itself.
+    lock_wait_seconds: float = Field(default=10.0, ge=0)
 
 
 class ActionsProcessorSettings(BaseOceanModel, extra=Extra.allow):
@@ -195,6 +311,38 @@ class LiveEventsRedisSettings(BaseOceanModel, extra=Extra.allow):
         ge=1,
         description="Maximum number of stream entries to return per XREADGROUP call.",
     )
+    worker_count: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "Number of stream messages processed concurrently by each consumer. "
+            "Messages sharing a group key are always processed in stream order."
+        ),
+    )
+    message_group_key_jq: str | None = Field(
+        default=None,
+        description=(
+            "JQ expression evaluated on the message payload to refine the "
+            "ordering group beyond the webhook path (e.g. '.repository.full_name'). "
+            "When unset, messages are ordered per webhook path."
+        ),
+    )
+    ack_batch_size: int = Field(
+        default=50,
+        ge=1,
+        description=(
+            "Maximum number of processed stream entries acknowledged and "
+            "deleted together in a single Redis call."
+        ),
+    )
+    ack_flush_interval_seconds: float = Field(
+        default=0.1,
+        gt=0,
+        description=(
+            "Maximum seconds a processed stream entry waits for its batch "
+            "before being acknowledged."
+        ),
+    )
     stream_ttl_seconds: int | None = Field(
         default=2_592_000,  # 30 days
         ge=1,
@@ -233,6 +381,22 @@ class LiveEventsRedisSettings(BaseOceanModel, extra=Extra.allow):
             "consumer group."
         ),
     )
+    stream_maintenance_scan_jitter_ratio: float = Field(
+        default=0.1,
+        ge=0,
+        lt=1,
+        description=(
+            "Random fraction of the scan interval added to or subtracted from "
+            "each maintenance worker sleep, so pods do not scan in lockstep."
+        ),
+    )
+    stream_maintenance_leader_election_enabled: bool = Field(
+        default=True,
+        description=(
+            "When true, pods compete for a Redis lease every scan interval and "
+            "only the holder reclaims PEL entries and cleans up idle consumers."
+        ),
+    )
     pel_xautoclaim_count: int = Field(
         default=100,
         ge=1,
@@ -386,6 +550,15 @@ class IntegrationConfiguration(BaseOceanSettings, extra=Extra.allow):
     caching_storage_mode: Optional[CachingStorageMode] = Field(
         default=CachingStorageMode.disk
     )
+    memory_cache: MemoryCacheSettings = Field(
+        default_factory=lambda: MemoryCacheSettings()
+    )
+    sqlite_cache: SQLiteCacheSettings = Field(
+        default_factory=lambda: SQLiteCacheSettings()
+    )
+    redis_cache: RedisCacheSettings = Field(
+        default_factory=lambda: RedisCacheSettings()
+    )
 
     upsert_entities_batch_max_length: int = 20
     upsert_entities_batch_max_size_in_bytes: int = 1024 * 1024
@@ -401,6 +574,9 @@ class IntegrationConfiguration(BaseOceanSettings, extra=Extra.allow):
     )
     delete_entities_max_batch_size: int = 1000
     streaming: StreamingSettings = Field(default_factory=lambda: StreamingSettings())
+    shared_rate_limit: SharedRateLimitSettings = Field(
+        default_factory=SharedRateLimitSettings
+    )
     actions_processor: ActionsProcessorSettings = Field(
         default_factory=lambda: ActionsProcessorSettings()
     )
@@ -408,6 +584,14 @@ class IntegrationConfiguration(BaseOceanSettings, extra=Extra.allow):
         default_factory=lambda: RedisLiveEventsSettings()
     )
     ssl: SslSettings = Field(default_factory=SslSettings)
+    profiler: ProfilerSettings = Field(default_factory=ProfilerSettings)
+    event_loop_watchdog: EventLoopWatchdogSettings = Field(
+        default_factory=EventLoopWatchdogSettings
+    )
+    tracing: TracingSettings = Field(default_factory=TracingSettings)
+    resync_recorder: ResyncRecorderSettings = Field(
+        default_factory=ResyncRecorderSettings
+    )
 
     @root_validator(pre=True)
     def warn_removed_process_execution_mode_env(
@@ -1,5 +1,6 @@
 import functools
 import signal
+import time
 from asyncio import get_running_loop, ensure_future
 from typing import Any, Callable, Awaitable
 
@@ -17,6 +18,8 @@ class KafkaConsumerConfig(BaseModel):
     authentication_mechanism: str
     kafka_security_enabled: bool
     consumer_poll_timeout: int
+    consumer_batch_size: int = 100
+    consumer_commit_interval_seconds: float = 5.0
 
 
 class KafkaConsumer:
@@ -25,13 +28,16 @@ class KafkaConsumer:
         msg_process: Callable[[Message], Awaitable[None]],
         config: KafkaConsumerConfig,
         org_id: str,
+        msg_filter: Callable[[Message], bool] | None = None,
     ) -> None:
         self.running = False
         self._assigned_partitions = False
+        self._has_uncommitted_offsets = False
         self.org_id = org_id
         self.config = config
 
         self.msg_process = msg_process
+        self.msg_filter = msg_filter
         kafka_config: dict[str, str | int | float | bool | None]
         if config.kafka_security_enabled:
             kafka_config = {
@@ -86,41 +92,66 @@ class KafkaConsumer:
         logger.info(f"Subscribed to topics: {topics}")
 
         loop = get_running_loop()
-        poll = functools.partial(
-            self.consumer.poll, timeout=self.config.consumer_poll_timeout
+        consume = functools.partial(
+            self.consumer.consume,
+            num_messages=self.config.consumer_batch_size,
+            timeout=self.config.consumer_poll_timeout,
         )
+        last_commit_time = time.monotonic()
         try:
             while self.running:
                 try:
-                    msg = await loop.run_in_executor(None, poll)
-                    if msg is None:
-                        continue
-                    if msg.error():
-                        raise KafkaException(msg.error())
-                    else:
-                        try:
-                            logger.info(
-                                "Process message "
-                                f"from topic {msg.topic()}, partition {msg.partition()}, offset {msg.offset()}"
-                            )
-                            ensure_future(self.msg_process(msg))
-
-                        except Exception as process_error:
-                            logger.exception(
-                                "Failed process message"
-                                f" from topic {msg.topic()}, partition {msg.partition()}, offset {msg.offset()}: {str(process_error)}"
-                            )
-                        finally:
-                            self.consumer.commit(asynchronous=False)
+                    messages = await loop.run_in_executor(None, consume)
+                    for msg in messages:
+                        self._has_uncommitted_offsets = True
+                        self._process_message(msg)
+
+                    if (
+                        self._has_uncommitted_offsets
+                        and time.monotonic() - last_commit_time
+                        >= self.config.consumer_commit_interval_seconds
+                    ):
+                        self.consumer.commit(asynchronous=True)
+                        self._has_uncommitted_offsets = False
+                        last_commit_time = time.monotonic()
                 except Exception as message_error:
                     logger.error(str(message_error))
         finally:
             logger.info("Closing consumer...")
             self.exit_gracefully()
 
+    def _process_message(self, msg: Message) -> None:
+        if msg.error():
+            logger.error(str(KafkaException(msg.error())))
+            return
+        if self.msg_filter is not None and not self.msg_filter(msg):
+            return
+
+        try:
+            logger.info(
+                "Process message "
+                f"from topic {msg.topic()}, partition {msg.partition()}, offset {msg.offset()}"
+            )
+            ensure_future(self.msg_process(msg))
+        except Exception as process_error:
+            logger.exception(
+                "Failed process message"
+                f" from topic {msg.topic()}, partition {msg.partition()}, offset {msg.offset()}: {str(process_error)}"
+            )
+
+    def _commit_before_close(self) -> None:
+        if not self._has_uncommitted_offsets:
+            return
+        self._has_uncommitted_offsets = False
+        try:
+            self.consumer.commit(asynchronous=False)
+        except Exception as commit_error:
+            logger.warning(f"Failed to commit offsets before closing: {commit_error}")
+
     def exit_gracefully(self, *_: Any) -> None:
         logger.info("Closing the kafka consumer gracefully...")
         self.running = False
+        self._commit_before_close()
         self.consumer.close()
 
 
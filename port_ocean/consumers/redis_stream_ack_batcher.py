@@ -0,0 +1,97 @@
+import asyncio
+
+from loguru import logger
+
+from port_ocean.consumers.redis_client import RedisClient
+from port_ocean.consumers.redis_stream_utils import (
+    ack_and_finalize_stream_entries,
+    is_redis_connection_error,
+)
+
+
+class RedisStreamAckBatcher:
+    """Accumulates processed stream entry IDs and acks them in batches.
+
+    IDs are flushed with a single multi-ID XACK + XDEL once ``max_batch_size``
+    entries are pending or ``flush_interval_seconds`` have passed since the
+    first pending entry. Entries are only added after they were processed, so
+    delaying the ack never loses a message: an entry whose flush fails stays in
+    the PEL and is redelivered by the stream maintenance worker.
+    """
+
+    def __init__(
+        self,
+        redis: RedisClient,
+        *,
+        stream_key: str,
+        consumer_group: str,
+        max_batch_size: int,
+        flush_interval_seconds: float,
+    ) -> None:
+        self._redis = redis
+        self._stream_key = stream_key
+        self._consumer_group = consumer_group
+        self._max_batch_size = max_batch_size
+        self._flush_interval_seconds = flush_interval_seconds
+        self._pending: list[str] = []
+        self._flush_task: asyncio.Task[None] | None = None
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    async def add(self, message_id: str) -> None:
+        self._pending.append(message_id)
+        if len(self._pending) >= self._max_batch_size:
+            await self.flush()
+        else:
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after_interval())
+
+    async def _flush_after_interval(self) -> None:
+        await asyncio.sleep(self._flush_interval_seconds)
+        self._flush_task = None
+        await self.flush()
+        if self._pending:
+            self._schedule_flush()
+
+    async def flush(self) -> None:
+        while self._pending:
+            message_ids = self._pending[: self._max_batch_size]
+            del self._pending[: self._max_batch_size]
+            try:
+                await ack_and_finalize_stream_entries(
+                    self._redis,
+                    stream_key=self._stream_key,
+                    consumer_group=self._consumer_group,
+                    message_ids=message_ids,
+                )
+            except Exception as error:
+                if is_redis_connection_error(error):
+                    # Keep the IDs for the next flush; they are still in the PEL.
+                    self._pending[:0] = message_ids
+                    logger.warning(
+                        "Lost connection to Redis while flushing stream acks, "
+                        "will retry",
+                        stream_key=self._stream_key,
+                        pending_count=len(self._pending),
+                        error=str(error),
+                    )
+                    return
+                logger.exception(
+                    "Failed to flush Redis stream acks, entries stay pending",
+                    stream_key=self._stream_key,
+                    message_ids=message_ids,
+                    error=str(error),
+                )
+
+    async def close(self) -> None:
+        """Cancel the flush timer and flush whatever is still pending."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        await self.flush()
@@ -6,9 +6,11 @@ import socket
 import tempfile
 import time
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 
+import jq  # type: ignore
 from loguru import logger
 from redis.asyncio.connection import SSLConnection
 from redis.exceptions import ResponseError
@@ -22,13 +24,14 @@ from port_ocean.consumers.abstract_live_events_consumer import (
     AbstractLiveEventsConsumer,
 )
 from port_ocean.consumers.stream_maintenance import RedisStreamMaintenanceWorker
+from port_ocean.consumers.redis_stream_ack_batcher import RedisStreamAckBatcher
 from port_ocean.consumers.redis_stream_utils import (
-    ack_and_finalize_stream_entry,
     ensure_consumer_group,
     is_missing_stream_or_group_error,
     is_redis_connection_error,
 )
 from port_ocean.context.ocean import ocean
+from port_ocean.core.handlers.queue import GroupQueue
 from port_ocean.exceptions.live_events import InvalidLiveEventsRedisStreamFieldError
 from port_ocean.core.handlers.webhook.webhook_event import (
     WebhookEvent,
@@ -41,6 +44,13 @@ _INTEGRATION_PATH_PREFIX = "/integration/"
 OnStreamMessage = Callable[[str, WebhookEvent], Awaitable[None]]
 
 
+@dataclass
+class _StreamMessage:
+    group_id: str
+    message_id: str
+    fields: dict[str, str]
+
+
 class RedisStreamConsumer(AbstractLiveEventsConsumer):
     """Consumes live events directly from a Redis stream and invokes a handler."""
 
@@ -66,6 +76,15 @@ class RedisStreamConsumer(AbstractLiveEventsConsumer):
             f"{ocean.config.integration.identifier}-{socket.gethostname()}"
         )
         self._stream_maintenance_worker: RedisStreamMaintenanceWorker | None = None
+        self._ack_batcher: RedisStreamAckBatcher | None = None
+        self._group_key_program: Any = (
+            jq.compile(redis_settings.message_group_key_jq)
+            if redis_settings.message_group_key_jq
+            else None
+        )
+        self._message_queue: GroupQueue[_StreamMessage] | None = None
+        self._in_flight: asyncio.Semaphore | None = None
+        self._worker_tasks: list[asyncio.Task[None]] = []
 
     def _resolve_consumer_group(self) -> str:
         integration = ocean.config.integration
@@ -163,6 +182,9 @@ class RedisStreamConsumer(AbstractLiveEventsConsumer):
             self._read_task.cancel()
             await asyncio.gather(self._read_task, return_exceptions=True)
             self._read_task = None
+        await self._stop_message_workers()
+        await self._flush_acks()
+        self._ack_batcher = None
         if self._stream_maintenance_worker is not None:
             await self._stream_maintenance_worker.stop()
             self._stream_maintenance_worker = None
@@ -174,12 +196,19 @@ class RedisStreamConsumer(AbstractLiveEventsConsumer):
     async def _ack(self, message_id: str) -> None:
         if self._redis is None:
             return
-        await ack_and_finalize_stream_entry(
-            self._redis,
-            stream_key=self._stream_key,
-            consumer_group=self._consumer_group,
-            message_id=message_id,
-        )
+        if self._ack_batcher is None:
+            self._ack_batcher = RedisStreamAckBatcher(
+                self._redis,
+                stream_key=self._stream_key,
+                consumer_group=self._consumer_group,
+                max_batch_size=self._settings.ack_batch_size,
+                flush_interval_seconds=self._settings.ack_flush_interval_seconds,
+            )
+        await self._ack_batcher.add(message_id)
+
+    async def _flush_acks(self) -> None:
+        if self._ack_batcher is not None:
+            await self._ack_batcher.close()
 
     def _require_redis(self) -> RedisClient:
         if self._redis is None:
@@ -208,8 +237,101 @@ class RedisStreamConsumer(AbstractLiveEventsConsumer):
                 error=str(recovery_error),
             )
 
+    def _start_message_workers(self) -> None:
+        """Start in-pod workers when more than one concurrent message is allowed."""
+        worker_count = self._settings.worker_count
+        if worker_count <= 1 or self._worker_tasks:
+            return
+
+        # A group lock outliving the stuck timeout is reclaimed by the
+        # maintenance worker anyway, so keep the queue from releasing it earlier.
+        self._message_queue = GroupQueue(
+            group_key="group_id",
+            name=self._stream_key,
+            lock_timeout=self._settings.pel_stuck_timeout_seconds,
+        )
+        self._in_flight = asyncio.Semaphore(worker_count * self._settings.read_count)
+        self._worker_tasks = [
+            asyncio.create_task(self._message_worker(self._message_queue))
+            for _ in range(worker_count)
+        ]
+        logger.info(
+            "Started Redis stream message workers",
+            stream_key=self._stream_key,
+            worker_count=worker_count,
+        )
+
+    async def _stop_message_workers(self) -> None:
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        self._message_queue = None
+        self._in_flight = None
+
+    async def _message_worker(self, queue: GroupQueue[_StreamMessage]) -> None:
+        while True:
+            message = await queue.get()
+            try:
+                await self._handle_message(message.message_id, message.fields)
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                # A worker that dies is never replaced, so keep it consuming.
+                logger.exception(
+                    "Unexpected error handling Redis stream message",
+                    stream_key=self._stream_key,
+                    message_id=message.message_id,
+                    error=str(error),
+                )
+            finally:
+                await queue.commit()
+                if self._in_flight is not None:
+                    self._in_flight.release()
+
+    def _resolve_group_id(self, fields: dict[str, str]) -> str:
+        """Return the key whose messages must be handled in stream order."""
+        raw_webhook_path = fields.get("webhookPath")
+        group_id = (
+            self._normalize_webhook_path(raw_webhook_path) if raw_webhook_path else ""
+        )
+        raw_payload = fields.get("payload")
+        if self._group_key_program is None or raw_payload is None:
+            return group_id
+
+        try:
+            group_value = self._group_key_program.input_text(raw_payload).first()
+        except Exception as error:
+            logger.warning(
+                "Failed to resolve Redis stream message group key, "
+                "falling back to webhookPath",
+                stream_key=self._stream_key,
+                redis_event_id=fields.get("eventId"),
+                error=str(error),
+            )
+            return group_id
+
+        if group_value is None:
+            return group_id
+        return f"{group_id}:{group_value}"
+
+    async def _dispatch_message(self, message_id: str, fields: dict[str, str]) -> None:
+        if self._message_queue is None or self._in_flight is None:
+            await self._handle_message(message_id, fields)
+            return
+
+        await self._in_flight.acquire()
+        await self._message_queue.put(
+            _StreamMessage(
+                group_id=self._resolve_group_id(fields),
+                message_id=message_id,
+                fields=fields,
+            )
+        )
+
     async def _read_loop(self) -> None:
         redis = self._require_redis()
+        self._start_message_workers()
 
         while self._is_running:
             try:
@@ -225,7 +347,7 @@ class RedisStreamConsumer(AbstractLiveEventsConsumer):
 
                 for _stream_name, messages in response:
                     for message_id, fields in messages:
-                        await self._handle_message(message_id, fields)
+                        await self._dispatch_message(message_id, fields)
             except asyncio.CancelledError:
                 break
             except ResponseError as error:
@@ -1,5 +1,5 @@
 import asyncio
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Sequence
 from typing import Any, cast
 
 from loguru import logger
@@ -122,14 +122,22 @@ async def cleanup_idle_consumers_from_group(
 
 
 ACK_AND_FINALIZE_STREAM_ENTRY_SCRIPT = """
-redis.call('XACK', KEYS[1], ARGV[1], ARGV[2])
-return redis.call('XDEL', KEYS[1], ARGV[2])
+redis.call('XACK', KEYS[1], ARGV[1], unpack(ARGV, 2))
+return redis.call('XDEL', KEYS[1], unpack(ARGV, 2))
 """
 
-REQUEUE_STREAM_ENTRY_SCRIPT = """
-redis.call('XADD', KEYS[1], '*', unpack(ARGV, 3))
-redis.call('XACK', KEYS[1], ARGV[1], ARGV[2])
-return redis.call('XDEL', KEYS[1], ARGV[2])
+REQUEUE_STREAM_ENTRIES_SCRIPT = """
+local requeued = 0
+local i = 2
+while i <= #ARGV do
+  local field_count = tonumber(ARGV[i + 1])
+  redis.call('XADD', KEYS[1], '*', unpack(ARGV, i + 2, i + 1 + field_count))
+  redis.call('XACK', KEYS[1], ARGV[1], ARGV[i])
+  redis.call('XDEL', KEYS[1], ARGV[i])
+  requeued = requeued + 1
+  i = i + 2 + field_count
+end
+return requeued
 """
 
 
@@ -151,20 +159,22 @@ async def _eval_lua_script(
     )
 
 
-async def ack_and_finalize_stream_entry(
+async def ack_and_finalize_stream_entries(
     redis: RedisClient,
     *,
     stream_key: str,
     consumer_group: str,
-    message_id: str,
+    message_ids: Sequence[str],
 ) -> None:
-    """Atomically ack a stream entry and delete it using a Lua script."""
+    """Atomically ack stream entries and delete them in a single Lua call."""
+    if not message_ids:
+        return
     try:
         await _eval_lua_script(
             redis,
             ACK_AND_FINALIZE_STREAM_ENTRY_SCRIPT,
             [stream_key],
-            [consumer_group, message_id],
+            [consumer_group, *message_ids],
         )
     except ResponseError as error:
         if not is_missing_stream_or_group_error(error):
@@ -173,27 +183,52 @@ async def ack_and_finalize_stream_entry(
             "Redis stream or consumer group missing during ack finalize",
             stream_key=stream_key,
             consumer_group=consumer_group,
-            message_id=message_id,
+            message_ids=list(message_ids),
             error=str(error),
         )
 
 
-async def requeue_stream_entry(
+async def ack_and_finalize_stream_entry(
     redis: RedisClient,
     *,
     stream_key: str,
     consumer_group: str,
     message_id: str,
-    fields: dict[str, str],
 ) -> None:
-    """Atomically re-enqueue a stream entry and finalize the original via Lua."""
-    field_items: list[str] = []
-    for key, value in fields.items():
-        field_items.extend((key, value))
+    """Atomically ack a stream entry and delete it using a Lua script."""
+    await ack_and_finalize_stream_entries(
+        redis,
+        stream_key=stream_key,
+        consumer_group=consumer_group,
+        message_ids=[message_id],
+    )
+
+
+async def requeue_stream_entries(
+    redis: RedisClient,
+    *,
+    stream_key: str,
+    consumer_group: str,
+    entries: Sequence[tuple[str, dict[str, str]]],
+) -> None:
+    """Atomically re-enqueue several stream entries and finalize the originals.
+
+    Each entry is encoded as ``message_id, field_count, *field_items`` so a
+    whole page of stuck messages is requeued with a single EVAL.
+    """
+    if not entries:
+        return
+
+    args: list[str] = [consumer_group]
+    for message_id, fields in entries:
+        field_items: list[str] = []
+        for key, value in fields.items():
+            field_items.extend((key, value))
+        args.extend((message_id, str(len(field_items)), *field_items))
 
     await _eval_lua_script(
         redis,
-        REQUEUE_STREAM_ENTRY_SCRIPT,
+        REQUEUE_STREAM_ENTRIES_SCRIPT,
         [stream_key],
-        [consumer_group, message_id, *field_items],
+        args,
     )
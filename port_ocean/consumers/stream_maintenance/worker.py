@@ -1,8 +1,10 @@
 """Redis stream maintenance worker.
 
-All pods run the scan concurrently. XAUTOCLAIM is a single atomic Redis
-command, so only one pod will ever claim a given stuck message; redundant
-scans by other pods are harmless no-ops.
+Every pod runs the worker, but each interval only the pod that acquires a
+short-lived scan lease (``SET NX PX``) performs the scan, and scan intervals are
+jittered so pods do not contend in lockstep. XAUTOCLAIM is a single atomic
+Redis command, so even with leader election disabled only one pod will ever
+claim a given stuck message.
 
 The worker reclaims stuck PEL entries and performs consumer-group hygiene.
 Stream consumer pods handle all actual message processing. When a message has
@@ -13,11 +15,17 @@ been stuck in the PEL longer than ``stuck_timeout_ms`` the worker:
 3. Otherwise increments ``requeue_count``, re-enqueues via XADD, then ACKs the
    original entry to remove it from the PEL.
 
+Discards and requeues are applied per claimed page, each as a single Lua call,
+so Redis work scales with the number of stuck messages rather than with
+round trips per message.
+
 After each scan, the worker may also remove idle consumers from the group that
 have no pending messages (see ``stream_maintenance_consumer_cleanup_enabled``).
 """
 
 import asyncio
+import random
+import socket
 
 from loguru import logger
 from redis.exceptions import ResponseError
@@ -27,20 +35,22 @@ from port_ocean.consumers.stream_maintenance.settings import (
     STREAM_MAINTENANCE_CONSUMER_NAME,
 )
 from port_ocean.consumers.redis_stream_utils import (
-    ack_and_finalize_stream_entry,
+    ack_and_finalize_stream_entries,
     cleanup_idle_consumers_from_group,
     ensure_consumer_group,
     is_missing_stream_or_group_error,
-    requeue_stream_entry,
+    requeue_stream_entries,
 )
 
+StreamEntry = tuple[str, dict[str, str] | None]
+
 
 class RedisStreamMaintenanceWorker:
     """Background worker for Redis stream consumer-group maintenance.
 
-    Every pod runs the scan independently on a fixed interval. XAUTOCLAIM
-    atomicity ensures each stuck message is claimed and processed by exactly
-    one pod even when multiple pods scan concurrently.
+    Every pod runs the loop on a jittered interval and scans only when it holds
+    the scan lease for that interval. XAUTOCLAIM atomicity still ensures each
+    stuck message is claimed and processed by exactly one pod.
     """
 
     def __init__(
@@ -61,6 +71,11 @@ class RedisStreamMaintenanceWorker:
             if stream_consumer_name
             else frozenset({STREAM_MAINTENANCE_CONSUMER_NAME})
         )
+        self._scan_lease_key = f"{stream_key}:maintenance-scan-lease"
+        self._scan_lease_owner = (
+            f"{stream_consumer_name or STREAM_MAINTENANCE_CONSUMER_NAME}"
+            f"-{socket.gethostname()}"
+        )
         self._is_running = False
         self._lifecycle_task: asyncio.Task[None] | None = None
 
@@ -101,15 +116,39 @@ class RedisStreamMaintenanceWorker:
                 error=str(recovery_error),
             )
 
+    def _next_scan_delay_seconds(self) -> float:
+        interval = self._redis_settings.stream_maintenance_scan_interval_seconds
+        jitter = self._redis_settings.stream_maintenance_scan_jitter_ratio
+        return interval * random.uniform(1 - jitter, 1 + jitter)
+
+    async def _try_acquire_scan_lease(self) -> bool:
+        """Return True when this pod should run the scan for the current interval.
+
+        The lease is never released explicitly: it expires after one scan
+        interval so the next scan is taken by whichever pod wakes up first.
+        """
+        if not self._redis_settings.stream_maintenance_leader_election_enabled:
+            return True
+
+        lease_ms = int(
+            self._redis_settings.stream_maintenance_scan_interval_seconds * 1000
+        )
+        acquired = await self._redis.set(
+            self._scan_lease_key,
+            self._scan_lease_owner,
+            nx=True,
+            px=max(lease_ms, 1),
+        )
+        return bool(acquired)
+
     async def _worker_loop(self) -> None:
         while self._is_running:
             try:
-                await self._scan_and_requeue()
-                if self._redis_settings.stream_maintenance_consumer_cleanup_enabled:
-                    await self._cleanup_idle_consumers()
-                await asyncio.sleep(
-                    self._redis_settings.stream_maintenance_scan_interval_seconds
-                )
+                if await self._try_acquire_scan_lease():
+                    await self._scan_and_requeue()
+                    if self._redis_settings.stream_maintenance_consumer_cleanup_enabled:
+                        await self._cleanup_idle_consumers()
+                await asyncio.sleep(self._next_scan_delay_seconds())
             except asyncio.CancelledError:
                 break
             except ResponseError as error:
@@ -171,31 +210,15 @@ class RedisStreamMaintenanceWorker:
                     stream_key=self._stream_key,
                 )
 
-            for message_id, fields in messages:
-                if fields is None:
-                    logger.info(
-                        "Acknowledging tombstoned PEL message missing stream entry",
-                        message_id=message_id,
-                        stream_key=self._stream_key,
-                    )
-                    await ack_and_finalize_stream_entry(
-                        self._redis,
-                        stream_key=self._stream_key,
-                        consumer_group=self._consumer_group,
-                        message_id=message_id,
-                    )
-                    continue
-
-                try:
-                    await self._handle_stuck_message(message_id, fields)
-                    total_processed += 1
-                except Exception as error:
-                    logger.exception(
-                        "Failed to handle stuck PEL message, skipping",
-                        message_id=message_id,
-                        stream_key=self._stream_key,
-                        error=str(error),
-                    )
+            try:
+                total_processed += await self._handle_stuck_messages(messages)
+            except Exception as error:
+                logger.exception(
+                    "Failed to handle page of stuck PEL messages, skipping",
+                    message_ids=[message_id for message_id, _ in messages],
+                    stream_key=self._stream_key,
+                    error=str(error),
+                )
 
             if next_cursor == "0-0":
                 break
@@ -223,48 +246,79 @@ class RedisStreamMaintenanceWorker:
                 raise
             await self._recover_missing_stream()
 
-    async def _handle_stuck_message(
-        self, message_id: str, fields: dict[str, str]
-    ) -> None:
-        requeue_count = int(fields.get("requeue_count", "0"))
+    async def _handle_stuck_messages(self, messages: list[StreamEntry]) -> int:
+        """Discard or requeue a page of claimed messages in at most two calls.
+
+        Returns the number of messages discarded or requeued, excluding
+        tombstones and messages that could not be prepared.
+        """
+        finalize_ids: list[str] = []
+        requeue_entries: list[tuple[str, dict[str, str]]] = []
+        processed = 0
         max_requeue_count = self._redis_settings.pel_max_requeue_count
 
-        if requeue_count >= max_requeue_count:
-            logger.warning(
-                "Discarding stuck message: requeue_count exceeded threshold",
-                message_id=message_id,
-                requeue_count=requeue_count,
-                max_requeue_count=max_requeue_count,
-                stream_key=self._stream_key,
-            )
-            await ack_and_finalize_stream_entry(
-                self._redis,
-                stream_key=self._stream_key,
-                consumer_group=self._consumer_group,
-                message_id=message_id,
-            )
-            return
+        for message_id, fields in messages:
+            if fields is None:
+                logger.info(
+                    "Acknowledging tombstoned PEL message missing stream entry",
+                    message_id=message_id,
+                    stream_key=self._stream_key,
+                )
+                finalize_ids.append(message_id)
+                continue
 
-        new_fields = dict(fields)
-        new_fields["requeue_count"] = str(requeue_count + 1)
+            try:
+                requeue_count = int(fields.get("requeue_count", "0"))
+            except Exception as error:
+                logger.exception(
+                    "Failed to handle stuck PEL message, skipping",
+                    message_id=message_id,
+                    stream_key=self._stream_key,
+                    error=str(error),
+                )
+                continue
+
+            processed += 1
+            if requeue_count >= max_requeue_count:
+                logger.warning(
+                    "Discarding stuck message: requeue_count exceeded threshold",
+                    message_id=message_id,
+                    requeue_count=requeue_count,
+                    max_requeue_count=max_requeue_count,
+                    stream_key=self._stream_key,
+                )
+                finalize_ids.append(message_id)
+                continue
+
+            new_fields = dict(fields)
+            new_fields["requeue_count"] = str(requeue_count + 1)
+            requeue_entries.append((message_id, new_fields))
+
+        await ack_and_finalize_stream_entries(
+            self._redis,
+            stream_key=self._stream_key,
+            consumer_group=self._consumer_group,
+            message_ids=finalize_ids,
+        )
 
         try:
-            await requeue_stream_entry(
+            await requeue_stream_entries(
                 self._redis,
                 stream_key=self._stream_key,
                 consumer_group=self._consumer_group,
-                message_id=message_id,
-                fields=new_fields,
+                entries=requeue_entries,
             )
         except ResponseError as error:
             if is_missing_stream_or_group_error(error):
                 await self._recover_missing_stream()
-                return
+                return processed - len(requeue_entries)
             raise
 
-        logger.info(
-            "Requeued stuck PEL message",
-            original_message_id=message_id,
-            new_requeue_count=requeue_count + 1,
-            stream_key=self._stream_key,
-        )
+        for message_id, new_fields in requeue_entries:
+            logger.info(
+                "Requeued stuck PEL message",
+                original_message_id=message_id,
+                new_requeue_count=int(new_fields["requeue_count"]),
+                stream_key=self._stream_key,
+            )
+        return processed
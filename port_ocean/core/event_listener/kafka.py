@@ -1,5 +1,6 @@
 import asyncio
 import json
+import re
 import sys
 from asyncio import ensure_future, Task
 from typing import Any, Literal
@@ -23,6 +24,10 @@ from port_ocean.core.event_listener.base import (
 from pydantic.v1 import validator
 from port_ocean.core.models import EventListenerType, IntegrationFeatureFlag
 
+# Identifiers made of these characters are serialized verbatim in JSON, so their
+# quoted form can be searched for in the raw message bytes.
+_JSON_VERBATIM_IDENTIFIER = re.compile(r"[A-Za-z0-9_.\-]+")
+
 
 class KafkaEventListenerSettings(EventListenerSettings):
     """
@@ -41,6 +46,10 @@ class KafkaEventListenerSettings(EventListenerSettings):
                                        The default value is True.
         consumer_poll_timeout (int): The maximum time in seconds to wait for messages during a poll.
                                      The default value is 1 second.
+        consumer_batch_size (int): The maximum number of messages fetched per consume call.
+                                   The default value is 100.
+        consumer_commit_interval_seconds (float): The minimum time in seconds between asynchronous
+                                                  offset commits. The default value is 5 seconds.
     """
 
     type: Literal[EventListenerType.KAFKA]
@@ -51,6 +60,8 @@ class KafkaEventListenerSettings(EventListenerSettings):
     authentication_mechanism: str = "SCRAM-SHA-512"
     kafka_security_enabled: bool = True
     consumer_poll_timeout: int = 1
+    consumer_batch_size: int = 100
+    consumer_commit_interval_seconds: float = 5.0
 
     @validator("brokers")
     @classmethod
@@ -106,6 +117,11 @@ class KafkaEventListener(BaseEventListener):
         self.integration_type = integration_type
         self._running_task: Task[Any] | None = None
         self.consumer: KafkaConsumer | None = None
+        self._identifier_needle: bytes | None = (
+            f'"{integration_identifier}"'.encode()
+            if _JSON_VERBATIM_IDENTIFIER.fullmatch(integration_identifier)
+            else None
+        )
 
     async def _get_kafka_config(self) -> KafkaConsumerConfig:
         """
@@ -176,6 +192,19 @@ class KafkaEventListener(BaseEventListener):
             and msg_value.get("action", "") == "RESYNC"
         )
 
+    def _may_be_relevant(self, raw_msg: Message) -> bool:
+        """
+        A cheap byte-level prefilter run before JSON decoding.
+        Every message that `_should_be_processed` accepts carries the integration identifier as a JSON string,
+        so messages whose raw bytes do not contain it are skipped without being decoded.
+        """
+        raw_value = raw_msg.value()
+        if raw_value is None:
+            return False
+        if self._identifier_needle is None:
+            return True
+        return self._identifier_needle in raw_value
+
     async def _handle_message(self, raw_msg: Message) -> None:
         """
         A private method that handles incoming Kafka messages.
@@ -219,6 +248,7 @@ class KafkaEventListener(BaseEventListener):
             msg_process=self._handle_message,
             config=await self._get_kafka_config(),
             org_id=self.org_id,
+            msg_filter=self._may_be_relevant,
         )
         if use_resync_requests_consumer:
             logger.info("Starting Kafka consumer for integration resync requests topic")
@@ -1,6 +1,8 @@
+import time
 from abc import abstractmethod
 
 from loguru import logger
+from port_ocean.context.ocean import ocean
 from port_ocean.core.handlers.base import BaseHandler
 from port_ocean.core.handlers.port_app_config.models import ResourceConfig
 from port_ocean.core.ocean_types import (
@@ -8,6 +10,7 @@ from port_ocean.core.ocean_types import (
     CalculationResult,
     EntitySelectorDiff,
 )
+from port_ocean.helpers.metric.metric import MetricType
 
 
 class BaseEntityProcessor(BaseHandler):
@@ -47,4 +50,20 @@ class BaseEntityProcessor(BaseHandler):
         with logger.contextualize(kind=mapping.kind, resource_kind=mapping.kind):
             if not raw_data:
                 return CalculationResult(EntitySelectorDiff([], []), [])
-            return await self._parse_items(mapping, raw_data, parse_all)
+            start = time.monotonic()
+            result = await self._parse_items(mapping, raw_data, parse_all)
+            self._report_batch_metrics(len(raw_data), time.monotonic() - start)
+            return result
+
+    @staticmethod
+    def _report_batch_metrics(items: int, duration: float) -> None:
+        if not ocean.initialized:
+            return
+        try:
+            kind = ocean.metrics.current_resource_kind()
+            ocean.metrics.observe_metric(
+                MetricType.TRANSFORM_BATCH_DURATION_NAME, [kind], duration
+            )
+            ocean.metrics.inc_metric(MetricType.TRANSFORM_ITEMS_NAME, [kind], items)
+        except Exception as e:
+            logger.debug(f"Failed to report transform metrics: {e}")
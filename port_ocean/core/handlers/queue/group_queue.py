@@ -1,7 +1,9 @@
 import asyncio
+import heapq
+import itertools
 from collections import defaultdict, deque
 import time
-from typing import Deque, Dict, Optional, Set, TypeVar, Any
+from typing import Deque, Dict, List, Optional, Set, Tuple, TypeVar, Any
 from contextvars import ContextVar
 
 from loguru import logger
@@ -16,7 +18,12 @@ _current_group: ContextVar[Any] = ContextVar("current_group", default=_NO_GROUP)
 
 
 class GroupQueue(AbstractQueue[T]):
-    """Queue with exclusive processing per group."""
+    """Queue with exclusive processing per group.
+
+    Groups that are non-empty and unlocked are kept in a ready deque, so
+    ``get`` and ``commit`` are O(1) regardless of the number of groups, and
+    lock expiry is driven by a heap of deadlines instead of a full scan.
+    """
 
     def __init__(
         self,
@@ -28,18 +35,33 @@ class GroupQueue(AbstractQueue[T]):
         self.group_key = group_key
         self._queues: Dict[MaybeStr, Deque[T]] = defaultdict(deque)
         self._locked: Set[MaybeStr] = set()
-        self._queue_not_empty = asyncio.Condition()
+        self._ready: Deque[MaybeStr] = deque()
+        self._ready_set: Set[MaybeStr] = set()
+        self._size = 0
+        self._mutex = asyncio.Lock()
+        self._queue_not_empty = asyncio.Condition(self._mutex)
+        self._queue_drained = asyncio.Condition(self._mutex)
         self.lock_timeout = lock_timeout
-        self._lock_timestamps: Dict[MaybeStr, float] = {}
+        self._lock_deadlines: Dict[MaybeStr, float] = {}
+        self._deadline_heap: List[Tuple[float, int, MaybeStr]] = []
+        self._heap_counter = itertools.count()
+        self._lock_added = asyncio.Event()
         self._timeout_task: Optional[asyncio.Task[None]] = None
 
     async def _background_timeout_check(self) -> None:
-        """Periodically release locks that have timed out."""
+        """Release locks as their deadlines pass, sleeping until the next one."""
         while True:
             try:
-                await asyncio.sleep(self.lock_timeout / 4)
-                async with self._queue_not_empty:
-                    await self._release_expired_locks()
+                async with self._mutex:
+                    self._release_expired_locks()
+                    next_deadline = self._next_deadline()
+                    if next_deadline is None:
+                        self._lock_added.clear()
+
+                if next_deadline is None:
+                    await self._lock_added.wait()
+                else:
+                    await asyncio.sleep(max(next_deadline - time.monotonic(), 0))
             except asyncio.CancelledError:
                 break
 
@@ -53,45 +75,97 @@ class GroupQueue(AbstractQueue[T]):
             )
         return getattr(item, self.group_key)
 
+    def _mark_ready(self, group: MaybeStr) -> None:
+        """Schedule a group for processing if it has items and is unlocked."""
+        if (
+            group in self._locked
+            or group in self._ready_set
+            or not self._queues.get(group)
+        ):
+            return
+        self._ready.append(group)
+        self._ready_set.add(group)
+        self._queue_not_empty.notify(1)
+
+    def _unlock(self, group: MaybeStr) -> None:
+        self._locked.discard(group)
+        self._lock_deadlines.pop(group, None)
+        self._mark_ready(group)
+
+    def _notify_if_drained(self) -> None:
+        if not self._queues and not self._locked:
+            self._queue_drained.notify_all()
+
+    def _next_deadline(self) -> float | None:
+        """Return the earliest live lock deadline, discarding stale heap entries."""
+        while self._deadline_heap:
+            deadline, _, group = self._deadline_heap[0]
+            if self._lock_deadlines.get(group) == deadline:
+                return deadline
+            heapq.heappop(self._deadline_heap)
+        return None
+
+    def _compact_deadline_heap(self) -> None:
+        """Drop entries of committed locks once they dominate the heap."""
+        if len(self._deadline_heap) <= 2 * len(self._lock_deadlines) + 64:
+            return
+        self._deadline_heap = [
+            entry
+            for entry in self._deadline_heap
+            if self._lock_deadlines.get(entry[2]) == entry[0]
+        ]
+        heapq.heapify(self._deadline_heap)
+
     async def put(self, item: T) -> None:
         """Add item to its group's queue."""
         group_key = self._extract_group_key(item)
-        async with self._queue_not_empty:
+        async with self._mutex:
             self._queues[group_key].append(item)
-            self._queue_not_empty.notify_all()
+            self._size += 1
+            self._mark_ready(group_key)
 
-    async def _release_expired_locks(self) -> None:
+    def _release_expired_locks(self) -> None:
         """Release locks that have exceeded the timeout."""
-        now = time.time()
-        expired_groups = []
-
-        for group, timestamp in list(self._lock_timestamps.items()):
-            if now - timestamp > self.lock_timeout:
-                expired_groups.append(group)
-                logger.warning(f"Releasing expired lock for group {group}")
-                self._locked.discard(group)
-                del self._lock_timestamps[group]
-
-        if expired_groups:
-            self._queue_not_empty.notify_all()
+        now = time.monotonic()
+        while (deadline := self._next_deadline()) is not None and deadline <= now:
+            _, _, group = heapq.heappop(self._deadline_heap)
+            logger.warning(f"Releasing expired lock for group {group}")
+            self._unlock(group)
+        self._notify_if_drained()
+
+    def _lock(self, group: MaybeStr) -> None:
+        deadline = time.monotonic() + self.lock_timeout
+        self._locked.add(group)
+        self._lock_deadlines[group] = deadline
+        heapq.heappush(self._deadline_heap, (deadline, next(self._heap_counter), group))
+        self._compact_deadline_heap()
+        self._lock_added.set()
 
     async def get(self) -> T:
         """Get the next item from an unlocked group, locking that group."""
         if self._timeout_task is None or self._timeout_task.done():
             self._timeout_task = asyncio.create_task(self._background_timeout_check())
 
-        async with self._queue_not_empty:
+        async with self._mutex:
             while True:
-                await self._release_expired_locks()
+                self._release_expired_locks()
 
-                for group, queue in self._queues.items():
+                while self._ready:
+                    group = self._ready.popleft()
+                    self._ready_set.discard(group)
+                    queue = self._queues.get(group)
                     if queue and group not in self._locked:
-                        self._locked.add(group)
-                        self._lock_timestamps[group] = time.time()
+                        self._lock(group)
                         _current_group.set(group)
                         return queue[0]
 
-                await self._queue_not_empty.wait()
+                try:
+                    await self._queue_not_empty.wait()
+                except asyncio.CancelledError:
+                    # Hand a notification we may have consumed to another waiter
+                    if self._ready:
+                        self._queue_not_empty.notify(1)
+                    raise
 
     async def commit(self) -> None:
         """Remove the current item and unlock its group."""
@@ -100,23 +174,23 @@ class GroupQueue(AbstractQueue[T]):
             logger.warning("commit() called without active get()")
             return
 
-        async with self._queue_not_empty:
+        async with self._mutex:
             queue = self._queues.get(group)
             if queue:
                 queue.popleft()
+                self._size -= 1
                 if not queue:
                     del self._queues[group]
 
-            self._locked.discard(group)
-            self._lock_timestamps.pop(group, None)
+            self._unlock(group)
             _current_group.set(_NO_GROUP)
-            self._queue_not_empty.notify_all()
+            self._notify_if_drained()
 
     async def teardown(self) -> None:
         """Wait until all queues are empty and no groups are locked."""
-        async with self._queue_not_empty:
-            while any(self._queues.values()) or self._locked:
-                await self._queue_not_empty.wait()
+        async with self._mutex:
+            while self._queues or self._locked:
+                await self._queue_drained.wait()
 
         if self._timeout_task and not self._timeout_task.done():
             self._timeout_task.cancel()
@@ -127,12 +201,16 @@ class GroupQueue(AbstractQueue[T]):
 
     async def size(self) -> int:
         """Return total number of items across all groups."""
-        async with self._queue_not_empty:
-            return sum(len(queue) for queue in self._queues.values())
+        async with self._mutex:
+            return self._size
 
     async def force_unlock_all(self) -> None:
         """Force unlock all groups."""
-        async with self._queue_not_empty:
+        async with self._mutex:
+            locked = list(self._locked)
             self._locked.clear()
-            self._lock_timestamps.clear()
-            self._queue_not_empty.notify_all()
+            self._lock_deadlines.clear()
+            self._deadline_heap.clear()
+            for group in locked:
+                self._mark_ready(group)
+            self._notify_if_drained()
@@ -10,6 +10,7 @@ from starlette.requests import ClientDisconnect
 import asyncio
 import base64
 import json
+from datetime import datetime, timezone
 
 from port_ocean.context.ocean import ocean
 from port_ocean.context.event import EventType, event_context
@@ -43,6 +44,12 @@ from port_ocean.consumers.redis_stream_consumer import RedisStreamConsumer
 from port_ocean.core.models import LiveEventsConsumerType
 from port_ocean.config.settings import RedisLiveEventsSettings
 from port_ocean.exceptions.core import UnsupportedLiveEventsConsumerTypeException
+from port_ocean.helpers.metric.metric import MetricType
+from port_ocean.helpers.tracing import (
+    SpanKind,
+    parent_span_id_from_headers,
+    start_span,
+)
 
 # Cap JSON UTF-8 size before base64 when logging under events_debug_logging (1 MiB).
 _WEBHOOK_DEBUG_LOG_MAX_JSON_UTF8_BYTES = 1024 * 1024
@@ -96,9 +103,8 @@ class LiveEventsProcessorManager(LiveEventsMixin, EventsMixin):
                 task.add_done_callback(self._event_processor_tasks.discard)
 
     async def _on_live_event_message(self, path: str, event: WebhookEvent) -> None:
-        await self._process_webhook_event(
-            path, 0, event
-        )  # for parallel processing, multiple LE pods are required.
+        # Concurrency is handled by the consumer (see LiveEventsRedisSettings.worker_count).
+        await self._process_webhook_event(path, 0, event)
 
     def _create_live_events_consumer(
         self, config: "IntegrationConfiguration"
@@ -137,10 +143,21 @@ class LiveEventsProcessorManager(LiveEventsMixin, EventsMixin):
             Tuple[ResourceConfig | None, AbstractWebhookProcessor, int | None]
         ] = []
         try:
-            with logger.contextualize(
-                worker=worker_id,
-                webhook_path=path,
-                trace_id=event.trace_id,
+            with (
+                logger.contextualize(
+                    worker=worker_id,
+                    webhook_path=path,
+                    trace_id=event.trace_id,
+                ),
+                start_span(
+                    "webhook.process",
+                    SpanKind.CONSUMER,
+                    attributes={"ocean.webhook_path": path},
+                    trace_id=event.trace_id,
+                    parent_span_id=parent_span_id_from_headers(
+                        event.headers, event.trace_id
+                    ),
+                ),
             ):
                 async with event_context(
                     EventType.HTTP_REQUEST,
@@ -204,6 +221,7 @@ class LiveEventsProcessorManager(LiveEventsMixin, EventsMixin):
             event = None
             try:
                 event = await queue.get()
+                self._report_queue_wait(path, event)
                 await self._process_webhook_event(path, worker_id, event)
             except asyncio.CancelledError:
                 logger.info(f"Worker {worker_id} for {path} shutting down")
@@ -218,6 +236,16 @@ class LiveEventsProcessorManager(LiveEventsMixin, EventsMixin):
                         f"Unexpected error in queue commit in worker {worker_id} for {path}: {e}"
                     )
 
+    @staticmethod
+    def _report_queue_wait(path: str, event: WebhookEvent) -> None:
+        try:
+            wait = (datetime.now(timezone.utc) - event.created_at).total_seconds()
+            ocean.metrics.observe_metric(
+                MetricType.WEBHOOK_QUEUE_WAIT_NAME, [path], max(wait, 0)
+            )
+        except Exception as e:
+            logger.debug(f"Failed to report webhook queue wait: {e}")
+
     async def _extract_matching_processors(
         self, webhook_event: WebhookEvent, path: str
     ) -> list[tuple[ResourceConfig | None, AbstractWebhookProcessor, int | None]]:
@@ -307,10 +335,17 @@ class LiveEventsProcessorManager(LiveEventsMixin, EventsMixin):
     ) -> WebhookEventRawResults:
         """Execute a single processor within a max processing time"""
         try:
-            return await asyncio.wait_for(
-                self._process_webhook_request(processor, resource, resource_index),
-                timeout=self._max_event_processing_seconds,
-            )
+            with start_span(
+                "webhook.processor",
+                attributes={
+                    "ocean.processor": type(processor).__name__,
+                    "ocean.kind": resource.kind if resource else "",
+                },
+            ):
+                return await asyncio.wait_for(
+                    self._process_webhook_request(processor, resource, resource_index),
+                    timeout=self._max_event_processing_seconds,
+                )
         except asyncio.TimeoutError:
             raise asyncio.TimeoutError(
                 f"Processor processing timed out after {self._max_event_processing_seconds} seconds"
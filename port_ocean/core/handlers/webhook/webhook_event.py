@@ -3,12 +3,13 @@ from collections.abc import Mapping
 from datetime import datetime, timezone
 from enum import StrEnum
 from typing import Any, Protocol
-from uuid import uuid4
+from uuid import UUID, uuid4
 from fastapi import Request
 from loguru import logger
 
 from port_ocean.core.handlers.port_app_config.models import ResourceConfig
 from port_ocean.core.ocean_types import RAW_ITEM
+from port_ocean.helpers.tracing import get_tracer, trace_id_from_headers
 
 EventPayload = dict[str, Any]
 EventHeaders = dict[str, str]
@@ -90,7 +91,11 @@ class WebhookEvent(LiveEvent):
 
     @classmethod
     async def from_request(cls, request: Request) -> "WebhookEvent":
-        trace_id = str(uuid4())
+        # Continue the sender's trace when it sent a W3C traceparent header
+        incoming_trace_id = (
+            trace_id_from_headers(request.headers) if get_tracer().enabled else None
+        )
+        trace_id = str(UUID(incoming_trace_id) if incoming_trace_id else uuid4())
         payload = await request.json()
         created_at = datetime.now(timezone.utc)
 
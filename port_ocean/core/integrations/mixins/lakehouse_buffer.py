@@ -7,6 +7,7 @@ from loguru import logger
 from port_ocean.context.ocean import ocean
 from port_ocean.core.models import LakehouseDataEntry, LakehouseDataEntryBatch, LakehouseEventType
 from port_ocean.core.utils.json_compat import make_json_compatible
+from port_ocean.helpers.tracing import start_span
 
 _DEFAULT_MAX_SIZE_BYTES = 100 * 1024 * 1024  # 100 MB
 _DEFAULT_MAX_BUFFER_COUNT = 50
@@ -75,10 +76,18 @@ class LakehouseBuffer:
             data=self._buffer,
         )
         try:
-            await ocean.port_client.post_integration_raw_data_batch(
-                self.sync_id,
-                event,
-            )
+            with start_span(
+                "lakehouse.flush",
+                attributes={
+                    "ocean.kind": self.kind,
+                    "ocean.items": len(self._buffer),
+                    "ocean.estimated_bytes": self._current_size_bytes,
+                },
+            ):
+                await ocean.port_client.post_integration_raw_data_batch(
+                    self.sync_id,
+                    event,
+                )
         except Exception as e:
             logger.warning(
                 f"Failed to flush lakehouse buffer for kind '{self.kind}': {e}. "
@@ -57,6 +57,8 @@ from port_ocean.helpers.metric.metric import (
 )
 from port_ocean.helpers.metric.utils import TimeMetric, TimeMetricWithResourceKind
 from port_ocean.helpers.monitor.monitor import start_monitoring, stop_monitoring
+from port_ocean.helpers.replay_recorder import resync_recording
+from port_ocean.helpers.tracing import current_span, start_span, traced
 
 SEND_RAW_DATA_EXAMPLES_AMOUNT = 5
 LIFECYCLE_ABORT_POLL_INTERVAL_SECONDS = 10
@@ -79,12 +81,14 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
     async def _on_resync(self, kind: str) -> RAW_RESULT:
         raise NotImplementedError("on_resync must be implemented")
 
+    @traced("resync.extract")
     async def _get_resource_raw_results(
         self,
         resource_config: ResourceConfig,
         send_raw_data_examples_amount: int = 0,
     ) -> tuple[RESYNC_RESULT, list[Exception]]:
         logger.info(f"Fetching {resource_config.kind} resync results")
+        current_span().set_attribute("ocean.kind", resource_config.kind)
 
         is_incremental = event.event_type == EventType.INCREMENTAL_RESYNC
         strategy_key = "incremental" if is_incremental else "resync"
@@ -282,7 +286,14 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
         parse_all: bool = False,
         batch_index: int = 1,
     ) -> CalculationResult:
-        with logger.contextualize(etl_phase=ETLPhase.TRANSFORM):
+        with logger.contextualize(etl_phase=ETLPhase.TRANSFORM), start_span(
+            "resync.transform",
+            attributes={
+                "ocean.kind": resource.kind,
+                "ocean.batch_index": batch_index,
+                "ocean.raw_items": len(results),
+            },
+        ) as span:
             logger.info(
                 "Starting transform phase",
                 batch_index=batch_index,
@@ -291,6 +302,12 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
             objects_diff = await self._calculate_raw([(resource, results)], parse_all)
             entities_transformed = len(objects_diff[0].entity_selector_diff.passed)
             entities_failed = len(objects_diff[0].entity_selector_diff.failed)
+            span.set_attributes(
+                {
+                    "ocean.entities_transformed": entities_transformed,
+                    "ocean.entities_failed": entities_failed,
+                }
+            )
             logger.info(
                 "Transform phase complete",
                 batch_index=batch_index,
@@ -308,7 +325,14 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
             value=entities_failed,
         )
 
-        with logger.contextualize(etl_phase=ETLPhase.LOAD):
+        with logger.contextualize(etl_phase=ETLPhase.LOAD), start_span(
+            "resync.load",
+            attributes={
+                "ocean.kind": resource.kind,
+                "ocean.batch_index": batch_index,
+                "ocean.entities_to_load": entities_transformed,
+            },
+        ) as span:
             logger.info(
                 "Starting load phase",
                 batch_index=batch_index,
@@ -377,6 +401,7 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
                     objects_diff[0].entity_selector_diff.passed, user_agent_type
                 )
 
+            span.set_attribute("ocean.entities_upserted", len(modified_objects))
             logger.info(
                 "Load phase complete",
                 batch_index=batch_index,
@@ -899,7 +924,10 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
         index: int,
         user_agent_type: UserAgentType,
     ) -> tuple[list[Entity], list[Exception]]:
-        with logger.contextualize(resource_kind=resource.kind, index=index):
+        with logger.contextualize(resource_kind=resource.kind, index=index), start_span(
+            "resync.kind",
+            attributes={"ocean.kind": resource.kind, "ocean.resource_index": index},
+        ):
             return await self._process_resource(resource, index, user_agent_type)
 
     @TimeMetricWithResourceKind(MetricPhase.RESYNC)
@@ -1254,6 +1282,7 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
                 ocean.metrics.clear_sync_context()
 
     @TimeMetric(MetricPhase.RESYNC)
+    @traced("resync")
     async def sync_raw_all(
         self,
         _: dict[Any, Any] | None = None,
@@ -1278,8 +1307,11 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
             EventType.RESYNC,
             trigger_type=trigger_type,
             attributes={"resync_start_time": datetime.now(timezone.utc)},
-        ):
+        ), resync_recording(event.id, ocean.config.integration.type) as recording:
             ocean.metrics.event_id = event.id
+            current_span().set_attributes(
+                {"ocean.event_id": event.id, "ocean.trigger_type": trigger_type}
+            )
 
             # If a resync is triggered due to a mappings change, we want to make sure that we have the updated version
             # rather than the old cache
@@ -1287,6 +1319,10 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
                 use_cache=False
             )
             logger.info(f"Resync will use the following mappings: {json.loads(app_config.json())}")
+            if recording is not None:
+                recording.record_port_app_config(
+                    json.loads(app_config.json(by_alias=True, exclude_unset=True))
+                )
 
             dsp_enabled = await is_dsp_mode_enabled()
             lifecycle_poll_task: asyncio.Task[None] | None = None
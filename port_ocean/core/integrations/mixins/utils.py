@@ -27,6 +27,7 @@ from port_ocean.exceptions.core import (
 )
 from port_ocean.helpers.metric.metric import MetricType, MetricPhase
 from port_ocean.helpers.monitor.monitor import get_monitor
+from port_ocean.helpers.tracing import start_span
 from port_ocean.utils.async_http import _http_client
 from port_ocean.core.models import IntegrationFeatureFlag, LakehouseDataEntry, LakehouseDataEntryMetadata, ProcessingMode
 
@@ -317,11 +318,18 @@ async def resync_generator_wrapper(
     generator = fn(kind)
     errors = []
     remaining_examples_to_send = send_raw_data_examples_amount
+    page = 0
     try:
         while True:
             try:
                 with resync_error_handling():
-                    result = validate_result(await anext(generator))
+                    page += 1
+                    with start_span(
+                        "resync.page",
+                        attributes={"ocean.kind": kind, "ocean.page": page},
+                    ) as span:
+                        result = validate_result(await anext(generator))
+                        span.set_attribute("ocean.raw_items", len(result))
                     sent_examples = await send_raw_data_examples(
                         result, kind, remaining_examples_to_send
                     )
@@ -30,6 +30,9 @@ class CreatePortResourcesOrigin(StrEnum):
 class CachingStorageMode(StrEnum):
     disk = "disk"
     memory = "memory"
+    bounded_memory = "bounded_memory"
+    sqlite = "sqlite"
+    redis = "redis"
 
 
 class Runtime(Enum):
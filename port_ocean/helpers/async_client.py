@@ -4,7 +4,20 @@ import httpx
 from loguru import logger
 
 from port_ocean.context.ocean import ocean
-from port_ocean.helpers.ip_blocker import IPBlockerTransport
+from port_ocean.helpers.connection_pool_metrics import ConnectionPoolMetricsTransport
+from port_ocean.helpers.ip_blocker import (
+    IPBlockerTransport,
+    pin_to_allowed_ip_addresses,
+)
+from port_ocean.helpers.rate_limit import RateLimiter, RateLimitTransport
+from port_ocean.helpers.replay_recorder import (
+    ResyncRecordingTransport,
+    is_resync_recorder_configured,
+)
+from port_ocean.helpers.request_metrics import (
+    RequestDurationMetric,
+    RequestDurationMetricsTransport,
+)
 from port_ocean.helpers.retry import RetryConfig, RetryTransport
 from port_ocean.helpers.ssl import resolve_verify_param
 from port_ocean.helpers.stream import Stream
@@ -16,6 +29,13 @@ class OceanAsyncClient(httpx.AsyncClient):
 
     When ``verify`` is not passed, uses ``ocean.config.ssl.third_party`` (``OCEAN__SSL__THIRD_PARTY__*``).
     Pass ``verify`` explicitly to override (e.g. Port API uses ``ssl.port``).
+
+    Pass ``rate_limiter`` to send every attempt, retries included, through a
+    ``RateLimiter`` bucket keyed by host, and ``pool_metrics_name`` to report
+    connection pool waits and reuse under that client name. Pass
+    ``request_duration_metric`` to observe every attempt's duration in it.
+    Attempts are recorded for replay while a resync is recorded (see
+    ``replay_recorder``).
     """
 
     def __init__(
@@ -23,9 +43,15 @@ class OceanAsyncClient(httpx.AsyncClient):
         transport_class: Type[RetryTransport] = RetryTransport,
         transport_kwargs: dict[str, Any] | None = None,
         retry_config: RetryConfig | None = None,
+        rate_limiter: RateLimiter | None = None,
+        pool_metrics_name: str | None = None,
+        request_duration_metric: RequestDurationMetric | None = None,
         **kwargs: Any,
     ):
         self._transport_kwargs = transport_kwargs
+        self._rate_limiter = rate_limiter
+        self._pool_metrics_name = pool_metrics_name
+        self._request_duration_metric = request_duration_metric
         self._transport_class = transport_class
         self._retry_config = retry_config
         if "verify" not in kwargs:
@@ -39,17 +65,38 @@ class OceanAsyncClient(httpx.AsyncClient):
             return transport
         return IPBlockerTransport(wrapped=transport)
 
+    def _wrap_connection_transport(
+        self, transport: httpx.AsyncBaseTransport
+    ) -> httpx.AsyncBaseTransport:
+        if self._pool_metrics_name is not None:
+            transport = ConnectionPoolMetricsTransport(
+                transport, self._pool_metrics_name
+            )
+        if self._request_duration_metric is not None:
+            transport = RequestDurationMetricsTransport(
+                transport, self._request_duration_metric
+            )
+        if is_resync_recorder_configured():
+            transport = ResyncRecordingTransport(transport)
+        if self._rate_limiter is not None:
+            transport = RateLimitTransport(transport, self._rate_limiter)
+        return transport
+
     def _init_transport(  # type: ignore[override]
         self,
         transport: httpx.AsyncBaseTransport | None = None,
         **kwargs: Any,
     ) -> httpx.AsyncBaseTransport:
         if transport is not None:
+            transport = self._wrap_connection_transport(transport)
             transport = self._wrap_with_ip_blocker_if_needed(transport)
             return super()._init_transport(transport=transport, **kwargs)
 
+        http_transport = httpx.AsyncHTTPTransport(**kwargs)
+        if not ocean.config.disable_ip_outbound_blocker:
+            pin_to_allowed_ip_addresses(http_transport)
         inner = self._transport_class(
-            wrapped_transport=httpx.AsyncHTTPTransport(**kwargs),
+            wrapped_transport=self._wrap_connection_transport(http_transport),
             retry_config=self._retry_config,
             logger=logger,
             **(self._transport_kwargs or {}),
@@ -60,7 +107,9 @@ class OceanAsyncClient(httpx.AsyncClient):
         self, proxy: httpx.Proxy, **kwargs: Any
     ) -> httpx.AsyncBaseTransport:
         inner = self._transport_class(
-            wrapped_transport=httpx.AsyncHTTPTransport(proxy=proxy, **kwargs),
+            wrapped_transport=self._wrap_connection_transport(
+                httpx.AsyncHTTPTransport(proxy=proxy, **kwargs)
+            ),
             retry_config=self._retry_config,
             logger=logger,
             **(self._transport_kwargs or {}),
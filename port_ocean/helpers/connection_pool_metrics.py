@@ -0,0 +1,88 @@
+import time
+from typing import Any
+
+import httpx
+from loguru import logger
+
+from port_ocean.context.ocean import ocean
+from port_ocean.helpers.metric.metric import MetricType
+
+
+class _PoolTrace:
+    """Collects httpcore trace events for a single request attempt."""
+
+    def __init__(self) -> None:
+        self.started_at = time.monotonic()
+        self.connect_started_at: float | None = None
+        self.headers_sent_at: float | None = None
+
+    def on_event(self, event_name: str) -> None:
+        if event_name == "connection.connect_tcp.started":
+            self.connect_started_at = time.monotonic()
+        elif (
+            event_name.endswith(".send_request_headers.started")
+            and self.headers_sent_at is None
+        ):
+            self.headers_sent_at = time.monotonic()
+
+    @property
+    def new_connection(self) -> bool:
+        return self.connect_started_at is not None
+
+    @property
+    def pool_wait(self) -> float | None:
+        """Time until the request got a connection: either it started opening a
+        new one or it started writing on an existing one."""
+        acquired_at = self.connect_started_at or self.headers_sent_at
+        if acquired_at is None:
+            return None
+        return acquired_at - self.started_at
+
+
+class ConnectionPoolMetricsTransport(httpx.AsyncBaseTransport):
+    """Reports pool waits and connection reuse of the wrapped connection pool.
+
+    Uses httpcore's ``trace`` request extension, so it has to wrap the
+    ``httpx.AsyncHTTPTransport`` directly (under any retry transport, so each
+    attempt is measured).
+    """
+
+    def __init__(self, wrapped: httpx.AsyncBaseTransport, client_name: str) -> None:
+        self._wrapped = wrapped
+        self._client_name = client_name
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        pool_trace = _PoolTrace()
+        extensions = request.extensions
+        inner_trace = extensions.get("trace")
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            pool_trace.on_event(event_name)
+            if inner_trace is not None:
+                await inner_trace(event_name, info)
+
+        request.extensions = {**extensions, "trace": trace}
+        try:
+            return await self._wrapped.handle_async_request(request)
+        finally:
+            request.extensions = extensions
+            self._report(pool_trace)
+
+    def _report(self, pool_trace: _PoolTrace) -> None:
+        pool_wait = pool_trace.pool_wait
+        if pool_wait is None or not ocean.initialized:
+            return
+        try:
+            ocean.metrics.inc_metric(
+                MetricType.HTTP_POOL_WAIT_NAME, [self._client_name], pool_wait
+            )
+            ocean.metrics.inc_metric(
+                MetricType.HTTP_POOL_REQUESTS_NAME,
+                [self._client_name, "new" if pool_trace.new_connection else "reused"],
+                1,
+            )
+        except Exception as e:
+            logger.debug(f"Failed to report connection pool metrics: {e}")
+
+    async def aclose(self) -> None:
+        await self._wrapped.aclose()
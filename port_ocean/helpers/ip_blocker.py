@@ -4,9 +4,14 @@ and other non-public IP ranges. Resolve host from URL to IP(s), block if any fal
 """
 
 import asyncio
+import copy
 import ipaddress
 import socket
+import time
+from collections import OrderedDict
+from typing import Any, Iterable
 
+import httpcore
 import httpx
 from loguru import logger
 
@@ -99,15 +104,100 @@ _TRUSTED_SUBDOMAINS = (
 )
 
 
-async def _resolve_to_ip_addresses(hostname: str) -> list[str]:
-    if not hostname:
-        return []
-    try:
-        ipaddress.ip_address(hostname)
-        return [hostname]
-    except ValueError:
-        pass
+# getaddrinfo does not expose record TTLs, so resolved hosts are kept for a fixed
+# time. Failed lookups are cached briefly so a dead host doesn't hit the resolver
+# on every retry.
+_DNS_CACHE_TTL_SECONDS = 60.0
+_DNS_NEGATIVE_CACHE_TTL_SECONDS = 5.0
+_DNS_CACHE_MAX_SIZE = 1024
+
+
+class _DNSCache:
+    """TTL cache in front of getaddrinfo with single-flight lookups per host."""
+
+    def __init__(self, ttl: float, negative_ttl: float, max_size: int) -> None:
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._max_size = max_size
+        self._entries: OrderedDict[str, tuple[float, list[str] | OSError]] = (
+            OrderedDict()
+        )
+        self._inflight: dict[str, asyncio.Future[list[str]]] = {}
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _store(self, hostname: str, result: list[str] | OSError, ttl: float) -> None:
+        self._entries[hostname] = (time.monotonic() + ttl, result)
+        self._entries.move_to_end(hostname)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def _cached(self, hostname: str) -> list[str] | OSError | None:
+        entry = self._entries.get(hostname)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at <= time.monotonic():
+            del self._entries[hostname]
+            return None
+        self._entries.move_to_end(hostname)
+        return result
 
+    async def resolve(self, hostname: str) -> list[str]:
+        cached = self._cached(hostname)
+        if isinstance(cached, OSError):
+            # A copy, so the cached error doesn't collect every raise's traceback.
+            raise copy.copy(cached)
+        if cached is not None:
+            return list(cached)
+
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight.get(hostname)
+        if inflight is not None and inflight.get_loop() is loop:
+            try:
+                return list(await asyncio.shield(inflight))
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if not inflight.cancelled() or (task and task.cancelling()):
+                    raise
+                # The task doing the lookup was cancelled, not this one.
+                return await self.resolve(hostname)
+
+        future: asyncio.Future[list[str]] = loop.create_future()
+        self._inflight[hostname] = future
+        try:
+            ip_addresses = await _getaddrinfo(hostname)
+        except OSError as error:
+            self._store(hostname, copy.copy(error), self._negative_ttl)
+            future.set_exception(error)
+            # Mark the exception as retrieved in case nobody else was waiting.
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            self._store(
+                hostname,
+                ip_addresses,
+                self._ttl if ip_addresses else self._negative_ttl,
+            )
+            future.set_result(ip_addresses)
+            return list(ip_addresses)
+        finally:
+            if self._inflight.get(hostname) is future:
+                del self._inflight[hostname]
+
+
+_DNS_CACHE = _DNSCache(
+    ttl=_DNS_CACHE_TTL_SECONDS,
+    negative_ttl=_DNS_NEGATIVE_CACHE_TTL_SECONDS,
+    max_size=_DNS_CACHE_MAX_SIZE,
+)
+
+
+async def _getaddrinfo(hostname: str) -> list[str]:
     addr_info = await asyncio.to_thread(
         socket.getaddrinfo,
         hostname,
@@ -118,6 +208,18 @@ async def _resolve_to_ip_addresses(hostname: str) -> list[str]:
     return list[str](dict.fromkeys(str(info[4][0]) for info in addr_info if info[4]))
 
 
+async def _resolve_to_ip_addresses(hostname: str) -> list[str]:
+    if not hostname:
+        return []
+    try:
+        ipaddress.ip_address(hostname)
+        return [hostname]
+    except ValueError:
+        pass
+
+    return await _DNS_CACHE.resolve(hostname)
+
+
 def _is_blocked(ip_str: str) -> bool:
     try:
         ip = ipaddress.ip_address(ip_str)
@@ -127,32 +229,42 @@ def _is_blocked(ip_str: str) -> bool:
     return any(ip in n for n in nets)
 
 
+def _is_trusted(hostname: str) -> bool:
+    return any(hostname.endswith(subdomain) for subdomain in _TRUSTED_SUBDOMAINS)
+
+
+async def _allowed_ip_addresses(hostname: str) -> list[str]:
+    ip_addresses: list[str] = await _resolve_to_ip_addresses(hostname)
+    if not ip_addresses:
+        raise BlockedIPError(
+            f"Request to {hostname} was blocked: Host could not resolve to any IP address"
+        )
+    blocked_ip_addresses: list[str] = [
+        ip_address for ip_address in ip_addresses if _is_blocked(ip_address)
+    ]
+    if blocked_ip_addresses:
+        raise BlockedIPError(
+            f"Request to {hostname} was blocked: Host IP address {str(blocked_ip_addresses)} is not within the allowed ranges"
+        )
+    return ip_addresses
+
+
 class IPBlockerTransport(httpx.AsyncBaseTransport):
-    """Blocks requests whose host resolves to a private/loopback/link-local/etc IP."""
+    """Blocks requests whose host resolves to a private/loopback/link-local/etc IP.
+
+    The request itself is passed on unchanged. Pinning the connection to the
+    addresses that were checked is done by ``pin_to_allowed_ip_addresses``.
+    """
 
     def __init__(self, wrapped: httpx.AsyncBaseTransport) -> None:
         self._wrapped = wrapped
 
     async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
         hostname: str = request.url.host
-        if any(hostname.endswith(subdomain) for subdomain in _TRUSTED_SUBDOMAINS):
+        if _is_trusted(hostname):
             return await self._wrapped.handle_async_request(request)
 
-        ip_addresses: list[str] = await _resolve_to_ip_addresses(hostname)
-        if not ip_addresses:
-            raise BlockedIPError(
-                f"Request to {hostname} was blocked: Host could not resolve to any IP address"
-            )
-        blocked_ip_addresses: list[str] = [
-            ip_address for ip_address in ip_addresses if _is_blocked(ip_address)
-        ]
-        if blocked_ip_addresses:
-            raise BlockedIPError(
-                f"Request to {hostname} was blocked: Host IP address {str(blocked_ip_addresses)} is not within the allowed ranges"
-            )
-        request.url = request.url.copy_with(host=ip_addresses[0])
-        request.headers["Host"] = hostname
-        request.extensions = {**request.extensions, "sni_hostname": hostname}
+        ip_addresses = await _allowed_ip_addresses(hostname)
         logger.debug(
             f"Request to {hostname} was allowed: Host IP address {str(ip_addresses)} is within the allowed ranges"
         )
@@ -160,3 +272,66 @@ class IPBlockerTransport(httpx.AsyncBaseTransport):
 
     async def aclose(self) -> None:
         await self._wrapped.aclose()
+
+
+class _AllowedIPNetworkBackend(httpcore.AsyncNetworkBackend):
+    """Opens connections only to addresses that pass the IP check.
+
+    The hostname is resolved through the same cache the transport checked, and
+    the connection is made to the resolved addresses in order, so DNS cannot
+    rebind it to a different address between the check and the connect. The
+    URL, Host header and TLS server name all keep the original hostname.
+    """
+
+    def __init__(self, wrapped: httpcore.AsyncNetworkBackend) -> None:
+        self._wrapped = wrapped
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Iterable[Any] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        if _is_trusted(host):
+            return await self._wrapped.connect_tcp(
+                host, port, timeout, local_address, socket_options
+            )
+
+        ip_addresses = await _allowed_ip_addresses(host)
+        for ip_address in ip_addresses[:-1]:
+            try:
+                return await self._wrapped.connect_tcp(
+                    ip_address, port, timeout, local_address, socket_options
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as error:
+                logger.debug(
+                    f"Connection to {host} at {ip_address} failed, trying the next address: {error!r}"
+                )
+        return await self._wrapped.connect_tcp(
+            ip_addresses[-1], port, timeout, local_address, socket_options
+        )
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: Iterable[Any] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._wrapped.connect_unix_socket(path, timeout, socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._wrapped.sleep(seconds)
+
+
+def pin_to_allowed_ip_addresses(transport: httpx.AsyncHTTPTransport) -> None:
+    """Make ``transport`` connect only to addresses that pass the IP check.
+
+    Only direct connections can be pinned: behind a proxy the proxy opens the
+    upstream connection, so requests are checked by ``IPBlockerTransport`` alone.
+    """
+    pool = transport._pool
+    if type(pool) is not httpcore.AsyncConnectionPool:
+        return
+    pool._network_backend = _AllowedIPNetworkBackend(pool._network_backend)
@@ -1,16 +1,17 @@
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
+import asyncio
 import os
+import weakref
 
 import prometheus_client
 import prometheus_client.openmetrics
 import prometheus_client.openmetrics.exposition
-import prometheus_client.parser
 from fastapi import APIRouter
 from fastapi.responses import PlainTextResponse
 from httpx import AsyncClient
 from loguru import logger
-from prometheus_client import Gauge
+from prometheus_client import Counter, Gauge, Histogram
 
 from port_ocean.context import metric_resource, resource
 from port_ocean.exceptions.context import ResourceContextNotFoundError
@@ -73,6 +74,13 @@ class MetricType:
     OBJECT_COUNT_NAME = "object_count"
     SUCCESS_NAME = "success"
     RATE_LIMIT_WAIT_NAME = "rate_limit_wait_seconds"
+    RATE_LIMIT_AVAILABLE_NAME = "rate_limit_available_requests"
+    RATE_LIMIT_WAITING_NAME = "rate_limit_waiting_requests"
+    HTTP_POOL_WAIT_NAME = "http_pool_wait_seconds"
+    HTTP_POOL_REQUESTS_NAME = "http_pool_requests"
+    CACHE_REQUESTS_NAME = "cache_requests"
+    CACHE_EVICTIONS_NAME = "cache_evictions"
+    CACHE_SIZE_NAME = "cache_size_bytes"
 
     # Resource usage metrics (CPU, memory, latency)
     CPU_MAX_NAME = "cpu_max_percent"
@@ -89,6 +97,20 @@ class MetricType:
     RESPONSE_SIZE_AVG_NAME = "response_size_avg_bytes"
     RESPONSE_SIZE_MEDIAN_NAME = "response_size_median_bytes"
 
+    # Distributions (histograms)
+    PORT_REQUEST_DURATION_NAME = "port_request_duration_seconds"
+    THIRD_PARTY_REQUEST_DURATION_NAME = "third_party_request_duration_seconds"
+    TRANSFORM_BATCH_DURATION_NAME = "transform_batch_duration_seconds"
+    WEBHOOK_QUEUE_WAIT_NAME = "webhook_queue_wait_seconds"
+    BULK_UPSERT_ENTITIES_NAME = "bulk_upsert_size_entities"
+    BULK_UPSERT_BYTES_NAME = "bulk_upsert_size_bytes"
+    RETRY_SLEEP_NAME = "retry_sleep_seconds"
+    EVENT_LOOP_STALL_NAME = "event_loop_stall_seconds"
+
+    # Counters
+    TRANSFORM_ITEMS_NAME = "transform_items"
+    HTTP_RETRIES_NAME = "http_retries"
+
 
 class SyncState:
     SYNCING = "syncing"
@@ -126,6 +148,41 @@ _metrics_registry: Dict[str, Tuple[str, str, List[str]]] = {
         "rate_limit_wait description",
         ["kind", "phase", "endpoint"],
     ),
+    MetricType.RATE_LIMIT_AVAILABLE_NAME: (
+        MetricType.RATE_LIMIT_AVAILABLE_NAME,
+        "Requests a rate limiter bucket can send right now without waiting",
+        ["limiter", "key"],
+    ),
+    MetricType.RATE_LIMIT_WAITING_NAME: (
+        MetricType.RATE_LIMIT_WAITING_NAME,
+        "Requests currently waiting on a rate limiter bucket",
+        ["limiter", "key"],
+    ),
+    MetricType.HTTP_POOL_WAIT_NAME: (
+        MetricType.HTTP_POOL_WAIT_NAME,
+        "Total time requests waited for a connection from the HTTP client pool",
+        ["client"],
+    ),
+    MetricType.HTTP_POOL_REQUESTS_NAME: (
+        MetricType.HTTP_POOL_REQUESTS_NAME,
+        "Requests sent on a new or a reused pooled HTTP connection",
+        ["client", "connection"],
+    ),
+    MetricType.CACHE_REQUESTS_NAME: (
+        MetricType.CACHE_REQUESTS_NAME,
+        "Cache lookups that were a hit or a miss",
+        ["cache", "result"],
+    ),
+    MetricType.CACHE_EVICTIONS_NAME: (
+        MetricType.CACHE_EVICTIONS_NAME,
+        "Cache entries evicted because they expired or to free space",
+        ["cache", "reason"],
+    ),
+    MetricType.CACHE_SIZE_NAME: (
+        MetricType.CACHE_SIZE_NAME,
+        "Approximate size of the values held by a cache",
+        ["cache"],
+    ),
     # CPU metrics
     MetricType.CPU_MAX_NAME: (
         MetricType.CPU_MAX_NAME,
@@ -193,6 +250,93 @@ _metrics_registry: Dict[str, Tuple[str, str, List[str]]] = {
 }
 
 
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+)
+ENTITY_COUNT_BUCKETS = (1, 5, 10, 20, 50, 100, 200, 500, 1000)
+BYTE_SIZE_BUCKETS = tuple(1024 * 4**power for power in range(9))  # 1KiB to 64MiB
+RETRY_SLEEP_BUCKETS = (0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+# Registry for histograms: name, description, labels and bucket upper bounds
+_histograms_registry: Dict[str, Tuple[str, str, List[str], Tuple[float, ...]]] = {
+    MetricType.PORT_REQUEST_DURATION_NAME: (
+        MetricType.PORT_REQUEST_DURATION_NAME,
+        "Time until Port answered a request attempt, by endpoint and status",
+        ["endpoint", "status"],
+        LATENCY_BUCKETS,
+    ),
+    MetricType.THIRD_PARTY_REQUEST_DURATION_NAME: (
+        MetricType.THIRD_PARTY_REQUEST_DURATION_NAME,
+        "Time until a third-party API answered a request attempt, by host and status",
+        ["host", "status"],
+        LATENCY_BUCKETS,
+    ),
+    MetricType.TRANSFORM_BATCH_DURATION_NAME: (
+        MetricType.TRANSFORM_BATCH_DURATION_NAME,
+        "Time spent mapping a batch of raw items into entities",
+        ["kind"],
+        LATENCY_BUCKETS,
+    ),
+    MetricType.WEBHOOK_QUEUE_WAIT_NAME: (
+        MetricType.WEBHOOK_QUEUE_WAIT_NAME,
+        "Time a webhook event waited between being received and being processed",
+        ["path"],
+        LATENCY_BUCKETS,
+    ),
+    MetricType.BULK_UPSERT_ENTITIES_NAME: (
+        MetricType.BULK_UPSERT_ENTITIES_NAME,
+        "Number of entities sent in a bulk upsert request",
+        ["kind"],
+        ENTITY_COUNT_BUCKETS,
+    ),
+    MetricType.BULK_UPSERT_BYTES_NAME: (
+        MetricType.BULK_UPSERT_BYTES_NAME,
+        "Size of the body of a bulk upsert request",
+        ["kind"],
+        BYTE_SIZE_BUCKETS,
+    ),
+    MetricType.RETRY_SLEEP_NAME: (
+        MetricType.RETRY_SLEEP_NAME,
+        "Time slept before retrying an HTTP request",
+        ["host"],
+        RETRY_SLEEP_BUCKETS,
+    ),
+    MetricType.EVENT_LOOP_STALL_NAME: (
+        MetricType.EVENT_LOOP_STALL_NAME,
+        "Time the event loop was blocked, by the code location blocking it",
+        ["location"],
+        LATENCY_BUCKETS,
+    ),
+}
+
+# Registry for counters, which are exposed with a `_total` suffix
+_counters_registry: Dict[str, Tuple[str, str, List[str]]] = {
+    MetricType.TRANSFORM_ITEMS_NAME: (
+        MetricType.TRANSFORM_ITEMS_NAME,
+        "Raw items mapped into entities",
+        ["kind"],
+    ),
+    MetricType.HTTP_RETRIES_NAME: (
+        MetricType.HTTP_RETRIES_NAME,
+        "HTTP requests retried, by host and the status code or error that caused it",
+        ["host", "reason"],
+    ),
+}
+
+
 def register_metric(name: str, description: str, labels: List[str]) -> None:
     """Register a custom metric that will be available for use.
 
@@ -204,6 +348,34 @@ def register_metric(name: str, description: str, labels: List[str]) -> None:
     _metrics_registry[name] = (name, description, labels)
 
 
+def register_histogram(
+    name: str,
+    description: str,
+    labels: List[str],
+    buckets: Tuple[float, ...] = LATENCY_BUCKETS,
+) -> None:
+    """Register a custom histogram that will be available for use.
+
+    Args:
+        name (str): The metric name to register
+        description (str): Description of what the metric measures
+        labels (list[str]): Labels to apply to the metric
+        buckets (tuple[float, ...]): Upper bounds of the histogram buckets
+    """
+    _histograms_registry[name] = (name, description, labels, buckets)
+
+
+def register_counter(name: str, description: str, labels: List[str]) -> None:
+    """Register a custom counter that will be available for use.
+
+    Args:
+        name (str): The metric name to register, without the `_total` suffix
+        description (str): Description of what the metric measures
+        labels (list[str]): Labels to apply to the metric
+    """
+    _counters_registry[name] = (name, description, labels)
+
+
 class EmptyMetric:
     def set(self, *args: Any) -> None:
         return None
@@ -214,6 +386,9 @@ class EmptyMetric:
     def inc(self, *args: Any) -> None:
         return None
 
+    def observe(self, *args: Any) -> None:
+        return None
+
 
 class Metrics:
     def __init__(
@@ -229,6 +404,11 @@ class Metrics:
         self.port_client = port_client
         self.registry = prometheus_client.CollectorRegistry()
         self.metrics: dict[str, Gauge] = {}
+        self.counters: dict[str, Counter] = {}
+        self.histograms: dict[str, Histogram] = {}
+        self._webhook_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, AsyncClient
+        ] = weakref.WeakKeyDictionary()
         self.load_metrics()
         self._integration_version: Optional[str] = None
         self._ocean_version: Optional[str] = None
@@ -298,6 +478,14 @@ class Metrics:
             self.metrics[name] = Gauge(
                 name, description, labels, registry=self.registry
             )
+        for name, (_, description, labels) in _counters_registry.items():
+            self.counters[name] = Counter(
+                name, description, labels, registry=self.registry
+            )
+        for name, (_, description, labels, buckets) in _histograms_registry.items():
+            self.histograms[name] = Histogram(
+                name, description, labels, buckets=buckets, registry=self.registry
+            )
 
     def get_metric(self, name: str, labels: list[str]) -> Gauge | EmptyMetric:
         metrics = self.metrics.get(name)
@@ -305,15 +493,30 @@ class Metrics:
             return EmptyMetric()
         return metrics.labels(*labels)
 
+    def get_counter(self, name: str, labels: list[str]) -> Counter | EmptyMetric:
+        counter = self.counters.get(name)
+        if not counter:
+            return EmptyMetric()
+        return counter.labels(*labels)
+
+    def get_histogram(self, name: str, labels: list[str]) -> Histogram | EmptyMetric:
+        histogram = self.histograms.get(name)
+        if not histogram:
+            return EmptyMetric()
+        return histogram.labels(*labels)
+
     def inc_metric(self, name: str, labels: list[str], value: float) -> None:
-        """Increment a metric value in a single method call.
+        """Increment a counter or gauge value in a single method call.
 
         Args:
             name (str): The metric name to inc.
             labels (list[str]): The labels to apply to the metric.
             value (float): The value to inc.
         """
-        self.get_metric(name, labels).inc(value)
+        if name in self.counters:
+            self.get_counter(name, labels).inc(value)
+        else:
+            self.get_metric(name, labels).inc(value)
 
     def set_metric(self, name: str, labels: list[str], value: float) -> None:
         """Set a metric value in a single method call.
@@ -325,6 +528,16 @@ class Metrics:
         """
         self.get_metric(name, labels).set(value)
 
+    def observe_metric(self, name: str, labels: list[str], value: float) -> None:
+        """Record an observation of a histogram in a single method call.
+
+        Args:
+            name (str): The histogram name to observe.
+            labels (list[str]): The labels to apply to the histogram.
+            value (float): The observed value.
+        """
+        self.get_histogram(name, labels).observe(value)
+
     def initialize_metrics(self, kind_blockes: list[str]) -> None:
         for kind in kind_blockes:
             self.set_metric(MetricType.SUCCESS_NAME, [kind, MetricPhase.RESYNC], 0)
@@ -446,6 +659,37 @@ class Metrics:
         except Exception as e:
             logger.error(f"Error putting metrics: {e}", metrics=metrics)
 
+    def _collect_kind_metrics(
+        self, metric_name: Optional[str] = None, kind: Optional[str] = None
+    ) -> dict[str, dict[str, Any]]:
+        """Nest the current samples of the per-kind gauges by their labels, in the
+        registry's label order, e.g. ``{kind: {"phase": {phase: {name: value}}}}``.
+
+        Reads the samples from the gauges themselves instead of rendering and
+        re-parsing the exposition text of the whole registry.
+        """
+        metrics_dict: dict[str, dict[str, Any]] = {}
+        for name, (_, _, ordered_labels) in _metrics_registry.items():
+            if metric_name and name != metric_name:
+                continue
+            if not ordered_labels or ordered_labels[0] != "kind":
+                continue
+            gauge = self.metrics.get(name)
+            if gauge is None:
+                continue
+            for family in gauge.collect():
+                for sample in family.samples:
+                    sample_kind = sample.labels["kind"]
+                    if kind and sample_kind != kind:
+                        continue
+                    current_level = metrics_dict.setdefault(sample_kind, {})
+                    for label_name in ordered_labels[1:]:
+                        current_level = current_level.setdefault(
+                            label_name, {}
+                        ).setdefault(sample.labels[label_name], {})
+                    current_level[sample.name] = sample.value
+        return metrics_dict
+
     def generate_metrics(
         self,
         metric_name: Optional[str] = None,
@@ -453,47 +697,14 @@ class Metrics:
         blueprint: Optional[str] = None,
     ) -> list[dict[str, Any]]:
         try:
-            latest_raw = self.generate_latest()
-            metric_families = prometheus_client.parser.text_string_to_metric_families(
-                latest_raw
-            )
-            metrics_dict: dict[str, Any] = {}
-            for family in metric_families:
-                for sample in family.samples:
-                    # Skip if a specific metric name was requested and this isn't it
-                    if metric_name and sample.name != metric_name:
-                        continue
-
-                    current_level = metrics_dict
-                    if sample.labels:
-                        # Skip if a specific kind was requested and this isn't it
-                        if kind and sample.labels.get("kind") != kind:
-                            continue
-
-                        # Get the ordered labels from the registry
-                        ordered_labels = _metrics_registry.get(
-                            sample.name, (None, None, [])
-                        )[2]
-
-                        # Create nested dictionary structure based on ordered labels
-                        for label_name in ordered_labels:
-                            if label_name in sample.labels:
-                                value = sample.labels[label_name]
-                                if label_name not in current_level:
-                                    current_level[label_name] = {}
-                                current_level = current_level[label_name]
-                                if value not in current_level:
-                                    current_level[value] = {}
-                                current_level = current_level[value]
-
-                    current_level[sample.name] = sample.value
+            metrics_dict = self._collect_kind_metrics(metric_name, kind)
 
             # If no metrics were filtered, exit early
-            if not metrics_dict.get("kind", {}):
+            if not metrics_dict:
                 return []
 
             events = []
-            for kind_key, metrics in metrics_dict.get("kind", {}).items():
+            for kind_key, metrics in metrics_dict.items():
                 # Skip if we're filtering by kind and this isn't the requested kind
                 if kind and kind_key != kind:
                     continue
@@ -523,6 +734,20 @@ class Metrics:
             logger.error(f"Error sending metrics to webhook: {e}")
             return []
 
+    def _get_webhook_client(self) -> AsyncClient:
+        # A client's connections belong to the event loop that opened them, so
+        # a resync running on another loop gets its own client.
+        loop = asyncio.get_running_loop()
+        client = self._webhook_clients.get(loop)
+        if client is None or client.is_closed:
+            client = self._webhook_clients[loop] = AsyncClient()
+        return client
+
+    async def close_webhook_client(self) -> None:
+        client = self._webhook_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
     async def send_metrics_to_webhook(
         self, metric_name: Optional[str] = None, kind: Optional[str] = None
     ) -> None:
@@ -539,7 +764,7 @@ class Metrics:
 
             for metric in metrics:
                 logger.info(f"Sending metrics to webhook {metric['kind']}: {metric}")
-                await AsyncClient().post(
+                await self._get_webhook_client().post(
                     url=self.metrics_settings.webhook_url, json=metric
                 )
         except Exception as e:
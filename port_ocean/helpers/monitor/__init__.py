@@ -9,6 +9,8 @@ from port_ocean.helpers.monitor.monitor import (
     start_monitoring,
     stop_monitoring,
 )
+from port_ocean.helpers.monitor.profiler import ProfilerBusyError, capture_profile
+from port_ocean.helpers.monitor.watchdog import EventLoopWatchdog, StallOffender
 
 __all__ = [
     "ProcessNode",
@@ -18,4 +20,8 @@ __all__ = [
     "get_monitor",
     "start_monitoring",
     "stop_monitoring",
+    "ProfilerBusyError",
+    "capture_profile",
+    "EventLoopWatchdog",
+    "StallOffender",
 ]
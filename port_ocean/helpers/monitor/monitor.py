@@ -7,11 +7,13 @@ Tracks resource usage metrics per resource kind:
 - Event loop latency
 - HTTP response body sizes
 
-All metrics are tracked in memory only for statistics calculation.
+All metrics are tracked in memory only for statistics calculation. Samples are
+read from /proc and kept in fixed-size ring buffers (see sampling.py), so the
+monitor stays cheap while the JQ worker pools are busy. A latency above the
+profiler's threshold starts a profile of the process (see profiler.py).
 """
 
 import asyncio
-import statistics
 import time
 from dataclasses import asdict
 from typing import Any, Optional
@@ -19,6 +21,8 @@ from typing import Any, Optional
 import psutil
 from loguru import logger
 
+from port_ocean.helpers.monitor.profiler import capture_on_latency
+from port_ocean.helpers.monitor.sampling import ProcessTreeSampler, SampleBuffer
 from port_ocean.helpers.monitor.utils import measure_event_loop_latency
 
 from .models import (
@@ -50,6 +54,7 @@ class PerformanceMonitor:
         self._running = False
         self._task: Optional[asyncio.Task[None]] = None
         self._process = psutil.Process()
+        self._sampler = ProcessTreeSampler(self._process.pid)
         self._start_time = time.time()
 
         # Track known PIDs for CPU baseline (first cpu_percent() call returns 0)
@@ -117,23 +122,20 @@ class PerformanceMonitor:
         Collect the full process tree starting from the main process.
 
         Returns a ProcessNode representing the main process with all
-        descendant processes nested in a true tree structure.
+        descendant processes nested in a true tree structure. This walks the
+        tree with psutil, so it is meant for on-demand inspection; background
+        sampling uses the cheaper ProcessTreeSampler totals.
         """
         return self._build_process_node(self._process)
 
     def _get_total_memory_rss(self) -> int:
         """
         Get total RSS memory usage including all child processes.
-        """
-        total_rss = self._process.memory_info().rss
-
-        for child in self._process.children(recursive=True):
-            try:
-                total_rss += child.memory_info().rss
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
 
-        return total_rss
+        Reads the RSS alone, so on-demand calls don't move the CPU baseline of
+        the background samples.
+        """
+        return self._sampler.rss()
 
     # -------------------------------------------------------------------------
     # System Metrics (Background Sampling)
@@ -144,30 +146,8 @@ class PerformanceMonitor:
         # Measure event loop latency first (most accurate when done immediately)
         latency = await measure_event_loop_latency()
 
-        # Get hierarchical process metrics (main + workers aggregated)
-        process_tree = self._collect_process_tree()
-
-        # Calculate totals from process tree (recursive sum)
-        def sum_tree(node: ProcessNode) -> tuple[float, int]:
-            """Sum cpu and memory from a tree node recursively."""
-            cpu = node.cpu_percent
-            mem = node.memory_rss
-            for child_dict in node.children:
-                child_cpu = child_dict.get("cpu_percent", 0)
-                child_mem = child_dict.get("memory_rss", 0)
-                cpu += child_cpu
-                mem += child_mem
-                # Recurse into grandchildren
-                for grandchild in child_dict.get("children", []):
-                    cpu += grandchild.get("cpu_percent", 0)
-                    mem += grandchild.get("memory_rss", 0)
-            return cpu, mem
-
-        if process_tree:
-            total_cpu, total_rss = sum_tree(process_tree)
-        else:
-            total_cpu = self._process.cpu_percent()
-            total_rss = self._process.memory_info().rss
+        # Main process and workers aggregated
+        total_cpu, total_rss = self._sampler.sample()
 
         return SystemSnapshot(
             process_cpu_percent=total_cpu,
@@ -180,6 +160,7 @@ class PerformanceMonitor:
         while self._running:
             try:
                 snapshot = await self._collect_system()
+                capture_on_latency(snapshot.event_loop_latency_ms)
 
                 # Store sample for current tracking kind if active
                 if (
@@ -207,10 +188,10 @@ class PerformanceMonitor:
         """
         self._kind_tracking[kind] = {
             "start_time": time.time(),
-            "cpu_samples": [],
-            "memory_samples": [],
-            "latency_samples": [],
-            "response_sizes": [],
+            "cpu_samples": SampleBuffer(),
+            "memory_samples": SampleBuffer(),
+            "latency_samples": SampleBuffer(),
+            "response_sizes": SampleBuffer(),
         }
         self._current_tracking_kind = kind
         logger.info(f"[Monitor] Started tracking kind: {kind} (monitor_id={id(self)})")
@@ -261,8 +242,9 @@ class PerformanceMonitor:
     def get_kind_stats(self, kind: str) -> ResourceUsageStats:
         """Get resource usage statistics for a tracked kind.
 
-        Calculates max, median, and average for CPU, memory, and latency
-        from samples collected during kind processing.
+        Reads the max, median, and average for CPU, memory, and latency
+        that the sample buffers maintain as samples are collected. The median
+        is a streaming estimate, exact up to five samples.
 
         Args:
             kind: The resource kind identifier
@@ -275,10 +257,10 @@ class PerformanceMonitor:
             return ResourceUsageStats()
 
         tracking = self._kind_tracking[kind]
-        cpu_samples = tracking["cpu_samples"]
-        memory_samples = tracking["memory_samples"]
-        latency_samples = tracking["latency_samples"]
-        response_sizes = tracking.get("response_sizes", [])
+        cpu_samples: SampleBuffer = tracking["cpu_samples"]
+        memory_samples: SampleBuffer = tracking["memory_samples"]
+        latency_samples: SampleBuffer = tracking["latency_samples"]
+        response_sizes: SampleBuffer = tracking["response_sizes"]
 
         if not cpu_samples:
             logger.debug(f"[Monitor] No samples collected for kind: {kind}")
@@ -286,28 +268,24 @@ class PerformanceMonitor:
 
         stats = ResourceUsageStats(
             cpu=CPUStats(
-                cpu_max=max(cpu_samples),
-                cpu_median=statistics.median(cpu_samples),
-                cpu_avg=statistics.mean(cpu_samples),
+                cpu_max=cpu_samples.max,
+                cpu_median=cpu_samples.median,
+                cpu_avg=cpu_samples.mean,
             ),
             memory=MemoryStats(
-                memory_max=max(memory_samples),
-                memory_median=int(statistics.median(memory_samples)),
-                memory_avg=int(statistics.mean(memory_samples)),
+                memory_max=int(memory_samples.max),
+                memory_median=int(memory_samples.median),
+                memory_avg=int(memory_samples.mean),
             ),
             latency=LatencyStats(
-                latency_max=max(latency_samples),
-                latency_median=statistics.median(latency_samples),
-                latency_avg=statistics.mean(latency_samples),
+                latency_max=latency_samples.max,
+                latency_median=latency_samples.median,
+                latency_avg=latency_samples.mean,
             ),
             response_size=ResponseSizeStats(
-                response_size_total=sum(response_sizes) if response_sizes else 0,
-                response_size_avg=(
-                    statistics.mean(response_sizes) if response_sizes else 0.0
-                ),
-                response_size_median=(
-                    statistics.median(response_sizes) if response_sizes else 0.0
-                ),
+                response_size_total=int(response_sizes.total),
+                response_size_avg=response_sizes.mean,
+                response_size_median=response_sizes.median,
             ),
             sample_count=len(cpu_samples),
         )
@@ -0,0 +1,324 @@
+"""
+Sampling profiler for live Ocean processes.
+
+A background thread samples the Python stacks of every thread of the process
+(the event loop thread and the default executor threads included) at a fixed
+interval, and JQ worker processes forked while a profile is running sample
+themselves the same way. Samples are returned as collapsed stacks, one
+``root;thread;frame;...;frame count`` line per distinct stack, which
+flamegraph.pl, speedscope and most flamegraph viewers read as is.
+
+Sampling from a thread keeps working while the event loop is blocked, which is
+exactly when a profile is needed.
+"""
+
+import asyncio
+import multiprocessing.util
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from types import FrameType
+from typing import TYPE_CHECKING, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from loguru import logger
+
+if TYPE_CHECKING:
+    from port_ocean.config.settings import ProfilerSettings
+
+MAIN_PROCESS_ROOT = "ocean"
+WORKER_PROCESS_ROOT = "jq-worker"
+
+# Leaf frames of threads that are waiting rather than running.
+_IDLE_FRAMES = frozenset(
+    {
+        ("threading.py", "wait"),
+        ("threading.py", "_wait_for_tstate_lock"),
+        ("queue.py", "get"),
+        ("selectors.py", "select"),
+        ("connection.py", "wait"),
+        ("connection.py", "_recv"),
+    }
+)
+
+
+class ProfilerBusyError(Exception):
+    pass
+
+
+@lru_cache(maxsize=4096)
+def _short_path(filename: str) -> str:
+    for marker in ("site-packages/", "dist-packages/"):
+        if marker in filename:
+            return filename.rsplit(marker, 1)[1]
+    parts = Path(filename).parts
+    return "/".join(parts[-2:])
+
+
+def _collapse_stack(frame: Optional[FrameType], include_idle: bool) -> str | None:
+    if frame is None:
+        return None
+    code = frame.f_code
+    if not include_idle and (Path(code.co_filename).name, code.co_name) in (
+        _IDLE_FRAMES
+    ):
+        return None
+    labels = []
+    while frame is not None:
+        code = frame.f_code
+        labels.append(f"{code.co_name} ({_short_path(code.co_filename)})")
+        frame = frame.f_back
+    labels.reverse()
+    return ";".join(labels)
+
+
+class _Sampler(threading.Thread):
+    """Counts the stacks of the other threads of this process until stopped."""
+
+    def __init__(
+        self,
+        root: str,
+        interval: float,
+        include_idle: bool,
+        ends_at: float,
+        output: Path | None = None,
+    ) -> None:
+        super().__init__(name="ocean-profiler", daemon=True)
+        self.root = root
+        self.interval = interval
+        self.include_idle = include_idle
+        self.ends_at = ends_at
+        self.output = output
+        self.stacks: Counter[str] = Counter()
+        self._stop_sampling = threading.Event()
+
+    def run(self) -> None:
+        last_write = time.monotonic()
+        while not self._stop_sampling.wait(self.interval):
+            now = time.monotonic()
+            if now >= self.ends_at:
+                break
+            self.sample()
+            # Workers can be killed by their pool, so keep what they sampled
+            # on disk as they go.
+            if self.output is not None and now - last_write >= 1:
+                self.write()
+                last_write = now
+        self.write()
+
+    def sample(self) -> None:
+        own_ident = threading.get_ident()
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+            stack = _collapse_stack(frame, self.include_idle)
+            if stack is None:
+                continue
+            thread_name = thread_names.get(ident, f"thread-{ident}")
+            self.stacks[f"{self.root};{thread_name};{stack}"] += 1
+
+    def stop(self) -> Counter[str]:
+        self._stop_sampling.set()
+        if self.is_alive() and self is not threading.current_thread():
+            self.join()
+        return self.stacks
+
+    def write(self) -> None:
+        if self.output is None:
+            return
+        try:
+            temporary = self.output.with_suffix(".tmp")
+            temporary.write_text(format_collapsed(self.stacks))
+            temporary.replace(self.output)
+        except OSError:
+            pass
+
+
+def format_collapsed(stacks: Counter[str]) -> str:
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+
+def _parse_collapsed(text: str) -> Counter[str]:
+    stacks: Counter[str] = Counter()
+    for line in text.splitlines():
+        stack, _, count = line.rpartition(" ")
+        if stack and count.isdigit():
+            stacks[stack] += int(count)
+    return stacks
+
+
+class _ProfileSession:
+    def __init__(self, seconds: float, interval: float, include_idle: bool) -> None:
+        self.interval = interval
+        self.include_idle = include_idle
+        self.ends_at = time.monotonic() + seconds
+        self.workers_dir = Path(tempfile.mkdtemp(prefix="ocean-profile-"))
+        self.sampler = _Sampler(MAIN_PROCESS_ROOT, interval, include_idle, self.ends_at)
+
+    def start(self) -> None:
+        self.sampler.start()
+
+    def stop(self) -> Counter[str]:
+        stacks = self.sampler.stop()
+        for worker_file in self.workers_dir.glob("*.collapsed"):
+            try:
+                stacks.update(_parse_collapsed(worker_file.read_text()))
+            except OSError:
+                pass
+        shutil.rmtree(self.workers_dir, ignore_errors=True)
+        return stacks
+
+    def sample_forked_worker(self) -> None:
+        """Start sampling in a worker process forked during the session."""
+        sampler = _Sampler(
+            WORKER_PROCESS_ROOT,
+            self.interval,
+            self.include_idle,
+            self.ends_at,
+            output=self.workers_dir / f"{os.getpid()}.collapsed",
+        )
+        sampler.start()
+        multiprocessing.util.Finalize(None, sampler.stop, exitpriority=100)
+
+
+class _ProfilerState:
+    session: Optional[_ProfileSession] = None
+
+    def after_fork(self) -> None:
+        session, self.session = self.session, None
+        if session is not None:
+            session.sample_forked_worker()
+
+
+_state = _ProfilerState()
+# Runs in processes started by multiprocessing (the JQ worker pools), after it
+# resets the finalizers inherited from the parent.
+multiprocessing.util.register_after_fork(_state, _ProfilerState.after_fork)
+
+
+def is_profiling() -> bool:
+    return _state.session is not None
+
+
+async def capture_profile(
+    seconds: float, interval: float = 0.01, include_idle: bool = False
+) -> str:
+    """Sample this process and the JQ workers forked meanwhile for ``seconds``
+    and return the samples as collapsed stacks.
+
+    Raises ProfilerBusyError if a profile is already being captured.
+    """
+    if _state.session is not None:
+        raise ProfilerBusyError("A profile is already being captured")
+    session = _state.session = _ProfileSession(seconds, interval, include_idle)
+    try:
+        session.start()
+        await asyncio.sleep(seconds)
+    finally:
+        _state.session = None
+        stacks = session.stop()
+    return format_collapsed(stacks)
+
+
+class _LatencyCapture:
+    def __init__(
+        self,
+        threshold_ms: float,
+        seconds: float,
+        cooldown_seconds: float,
+        interval: float,
+        output_dir: Path,
+    ) -> None:
+        self.threshold_ms = threshold_ms
+        self.seconds = seconds
+        self.cooldown_seconds = cooldown_seconds
+        self.interval = interval
+        self.output_dir = output_dir
+        self.last_capture_at: float | None = None
+        self.task: asyncio.Task[Path | None] | None = None
+
+    def trigger(self, latency_ms: float) -> None:
+        if latency_ms < self.threshold_ms or is_profiling():
+            return
+        now = time.monotonic()
+        if (
+            self.last_capture_at is not None
+            and now - self.last_capture_at < self.cooldown_seconds
+        ):
+            return
+        self.last_capture_at = now
+        self.task = asyncio.create_task(self._capture(latency_ms))
+
+    async def _capture(self, latency_ms: float) -> Path | None:
+        logger.warning(
+            f"[Profiler] Event loop latency of {latency_ms:.0f}ms is above "
+            f"{self.threshold_ms:.0f}ms, profiling for {self.seconds:.0f}s"
+        )
+        try:
+            collapsed = await capture_profile(self.seconds, self.interval)
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            started_at = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+            path = self.output_dir / f"profile-{started_at}.collapsed"
+            path.write_text(collapsed)
+        except (ProfilerBusyError, OSError) as e:
+            logger.warning(f"[Profiler] Failed to capture a latency profile: {e}")
+            return None
+        logger.warning(f"[Profiler] Wrote latency profile to {path}")
+        return path
+
+
+_latency_capture: Optional[_LatencyCapture] = None
+
+
+def configure_latency_capture(settings: "ProfilerSettings") -> None:
+    """Profile automatically when the performance monitor measures an event
+    loop latency above ``settings.latency_threshold_ms``."""
+    global _latency_capture
+    if settings.latency_threshold_ms is None:
+        _latency_capture = None
+        return
+    _latency_capture = _LatencyCapture(
+        threshold_ms=settings.latency_threshold_ms,
+        seconds=settings.latency_capture_seconds,
+        cooldown_seconds=settings.latency_capture_cooldown_seconds,
+        interval=settings.sampling_interval_ms / 1000,
+        output_dir=Path(settings.output_dir),
+    )
+
+
+def capture_on_latency(latency_ms: float) -> None:
+    """Start a latency profile if one is configured and due."""
+    if _latency_capture is not None:
+        _latency_capture.trigger(latency_ms)
+
+
+def create_profiler_router(settings: "ProfilerSettings") -> APIRouter:
+    router = APIRouter()
+
+    @router.get("/", response_class=PlainTextResponse, include_in_schema=False)
+    @router.get("", response_class=PlainTextResponse, include_in_schema=False)
+    async def profile(
+        seconds: float = Query(default=10, gt=0),
+        interval_ms: float = Query(default=settings.sampling_interval_ms, ge=1),
+        idle: bool = False,
+    ) -> str:
+        if seconds > settings.max_seconds:
+            raise HTTPException(
+                status_code=400,
+                detail=f"seconds must be at most {settings.max_seconds}",
+            )
+        try:
+            return await capture_profile(seconds, interval_ms / 1000, idle)
+        except ProfilerBusyError as e:
+            raise HTTPException(status_code=409, detail=str(e))
+
+    return router
@@ -0,0 +1,307 @@
+"""
+Low-overhead sampling for the performance monitor.
+
+``ProcessTreeSampler`` totals the CPU and memory of the Ocean process and its
+descendants (the JQ worker pools) with one read of ``/proc/<pid>/stat`` per
+process, instead of building psutil objects for the whole tree every sample.
+
+``SampleBuffer`` keeps the samples of a kind in a fixed-size ``array`` ring and
+updates their count, sum, max and median estimate as samples arrive, so reading
+the statistics does not sort or even keep every sample.
+"""
+
+import os
+import time
+from array import array
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+import psutil
+
+PROC = Path("/proc")
+DEFAULT_BUFFER_CAPACITY = 1024
+# How often descendants are looked up again when the kernel does not list a
+# process's children in /proc.
+DISCOVERY_INTERVAL_SECONDS = 2.0
+
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+class P2Quantile:
+    """Streaming quantile estimate with the P² algorithm (Jain & Chlamtac),
+    in constant memory and time per value. Exact up to five values."""
+
+    def __init__(self, quantile: float = 0.5) -> None:
+        self.quantile = quantile
+        self._heights: list[float] = []
+        self._positions = [1, 2, 3, 4, 5]
+        self._desired = [
+            1.0,
+            1 + 2 * quantile,
+            1 + 4 * quantile,
+            3 + 2 * quantile,
+            5.0,
+        ]
+        self._increments = [0.0, quantile / 2, quantile, (1 + quantile) / 2, 1.0]
+
+    def add(self, value: float) -> None:
+        heights = self._heights
+        if len(heights) < 5:
+            heights.append(value)
+            heights.sort()
+            return
+
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = 0
+            while value >= heights[cell + 1]:
+                cell += 1
+
+        positions = self._positions
+        for index in range(cell + 1, 5):
+            positions[index] += 1
+        for index in range(5):
+            self._desired[index] += self._increments[index]
+
+        for index in (1, 2, 3):
+            offset = self._desired[index] - positions[index]
+            if (offset >= 1 and positions[index + 1] - positions[index] > 1) or (
+                offset <= -1 and positions[index - 1] - positions[index] < -1
+            ):
+                step = 1 if offset > 0 else -1
+                height = self._parabolic(index, step)
+                if not heights[index - 1] < height < heights[index + 1]:
+                    height = self._linear(index, step)
+                heights[index] = height
+                positions[index] += step
+
+    def _parabolic(self, index: int, step: int) -> float:
+        heights, positions = self._heights, self._positions
+        return heights[index] + step / (positions[index + 1] - positions[index - 1]) * (
+            (positions[index] - positions[index - 1] + step)
+            * (heights[index + 1] - heights[index])
+            / (positions[index + 1] - positions[index])
+            + (positions[index + 1] - positions[index] - step)
+            * (heights[index] - heights[index - 1])
+            / (positions[index] - positions[index - 1])
+        )
+
+    def _linear(self, index: int, step: int) -> float:
+        heights, positions = self._heights, self._positions
+        return heights[index] + step * (heights[index + step] - heights[index]) / (
+            positions[index + step] - positions[index]
+        )
+
+    @property
+    def value(self) -> float:
+        heights = self._heights
+        if not heights:
+            return 0.0
+        if len(heights) < 5:
+            # Exact, interpolated like statistics.quantiles(method="inclusive").
+            position = (len(heights) - 1) * self.quantile
+            lower = int(position)
+            upper = min(lower + 1, len(heights) - 1)
+            return heights[lower] + (heights[upper] - heights[lower]) * (
+                position - lower
+            )
+        return heights[2]
+
+
+class SampleBuffer:
+    """A fixed-size ring of numeric samples with running statistics.
+
+    The count, total, mean, max and median cover every sample added, while
+    iterating yields only the last ``capacity`` samples, oldest first.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_BUFFER_CAPACITY) -> None:
+        self.capacity = capacity
+        self._ring = array("d", bytes(8 * capacity))
+        self._next = 0
+        self._count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._median = P2Quantile(0.5)
+
+    def append(self, value: float) -> None:
+        self._ring[self._next] = value
+        self._next = (self._next + 1) % self.capacity
+        self.max = value if self._count == 0 else max(self.max, value)
+        self._count += 1
+        self.total += value
+        self._median.add(value)
+
+    def extend(self, values: Iterable[float]) -> None:
+        for value in values:
+            self.append(value)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self._count if self._count else 0.0
+
+    @property
+    def median(self) -> float:
+        return self._median.value
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[float]:
+        retained = min(self._count, self.capacity)
+        start = (self._next - retained) % self.capacity
+        for offset in range(retained):
+            yield self._ring[(start + offset) % self.capacity]
+
+
+def _read_stat(pid: int) -> Optional[tuple[int, int, int]]:
+    """CPU ticks used, start time in ticks since boot and RSS pages of a
+    process, from ``/proc/<pid>/stat``."""
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as stat:
+            data = stat.read()
+    except OSError:
+        return None
+    # The command name is in parentheses and may contain spaces.
+    fields = data[data.rfind(b")") + 2 :].split()
+    # Fields from the state (3rd), see proc(5).
+    return int(fields[11]) + int(fields[12]), int(fields[19]), int(fields[21])
+
+
+def _uptime_seconds() -> float:
+    with open("/proc/uptime", "rb") as uptime:
+        return float(uptime.read().split()[0])
+
+
+class ProcessTreeSampler:
+    """Totals the CPU percentage and RSS of a process and its descendants."""
+
+    def __init__(self, pid: Optional[int] = None) -> None:
+        self.pid = pid or os.getpid()
+        self.use_proc = (PROC / str(self.pid) / "stat").exists()
+        self._lists_children = (
+            PROC / str(self.pid) / "task" / str(self.pid) / "children"
+        ).exists()
+        self._pids: list[int] = [self.pid]
+        self._discovered_at = 0.0
+        # pid -> (cpu ticks, monotonic time) of the previous sample
+        self._previous: dict[int, tuple[int, float]] = {}
+        self._process = psutil.Process(self.pid)
+        self._psutil_children: dict[int, psutil.Process] = {}
+
+    def sample(self) -> tuple[float, int]:
+        """The CPU percentage since the previous sample and the RSS in bytes
+        of the process tree."""
+        if self.use_proc:
+            try:
+                return self._sample_proc()
+            except OSError:
+                self.use_proc = False
+        return self._sample_psutil()
+
+    def _children(self, pid: int) -> list[int]:
+        # Children are listed by the thread that started them, and the pools
+        # can be started from executor threads.
+        children: list[int] = []
+        try:
+            tasks = os.listdir(f"/proc/{pid}/task")
+        except OSError:
+            return children
+        for task in tasks:
+            try:
+                with open(f"/proc/{pid}/task/{task}/children", "rb") as listed:
+                    children.extend(int(child) for child in listed.read().split())
+            except OSError:
+                pass
+        return children
+
+    def _descendants(self) -> list[int]:
+        if self._lists_children:
+            pids = [self.pid]
+            for pid in pids:
+                pids.extend(self._children(pid))
+            return pids
+        now = time.monotonic()
+        if now - self._discovered_at >= DISCOVERY_INTERVAL_SECONDS:
+            self._discovered_at = now
+            try:
+                children = self._process.children(recursive=True)
+            except psutil.Error:
+                children = []
+            self._pids = [self.pid, *(child.pid for child in children)]
+        return self._pids
+
+    def rss(self) -> int:
+        """The RSS in bytes of the process tree. Unlike ``sample`` it leaves
+        the CPU baseline alone, so it can be read at any time."""
+        if self.use_proc:
+            rss_pages = 0
+            for pid in self._descendants():
+                stat = _read_stat(pid)
+                if stat is not None:
+                    rss_pages += stat[2]
+            return rss_pages * _PAGE_SIZE
+        rss = 0
+        for process in [self._process, *self._psutil_tree()]:
+            try:
+                rss += process.memory_info().rss
+            except psutil.Error:
+                continue
+        return rss
+
+    def _psutil_tree(self) -> list[psutil.Process]:
+        try:
+            return self._process.children(recursive=True)
+        except psutil.Error:
+            return []
+
+    def _sample_proc(self) -> tuple[float, int]:
+        now = time.monotonic()
+        uptime: Optional[float] = None
+        cpu_percent = 0.0
+        rss_pages = 0
+        previous = self._previous
+        current: dict[int, tuple[int, float]] = {}
+        for pid in self._descendants():
+            stat = _read_stat(pid)
+            if stat is None:
+                continue
+            ticks, started_at, rss = stat
+            rss_pages += rss
+            current[pid] = (ticks, now)
+            if pid in previous:
+                previous_ticks, previous_time = previous[pid]
+                elapsed = now - previous_time
+            else:
+                # A new process, e.g. a freshly forked JQ worker: its CPU time
+                # is all since it started.
+                if uptime is None:
+                    uptime = _uptime_seconds()
+                previous_ticks = 0
+                elapsed = uptime - started_at / _CLOCK_TICKS
+            if elapsed > 0:
+                cpu_percent += (ticks - previous_ticks) / _CLOCK_TICKS / elapsed * 100
+        self._previous = current
+        return cpu_percent, rss_pages * _PAGE_SIZE
+
+    def _sample_psutil(self) -> tuple[float, int]:
+        """Fallback for platforms without /proc."""
+        cpu_percent = self._process.cpu_percent()
+        rss = self._process.memory_info().rss
+        tracked: dict[int, psutil.Process] = {}
+        for child in self._psutil_tree():
+            process = self._psutil_children.get(child.pid, child)
+            try:
+                cpu_percent += process.cpu_percent()
+                rss += process.memory_info().rss
+            except psutil.Error:
+                continue
+            tracked[child.pid] = process
+        self._psutil_children = tracked
+        return cpu_percent, rss
@@ -0,0 +1,255 @@
+"""
+Event loop watchdog.
+
+A callback on the event loop records a tick every few milliseconds. A thread
+checks the ticks and, when the loop has not run a callback for longer than the
+threshold, captures the stack of the loop thread while it is still blocked.
+
+Each stall is attributed to the innermost frame of Ocean or integration code
+in that stack, so a stall in ``pickle.dumps`` or ``json.dumps`` is reported at
+the line calling it. Stalls are observed in the ``event_loop_stall_seconds``
+histogram by location, a location's stack is logged the first time it blocks
+the loop, and the top offenders are logged periodically.
+"""
+
+import asyncio
+import sys
+import sysconfig
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from types import FrameType
+from typing import Optional
+
+from loguru import logger
+
+from port_ocean.context.ocean import ocean
+from port_ocean.helpers.metric.metric import MetricType
+
+# Locations past this many are aggregated, to keep the metric labels bounded.
+MAX_LOCATIONS = 100
+OTHER_LOCATION = "other"
+
+_STDLIB_PATHS = tuple(
+    {sysconfig.get_paths()["stdlib"], sysconfig.get_paths()["platstdlib"]}
+)
+
+
+@lru_cache(maxsize=4096)
+def _is_application_file(filename: str) -> bool:
+    """Whether a file is Ocean or integration code rather than the standard
+    library or a third-party package."""
+    if "/port_ocean/" in filename:
+        return True
+    if filename.startswith("<") or filename.startswith(_STDLIB_PATHS):
+        return False
+    return "site-packages/" not in filename and "dist-packages/" not in filename
+
+
+@lru_cache(maxsize=4096)
+def _short_path(filename: str) -> str:
+    for marker in ("site-packages/", "dist-packages/"):
+        if marker in filename:
+            return filename.rsplit(marker, 1)[1]
+    try:
+        return str(Path(filename).relative_to(Path.cwd()))
+    except ValueError:
+        return "/".join(Path(filename).parts[-2:])
+
+
+def blocking_location(frame: FrameType) -> str:
+    """The innermost application frame of a stack, or its innermost frame."""
+    current: Optional[FrameType] = frame
+    while current is not None:
+        if _is_application_file(current.f_code.co_filename):
+            break
+        current = current.f_back
+    located = current or frame
+    return (
+        f"{located.f_code.co_name} "
+        f"({_short_path(located.f_code.co_filename)}:{located.f_lineno})"
+    )
+
+
+@dataclass
+class StallOffender:
+    location: str
+    stalls: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    stack: str = ""
+
+
+class EventLoopWatchdog:
+    def __init__(
+        self,
+        threshold_ms: float = 200,
+        report_interval_seconds: float = 60,
+        top_offenders: int = 10,
+    ) -> None:
+        self.threshold = threshold_ms / 1000
+        self.report_interval_seconds = report_interval_seconds
+        self.top_offenders = top_offenders
+        # Tick and check often enough to catch a stall soon after it passes
+        # the threshold.
+        self.tick_interval = min(self.threshold / 4, 0.05)
+        self._offenders: dict[str, StallOffender] = {}
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._tick_handle: Optional[asyncio.TimerHandle] = None
+        self._last_tick = time.monotonic()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._stalls_since_report = 0
+
+    def start(self) -> None:
+        """Start watching the running event loop. Call from the loop's thread."""
+        if self._thread is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stopping.clear()
+        self._tick()
+        self._thread = threading.Thread(
+            target=self._watch, name="ocean-loop-watchdog", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            f"Started event loop watchdog (threshold {self.threshold * 1000:.0f}ms)"
+        )
+
+    def stop(self) -> None:
+        self._stopping.set()
+        if self._tick_handle is not None:
+            self._tick_handle.cancel()
+            self._tick_handle = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _tick(self) -> None:
+        self._last_tick = time.monotonic()
+        if not self._stopping.is_set() and self._loop is not None:
+            self._tick_handle = self._loop.call_later(self.tick_interval, self._tick)
+
+    def _watch(self) -> None:
+        stalled_since: Optional[float] = None
+        location = ""
+        stack = ""
+        last_report = time.monotonic()
+        while not self._stopping.wait(self.tick_interval):
+            last_tick = self._last_tick
+            now = time.monotonic()
+            if stalled_since is not None and last_tick != stalled_since:
+                # The loop ran again: the stall lasted from the last tick before
+                # it until the first one after it, less the usual tick delay.
+                duration = last_tick - stalled_since - self.tick_interval
+                self._record_stall(location, stack, duration)
+                stalled_since = None
+            if (
+                stalled_since is None
+                and now - last_tick > self.tick_interval + self.threshold
+            ):
+                frame = sys._current_frames().get(self._loop_thread_id or 0)
+                if frame is not None:
+                    stalled_since = last_tick
+                    location = blocking_location(frame)
+                    stack = "".join(traceback.format_stack(frame))
+            if now - last_report >= self.report_interval_seconds:
+                self.report_top_offenders()
+                last_report = now
+
+    def _record_stall(self, location: str, stack: str, duration: float) -> None:
+        with self._lock:
+            if (
+                location not in self._offenders
+                and len(self._offenders) >= MAX_LOCATIONS
+            ):
+                location = OTHER_LOCATION
+            offender = self._offenders.get(location)
+            is_new = offender is None
+            if offender is None:
+                offender = self._offenders[location] = StallOffender(
+                    location, stack=stack
+                )
+            offender.stalls += 1
+            offender.total_seconds += duration
+            offender.max_seconds = max(offender.max_seconds, duration)
+            self._stalls_since_report += 1
+
+        if is_new:
+            logger.warning(
+                f"Event loop was blocked for {duration * 1000:.0f}ms by {location}",
+                stack=stack,
+            )
+        else:
+            logger.debug(
+                f"Event loop was blocked for {duration * 1000:.0f}ms by {location}"
+            )
+        self._report_metric(location, duration)
+
+    @staticmethod
+    def _report_metric(location: str, duration: float) -> None:
+        if not ocean.initialized:
+            return
+        try:
+            ocean.metrics.observe_metric(
+                MetricType.EVENT_LOOP_STALL_NAME, [location], duration
+            )
+        except Exception as e:
+            logger.debug(f"Failed to report event loop stall metrics: {e}")
+
+    def offenders(self) -> list[StallOffender]:
+        """Blocking locations, the longest total blocking time first."""
+        with self._lock:
+            return sorted(
+                self._offenders.values(),
+                key=lambda offender: offender.total_seconds,
+                reverse=True,
+            )
+
+    def report_top_offenders(self) -> None:
+        with self._lock:
+            if not self._stalls_since_report:
+                return
+            self._stalls_since_report = 0
+        top = self.offenders()[: self.top_offenders]
+        summary = "\n".join(
+            f"  {offender.total_seconds * 1000:.0f}ms in {offender.stalls} stalls "
+            f"(max {offender.max_seconds * 1000:.0f}ms) {offender.location}"
+            for offender in top
+        )
+        logger.warning(f"Top event loop blocking locations:\n{summary}")
+
+
+_watchdog: Optional[EventLoopWatchdog] = None
+
+
+def get_watchdog() -> Optional[EventLoopWatchdog]:
+    return _watchdog
+
+
+def start_event_loop_watchdog(
+    threshold_ms: float = 200,
+    report_interval_seconds: float = 60,
+    top_offenders: int = 10,
+) -> EventLoopWatchdog:
+    """Start the global watchdog on the running loop, if it is not running."""
+    global _watchdog
+    if _watchdog is None:
+        _watchdog = EventLoopWatchdog(
+            threshold_ms, report_interval_seconds, top_offenders
+        )
+        _watchdog.start()
+    return _watchdog
+
+
+def stop_event_loop_watchdog() -> None:
+    global _watchdog
+    if _watchdog is not None:
+        _watchdog.stop()
+        _watchdog = None
@@ -0,0 +1,30 @@
+from port_ocean.helpers.rate_limit.adaptive import AdaptiveHeaderStrategy
+from port_ocean.helpers.rate_limit.base import RateLimitStrategy
+from port_ocean.helpers.rate_limit.circuit_breaker import CircuitBreaker, CircuitState
+from port_ocean.helpers.rate_limit.fixed_window import FixedWindowStrategy
+from port_ocean.helpers.rate_limit.headers import parse_rate_limit_reset
+from port_ocean.helpers.rate_limit.host import (
+    HostRateLimitConfig,
+    HostRateLimiter,
+    get_host_rate_limiter,
+)
+from port_ocean.helpers.rate_limit.limiter import RateLimiter
+from port_ocean.helpers.rate_limit.sliding_window import SlidingWindowStrategy
+from port_ocean.helpers.rate_limit.token_bucket import TokenBucket
+from port_ocean.helpers.rate_limit.transport import RateLimitTransport
+
+__all__ = [
+    "AdaptiveHeaderStrategy",
+    "CircuitBreaker",
+    "CircuitState",
+    "FixedWindowStrategy",
+    "HostRateLimitConfig",
+    "HostRateLimiter",
+    "RateLimitStrategy",
+    "RateLimitTransport",
+    "RateLimiter",
+    "SlidingWindowStrategy",
+    "TokenBucket",
+    "get_host_rate_limiter",
+    "parse_rate_limit_reset",
+]
@@ -0,0 +1,94 @@
+import time
+from http import HTTPStatus
+from typing import Callable, Optional
+
+import httpx
+
+from port_ocean.helpers.rate_limit.base import RateLimitStrategy
+from port_ocean.helpers.rate_limit.headers import parse_rate_limit_reset
+from port_ocean.helpers.rate_limit.token_bucket import TokenBucket
+
+
+class AdaptiveHeaderStrategy(RateLimitStrategy):
+    """Follows the quota an API reports in its rate-limit headers.
+
+    Unlimited until the first response arrives. After that the remaining
+    quota is spread evenly over the time left until the reset, and once the
+    quota is used up (or a 429 arrives) requests are held until the reset.
+    ``reserve_ratio`` keeps a share of ``limit_header`` untouched, for APIs
+    whose quota is shared with other consumers.
+    """
+
+    def __init__(
+        self,
+        *,
+        limit_header: str = "x-ratelimit-limit",
+        remaining_header: str = "x-ratelimit-remaining",
+        reset_header: str = "x-ratelimit-reset",
+        retry_after_header: str = "Retry-After",
+        reserve_ratio: float = 0.0,
+        initial_rate: float | None = None,
+        parse_reset: Callable[[str], Optional[float]] = parse_rate_limit_reset,
+    ) -> None:
+        if not 0 <= reserve_ratio < 1:
+            raise ValueError(
+                f"Reserve ratio should be between 0 and 1, actual {reserve_ratio}"
+            )
+        self.limit_header = limit_header
+        self.remaining_header = remaining_header
+        self.reset_header = reset_header
+        self.retry_after_header = retry_after_header
+        self.reserve_ratio = reserve_ratio
+        self._parse_reset = parse_reset
+        self._bucket = TokenBucket(initial_rate)
+        self._paused_until = 0.0
+
+    @property
+    def rate(self) -> float | None:
+        return self._bucket.rate
+
+    @property
+    def available(self) -> float:
+        return self._bucket.available
+
+    def reserve(self) -> float:
+        return self._bucket.reserve()
+
+    def pause_remaining(self) -> float:
+        return max(0.0, self._paused_until - time.monotonic())
+
+    def _int_header(self, headers: httpx.Headers, name: str) -> int | None:
+        value = (headers.get(name) or "").strip()
+        return int(value) if value.isdigit() else None
+
+    def _seconds_header(self, headers: httpx.Headers, name: str) -> float | None:
+        if value := (headers.get(name) or "").strip():
+            return self._parse_reset(value)
+        return None
+
+    def observe(self, response: httpx.Response) -> None:
+        headers = response.headers
+        reset = self._seconds_header(headers, self.reset_header)
+        if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            pause = self._seconds_header(headers, self.retry_after_header)
+            self._hold(pause if pause is not None else reset or 0.0)
+            return
+
+        remaining = self._int_header(headers, self.remaining_header)
+        if remaining is None or not reset:
+            return
+        limit = self._int_header(headers, self.limit_header)
+        usable = remaining - int((limit or 0) * self.reserve_ratio)
+        if usable <= 0:
+            self._hold(reset)
+            return
+        self._bucket.set_rate(usable / reset)
+        self._bucket.drain(usable)
+
+    def _hold(self, seconds: float) -> None:
+        if self._bucket.rate is None:
+            self._bucket.set_rate(1 / max(seconds, 1.0))
+        # Leave a single token for when the window resets, its response
+        # teaches the strategy the new quota.
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._bucket.drain(1.0, refill_from=self._paused_until)
@@ -0,0 +1,40 @@
+import asyncio
+from abc import ABC, abstractmethod
+
+import httpx
+
+
+class RateLimitStrategy(ABC):
+    """A single rate-limit bucket.
+
+    Strategies hand out reservations instead of making callers poll: ``reserve``
+    takes the next free slot and returns how long the caller has to wait for
+    it, so concurrent callers are released one by one in arrival order.
+    """
+
+    @abstractmethod
+    def reserve(self) -> float:
+        """Take the next free slot and return the seconds to wait for it."""
+
+    @property
+    @abstractmethod
+    def available(self) -> float:
+        """Requests that could be sent right now without waiting."""
+
+    def observe(self, response: httpx.Response) -> None:
+        """Feed a response back to the strategy, e.g. to learn rate-limit headers."""
+
+    def pause_remaining(self) -> float:
+        """Seconds left of a pause that started after slots were reserved."""
+        return 0.0
+
+    async def acquire(self) -> float:
+        """Wait for a slot and return the seconds spent waiting."""
+        waited = self.reserve()
+        if waited > 0:
+            await asyncio.sleep(waited)
+        # A reservation taken before a 429 must not be used before the pause ends.
+        while (pause := self.pause_remaining()) > 0:
+            await asyncio.sleep(pause)
+            waited += pause
+        return waited
@@ -0,0 +1,81 @@
+import asyncio
+import time
+from enum import Enum
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stops sending requests to a host that keeps failing.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    callers of ``wait_until_closed`` are held for ``recovery_timeout`` seconds.
+    The circuit then turns half-open and lets a single probe request through;
+    everyone else waits for its outcome. A successful probe closes the circuit,
+    a failed one opens it again, and an inconclusive one (e.g. rate limited)
+    lets the next caller probe.
+    """
+
+    def __init__(self, failure_threshold: int, recovery_timeout: float) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.opened_until = 0.0
+        self._probe_done: asyncio.Event | None = None
+
+    async def wait_until_closed(self) -> None:
+        while True:
+            if self.state is CircuitState.CLOSED:
+                return
+            if self.state is CircuitState.OPEN:
+                remaining = self.opened_until - time.monotonic()
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+                    continue
+                self.state = CircuitState.HALF_OPEN
+            if self._probe_done is None:
+                # This caller is the probe, the circuit closes or reopens on
+                # its outcome.
+                self._probe_done = asyncio.Event()
+                return
+            try:
+                await asyncio.wait_for(
+                    self._probe_done.wait(), timeout=self.recovery_timeout
+                )
+            except asyncio.TimeoutError:
+                # The probe was cancelled without reporting back, allow another.
+                self._release_probe()
+
+    def record_success(self) -> None:
+        self.consecutive_failures = 0
+        if self.state is not CircuitState.CLOSED:
+            self.state = CircuitState.CLOSED
+            self._release_probe()
+
+    def record_inconclusive(self) -> None:
+        """An outcome that says nothing about the host's health, e.g. a 429."""
+        if self.state is CircuitState.HALF_OPEN:
+            self._release_probe()
+
+    def record_failure(self) -> bool:
+        """Count a failure and return True if it opened the circuit."""
+        self.consecutive_failures += 1
+        if self.state is CircuitState.HALF_OPEN or (
+            self.state is CircuitState.CLOSED
+            and self.consecutive_failures >= self.failure_threshold
+        ):
+            self.state = CircuitState.OPEN
+            self.opened_until = time.monotonic() + self.recovery_timeout
+            self._release_probe()
+            return True
+        return False
+
+    def _release_probe(self) -> None:
+        if self._probe_done is not None:
+            self._probe_done.set()
+            self._probe_done = None
@@ -0,0 +1,45 @@
+import time
+
+from port_ocean.helpers.rate_limit.base import RateLimitStrategy
+
+
+class FixedWindowStrategy(RateLimitStrategy):
+    """Allows ``max_requests`` per ``period`` seconds, counted in fixed windows.
+
+    Windows start at the first request rather than on a wall-clock boundary.
+    Once a window is full, reservations roll over into the next one, so a burst
+    larger than the quota is spread across as many windows as it needs.
+    """
+
+    def __init__(self, max_requests: int, period: float) -> None:
+        if max_requests < 1 or period <= 0:
+            raise ValueError(
+                "Fixed window needs max_requests >= 1 and a positive period, "
+                f"got {max_requests} per {period}s"
+            )
+        self.max_requests = max_requests
+        self.period = period
+        self._window_start = float("-inf")
+        self._count = 0
+
+    def _roll(self, now: float) -> None:
+        if now >= self._window_start + self.period:
+            self._window_start = now
+            self._count = 0
+
+    @property
+    def available(self) -> float:
+        now = time.monotonic()
+        self._roll(now)
+        if self._window_start > now:
+            return 0.0
+        return float(self.max_requests - self._count)
+
+    def reserve(self) -> float:
+        now = time.monotonic()
+        self._roll(now)
+        if self._count >= self.max_requests:
+            self._window_start += self.period
+            self._count = 0
+        self._count += 1
+        return max(0.0, self._window_start - now)
@@ -0,0 +1,36 @@
+from datetime import datetime
+from typing import Optional
+
+from dateutil.parser import isoparse
+
+
+def parse_rate_limit_reset(
+    header_value: str, now: Optional[datetime] = None
+) -> Optional[float]:
+    """Parse a Retry-After / rate-limit reset header into seconds from ``now``.
+
+    Accepts a number of seconds, a UNIX timestamp or an ISO date. Returns None
+    when the value cannot be parsed.
+    """
+    now = now or datetime.now()
+    if header_value.isdigit():
+        value = int(header_value)
+
+        # Heuristic: large values could be UNIX timestamps
+        # Anything far bigger than "reasonable sleep" should be treated as epoch.
+        if value > 10_000:  # ~2.7 hours, safe threshold
+            sleep = value - int(now.timestamp())
+            return float(sleep) if sleep > 0 else 0.0
+
+        return float(value)
+
+    try:
+        # Try to parse as ISO date (common for rate limit headers like X-RateLimit-Reset)
+        parsed_date = isoparse(header_value).astimezone()
+        diff = (parsed_date - now.astimezone()).total_seconds()
+        if diff > 0:
+            return diff
+    except ValueError:
+        pass
+
+    return None
@@ -0,0 +1,202 @@
+import asyncio
+import random
+import time
+import weakref
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import Callable, Optional
+
+import httpx
+from loguru import logger
+
+from port_ocean.helpers.rate_limit.circuit_breaker import CircuitBreaker
+from port_ocean.helpers.rate_limit.token_bucket import TokenBucket
+
+# Requests per second a host is throttled to after its first 429 when no rate
+# was configured or learned from headers. Additive increase lifts it from there.
+_MIN_ADAPTIVE_RATE = 1.0
+_ADAPTIVE_INCREASE_PER_SUCCESS = 0.1
+_THROUGHPUT_WINDOW_SECONDS = 10.0
+
+
+@dataclass(frozen=True)
+class HostRateLimitConfig:
+    requests_per_second: float | None = None
+    burst: float | None = None
+    failure_threshold: int = 5
+    recovery_timeout: float = 30.0
+    jitter_ratio: float = 0.1
+
+
+class HostRateLimiter:
+    """Rate-limit and circuit state shared by every request to a single host.
+
+    Requests call ``acquire`` before being sent and report the outcome through
+    ``record_response`` / ``record_error``. The limiter:
+
+    * learns the allowed rate from ``x-ratelimit-remaining`` and
+      ``x-ratelimit-reset`` and gates requests through a token bucket,
+    * turns a 429 into a host-wide pause until ``Retry-After`` and then halves
+      the rate, so the waiting requests are released one slot at a time
+      instead of all at once,
+    * opens a circuit after ``failure_threshold`` consecutive 5xx responses
+      or transport errors.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        config: HostRateLimitConfig,
+        parse_reset_header: Callable[[str], Optional[float]],
+    ) -> None:
+        self.host = host
+        self._config = config
+        self._parse_reset_header = parse_reset_header
+        self._bucket = TokenBucket(config.requests_per_second, config.burst)
+        self._circuit = CircuitBreaker(
+            config.failure_threshold, config.recovery_timeout
+        )
+        self._rate_learned_from_headers = False
+        self._paused_until = 0.0
+        self._slow_down_not_before = 0.0
+        self._sent_at: list[float] = []
+
+    @property
+    def bucket(self) -> TokenBucket:
+        return self._bucket
+
+    @property
+    def circuit(self) -> CircuitBreaker:
+        return self._circuit
+
+    @property
+    def paused_until(self) -> float:
+        return self._paused_until
+
+    async def acquire(self) -> None:
+        while True:
+            remaining = self._paused_until - time.monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(remaining)
+        await self._circuit.wait_until_closed()
+        await self._bucket.acquire()
+        self._track_sent(time.monotonic())
+
+    def record_response(self, response: httpx.Response) -> None:
+        headers = response.headers
+        if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            # The next probe waits out the pause in the token bucket rather
+            # than holding everyone else for the recovery timeout.
+            self._circuit.record_inconclusive()
+            self._on_rate_limited(headers)
+            return
+        if response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR:
+            self.record_error()
+            return
+
+        self._circuit.record_success()
+        if not self._learn_rate_from_headers(headers):
+            self._increase_adaptive_rate()
+
+    def record_error(self) -> None:
+        if self._circuit.record_failure():
+            logger.warning(
+                f"Circuit opened for {self.host} after "
+                f"{self._circuit.consecutive_failures} consecutive failures, "
+                f"pausing requests for {self._circuit.recovery_timeout} seconds"
+            )
+
+    def _track_sent(self, now: float) -> None:
+        self._sent_at.append(now)
+        cutoff = now - _THROUGHPUT_WINDOW_SECONDS
+        if self._sent_at[0] < cutoff:
+            self._sent_at = [sent for sent in self._sent_at if sent >= cutoff]
+
+    def _observed_rate(self) -> float:
+        return len(self._sent_at) / _THROUGHPUT_WINDOW_SECONDS
+
+    def _header_seconds(self, headers: httpx.Headers, name: str) -> float | None:
+        if value := (headers.get(name) or "").strip():
+            return self._parse_reset_header(value)
+        return None
+
+    def _learn_rate_from_headers(self, headers: httpx.Headers) -> bool:
+        remaining_header = (headers.get("x-ratelimit-remaining") or "").strip()
+        reset_seconds = self._header_seconds(headers, "x-ratelimit-reset")
+        if not remaining_header.isdigit() or not reset_seconds:
+            return False
+
+        remaining = int(remaining_header)
+        if remaining == 0:
+            self._pause(reset_seconds)
+            return True
+        # Spread what is left of the window evenly over the time until reset.
+        self._bucket.set_rate(remaining / reset_seconds)
+        self._bucket.drain(remaining)
+        self._rate_learned_from_headers = True
+        return True
+
+    def _on_rate_limited(self, headers: httpx.Headers) -> None:
+        pause = self._header_seconds(headers, "Retry-After")
+        if pause is None:
+            pause = self._header_seconds(headers, "x-ratelimit-reset")
+        self._pause(pause or 0.0)
+        self._bucket.drain(0.0, refill_from=self._paused_until)
+        self._rate_learned_from_headers = False
+
+        # A wave of requests sent together is answered with a wave of 429s,
+        # slow down once per wave rather than once per response.
+        if time.monotonic() < self._slow_down_not_before:
+            return
+        current = self._bucket.rate or self._observed_rate()
+        new_rate = max(_MIN_ADAPTIVE_RATE, current / 2)
+        self._bucket.set_rate(new_rate, capacity=1.0)
+        self._slow_down_not_before = self._paused_until + 1 / new_rate
+        logger.warning(
+            f"Rate limited by {self.host}, pausing all requests to it for "
+            f"{pause or 0.0:.2f} seconds and throttling to {new_rate:.2f} requests/s"
+        )
+
+    def _pause(self, seconds: float) -> None:
+        jitter = seconds * self._config.jitter_ratio * random.random()
+        self._paused_until = max(
+            self._paused_until, time.monotonic() + seconds + jitter
+        )
+
+    def _increase_adaptive_rate(self) -> None:
+        rate = self._bucket.rate
+        if rate is None or self._rate_learned_from_headers:
+            return
+        if rate == self._config.requests_per_second:
+            return
+        new_rate = rate + _ADAPTIVE_INCREASE_PER_SUCCESS
+        if (
+            self._config.requests_per_second is not None
+            and new_rate >= self._config.requests_per_second
+        ):
+            self._bucket.set_rate(self._config.requests_per_second, self._config.burst)
+        else:
+            self._bucket.set_rate(new_rate)
+
+
+_HOST_LIMITERS: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, HostRateLimiter]]"
+) = weakref.WeakKeyDictionary()
+
+
+def get_host_rate_limiter(
+    host: str,
+    config: HostRateLimitConfig,
+    parse_reset_header: Callable[[str], Optional[float]],
+) -> HostRateLimiter:
+    """Return the limiter shared by all transports talking to ``host``.
+
+    Limiters are kept per event loop since their waiters are bound to it. The
+    first transport to reach a host decides its configuration.
+    """
+    limiters = _HOST_LIMITERS.setdefault(asyncio.get_running_loop(), {})
+    limiter = limiters.get(host)
+    if limiter is None:
+        limiter = limiters[host] = HostRateLimiter(host, config, parse_reset_header)
+    return limiter
@@ -0,0 +1,121 @@
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable
+
+import httpx
+from loguru import logger
+
+from port_ocean.context.ocean import ocean
+from port_ocean.helpers.metric.metric import MetricPhase, MetricType
+from port_ocean.helpers.rate_limit.base import RateLimitStrategy
+
+DEFAULT_KEY = "default"
+
+
+@dataclass
+class _Bucket:
+    strategy: RateLimitStrategy
+    semaphore: asyncio.Semaphore | None
+    waiting: int = field(default=0)
+
+
+class RateLimiter:
+    """Keyed rate limiter with an async context-manager API.
+
+    Every key (an org, a project, an API host...) gets its own bucket built by
+    ``strategy_factory``, and optionally a cap of ``max_concurrent`` requests
+    in flight. Usage::
+
+        limiter = RateLimiter(lambda: SlidingWindowStrategy(100, 60), name="jira")
+
+        async with limiter.limit(project_key):
+            response = await client.get(url)
+        limiter.observe(project_key, response)
+
+    Bucket state is exposed through the ``rate_limit_available_requests`` and
+    ``rate_limit_waiting_requests`` gauges, and time spent waiting is added to
+    ``rate_limit_wait_seconds``.
+    """
+
+    def __init__(
+        self,
+        strategy_factory: Callable[[], RateLimitStrategy],
+        *,
+        name: str = DEFAULT_KEY,
+        max_concurrent: int | None = None,
+    ) -> None:
+        self.name = name
+        self._strategy_factory = strategy_factory
+        self._max_concurrent = max_concurrent
+        self._buckets: dict[str, _Bucket] = {}
+
+    def _bucket(self, key: str) -> _Bucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            semaphore = (
+                asyncio.Semaphore(self._max_concurrent)
+                if self._max_concurrent
+                else None
+            )
+            bucket = self._buckets[key] = _Bucket(self._strategy_factory(), semaphore)
+        return bucket
+
+    def strategy(self, key: str = DEFAULT_KEY) -> RateLimitStrategy:
+        return self._bucket(key).strategy
+
+    def keys(self) -> list[str]:
+        return list(self._buckets)
+
+    @asynccontextmanager
+    async def limit(self, key: str = DEFAULT_KEY) -> AsyncIterator[None]:
+        bucket = self._bucket(key)
+        bucket.waiting += 1
+        self._report(key, bucket)
+        try:
+            waited = await bucket.strategy.acquire()
+            if bucket.semaphore is not None:
+                await bucket.semaphore.acquire()
+        finally:
+            bucket.waiting -= 1
+            self._report(key, bucket)
+        if waited > 0:
+            self._report_wait(key, waited)
+
+        try:
+            yield
+        finally:
+            if bucket.semaphore is not None:
+                bucket.semaphore.release()
+
+    def observe(self, key: str, response: httpx.Response) -> None:
+        bucket = self._bucket(key)
+        bucket.strategy.observe(response)
+        self._report(key, bucket)
+
+    def _report(self, key: str, bucket: _Bucket) -> None:
+        if not ocean.initialized:
+            return
+        try:
+            ocean.metrics.set_metric(
+                MetricType.RATE_LIMIT_WAITING_NAME, [self.name, key], bucket.waiting
+            )
+            ocean.metrics.set_metric(
+                MetricType.RATE_LIMIT_AVAILABLE_NAME,
+                [self.name, key],
+                bucket.strategy.available,
+            )
+        except Exception as e:
+            logger.debug(f"Failed to report rate limiter metrics: {e}")
+
+    def _report_wait(self, key: str, waited: float) -> None:
+        if not ocean.initialized:
+            return
+        try:
+            ocean.metrics.inc_metric(
+                MetricType.RATE_LIMIT_WAIT_NAME,
+                [ocean.metrics.current_resource_kind(), MetricPhase.EXTRACT, key],
+                waited,
+            )
+        except Exception as e:
+            logger.debug(f"Failed to report rate limiter wait time: {e}")
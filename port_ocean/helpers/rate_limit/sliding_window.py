@@ -0,0 +1,43 @@
+import time
+from collections import deque
+
+from port_ocean.helpers.rate_limit.base import RateLimitStrategy
+
+
+class SlidingWindowStrategy(RateLimitStrategy):
+    """Allows at most ``max_requests`` in any ``period`` second span.
+
+    Unlike a fixed window this never lets ``2 * max_requests`` through around
+    a window boundary. Reserved slots are kept in order, so the next slot is
+    simply ``period`` seconds after the ``max_requests``-th most recent one.
+    """
+
+    def __init__(self, max_requests: int, period: float) -> None:
+        if max_requests < 1 or period <= 0:
+            raise ValueError(
+                "Sliding window needs max_requests >= 1 and a positive period, "
+                f"got {max_requests} per {period}s"
+            )
+        self.max_requests = max_requests
+        self.period = period
+        self._slots: deque[float] = deque()
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.period
+        while self._slots and self._slots[0] <= cutoff:
+            self._slots.popleft()
+
+    @property
+    def available(self) -> float:
+        now = time.monotonic()
+        self._prune(now)
+        return float(max(0, self.max_requests - len(self._slots)))
+
+    def reserve(self) -> float:
+        now = time.monotonic()
+        self._prune(now)
+        slot = now
+        if len(self._slots) >= self.max_requests:
+            slot = max(now, self._slots[-self.max_requests] + self.period)
+        self._slots.append(slot)
+        return slot - now
@@ -0,0 +1,83 @@
+import time
+
+from port_ocean.helpers.rate_limit.base import RateLimitStrategy
+
+
+class TokenBucket(RateLimitStrategy):
+    """Reservation based token bucket.
+
+    Every ``acquire`` reserves the next free slot up front, so concurrent
+    callers are spaced ``1 / rate`` seconds apart instead of all waking up at
+    the same moment and racing for a single token. A ``rate`` of ``None``
+    disables the bucket entirely.
+    """
+
+    def __init__(self, rate: float | None = None, capacity: float | None = None):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+
+    @property
+    def rate(self) -> float | None:
+        return self._rate
+
+    @property
+    def capacity(self) -> float:
+        if self._capacity is not None:
+            return self._capacity
+        return max(1.0, self._rate or 1.0)
+
+    @property
+    def tokens(self) -> float:
+        self._refill(time.monotonic())
+        return self._tokens
+
+    @property
+    def available(self) -> float:
+        tokens = self.tokens
+        if self._updated_at > time.monotonic():
+            return 0.0
+        return max(0.0, tokens)
+
+    def _refill(self, now: float) -> None:
+        if self._rate is None:
+            self._tokens = self.capacity
+        elif now > self._updated_at:
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated_at) * self._rate
+            )
+        # The refill clock may be pushed into the future by ``drain``.
+        self._updated_at = max(self._updated_at, now)
+
+    def set_rate(self, rate: float | None, capacity: float | None = None) -> None:
+        now = time.monotonic()
+        self._refill(now)
+        self._rate = rate
+        if capacity is not None:
+            self._capacity = capacity
+        self._tokens = min(self._tokens, self.capacity)
+
+    def drain(self, tokens: float = 0.0, refill_from: float | None = None) -> None:
+        """Drop the available tokens to ``tokens``, e.g. after a 429.
+
+        ``refill_from`` is a ``time.monotonic()`` timestamp before which no
+        tokens are refilled, used to hold the bucket empty during a pause.
+        """
+        now = time.monotonic()
+        self._refill(now)
+        self._tokens = min(self._tokens, tokens)
+        if refill_from is not None:
+            self._updated_at = max(self._updated_at, refill_from)
+
+    def reserve(self) -> float:
+        """Take a token and return how long the caller must wait before using it."""
+        if self._rate is None:
+            return 0.0
+        now = time.monotonic()
+        self._refill(now)
+        self._tokens -= 1
+        wait = self._updated_at - now
+        if self._tokens < 0:
+            wait += -self._tokens / self._rate
+        return max(0.0, wait)
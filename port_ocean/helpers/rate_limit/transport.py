@@ -0,0 +1,39 @@
+from typing import Callable
+
+import httpx
+
+from port_ocean.helpers.rate_limit.limiter import RateLimiter
+
+
+def _host_key(request: httpx.Request) -> str:
+    return request.url.host
+
+
+class RateLimitTransport(httpx.AsyncBaseTransport):
+    """Sends every request through a ``RateLimiter`` bucket.
+
+    Meant to sit under ``RetryTransport`` so retries are limited too, which is
+    what ``OceanAsyncClient(rate_limiter=...)`` does. Buckets are keyed by host
+    unless ``key_func`` says otherwise, and every response is fed back to the
+    bucket so header-driven strategies can adapt.
+    """
+
+    def __init__(
+        self,
+        wrapped: httpx.AsyncBaseTransport,
+        limiter: RateLimiter,
+        key_func: Callable[[httpx.Request], str] = _host_key,
+    ) -> None:
+        self._wrapped = wrapped
+        self._limiter = limiter
+        self._key_func = key_func
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = self._key_func(request)
+        async with self._limiter.limit(key):
+            response = await self._wrapped.handle_async_request(request)
+        self._limiter.observe(key, response)
+        return response
+
+    async def aclose(self) -> None:
+        await self._wrapped.aclose()
@@ -0,0 +1,458 @@
+"""
+Recording of resyncs for offline replay.
+
+While a resync is recorded, every third-party HTTP attempt made through an
+``OceanAsyncClient`` is written with its timing and response to a gzipped JSON
+lines file, along with the port app config of the resync. The file can be
+replayed through ``IntegrationTestHarness.from_recording`` to reproduce and
+profile a slow resync without access to the third-party system.
+
+Request and response bodies, URLs and response headers are masked with
+``sensitive_log_filter`` and request headers are not recorded at all. Requests
+to Port are not recorded. Records are masked, encoded and compressed on a
+writer thread, so recording costs the event loop a queue put per attempt.
+
+Only attempts made from the resync's own task and the tasks it starts are
+recorded, so concurrent work such as webhook processing is left out. Response
+bodies are copied as the caller reads them, so streamed responses stay streamed. Bodies above ``max_body_bytes`` are recorded without their
+content, and a recording stops once ``max_queued_bytes`` wait for the writer.
+"""
+
+import asyncio
+import base64
+import gzip
+import json
+import os
+import queue
+import threading
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, AsyncIterator, Optional
+
+import httpx
+from loguru import logger
+
+from port_ocean.log.sensetive import sensitive_log_filter
+
+if TYPE_CHECKING:
+    from port_ocean.config.settings import ResyncRecorderSettings
+
+RECORDING_FORMAT_VERSION = 1
+HEADER_RECORD = "header"
+PORT_APP_CONFIG_RECORD = "port_app_config"
+CALL_RECORD = "call"
+
+_DROPPED_RESPONSE_HEADERS = frozenset(
+    {"set-cookie", "content-encoding", "content-length", "transfer-encoding"}
+)
+_TEXT_CONTENT_TYPES = ("json", "text", "xml", "javascript", "x-www-form-urlencoded")
+
+
+def _mask(text: str) -> str:
+    return sensitive_log_filter.mask_string(text, full_hide=True)
+
+
+def _encode_body(content: bytes, content_type: str) -> dict[str, str]:
+    if not content:
+        return {}
+    if any(marker in content_type for marker in _TEXT_CONTENT_TYPES) or not (
+        content_type
+    ):
+        try:
+            return {"text": _mask(content.decode("utf-8"))}
+        except UnicodeDecodeError:
+            pass
+    return {"base64": base64.b64encode(content).decode("ascii")}
+
+
+def decode_body(record: dict[str, Any]) -> bytes:
+    """The bytes of a body encoded by the recorder."""
+    if "text" in record:
+        return record["text"].encode("utf-8")
+    if "base64" in record:
+        return base64.b64decode(record["base64"])
+    return b""
+
+
+# What a queued call is charged for besides its bodies.
+_CALL_OVERHEAD_BYTES = 1024
+
+
+class ResyncRecording:
+    """One resync's recording file, written by a background thread.
+
+    Calls wait for the writer in a queue bounded by ``max_queued_bytes``. When
+    the writer falls behind that far, or the file reaches ``max_size_bytes``,
+    the recording is marked ``truncated`` and records no more calls.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        header: dict[str, Any],
+        max_size_bytes: int,
+        max_queued_bytes: int,
+    ):
+        self.path = path
+        self.max_size_bytes = max_size_bytes
+        self.max_queued_bytes = max_queued_bytes
+        self.started_at = time.monotonic()
+        self.calls = 0
+        self.truncated = False
+        self.closed = False
+        self._queue: queue.SimpleQueue[Optional[dict[str, Any]]] = queue.SimpleQueue()
+        self._queued_bytes = 0
+        self._queued_bytes_lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: IO[bytes] = path.open("wb")
+        self._gzip = gzip.GzipFile(fileobj=self._file, mode="wb", compresslevel=6)
+        self._write_record({"type": HEADER_RECORD, **header})
+        self._thread = threading.Thread(
+            target=self._write_records, name="ocean-resync-recorder", daemon=True
+        )
+        self._thread.start()
+
+    def record_port_app_config(self, port_app_config: dict[str, Any]) -> None:
+        self._queue.put({"type": PORT_APP_CONFIG_RECORD, "config": port_app_config})
+
+    def record_call(
+        self,
+        request: httpx.Request,
+        request_body: bytes | None,
+        response: httpx.Response | None,
+        response_body: bytes | None,
+        started_at: float,
+        duration: float,
+        error: BaseException | None = None,
+    ) -> None:
+        """Queue an attempt. A body of None was not recorded: too large, or a
+        streamed request. Masking and encoding happen on the writer thread."""
+        if self.truncated or self.closed:
+            return
+        size = (
+            len(request_body or b"") + len(response_body or b"") + _CALL_OVERHEAD_BYTES
+        )
+        with self._queued_bytes_lock:
+            fell_behind = self._queued_bytes + size > self.max_queued_bytes
+            if not fell_behind:
+                self._queued_bytes += size
+        if fell_behind:
+            self.truncated = True
+            logger.warning(
+                f"Resync recording {self.path} fell {self.max_queued_bytes} bytes "
+                "behind, recording no more calls"
+            )
+            return
+        self.calls += 1
+        self._queue.put(
+            {
+                "type": CALL_RECORD,
+                "size": size,
+                "method": request.method,
+                "url": str(request.url),
+                "request_content_type": request.headers.get("content-type", ""),
+                "request_body": request_body,
+                "status": response.status_code if response is not None else None,
+                "headers": (
+                    list(response.headers.items()) if response is not None else []
+                ),
+                "response_body": response_body,
+                "offset": started_at - self.started_at,
+                "duration": duration,
+                "error": type(error).__name__ if error is not None else None,
+            }
+        )
+
+    def close(self) -> None:
+        # Tasks started during the resync may outlive it; their calls are dropped.
+        self.closed = True
+        self._queue.put(None)
+        self._thread.join()
+        self._gzip.close()
+        self._file.close()
+
+    def _write_records(self) -> None:
+        while True:
+            record = self._queue.get()
+            if record is None:
+                return
+            try:
+                if record["type"] == CALL_RECORD:
+                    with self._queued_bytes_lock:
+                        self._queued_bytes -= record["size"]
+                    record = self._encode_call(record)
+                self._write_record(record)
+            except Exception as e:
+                logger.warning(f"Failed to write to resync recording {self.path}: {e}")
+                self.truncated = True
+            if not self.truncated and self._file.tell() >= self.max_size_bytes:
+                logger.warning(
+                    f"Resync recording {self.path} reached "
+                    f"{self.max_size_bytes} bytes, recording no more calls"
+                )
+                self.truncated = True
+
+    def _write_record(self, record: dict[str, Any]) -> None:
+        self._gzip.write(
+            json.dumps(record, separators=(",", ":"), default=str).encode() + b"\n"
+        )
+
+    @staticmethod
+    def _encode_call(record: dict[str, Any]) -> dict[str, Any]:
+        encoded: dict[str, Any] = {
+            "type": CALL_RECORD,
+            "method": record["method"],
+            "url": _mask(record["url"]),
+            "offset": round(record["offset"], 6),
+            "duration": round(record["duration"], 6),
+        }
+        if record["request_body"] is None:
+            encoded["request_body_omitted"] = True
+        else:
+            encoded["request_body"] = _encode_body(
+                record["request_body"], record["request_content_type"]
+            )
+        if record["error"] is not None:
+            encoded["error"] = record["error"]
+        if record["status"] is not None:
+            headers = dict(record["headers"])
+            encoded["status"] = record["status"]
+            encoded["headers"] = {
+                name: _mask(value)
+                for name, value in headers.items()
+                if name.lower() not in _DROPPED_RESPONSE_HEADERS
+            }
+            if record["response_body"] is None:
+                encoded["body_omitted"] = True
+            else:
+                encoded["body"] = _encode_body(
+                    record["response_body"], headers.get("content-type", "")
+                )
+        return encoded
+
+
+class ResyncRecorder:
+    def __init__(self, settings: "ResyncRecorderSettings", port_base_url: str):
+        self.settings = settings
+        self.port_base_url = port_base_url.rstrip("/")
+        self.recording: ResyncRecording | None = None
+
+    def is_recorded(self, request: httpx.Request) -> bool:
+        return not str(request.url).startswith(self.port_base_url)
+
+    def start(self, resync_id: str, integration_type: str) -> ResyncRecording | None:
+        if self.recording is not None:
+            # Resyncs do not overlap, but never write two recordings at once.
+            return None
+        started_at = datetime.now(timezone.utc)
+        path = Path(self.settings.output_dir) / (
+            f"resync-{started_at.strftime('%Y%m%dT%H%M%SZ')}-{resync_id}.jsonl.gz"
+        )
+        try:
+            self.recording = ResyncRecording(
+                path,
+                {
+                    "version": RECORDING_FORMAT_VERSION,
+                    "resync_id": resync_id,
+                    "integration_type": integration_type,
+                    "started_at": started_at.isoformat(),
+                },
+                self.settings.max_size_bytes,
+                self.settings.max_queued_bytes,
+            )
+        except OSError as e:
+            logger.warning(f"Failed to start a resync recording at {path}: {e}")
+            return None
+        logger.info(f"Recording resync third-party calls to {path}")
+        return self.recording
+
+    def stop(self) -> None:
+        recording, self.recording = self.recording, None
+        if recording is None:
+            return
+        recording.close()
+        logger.info(
+            f"Recorded {recording.calls} third-party calls to {recording.path}"
+            f" ({os.path.getsize(recording.path) / 1024**2:.1f}MB)"
+        )
+
+
+_recorder: ResyncRecorder | None = None
+# The recording of the resync whose context a call is made from.
+_active_recording: ContextVar[ResyncRecording | None] = ContextVar(
+    "active_resync_recording", default=None
+)
+
+
+def configure_resync_recorder(
+    settings: "ResyncRecorderSettings", port_base_url: str
+) -> None:
+    """Record resyncs when ``settings.enabled``. Clients created from now on
+    are wrapped with ``ResyncRecordingTransport``."""
+    global _recorder
+    _recorder = ResyncRecorder(settings, port_base_url) if settings.enabled else None
+
+
+def is_resync_recorder_configured() -> bool:
+    return _recorder is not None
+
+
+def get_active_recording() -> ResyncRecording | None:
+    return _active_recording.get()
+
+
+@asynccontextmanager
+async def resync_recording(
+    resync_id: str, integration_type: str
+) -> AsyncIterator[ResyncRecording | None]:
+    """Record the third-party calls made in the block, and in the tasks it
+    starts, if recording is configured."""
+    recorder = _recorder
+    if recorder is None:
+        yield None
+        return
+    recording = recorder.start(resync_id, integration_type)
+    token = _active_recording.set(recording)
+    try:
+        yield recording
+    finally:
+        _active_recording.reset(token)
+        if recording is not None:
+            # Waits for the writer thread to drain its queue.
+            await asyncio.to_thread(recorder.stop)
+
+
+class _RecordingStream(httpx.AsyncByteStream):
+    """Passes a response body through while keeping a copy of it, up to
+    ``max_body_bytes``, and records the call once the body is closed. Nothing
+    is read on the caller's behalf, so streamed responses stay streamed."""
+
+    def __init__(
+        self,
+        stream: httpx.AsyncByteStream,
+        recording: ResyncRecording,
+        request: httpx.Request,
+        request_body: bytes | None,
+        response: httpx.Response,
+        started_at: float,
+        max_body_bytes: int,
+    ) -> None:
+        self._stream = stream
+        self._recording = recording
+        self._request = request
+        self._request_body = request_body
+        self._response = response
+        self._started_at = started_at
+        self._max_body_bytes = max_body_bytes
+        self._chunks: list[bytes] | None = []
+        self._size = 0
+        self._error: BaseException | None = None
+        self._recorded = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self._stream:
+                if self._chunks is not None:
+                    self._size += len(chunk)
+                    if self._size > self._max_body_bytes:
+                        self._chunks = None
+                    else:
+                        self._chunks.append(chunk)
+                yield chunk
+        except Exception as e:
+            self._error = e
+            raise
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._record()
+
+    def _record(self) -> None:
+        if self._recorded:
+            return
+        self._recorded = True
+        body = b"".join(self._chunks) if self._chunks is not None else None
+        self._recording.record_call(
+            self._request,
+            self._request_body,
+            self._response,
+            body,
+            self._started_at,
+            time.monotonic() - self._started_at,
+            self._error,
+        )
+
+
+class ResyncRecordingTransport(httpx.AsyncBaseTransport):
+    """Records the attempts made while a resync is recorded. Wraps the
+    connection transport, under any retry transport, so every attempt and its
+    own latency is recorded. A response is recorded once the caller has read
+    and closed it, so its latency includes the body's transfer."""
+
+    def __init__(self, wrapped: httpx.AsyncBaseTransport) -> None:
+        self._wrapped = wrapped
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        recorder = _recorder
+        recording = _active_recording.get()
+        if (
+            recorder is None
+            or recording is None
+            or recording.closed
+            or not recorder.is_recorded(request)
+        ):
+            return await self._wrapped.handle_async_request(request)
+        max_body_bytes = recorder.settings.max_body_bytes
+        request_body = _request_body(request, max_body_bytes)
+        started_at = time.monotonic()
+        try:
+            response = await self._wrapped.handle_async_request(request)
+        except Exception as e:
+            recording.record_call(
+                request,
+                request_body,
+                None,
+                None,
+                started_at,
+                time.monotonic() - started_at,
+                e,
+            )
+            raise
+        if hasattr(response, "_content"):
+            # Built with its content, e.g. by a mock transport: already read.
+            recording.record_call(
+                request,
+                request_body,
+                response,
+                response.content if len(response.content) <= max_body_bytes else None,
+                started_at,
+                time.monotonic() - started_at,
+            )
+            return response
+        response.stream = _RecordingStream(
+            response.stream,  # type: ignore[arg-type]
+            recording,
+            request,
+            request_body,
+            response,
+            started_at,
+            max_body_bytes,
+        )
+        return response
+
+    async def aclose(self) -> None:
+        await self._wrapped.aclose()
+
+
+def _request_body(request: httpx.Request, max_body_bytes: int) -> bytes | None:
+    """The request's body, or None when it is streamed or too large."""
+    try:
+        content = request.content
+    except httpx.RequestNotRead:
+        return None
+    return content if len(content) <= max_body_bytes else None
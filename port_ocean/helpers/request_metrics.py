@@ -0,0 +1,122 @@
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+import httpx
+from loguru import logger
+
+from port_ocean.context.ocean import ocean
+from port_ocean.helpers.metric.metric import MetricType
+
+# Path segments of the Port API that name a route rather than an identifier.
+# Every other segment is reported as `{id}` to keep the endpoint label bounded.
+_PORT_ROUTE_SEGMENTS = frozenset(
+    {
+        "access_token",
+        "ack",
+        "actions",
+        "all-entities",
+        "auth",
+        "blueprints",
+        "bulk",
+        "claim-pending",
+        "config",
+        "cursor",
+        "datasource-entities",
+        "delete",
+        "entities",
+        "examples",
+        "integration",
+        "kafka-credentials",
+        "kind",
+        "kinds",
+        "logs",
+        "migrations",
+        "nodes",
+        "organization",
+        "pages",
+        "provision-enabled",
+        "resync",
+        "resync-request",
+        "resync-state",
+        "runs",
+        "scorecards",
+        "search",
+        "syncMetrics",
+        "v1",
+        "workflows",
+    }
+)
+
+
+def port_endpoint(request: httpx.Request) -> str:
+    """The method and route of a Port API request, e.g.
+    `POST /v1/blueprints/{id}/entities/bulk`."""
+    segments = [
+        segment if segment in _PORT_ROUTE_SEGMENTS else "{id}"
+        for segment in request.url.path.split("/")
+        if segment
+    ]
+    return f"{request.method} /{'/'.join(segments)}"
+
+
+def _request_host(request: httpx.Request) -> str:
+    return request.url.host
+
+
+@dataclass(frozen=True)
+class RequestDurationMetric:
+    """A histogram of request durations and how to name the target of a request."""
+
+    name: str
+    target: Callable[[httpx.Request], str]
+
+
+PORT_REQUEST_DURATION = RequestDurationMetric(
+    MetricType.PORT_REQUEST_DURATION_NAME, port_endpoint
+)
+THIRD_PARTY_REQUEST_DURATION = RequestDurationMetric(
+    MetricType.THIRD_PARTY_REQUEST_DURATION_NAME, _request_host
+)
+
+
+class RequestDurationMetricsTransport(httpx.AsyncBaseTransport):
+    """Reports how long each request attempt took until its response headers
+    arrived, labeled with the request target and the response status (or the
+    error type when no response arrived).
+
+    Wraps the connection transport (under any retry transport), so every
+    attempt is observed on its own.
+    """
+
+    def __init__(
+        self, wrapped: httpx.AsyncBaseTransport, metric: RequestDurationMetric
+    ) -> None:
+        self._wrapped = wrapped
+        self._metric = metric
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started_at = time.monotonic()
+        status = "error"
+        try:
+            response = await self._wrapped.handle_async_request(request)
+            status = str(response.status_code)
+            return response
+        except Exception as e:
+            status = type(e).__name__
+            raise
+        finally:
+            self._report(request, status, time.monotonic() - started_at)
+
+    def _report(self, request: httpx.Request, status: str, duration: float) -> None:
+        if not ocean.initialized:
+            return
+        try:
+            ocean.metrics.observe_metric(
+                self._metric.name, [self._metric.target(request), status], duration
+            )
+        except Exception as e:
+            logger.debug(f"Failed to report request duration metrics: {e}")
+
+    async def aclose(self) -> None:
+        await self._wrapped.aclose()
@@ -17,9 +17,15 @@ from typing import (
     List,
 )
 import httpx
-from dateutil.parser import isoparse
 import logging
+from port_ocean.helpers.metric.metric import MetricType
 from port_ocean.helpers.monitor.monitor import get_monitor
+from port_ocean.helpers.rate_limit import (
+    HostRateLimitConfig,
+    HostRateLimiter,
+    get_host_rate_limiter,
+)
+from port_ocean.helpers.rate_limit.headers import parse_rate_limit_reset
 from port_ocean.context.ocean import ocean
 
 MAX_BACKOFF_WAIT_IN_SECONDS = 60
@@ -63,6 +69,11 @@ class RetryConfig:
         retry_after_headers: Optional[List[str]] = None,
         additional_retry_status_codes: Optional[Iterable[int]] = None,
         ignore_retry_after_status_codes: Optional[Iterable[int]] = None,
+        shared_rate_limit: bool = False,
+        rate_limit_requests_per_second: Optional[float] = None,
+        rate_limit_burst: Optional[float] = None,
+        circuit_breaker_failure_threshold: int = 5,
+        circuit_breaker_recovery_timeout: float = 30.0,
     ):
         """
         Initialize retry configuration.
@@ -79,6 +90,15 @@ class RetryConfig:
             additional_retry_status_codes: Additional status codes to retry (extends system defaults)
             ignore_retry_after_status_codes: Status codes that should ignore Retry-After/rate-limit headers
                 and always fall back to exponential backoff.
+            shared_rate_limit: Share rate-limit and circuit-breaker state between all requests to the
+                same host, so a 429 pauses every in-flight request instead of each one backing off alone.
+                Transports without a RetryConfig take it from ``OCEAN__SHARED_RATE_LIMIT__*``
+            rate_limit_requests_per_second: Initial per-host request rate when shared_rate_limit is on.
+                None means unlimited until the host sends rate-limit headers or a 429
+            rate_limit_burst: Maximum number of requests sent back to back before the rate applies
+            circuit_breaker_failure_threshold: Consecutive 5xx responses or transport errors that open
+                the circuit for a host
+            circuit_breaker_recovery_timeout: Seconds an open circuit holds requests before probing the host
         """
         self.max_attempts = max_attempts
         self.max_backoff_wait = max_backoff_wait
@@ -127,10 +147,53 @@ class RetryConfig:
             else frozenset()
         )
 
+        self.shared_rate_limit = shared_rate_limit
+        self.rate_limit_requests_per_second = rate_limit_requests_per_second
+        self.rate_limit_burst = rate_limit_burst
+        self.circuit_breaker_failure_threshold = circuit_breaker_failure_threshold
+        self.circuit_breaker_recovery_timeout = circuit_breaker_recovery_timeout
+
         if jitter_ratio < 0 or jitter_ratio > 0.5:
             raise ValueError(
                 f"Jitter ratio should be between 0 and 0.5, actual {jitter_ratio}"
             )
+        if rate_limit_requests_per_second is not None and (
+            rate_limit_requests_per_second <= 0
+        ):
+            raise ValueError(
+                "Rate limit requests per second should be positive, "
+                f"actual {rate_limit_requests_per_second}"
+            )
+
+    def host_rate_limit_config(self) -> HostRateLimitConfig:
+        return HostRateLimitConfig(
+            requests_per_second=self.rate_limit_requests_per_second,
+            burst=self.rate_limit_burst,
+            failure_threshold=self.circuit_breaker_failure_threshold,
+            recovery_timeout=self.circuit_breaker_recovery_timeout,
+            jitter_ratio=self.jitter_ratio,
+        )
+
+
+def _configured_shared_rate_limit() -> dict[str, Any]:
+    """The ``RetryConfig`` arguments for ``ocean.config.shared_rate_limit``.
+
+    Only used for transports that get no ``RetryConfig`` of their own. Outside
+    an initialized Ocean app (tests, scripts) there are no settings to apply.
+    """
+    try:
+        settings = ocean.config.shared_rate_limit
+        if settings.enabled is not True:
+            return {}
+    except Exception:
+        return {}
+    return {
+        "shared_rate_limit": True,
+        "rate_limit_requests_per_second": settings.requests_per_second,
+        "rate_limit_burst": settings.burst,
+        "circuit_breaker_failure_threshold": settings.circuit_breaker_failure_threshold,
+        "circuit_breaker_recovery_timeout": settings.circuit_breaker_recovery_timeout,
+    }
 
 
 # Adapted from https://github.com/encode/httpx/issues/108#issuecomment-1434439481
@@ -226,6 +289,7 @@ class RetryTransport(httpx.AsyncBaseTransport, httpx.BaseTransport):
                 retryable_methods=retryable_methods,
                 retry_status_codes=retry_status_codes,
                 retry_after_headers=retry_after_headers,
+                **_configured_shared_rate_limit(),
             )
 
         self._logger = logger
@@ -373,11 +437,17 @@ class RetryTransport(httpx.AsyncBaseTransport, httpx.BaseTransport):
         """
         try:
             transport: httpx.AsyncBaseTransport = self._wrapped_transport  # type: ignore
+            send_method = partial(transport.handle_async_request)
+            if self._retry_config.shared_rate_limit:
+                send_method = partial(
+                    self._send_with_shared_rate_limit_async,
+                    self._get_host_rate_limiter(request),
+                    transport.handle_async_request,
+                )
             if self._is_retryable_method(request):
-                send_method = partial(transport.handle_async_request)
                 response = await self._retry_operation_async(request, send_method)
             else:
-                response = await transport.handle_async_request(request)
+                response = await send_method(request)
 
             await self._log_response_size_async(request, response)
 
@@ -388,6 +458,33 @@ class RetryTransport(httpx.AsyncBaseTransport, httpx.BaseTransport):
                 self._logger.exception(f"{repr(e)} - {request.url}", exc_info=e)
             raise e
 
+    def _get_host_rate_limiter(self, request: httpx.Request) -> HostRateLimiter:
+        return get_host_rate_limiter(
+            request.url.host,
+            self._retry_config.host_rate_limit_config(),
+            self._parse_retry_header,
+        )
+
+    async def _send_with_shared_rate_limit_async(
+        self,
+        limiter: HostRateLimiter,
+        send: Callable[[httpx.Request], Coroutine[Any, Any, httpx.Response]],
+        request: httpx.Request,
+    ) -> httpx.Response:
+        """Send a single attempt through the host's shared limiter.
+
+        Every attempt, first try or retry, waits for the host-wide pause, the
+        circuit and a token, so retries after a 429 are released one by one.
+        """
+        await limiter.acquire()
+        try:
+            response = await send(request)
+        except httpx.TransportError:
+            limiter.record_error()
+            raise
+        limiter.record_response(response)
+        return response
+
     async def aclose(self) -> None:
         """
         Closes the underlying HTTP transport, terminating all outstanding connections and rejecting any further
@@ -456,6 +553,31 @@ class RetryTransport(httpx.AsyncBaseTransport, httpx.BaseTransport):
                 f" {type(error).__name__} - {str(error) or 'No error message'}, retrying in {sleep_time} seconds."
             )
 
+    def _report_retry(
+        self,
+        request: httpx.Request,
+        sleep_time: float,
+        response: httpx.Response | None,
+        error: Exception | None,
+    ) -> None:
+        reason = (
+            str(response.status_code)
+            if response is not None
+            else type(error).__name__ if error is not None else "unknown"
+        )
+        try:
+            if not ocean.initialized:
+                return
+            ocean.metrics.inc_metric(
+                MetricType.HTTP_RETRIES_NAME, [request.url.host, reason], 1
+            )
+            ocean.metrics.observe_metric(
+                MetricType.RETRY_SLEEP_NAME, [request.url.host], sleep_time
+            )
+        except Exception as e:
+            if self._logger:
+                self._logger.debug(f"Failed to report retry metrics: {e}")
+
     def _should_log_response_size(self, request: httpx.Request) -> bool:
         return self._logger is not None and not request.url.host.endswith("port.io")
 
@@ -633,28 +755,7 @@ class RetryTransport(httpx.AsyncBaseTransport, httpx.BaseTransport):
         Returns:
             Sleep time in seconds if parsing succeeds, None if the header value cannot be parsed
         """
-        if header_value.isdigit():
-            value = int(header_value)
-            now = int(datetime.now().timestamp())
-
-            # Heuristic: large values could be UNIX timestamps
-            # Anything far bigger than "reasonable sleep" should be treated as epoch.
-            if value > 10_000:  # ~2.7 hours, safe threshold
-                sleep = value - now
-                return float(sleep) if sleep > 0 else 0.0
-
-            return float(value)
-
-        try:
-            # Try to parse as ISO date (common for rate limit headers like X-RateLimit-Reset)
-            parsed_date = isoparse(header_value).astimezone()
-            diff = (parsed_date - datetime.now().astimezone()).total_seconds()
-            if diff > 0:
-                return diff
-        except ValueError:
-            pass
-
-        return None
+        return parse_rate_limit_reset(header_value, datetime.now())
 
     async def _retry_operation_async(
         self,
@@ -679,6 +780,7 @@ class RetryTransport(httpx.AsyncBaseTransport, httpx.BaseTransport):
                 if refreshed_request is not None:
                     request = refreshed_request
                 self._log_before_retry(request, sleep_time, response, error)
+                self._report_retry(request, sleep_time, response, error)
                 await asyncio.sleep(sleep_time)
                 post_sleep_request = await self.before_retry_after_sleep_async(
                     request, response, sleep_time, attempts_made
@@ -757,6 +859,7 @@ class RetryTransport(httpx.AsyncBaseTransport, httpx.BaseTransport):
                 if refreshed_request is not None:
                     request = refreshed_request
                 self._log_before_retry(request, sleep_time, response, error)
+                self._report_retry(request, sleep_time, response, error)
                 time.sleep(sleep_time)
                 post_sleep_request = self.before_retry_after_sleep(
                     request, response, sleep_time, attempts_made
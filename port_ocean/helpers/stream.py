@@ -1,51 +1,79 @@
+import json
 import os
+from contextlib import aclosing
 from typing import Any, AsyncGenerator
 import uuid
 
 import aiofiles
 import httpx
 import ijson  # type: ignore[import-untyped]
-from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.ciphers import Cipher, CipherContext, algorithms
 
 import port_ocean.context.ocean as ocean_context
 
 
+class _SpoolCipher:
+    """ChaCha20 stream cipher with a throwaway key for a single spool file.
+
+    A stream cipher keeps ciphertext the same size as the plaintext, so the spool
+    can be written and read back in arbitrary chunks through one context each.
+    """
+
+    def __init__(self) -> None:
+        self._algorithm = algorithms.ChaCha20(os.urandom(32), os.urandom(16))
+
+    def encryptor(self) -> CipherContext:
+        return Cipher(self._algorithm, mode=None).encryptor()
+
+    def decryptor(self) -> CipherContext:
+        return Cipher(self._algorithm, mode=None).decryptor()
+
+
 class Stream:
     def __init__(self, response: httpx.Response):
         self.response = response
         self.headers = response.headers
         self.status_code = response.status_code
 
+    async def _response_bytes(self, chunk_size: int) -> AsyncGenerator[bytes, None]:
+        try:
+            async for chunk in self.response.aiter_bytes(chunk_size=chunk_size):
+                if chunk:
+                    yield chunk
+        finally:
+            await self.response.aclose()
+
     async def _byte_stream(
         self, chunk_size: int | None = None
     ) -> AsyncGenerator[bytes, None]:
+        streaming_config = ocean_context.ocean.config.streaming
         if chunk_size is None:
-            chunk_size = ocean_context.ocean.config.streaming.chunk_size
+            chunk_size = streaming_config.chunk_size
 
-        streaming_location = ocean_context.ocean.config.streaming.location
-        os.makedirs(streaming_location, exist_ok=True)
+        if streaming_config.spool_mode == "passthrough":
+            async with aclosing(self._response_bytes(chunk_size)) as response_bytes:
+                async for chunk in response_bytes:
+                    yield chunk
+            return
 
+        # Spooling releases the connection as soon as the download is done,
+        # regardless of how slowly the items are consumed.
+        streaming_location = streaming_config.location
+        os.makedirs(streaming_location, exist_ok=True)
         file_name = f"{streaming_location}/{uuid.uuid4()}"
-
-        crypt = Fernet(Fernet.generate_key())
+        cipher = _SpoolCipher() if streaming_config.spool_mode == "encrypted" else None
 
         try:
-            async for chunk in self.response.aiter_bytes(chunk_size=chunk_size):
-                async with aiofiles.open(f"{file_name}", "ab") as f:
-                    if len(chunk) > 0:
-                        await f.write(crypt.encrypt(chunk))
-                        await f.write(b"\n")
-        finally:
-            await self.response.aclose()
+            async with aiofiles.open(file_name, "wb") as f:
+                encryptor = cipher.encryptor() if cipher else None
+                async with aclosing(self._response_bytes(chunk_size)) as response_bytes:
+                    async for chunk in response_bytes:
+                        await f.write(encryptor.update(chunk) if encryptor else chunk)
 
-        try:
-            async with aiofiles.open(f"{file_name}", mode="rb") as f:
-                while True:
-                    line = await f.readline()
-                    if not line:
-                        break
-                    data = crypt.decrypt(line)
-                    yield data
+            async with aiofiles.open(file_name, mode="rb") as f:
+                decryptor = cipher.decryptor() if cipher else None
+                while chunk := await f.read(chunk_size):
+                    yield decryptor.update(chunk) if decryptor else chunk
         finally:
             try:
                 os.remove(file_name)
@@ -56,19 +84,64 @@ class Stream:
         self,
         target_items: str = "",
         max_buffer_size_mb: int | None = None,
+        max_batch_items: int | None = None,
     ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """Parse the items at ``target_items`` into batches as the body streams in.
+
+        A batch is yielded once it holds ``max_batch_items`` items or its items
+        add up to ``max_buffer_size_mb`` bytes of JSON (a byte count, despite the
+        name). Every batch is a new, non-empty list.
+        """
+        streaming_config = ocean_context.ocean.config.streaming
         if max_buffer_size_mb is None:
-            max_buffer_size_mb = ocean_context.ocean.config.streaming.max_buffer_size_mb
-
-        events = ijson.sendable_list()
-        coro = ijson.items_coro(events, target_items)
-        current_buffer_size = 0
-        async for chunk in self._byte_stream():
-            coro.send(chunk)
-            current_buffer_size += len(chunk)
-            if current_buffer_size >= max_buffer_size_mb:
-                if len(events) > 0:
-                    yield events
-                    events.clear()
-                    current_buffer_size = 0
-        yield events
+            max_buffer_size_mb = streaming_config.max_buffer_size_mb
+        if max_batch_items is None:
+            max_batch_items = streaming_config.max_batch_items
+
+        batcher = _JsonItemBatcher(max_batch_items, max_buffer_size_mb)
+        parsed = ijson.sendable_list()
+        coro = ijson.items_coro(parsed, target_items)
+        async with aclosing(self._byte_stream()) as chunks:
+            async for chunk in chunks:
+                coro.send(chunk)
+                for batch in batcher.add(parsed):
+                    yield batch
+                parsed.clear()
+        coro.close()
+        for batch in batcher.add(parsed):
+            yield batch
+        if last_batch := batcher.flush():
+            yield last_batch
+
+
+class _JsonItemBatcher:
+    """Splits parsed items into batches bounded by item count and JSON size.
+
+    An item's size is the length of its own compact UTF-8 JSON encoding, so a
+    large item is counted as large whichever chunk it arrived in.
+    """
+
+    def __init__(self, max_items: int, max_bytes: int) -> None:
+        self._max_items = max_items
+        self._max_bytes = max_bytes
+        self._items: list[dict[str, Any]] = []
+        self._size = 0
+
+    def add(self, items: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+        batches = []
+        for item in items:
+            self._items.append(item)
+            self._size += _json_size(item)
+            if len(self._items) >= self._max_items or self._size >= self._max_bytes:
+                batches.append(self.flush())
+        return batches
+
+    def flush(self) -> list[dict[str, Any]]:
+        batch, self._items, self._size = self._items, [], 0
+        return batch
+
+
+def _json_size(item: Any) -> int:
+    # ijson parses numbers with a fraction into Decimal, which json can't encode.
+    encoded = json.dumps(item, separators=(",", ":"), ensure_ascii=False, default=str)
+    return len(encoded.encode())
@@ -0,0 +1,488 @@
+"""
+Optional tracing of the resync and webhook pipelines.
+
+Spans follow the OpenTelemetry data model: a trace id of 16 bytes and span ids
+of 8 bytes (hex encoded), a parent span, a kind, start and end times in unix
+nanoseconds, attributes, events and a status. The current span is kept in a
+context variable, so spans started in tasks created under a span are its
+children, as with the OpenTelemetry SDK.
+
+Tracing is off by default and every span is then the same non-recording span,
+which costs about as much as a ``with`` statement. When enabled, finished spans
+are written to a file as OTLP JSON, one ``ExportTraceServiceRequest`` per line,
+which the OpenTelemetry Collector's ``otlpjsonfile`` receiver reads, so a trace
+captured offline can be loaded in Jaeger, Tempo or any OTLP backend for a
+critical-path view of a resync.
+"""
+
+import functools
+import json
+import os
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextvars import ContextVar, Token
+from enum import Enum
+from hashlib import blake2b
+from pathlib import Path
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Mapping,
+    Optional,
+    ParamSpec,
+    TypeVar,
+)
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from port_ocean.config.settings import TracingSettings
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+INSTRUMENTATION_SCOPE = "port_ocean"
+_TRACE_ID = re.compile(r"^[0-9a-f]{32}$")
+_TRACEPARENT = re.compile(r"^[0-9a-f]{2}-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+_INVALID_TRACE_ID = "0" * 32
+_INVALID_SPAN_ID = "0" * 16
+
+AttributeValue = str | bool | int | float
+# Raised to end a page loop rather than to report a failure.
+_END_OF_ITERATION = (StopAsyncIteration, StopIteration, GeneratorExit)
+
+
+class SpanKind(Enum):
+    # Values of the OTLP SpanKind enum.
+    INTERNAL = 1
+    SERVER = 2
+    CLIENT = 3
+    PRODUCER = 4
+    CONSUMER = 5
+
+
+class StatusCode(Enum):
+    UNSET = 0
+    OK = 1
+    ERROR = 2
+
+
+def _new_trace_id() -> str:
+    return os.urandom(16).hex()
+
+
+def _new_span_id() -> str:
+    return os.urandom(8).hex()
+
+
+def to_trace_id(value: str) -> str:
+    """The trace id a string maps to: the hex digits of a UUID or of a trace id
+    as is, and a stable hash of anything else (such as a Redis stream id)."""
+    normalized = value.replace("-", "").lower()
+    if _TRACE_ID.match(normalized) and normalized != _INVALID_TRACE_ID:
+        return normalized
+    return blake2b(value.encode(), digest_size=16).hexdigest()
+
+
+def _traceparent(headers: Mapping[str, str]) -> tuple[str, str] | None:
+    match = _TRACEPARENT.match(headers.get("traceparent", "").strip().lower())
+    if (
+        match is None
+        or match.group(1) == _INVALID_TRACE_ID
+        or match.group(2) == _INVALID_SPAN_ID
+    ):
+        return None
+    return match.group(1), match.group(2)
+
+
+def trace_id_from_headers(headers: Mapping[str, str]) -> str | None:
+    """The trace id of a W3C ``traceparent`` header, if there is a valid one."""
+    traceparent = _traceparent(headers)
+    return traceparent[0] if traceparent else None
+
+
+def parent_span_id_from_headers(
+    headers: Mapping[str, str], trace_id: str
+) -> str | None:
+    """The span id of a W3C ``traceparent`` header, if there is a valid one in
+    ``trace_id``'s trace."""
+    traceparent = _traceparent(headers)
+    if traceparent is None or traceparent[0] != to_trace_id(trace_id):
+        return None
+    return traceparent[1]
+
+
+class Span:
+    """A recorded operation. Use as a context manager, or call ``end()``."""
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        trace_id: str,
+        parent_span_id: str | None,
+        kind: SpanKind = SpanKind.INTERNAL,
+        attributes: Mapping[str, AttributeValue] | None = None,
+    ) -> None:
+        self._tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = _new_span_id()
+        self.parent_span_id = parent_span_id
+        self.kind = kind
+        self.attributes: dict[str, AttributeValue] = dict(attributes or {})
+        self.events: list[tuple[str, int, dict[str, AttributeValue]]] = []
+        self.status_code = StatusCode.UNSET
+        self.status_message = ""
+        self.start_time_unix_nano = time.time_ns()
+        self.end_time_unix_nano: int | None = None
+        self._token: Optional[Token[Optional["Span"]]] = None
+
+    @property
+    def is_recording(self) -> bool:
+        return self.end_time_unix_nano is None
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        self.attributes[key] = value
+
+    def set_attributes(self, attributes: Mapping[str, AttributeValue]) -> None:
+        self.attributes.update(attributes)
+
+    def add_event(
+        self, name: str, attributes: Mapping[str, AttributeValue] | None = None
+    ) -> None:
+        self.events.append((name, time.time_ns(), dict(attributes or {})))
+
+    def set_status(self, code: StatusCode, message: str = "") -> None:
+        self.status_code = code
+        self.status_message = message
+
+    def record_exception(self, exception: BaseException) -> None:
+        self.add_event(
+            "exception",
+            {
+                "exception.type": type(exception).__name__,
+                "exception.message": str(exception),
+            },
+        )
+
+    def end(self) -> None:
+        if self.end_time_unix_nano is not None:
+            return
+        self.end_time_unix_nano = time.time_ns()
+        self._tracer._on_end(self)
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc is not None and not isinstance(exc, _END_OF_ITERATION):
+            self.record_exception(exc)
+            self.set_status(StatusCode.ERROR, str(exc))
+        if self._token is not None:
+            try:
+                _current_span.reset(self._token)
+            except ValueError:
+                # Ended in another context than it started in, e.g. by a
+                # generator resumed from another task.
+                _current_span.set(None)
+            self._token = None
+        self.end()
+
+    def to_otlp(self) -> dict[str, Any]:
+        span: dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind.value,
+            "startTimeUnixNano": str(self.start_time_unix_nano),
+            "endTimeUnixNano": str(self.end_time_unix_nano),
+            "attributes": _otlp_attributes(self.attributes),
+            "status": {"code": self.status_code.value},
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        if self.events:
+            span["events"] = [
+                {
+                    "name": name,
+                    "timeUnixNano": str(timestamp),
+                    "attributes": _otlp_attributes(attributes),
+                }
+                for name, timestamp, attributes in self.events
+            ]
+        return span
+
+
+class NonRecordingSpan(Span):
+    """The span handed out while tracing is disabled. Records nothing."""
+
+    def __init__(self) -> None:
+        self.name = ""
+        self.trace_id = _INVALID_TRACE_ID
+        self.span_id = "0" * 16
+        self.parent_span_id = None
+
+    @property
+    def is_recording(self) -> bool:
+        return False
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        pass
+
+    def set_attributes(self, attributes: Mapping[str, AttributeValue]) -> None:
+        pass
+
+    def add_event(
+        self, name: str, attributes: Mapping[str, AttributeValue] | None = None
+    ) -> None:
+        pass
+
+    def set_status(self, code: StatusCode, message: str = "") -> None:
+        pass
+
+    def record_exception(self, exception: BaseException) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+    def __enter__(self) -> "Span":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        pass
+
+
+NON_RECORDING_SPAN = NonRecordingSpan()
+_current_span: ContextVar[Optional[Span]] = ContextVar(
+    "ocean_current_span", default=None
+)
+
+
+def _otlp_value(value: AttributeValue) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Mapping[str, AttributeValue]) -> list[dict[str, Any]]:
+    return [
+        {"key": key, "value": _otlp_value(value)} for key, value in attributes.items()
+    ]
+
+
+class SpanExporter(ABC):
+    @abstractmethod
+    def export(self, spans: list[Span]) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        pass
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps finished spans in memory, for tests and in-process inspection."""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+
+    def export(self, spans: list[Span]) -> None:
+        self.spans.extend(spans)
+
+
+class FileSpanExporter(SpanExporter):
+    """Appends spans to a file as OTLP JSON lines."""
+
+    def __init__(
+        self, path: str | Path, resource_attributes: Mapping[str, AttributeValue]
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("a", encoding="utf-8")
+        self._resource = {"attributes": _otlp_attributes(resource_attributes)}
+        self._lock = threading.Lock()
+
+    def export(self, spans: list[Span]) -> None:
+        line = json.dumps(
+            {
+                "resourceSpans": [
+                    {
+                        "resource": self._resource,
+                        "scopeSpans": [
+                            {
+                                "scope": {"name": INSTRUMENTATION_SCOPE},
+                                "spans": [span.to_otlp() for span in spans],
+                            }
+                        ],
+                    }
+                ]
+            },
+            separators=(",", ":"),
+        )
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(line + "\n")
+                self._file.flush()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class Tracer:
+    """Starts spans and hands finished ones to an exporter in batches.
+
+    Without an exporter every span is ``NON_RECORDING_SPAN``.
+    """
+
+    def __init__(
+        self, exporter: SpanExporter | None = None, batch_size: int = 256
+    ) -> None:
+        self.exporter = exporter
+        self.batch_size = batch_size
+        self._finished: list[Span] = []
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def start_span(
+        self,
+        name: str,
+        kind: SpanKind = SpanKind.INTERNAL,
+        attributes: Mapping[str, AttributeValue] | None = None,
+        trace_id: str | None = None,
+        parent_span_id: str | None = None,
+    ) -> Span:
+        """Start a span, a child of the current span unless ``trace_id`` is
+        given, in which case it is the child of ``parent_span_id`` in that
+        trace, e.g. the sender's span of a ``traceparent`` header, or its root.
+
+        Enter the span (``with tracer.start_span(...)``) to make it the current
+        span; it ends when the block exits.
+        """
+        if self.exporter is None:
+            return NON_RECORDING_SPAN
+        parent = _current_span.get()
+        if trace_id is not None:
+            return Span(
+                self, name, to_trace_id(trace_id), parent_span_id, kind, attributes
+            )
+        if parent is not None and parent.is_recording:
+            return Span(self, name, parent.trace_id, parent.span_id, kind, attributes)
+        return Span(self, name, _new_trace_id(), None, kind, attributes)
+
+    def _on_end(self, span: Span) -> None:
+        with self._lock:
+            self._finished.append(span)
+            if len(self._finished) < self.batch_size:
+                return
+            batch, self._finished = self._finished, []
+        self._export(batch)
+
+    def _export(self, batch: list[Span]) -> None:
+        if not batch or self.exporter is None:
+            return
+        try:
+            self.exporter.export(batch)
+        except Exception as e:
+            logger.debug(f"Failed to export {len(batch)} spans: {e}")
+
+    def flush(self) -> None:
+        with self._lock:
+            batch, self._finished = self._finished, []
+        self._export(batch)
+
+    def shutdown(self) -> None:
+        self.flush()
+        if self.exporter is not None:
+            self.exporter.shutdown()
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    return _tracer
+
+
+def set_tracer(tracer: Tracer) -> None:
+    global _tracer
+    _tracer = tracer
+
+
+def configure_tracing(settings: "TracingSettings", service_name: str) -> Tracer:
+    """Replace the global tracer according to the settings."""
+    exporter = (
+        FileSpanExporter(
+            settings.output_path,
+            {"service.name": service_name, "telemetry.sdk.name": INSTRUMENTATION_SCOPE},
+        )
+        if settings.enabled
+        else None
+    )
+    set_tracer(Tracer(exporter, settings.batch_size))
+    if exporter is not None:
+        logger.info(f"Writing trace spans to {exporter.path}")
+    return _tracer
+
+
+def shutdown_tracing() -> None:
+    _tracer.shutdown()
+
+
+def start_span(
+    name: str,
+    kind: SpanKind = SpanKind.INTERNAL,
+    attributes: Mapping[str, AttributeValue] | None = None,
+    trace_id: str | None = None,
+    parent_span_id: str | None = None,
+) -> Span:
+    """Start a span with the global tracer, see ``Tracer.start_span``."""
+    return _tracer.start_span(name, kind, attributes, trace_id, parent_span_id)
+
+
+def current_span() -> Span:
+    """The current span, or ``NON_RECORDING_SPAN`` outside of any span."""
+    return _current_span.get() or NON_RECORDING_SPAN
+
+
+def traced(
+    name: str, kind: SpanKind = SpanKind.INTERNAL
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Run each call of a coroutine function in a span. The function can add
+    attributes to it through ``current_span()``."""
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with _tracer.start_span(name, kind):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
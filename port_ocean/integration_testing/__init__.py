@@ -2,6 +2,7 @@ from port_ocean.integration_testing.transport import InterceptTransport
 from port_ocean.integration_testing.port_mock import PortMockResponder
 from port_ocean.integration_testing.harness import IntegrationTestHarness, ResyncResult
 from port_ocean.integration_testing.base import BaseIntegrationTest
+from port_ocean.integration_testing.replay import ReplayTransport, load_recording
 
 __all__ = [
     "InterceptTransport",
@@ -9,4 +10,6 @@ __all__ = [
     "IntegrationTestHarness",
     "ResyncResult",
     "BaseIntegrationTest",
+    "ReplayTransport",
+    "load_recording",
 ]
@@ -12,6 +12,7 @@ from port_ocean.config.dynamic import default_config_factory
 from port_ocean.ocean import Ocean
 from port_ocean.helpers.retry import RetryTransport
 from port_ocean.integration_testing.port_mock import PortMockResponder
+from port_ocean.integration_testing.replay import ReplayTransport, load_recording
 from port_ocean.integration_testing.transport import (
     InterceptTransport,
     RecordingTransport,
@@ -51,7 +52,9 @@ class IntegrationTestHarness:
         self,
         integration_path: str,
         port_mapping_config: dict[str, Any],
-        third_party_transport: InterceptTransport | RecordingTransport,
+        third_party_transport: (
+            InterceptTransport | RecordingTransport | ReplayTransport
+        ),
         port_blueprints: dict[str, dict[str, Any]] | None = None,
         config_overrides: dict[str, Any] | None = None,
         port_search_entities_response: list[dict[str, Any]] | None = None,
@@ -70,6 +73,28 @@ class IntegrationTestHarness:
         self._pushed_signal_handler: bool = False
         self._inserted_sys_path: bool = False
 
+    @classmethod
+    def from_recording(
+        cls,
+        integration_path: str,
+        recording_path: str | Path,
+        speed: float | None = None,
+        strict: bool = True,
+        **kwargs: Any,
+    ) -> "IntegrationTestHarness":
+        """A harness replaying a recorded resync: its port app config and its
+        third-party responses, with the recorded latencies divided by ``speed``
+        or at full speed when ``speed`` is None. Requests the recording has no
+        call left for raise UnmatchedRequestError, or get a 404 when not
+        ``strict``."""
+        recording = load_recording(recording_path)
+        return cls(
+            integration_path,
+            port_mapping_config=recording.port_app_config,
+            third_party_transport=ReplayTransport(recording, speed, strict),
+            **kwargs,
+        )
+
     async def start(self) -> None:
         """Boot the integration and patch HTTP clients."""
         import port_ocean.context.ocean as ocean_ctx_module
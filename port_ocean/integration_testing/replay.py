@@ -0,0 +1,206 @@
+"""Replay of resyncs recorded with ``OCEAN__RESYNC_RECORDER__ENABLED``.
+
+A recording holds the port app config of a resync and every third-party HTTP
+attempt it made, masked with ``sensitive_log_filter`` (see
+``port_ocean.helpers.replay_recorder``). ``ReplayTransport`` answers the same
+requests with the recorded responses, at full speed or with the recorded
+latencies, so a customer's slow resync can be reproduced and profiled locally:
+
+    harness = IntegrationTestHarness.from_recording(
+        "integrations/github", "resync-20250101T000000Z-abc.jsonl.gz", speed=1.0
+    )
+    await harness.start()
+    result = await harness.trigger_resync()
+"""
+
+import asyncio
+import gzip
+import json
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Hashable
+
+import httpx
+from loguru import logger
+
+from port_ocean.helpers.replay_recorder import (
+    CALL_RECORD,
+    HEADER_RECORD,
+    PORT_APP_CONFIG_RECORD,
+    RECORDING_FORMAT_VERSION,
+    decode_body,
+)
+from port_ocean.integration_testing.transport import RequestLog, UnmatchedRequestError
+from port_ocean.log.sensetive import sensitive_log_filter
+
+
+@dataclass
+class RecordedCall:
+    method: str
+    url: str
+    request_body: bytes
+    status: int | None
+    headers: dict[str, str]
+    body: bytes
+    offset: float
+    duration: float
+    error: str | None = None
+    # The body was too large or streamed, so it was not recorded.
+    body_omitted: bool = False
+
+
+@dataclass
+class ResyncRecordingFile:
+    header: dict[str, Any]
+    port_app_config: dict[str, Any] = field(default_factory=dict)
+    calls: list[RecordedCall] = field(default_factory=list)
+
+
+def load_recording(path: str | Path) -> ResyncRecordingFile:
+    """Read a recording written by the resync recorder."""
+    recording: ResyncRecordingFile | None = None
+    with gzip.open(path, "rt", encoding="utf-8") as lines:
+        for line in lines:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            record_type = record.pop("type")
+            if record_type == HEADER_RECORD:
+                if record.get("version") != RECORDING_FORMAT_VERSION:
+                    raise ValueError(
+                        f"Unsupported recording version {record.get('version')}, "
+                        f"expected {RECORDING_FORMAT_VERSION}"
+                    )
+                recording = ResyncRecordingFile(header=record)
+            elif recording is None:
+                raise ValueError(f"{path} does not start with a recording header")
+            elif record_type == PORT_APP_CONFIG_RECORD:
+                recording.port_app_config = record["config"]
+            elif record_type == CALL_RECORD:
+                recording.calls.append(
+                    RecordedCall(
+                        method=record["method"],
+                        url=record["url"],
+                        request_body=decode_body(record.get("request_body", {})),
+                        status=record.get("status"),
+                        headers=record.get("headers", {}),
+                        body=decode_body(record.get("body", {})),
+                        offset=record["offset"],
+                        duration=record["duration"],
+                        error=record.get("error"),
+                        body_omitted=record.get("body_omitted", False),
+                    )
+                )
+    if recording is None:
+        raise ValueError(f"{path} is empty")
+    return recording
+
+
+def _mask(text: str) -> str:
+    return sensitive_log_filter.mask_string(text, full_hide=True)
+
+
+def _match_keys(method: str, url: str, body: bytes) -> list[Hashable]:
+    """Keys to match a request with a recorded call by, the most specific
+    first: with its body, its URL, and its URL without the query string."""
+    return [(method, url, body), (method, url), (method, url.split("?", 1)[0])]
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Answers requests with the calls of a recording, in recorded order.
+
+    A request is matched with the first unused call of the same method, URL
+    and body, falling back to the same method and URL, then to the same path.
+    URLs and bodies are masked the way the recorder masked them before being
+    compared. With ``speed`` set, each response waits for its recorded
+    latency divided by ``speed``.
+    """
+
+    def __init__(
+        self,
+        recording: ResyncRecordingFile,
+        speed: float | None = None,
+        strict: bool = True,
+    ) -> None:
+        self.recording = recording
+        self.speed = speed
+        self.strict = strict
+        self._used: list[bool] = []
+        self._index: defaultdict[Hashable, deque[int]] = defaultdict(deque)
+        self._call_log: list[RequestLog] = []
+        self.reset()
+
+    def _take(self, request: httpx.Request) -> RecordedCall | None:
+        url = _mask(str(request.url))
+        try:
+            body = _mask(request.content.decode("utf-8")).encode("utf-8")
+        except UnicodeDecodeError:
+            body = request.content
+        for key in _match_keys(request.method, url, body):
+            positions = self._index.get(key)
+            while positions:
+                position = positions.popleft()
+                if not self._used[position]:
+                    self._used[position] = True
+                    return self.recording.calls[position]
+        return None
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        call = self._take(request)
+        if call is None:
+            if self.strict:
+                raise UnmatchedRequestError(
+                    f"No recorded call left for: {request.method} {request.url}"
+                )
+            response = httpx.Response(
+                status_code=404, content=b"No recorded call matched", request=request
+            )
+            self._call_log.append(RequestLog(request=request, response=response))
+            return response
+
+        if self.speed:
+            await asyncio.sleep(call.duration / self.speed)
+
+        if call.error is not None or call.status is None:
+            error_class = getattr(httpx, call.error or "", None)
+            if not (
+                isinstance(error_class, type)
+                and issubclass(error_class, httpx.RequestError)
+            ):
+                error_class = httpx.TransportError
+            raise error_class(f"Recorded {call.error}", request=request)
+
+        if call.body_omitted:
+            logger.warning(
+                f"The body of {call.method} {call.url} was not recorded, "
+                "replaying it empty"
+            )
+        response = httpx.Response(
+            status_code=call.status,
+            headers=call.headers,
+            content=call.body,
+            request=request,
+        )
+        self._call_log.append(RequestLog(request=request, response=response))
+        return response
+
+    @property
+    def calls(self) -> list[RequestLog]:
+        return list(self._call_log)
+
+    @property
+    def unused_calls(self) -> list[RecordedCall]:
+        """Recorded calls the replay did not request (yet)."""
+        return [
+            call for call, used in zip(self.recording.calls, self._used) if not used
+        ]
+
+    def reset(self) -> None:
+        """Make every recorded call available again."""
+        self._used = [False] * len(self.recording.calls)
+        self._index.clear()
+        for position, call in enumerate(self.recording.calls):
+            for key in _match_keys(call.method, call.url, call.request_body):
+                self._index[key].append(position)
+        self._call_log.clear()
@@ -1,11 +1,11 @@
+import asyncio
+import gzip
+import json
 import logging
-from pathlib import PosixPath
-import sys
 import threading
-import time
-from copy import deepcopy
-from datetime import datetime
-from logging.handlers import MemoryHandler
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import PosixPath
 from traceback import format_exception
 from typing import Any
 
@@ -13,7 +13,6 @@ from loguru import logger
 
 from port_ocean import Ocean
 from port_ocean.context.ocean import ocean
-from port_ocean.utils.misc import run_async_in_new_event_loop
 
 
 def _serialize_posix_paths(
@@ -40,7 +39,9 @@ def _serialize_posix_paths(
 
 
 def _serialize_record(record: logging.LogRecord) -> dict[str, Any]:
-    extra = {**deepcopy(record.__dict__["extra"])}
+    # The record is this handler's own copy, unpickled from loguru's queue, so
+    # only the top level needs copying.
+    extra = {**record.__dict__["extra"]}
     if isinstance(extra.get("exc_info"), Exception):
         serialized_exception = "".join(format_exception(extra.get("exc_info")))
         extra["exc_info"] = serialized_exception
@@ -57,20 +58,63 @@ def _serialize_record(record: logging.LogRecord) -> dict[str, Any]:
     }
 
 
-class HTTPMemoryHandler(MemoryHandler):
+def _encode_record(record: logging.LogRecord) -> bytes:
+    return json.dumps(_serialize_record(record), default=str).encode()
+
+
+# Longest the shipper waits before trying Port again after failed sends.
+_MAX_SHIP_BACKOFF_SECONDS = 60.0
+
+
+def _encode_batch(logs: list[bytes]) -> bytes:
+    return b'{"logs":[' + b",".join(logs) + b"]}"
+
+
+class HTTPMemoryHandler(logging.Handler):
+    """Ships log records to Port in batches from a single background thread.
+
+    Records are encoded to JSON once when they are emitted and kept in a ring
+    buffer bounded by ``max_buffer_size`` bytes, so nothing but this handler's
+    thread waits for Port. The shipper sends up to ``max_batch_size`` bytes per
+    request, every ``flush_interval`` seconds or as soon as ``flush_size`` bytes
+    (or a record at ``flush_level``) are buffered, gzip compressed when
+    ``compress`` is set.
+
+    A batch Port failed to take is put back at the front of the buffer and the
+    shipper backs off, doubling its wait up to a minute while sends keep failing.
+    When Port falls behind and the buffer passes ``sampling_threshold`` of its
+    size, only one in ``sampling_rate`` records below WARNING is kept. Past its
+    size, the oldest records are dropped. Both are reported in the next batch.
+    """
+
     def __init__(
         self,
-        capacity: int = 100,
         flush_level: int = logging.FATAL,
-        flush_interval: int = 5,
-        flush_size: int = 1024,
+        flush_interval: float = 5,
+        flush_size: int = 256 * 1024,
+        max_batch_size: int = 1024 * 1024,
+        max_buffer_size: int = 16 * 1024 * 1024,
+        sampling_threshold: float = 0.5,
+        sampling_rate: int = 10,
+        compress: bool = False,
     ):
-        super().__init__(capacity, flushLevel=flush_level, target=None)
+        super().__init__()
+        self.flush_level = flush_level
         self.flush_interval = flush_interval
         self.flush_size = flush_size
-        self.last_flush_time = time.time()
-        self._serialized_buffer: list[dict[str, Any]] = []
-        self._thread_pool: list[threading.Thread] = []
+        self.max_batch_size = max_batch_size
+        self.max_buffer_size = max_buffer_size
+        self.sampling_threshold = sampling_threshold
+        self.sampling_rate = sampling_rate
+        self.compress = compress
+        self._buffer: deque[bytes] = deque()
+        self._buffered_bytes = 0
+        self._sampled_count = 0
+        self._sampled_out = 0
+        self._dropped = 0
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._shipper: threading.Thread | None = None
 
     @property
     def ocean(self) -> Ocean | None:
@@ -79,55 +123,154 @@ class HTTPMemoryHandler(MemoryHandler):
             return ocean.app
         return None
 
+    @property
+    def buffered_bytes(self) -> int:
+        return self._buffered_bytes
+
     def emit(self, record: logging.LogRecord) -> None:
-        self._serialized_buffer.append(_serialize_record(record))
-        super().emit(record)
-
-    def shouldFlush(self, record: logging.LogRecord) -> bool:
-        """
-        Extending shouldFlush to include size and time validation as part of the decision whether to flush
-        """
-        if bool(self.buffer) and (
-            super(HTTPMemoryHandler, self).shouldFlush(record)
-            or sys.getsizeof(self.buffer) >= self.flush_size
-            or time.time() - self.last_flush_time >= self.flush_interval
+        # Called with the handler lock held.
+        if self._should_sample_out(record):
+            self._sampled_out += 1
+            return
+        try:
+            encoded = _encode_record(record)
+        except Exception:
+            self.handleError(record)
+            return
+        self._buffer.append(encoded)
+        self._buffered_bytes += len(encoded)
+        self._drop_oldest_past_max_buffer_size()
+
+        self._ensure_shipper()
+        if (
+            record.levelno >= self.flush_level
+            or self._buffered_bytes >= self.flush_size
         ):
-            return True
-        return False
+            self._wakeup.set()
+
+    def _drop_oldest_past_max_buffer_size(self) -> None:
+        while self._buffered_bytes > self.max_buffer_size and len(self._buffer) > 1:
+            self._buffered_bytes -= len(self._buffer.popleft())
+            self._dropped += 1
+
+    def _should_sample_out(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return False
+        if self._buffered_bytes < self.max_buffer_size * self.sampling_threshold:
+            return False
+        self._sampled_count += 1
+        return self._sampled_count % self.sampling_rate != 0
 
-    def wait_for_lingering_threads(self) -> None:
-        for thread in self._thread_pool:
-            if thread.is_alive():
-                thread.join()
+    def _ensure_shipper(self) -> None:
+        if self._shipper is None and not self._stopping.is_set():
+            self._shipper = threading.Thread(
+                target=self._run_shipper, name="ocean-log-shipper", daemon=True
+            )
+            self._shipper.start()
 
     def flush(self) -> None:
-        if self.ocean is None or not self.buffer:
-            return
+        """Wake the shipper to send everything buffered so far."""
+        self._wakeup.set()
 
-        def _wrap_event_loop(_ocean: Ocean, logs_to_send: list[dict[str, Any]]) -> None:
-            run_async_in_new_event_loop(self.send_logs(_ocean, logs_to_send))
+    def close(self) -> None:
+        """Send what is left in the buffer and stop the shipper."""
+        self.shutdown()
+        super().close()
 
-        def clear_thread_pool() -> None:
-            for thread in self._thread_pool:
-                if not thread.is_alive():
-                    self._thread_pool.remove(thread)
+    def shutdown(self, timeout: float = 10) -> None:
+        self._stopping.set()
+        self._wakeup.set()
+        if self._shipper is not None and self._shipper.is_alive():
+            self._shipper.join(timeout)
 
-        self.acquire()
-        logs = list(self._serialized_buffer)
-        if logs:
-            self.buffer.clear()
-            self._serialized_buffer.clear()
-            self.last_flush_time = time.time()
-            clear_thread_pool()
-            thread = threading.Thread(target=_wrap_event_loop, args=(self.ocean, logs))
-            thread.start()
-            self._thread_pool.append(thread)
-        self.release()
-
-    async def send_logs(
-        self, _ocean: Ocean, logs_to_send: list[dict[str, Any]]
-    ) -> None:
+    def _run_shipper(self) -> None:
+        # A single event loop for the lifetime of the shipper, so the Port
+        # client and its connections are reused between batches.
+        loop = asyncio.new_event_loop()
+        backoff = 0.0
         try:
-            await _ocean.port_client.ingest_integration_logs(logs_to_send)
+            while not self._stopping.is_set():
+                self._wakeup.wait(self.flush_interval)
+                self._wakeup.clear()
+                if backoff:
+                    # Wakeups don't cut the backoff short, only shutting down.
+                    self._stopping.wait(backoff)
+                if self._ship_buffered(loop):
+                    backoff = 0.0
+                else:
+                    backoff = min(
+                        max(backoff * 2, self.flush_interval),
+                        _MAX_SHIP_BACKOFF_SECONDS,
+                    )
+            self._ship_buffered(loop)
+        finally:
+            loop.close()
+
+    def _ship_buffered(self, loop: asyncio.AbstractEventLoop) -> bool:
+        """Send the buffer to Port, returning False if a batch failed."""
+        _ocean = self.ocean
+        if _ocean is None:
+            return True
+        try:
+            loop.run_until_complete(self._send_buffered(_ocean))
         except Exception as e:
             logger.error(f"Failed to send logs to Port with error: {e}")
+            return False
+        return True
+
+    def _take_batch(self) -> list[bytes]:
+        self.acquire()
+        try:
+            batch = self._take_dropped_summary()
+            batch_bytes = len(_encode_batch(batch))
+            # Each log after the first also adds a comma to the encoded body.
+            while self._buffer and (
+                not batch
+                or batch_bytes + 1 + len(self._buffer[0]) <= self.max_batch_size
+            ):
+                log = self._buffer.popleft()
+                self._buffered_bytes -= len(log)
+                batch_bytes += len(log) + (1 if batch else 0)
+                batch.append(log)
+            return batch
+        finally:
+            self.release()
+
+    def _take_dropped_summary(self) -> list[bytes]:
+        if not self._dropped and not self._sampled_out:
+            return []
+        summary = {
+            "message": (
+                f"Log shipping to Port fell behind: dropped {self._dropped} "
+                f"and sampled out {self._sampled_out} log records"
+            ),
+            "level": "WARNING",
+            "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+            "extra": {"dropped": self._dropped, "sampled_out": self._sampled_out},
+        }
+        self._dropped = self._sampled_out = 0
+        return [json.dumps(summary).encode()]
+
+    async def _send_buffered(self, _ocean: Ocean) -> None:
+        while batch := self._take_batch():
+            body = _encode_batch(batch)
+            if self.compress:
+                body = gzip.compress(body, compresslevel=5)
+            try:
+                await _ocean.port_client.ingest_integration_logs_batch(
+                    body, content_encoding="gzip" if self.compress else None
+                )
+            except BaseException:
+                self._put_back(batch)
+                raise
+
+    def _put_back(self, batch: list[bytes]) -> None:
+        """Return a batch that failed to send to the front of the buffer. If
+        that takes the buffer past its size, its oldest records are dropped."""
+        self.acquire()
+        try:
+            self._buffer.extendleft(reversed(batch))
+            self._buffered_bytes += sum(len(log) for log in batch)
+            self._drop_oldest_past_max_buffer_size()
+        finally:
+            self.release()
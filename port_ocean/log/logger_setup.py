@@ -17,14 +17,18 @@ from port_ocean.utils.signal import signal_handler
 _sensitive_http_log_filter = sensitive_log_filter.create_filter(full_hide=True)
 
 
-def setup_logger(level: LogLevelType, enable_http_handler: bool) -> None:
+def setup_logger(
+    level: LogLevelType,
+    enable_http_handler: bool,
+    http_logging_compression: bool = False,
+) -> None:
     logger.remove()
     logger.configure(
         extra={"hostname": resolve_hostname(), "instance": str(uuid.uuid4())}
     )
     _stdout_loguru_handler(level)
     if enable_http_handler:
-        _http_loguru_handler(level)
+        _http_loguru_handler(level, http_logging_compression)
 
 
 def _stdout_loguru_handler(level: LogLevelType) -> None:
@@ -47,7 +51,7 @@ def _stdout_loguru_handler(level: LogLevelType) -> None:
     logger.configure(patcher=_combined_patcher)
 
 
-def _http_loguru_handler(level: LogLevelType) -> None:
+def _http_loguru_handler(level: LogLevelType, compress: bool = False) -> None:
     queue: Queue[LogRecord] = Queue()
 
     handler = QueueHandler(queue)
@@ -62,11 +66,8 @@ def _http_loguru_handler(level: LogLevelType) -> None:
     )
     logger.configure(patcher=_combined_patcher)
 
-    http_memory_handler = HTTPMemoryHandler()
-    signal_handler.register(
-        http_memory_handler.wait_for_lingering_threads, priority=-900
-    )
-    signal_handler.register(http_memory_handler.flush, priority=-899)
+    http_memory_handler = HTTPMemoryHandler(compress=compress)
+    signal_handler.register(http_memory_handler.shutdown, priority=-900)
 
     queue_listener = QueueListener(queue, http_memory_handler)
     queue_listener.start()
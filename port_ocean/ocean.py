@@ -11,10 +11,14 @@ from starlette.types import Receive, Scope, Send
 
 import port_ocean.helpers.metric.metric
 from port_ocean.cache.base import CacheProvider
+from port_ocean.cache.bounded_memory import BoundedMemoryCacheProvider
 from port_ocean.cache.disk import DiskCacheProvider
 from port_ocean.cache.memory import InMemoryCacheProvider
+from port_ocean.cache.redis_cache import RedisCacheProvider
+from port_ocean.cache.sqlite import SQLiteCacheProvider
 from port_ocean.clients.dsp.lifecycle import LifecycleClient
 from port_ocean.clients.port.client import PortClient
+from port_ocean.clients.port.utils import get_entities_concurrency
 from port_ocean.config.settings import IntegrationConfiguration
 from port_ocean.context.ocean import (
     PortOceanContext,
@@ -29,6 +33,16 @@ from port_ocean.core.handlers.webhook.processor_manager import (
 from port_ocean.core.integrations.base import BaseIntegration
 from port_ocean.core.integrations.mixins.utils import is_dsp_mode_enabled
 from port_ocean.health import create_health_router
+from port_ocean.helpers.monitor.profiler import (
+    configure_latency_capture,
+    create_profiler_router,
+)
+from port_ocean.helpers.monitor.watchdog import (
+    start_event_loop_watchdog,
+    stop_event_loop_watchdog,
+)
+from port_ocean.helpers.replay_recorder import configure_resync_recorder
+from port_ocean.helpers.tracing import configure_tracing, shutdown_tracing
 from port_ocean.log.sensetive import sensitive_log_filter
 from port_ocean.middlewares import request_handler
 from port_ocean.utils.misc import IntegrationStateStatus
@@ -60,6 +74,9 @@ class Ocean:
         sensitive_log_filter.hide_sensitive_strings(
             *self.config.get_sensitive_fields_data()
         )
+        configure_resync_recorder(
+            self.config.resync_recorder, str(self.config.port.base_url)
+        )
         self.integration_router = integration_router or APIRouter()
 
         self.port_client = PortClient(
@@ -71,6 +88,7 @@ class Ocean:
             integration_version=__integration_version__,
             feature_flags_cache_ttl_seconds=self.config.port.feature_flags_cache_ttl_seconds,
             blueprint_cache_ttl_seconds=self.config.port.blueprint_cache_ttl_seconds,
+            entities_concurrency=get_entities_concurrency(self.config.port),
         )
         self.cache_provider: CacheProvider = self._get_caching_provider()
         self.metrics = port_ocean.helpers.metric.metric.Metrics(
@@ -114,6 +132,7 @@ class Ocean:
 
         signal_handler.register(self._report_resync_aborted, priority=100)
         signal_handler.register(self._stop_status_heartbeat, priority=90)
+        signal_handler.register(self.metrics.close_webhook_client, priority=80)
 
     def _warn_non_default_ssl_settings(self) -> None:
         for label, client_ssl in (
@@ -174,15 +193,42 @@ class Ocean:
 
     def _get_caching_provider(self) -> CacheProvider:
         if self.config.caching_storage_mode:
-            caching_type_to_provider = {
+            caching_type_to_provider: dict[str, Callable[[], CacheProvider]] = {
                 DiskCacheProvider.STORAGE_TYPE: DiskCacheProvider,
                 InMemoryCacheProvider.STORAGE_TYPE: InMemoryCacheProvider,
+                BoundedMemoryCacheProvider.STORAGE_TYPE: lambda: BoundedMemoryCacheProvider(
+                    max_size_bytes=self.config.memory_cache.max_size_bytes,
+                    ttl_seconds=self.config.memory_cache.ttl_seconds,
+                ),
+                SQLiteCacheProvider.STORAGE_TYPE: lambda: SQLiteCacheProvider(
+                    path=self.config.sqlite_cache.path,
+                    ttl_seconds=self.config.sqlite_cache.ttl_seconds,
+                ),
+                RedisCacheProvider.STORAGE_TYPE: self._get_redis_cache_provider,
             }
             if self.config.caching_storage_mode in caching_type_to_provider:
                 return caching_type_to_provider[self.config.caching_storage_mode]()
 
         return InMemoryCacheProvider()
 
+    def _get_redis_cache_provider(self) -> CacheProvider:
+        settings = self.config.redis_cache
+        client_kwargs: dict[str, Any] = {}
+        if settings.username:
+            client_kwargs["username"] = settings.username
+        if settings.password is not None:
+            client_kwargs["password"] = settings.password
+        return RedisCacheProvider(
+            settings.url,
+            key_prefix=settings.key_prefix
+            or f"ocean:cache:{self.config.integration.identifier}",
+            ttl_seconds=settings.ttl_seconds,
+            compression_threshold_bytes=settings.compression_threshold_bytes,
+            lock_timeout_seconds=settings.lock_timeout_seconds,
+            lock_wait_seconds=settings.lock_wait_seconds,
+            **client_kwargs,
+        )
+
     def is_saas(self) -> bool:
         return self.config.runtime.is_saas_runtime
 
@@ -232,6 +278,23 @@ class Ocean:
             )
             await repeated_function()
 
+    def _start_event_loop_watchdog(self) -> None:
+        settings = self.config.event_loop_watchdog
+        if not settings.enabled:
+            return
+        start_event_loop_watchdog(
+            threshold_ms=settings.threshold_ms,
+            report_interval_seconds=settings.report_interval_seconds,
+            top_offenders=settings.top_offenders,
+        )
+        signal_handler.register(stop_event_loop_watchdog)
+
+    def _start_tracing(self) -> None:
+        if not self.config.tracing.enabled:
+            return
+        configure_tracing(self.config.tracing, self.config.integration.type)
+        signal_handler.register(shutdown_tracing, priority=-800)
+
     async def _setup_status_heartbeat(self) -> None:
         interval = self.config.status_heartbeat_interval_seconds
         logger.info(
@@ -315,10 +378,18 @@ class Ocean:
         self.fast_api_app.include_router(
             create_health_router(), prefix=f"{self.route_prefix}/health"
         )
+        if self.config.profiler.enabled:
+            self.fast_api_app.include_router(
+                create_profiler_router(self.config.profiler),
+                prefix=f"{self.route_prefix}/debug/profile",
+            )
+        configure_latency_capture(self.config.profiler)
 
         @asynccontextmanager
         async def lifecycle(_: FastAPI) -> AsyncIterator[None]:
             try:
+                self._start_event_loop_watchdog()
+                self._start_tracing()
                 await self.integration.start()
                 await self._register_addons()
                 await self._setup_status_heartbeat()
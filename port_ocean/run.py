@@ -37,6 +37,7 @@ def run(
     setup_logger(
         application_settings.log_level,
         enable_http_handler=application_settings.enable_http_logging,
+        http_logging_compression=application_settings.http_logging_compression,
     )
 
     config_factory = _get_default_config_factory()
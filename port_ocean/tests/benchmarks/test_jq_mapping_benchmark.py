@@ -0,0 +1,98 @@
+import pytest
+
+from port_ocean.benchmarks.jq_mapping import (
+    INTEGRATIONS_PATH,
+    MAPPING_INTEGRATIONS,
+    PARSE_PATHS,
+    MappingCase,
+    benchmark_context,
+    infer_raw_item_shape,
+    load_mapping_cases,
+    run_jq_benchmark,
+    synthesize_raw_items,
+    with_search_relation,
+)
+from port_ocean.core.handlers.port_app_config.models import ResourceConfig
+
+
+def _resource(mappings: dict[str, object], query: str = "true") -> ResourceConfig:
+    return ResourceConfig.parse_obj(
+        {
+            "kind": "pull-request",
+            "selector": {"query": query},
+            "port": {"entity": {"mappings": mappings}},
+        }
+    )
+
+
+def test_infer_raw_item_shape() -> None:
+    """Test that the shape covers nested, quoted and array paths of every pattern."""
+    resource = _resource(
+        {
+            "identifier": ".head.repo.name + (.id|tostring)",
+            "blueprint": '"githubPullRequest"',
+            "properties": {
+                "readme": '.__includedFiles["README.md"]',
+                "assignees": "[.assignees[].login]",
+                "labels": '.labels | join(",")',
+                "createdAt": ".created_at",
+            },
+        },
+        query='.state == "open"',
+    )
+
+    assert infer_raw_item_shape(resource) == {
+        "state": None,
+        "head": {"repo": {"name": None}},
+        "id": None,
+        "__includedFiles": {"README.md": None},
+        "assignees": [{"login": None}],
+        "labels": [{}],
+        "created_at": None,
+    }
+    [item] = synthesize_raw_items(resource, 1)
+    assert item["assignees"] == [{"login": "login-0"}, {"login": "login-1"}]
+    assert item["labels"] == ["labels-0", "labels-1"]
+    assert item["created_at"].startswith("2024-01-01T")
+
+
+def test_with_search_relation_is_uncompileable() -> None:
+    """Test that the mixed path adds a search relation without changing the case."""
+    resource = _resource({"identifier": ".id", "blueprint": '"service"'})
+
+    mixed = with_search_relation(resource)
+
+    assert "benchmarkSearch" in mixed.port.entity.mappings.relations
+    assert resource.port.entity.mappings.relations == {}
+
+
+@pytest.mark.skipif(
+    not INTEGRATIONS_PATH.exists(), reason="integrations are not available"
+)
+def test_load_mapping_cases() -> None:
+    """Test that the real mappings of every benchmarked integration load."""
+    cases = load_mapping_cases()
+
+    assert {case.integration for case in cases} == set(MAPPING_INTEGRATIONS)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", PARSE_PATHS)
+async def test_run_jq_benchmark(path: str) -> None:
+    """Test that every parse path maps the synthetic items into entities."""
+    resource = _resource(
+        {
+            "identifier": ".id",
+            "title": ".title",
+            "blueprint": '"githubPullRequest"',
+            "properties": {"creator": ".user.login"},
+        }
+    )
+    with benchmark_context(max_workers=2):
+        result = await run_jq_benchmark(MappingCase("test", resource), path, 10)
+
+    assert result.path == path
+    assert result.batch_size == 10
+    assert result.entities == 10
+    assert result.misconfigured_fields == 0
+    assert result.items_per_second > 0
@@ -0,0 +1,78 @@
+from typing import Any
+
+import pytest
+
+from port_ocean.benchmarks.resync import (
+    FAKE_INTEGRATION_PATH,
+    ResyncScenario,
+    compare_to_baseline,
+    run_resync_benchmark,
+)
+
+pytestmark = pytest.mark.skipif(
+    not FAKE_INTEGRATION_PATH.exists(), reason="fake-integration is not available"
+)
+
+
+def _result(**overrides: Any) -> dict[str, Any]:
+    result: dict[str, Any] = {
+        "items_per_second": 1000.0,
+        "phases": {
+            "extract": {"items_per_second": 10000.0},
+            "transform": {"items_per_second": 2000.0},
+            "load": {"items_per_second": 5000.0},
+        },
+        "peak_rss_bytes": 100_000_000,
+        "event_loop_lag_p99_ms": 10.0,
+        "port_requests_total": 100,
+    }
+    return result | overrides
+
+
+@pytest.mark.asyncio
+async def test_resync_benchmark_measures_every_phase() -> None:
+    """Test a small resync through the harness with rate limiting injected."""
+    scenario = ResyncScenario(
+        name="small", raw_items=100, batch_size=50, rate_limit_every=2
+    )
+
+    result = await run_resync_benchmark(scenario)
+
+    assert result.errors == []
+    assert result.upserted_entities == 100
+    assert result.injected_rate_limits == 1
+    assert result.third_party_requests == 3
+    for phase in ("extract", "transform", "load"):
+        assert result.phases[phase].items == 100
+        assert result.phases[phase].items_per_second > 0
+    assert result.peak_rss_bytes > 0
+    assert result.port_requests["POST /v1/blueprints/fakePerson/entities/bulk"] > 0
+    assert result.to_dict()["port_requests_total"] == sum(result.port_requests.values())
+
+
+def test_compare_to_baseline_within_tolerance() -> None:
+    """Test that changes within the tolerance are not reported."""
+    baseline = _result()
+    result = _result(items_per_second=900.0, peak_rss_bytes=110_000_000)
+
+    assert compare_to_baseline(result, baseline, tolerance=0.2) == []
+
+
+def test_compare_to_baseline_reports_regressions() -> None:
+    """Test that slower phases and higher resource usage are reported."""
+    baseline = _result()
+    result = _result(
+        phases={
+            "extract": {"items_per_second": 10000.0},
+            "transform": {"items_per_second": 1000.0},
+            "load": {"items_per_second": 5000.0},
+        },
+        event_loop_lag_p99_ms=50.0,
+        port_requests_total=90,
+    )
+
+    regressions = compare_to_baseline(result, baseline, tolerance=0.2)
+
+    assert len(regressions) == 2
+    assert regressions[0].startswith("transform.items_per_second")
+    assert regressions[1].startswith("event_loop_lag_p99_ms")
@@ -0,0 +1,154 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from port_ocean.cache.bounded_memory import (
+    BoundedMemoryCacheProvider,
+    approximate_size,
+)
+from port_ocean.helpers.metric.metric import MetricType
+
+
+@pytest.fixture
+def bounded_cache() -> BoundedMemoryCacheProvider:
+    """Fixture that provides a BoundedMemoryCacheProvider."""
+    return BoundedMemoryCacheProvider(max_size_bytes=1024 * 1024, ttl_seconds=60)
+
+
+@pytest.mark.asyncio
+async def test_bounded_memory_cache_set_get(
+    bounded_cache: BoundedMemoryCacheProvider,
+) -> None:
+    """Test setting and getting values from the bounded memory cache."""
+    await bounded_cache.set("test_key", {"a": [1, 2, 3]})
+    assert await bounded_cache.get("test_key") == {"a": [1, 2, 3]}
+    assert await bounded_cache.get("missing") is None
+
+    assert bounded_cache.stats.hits == 1
+    assert bounded_cache.stats.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_bounded_memory_cache_ttl(
+    bounded_cache: BoundedMemoryCacheProvider,
+) -> None:
+    """Test that entries expire after their TTL."""
+    await bounded_cache.set("short", "value", ttl=0.05)
+    await bounded_cache.set("long", "value")
+
+    await asyncio.sleep(0.1)
+
+    assert await bounded_cache.get("short") is None
+    assert await bounded_cache.get("long") == "value"
+    assert bounded_cache.stats.expirations == 1
+    assert len(bounded_cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_bounded_memory_cache_evicts_least_recently_used() -> None:
+    """Test that the least recently used entries are evicted to stay within size."""
+    value_size = approximate_size("x" * 1000)
+    cache = BoundedMemoryCacheProvider(max_size_bytes=value_size * 3)
+
+    for key in ("a", "b", "c"):
+        await cache.set(key, "x" * 1000)
+    # Touch "a" so "b" becomes the least recently used entry.
+    await cache.get("a")
+    await cache.set("d", "x" * 1000)
+
+    assert await cache.get("b") is None
+    for key in ("a", "c", "d"):
+        assert await cache.get(key) is not None
+    assert cache.size <= cache.max_size_bytes
+    assert cache.stats.evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_bounded_memory_cache_skips_oversized_values() -> None:
+    """Test that a value larger than the whole cache is not stored."""
+    cache = BoundedMemoryCacheProvider(max_size_bytes=1024)
+    await cache.set("small", "x")
+    await cache.set("big", "x" * 4096)
+
+    assert await cache.get("big") is None
+    assert await cache.get("small") == "x"
+
+
+@pytest.mark.asyncio
+async def test_bounded_memory_cache_overwrite_and_clear(
+    bounded_cache: BoundedMemoryCacheProvider,
+) -> None:
+    """Test that overwriting and clearing keep the size accounting consistent."""
+    await bounded_cache.set("key", "x" * 1000)
+    await bounded_cache.set("key", "y")
+    assert bounded_cache.size == approximate_size("y")
+
+    await bounded_cache.clear()
+    assert bounded_cache.size == 0
+    assert await bounded_cache.get("key") is None
+
+
+@pytest.mark.asyncio
+async def test_bounded_memory_cache_reports_metrics(
+    bounded_cache: BoundedMemoryCacheProvider,
+) -> None:
+    """Test that hits, misses and size are reported through ocean.metrics."""
+    mock_ocean = MagicMock()
+    mock_ocean.initialized = True
+
+    with patch("port_ocean.cache.bounded_memory.ocean", mock_ocean):
+        await bounded_cache.set("key", "value")
+        await bounded_cache.get("key")
+        await bounded_cache.get("missing")
+
+    mock_ocean.metrics.inc_metric.assert_any_call(
+        MetricType.CACHE_REQUESTS_NAME, ["memory", "hit"], 1
+    )
+    mock_ocean.metrics.inc_metric.assert_any_call(
+        MetricType.CACHE_REQUESTS_NAME, ["memory", "miss"], 1
+    )
+    mock_ocean.metrics.set_metric.assert_called_with(
+        MetricType.CACHE_SIZE_NAME, ["memory"], bounded_cache.size
+    )
+
+
+def test_approximate_size_counts_nested_values() -> None:
+    """Test that nested containers are included in the approximate size."""
+    shared = "x" * 1000
+    assert approximate_size({"a": [shared]}) > approximate_size(shared)
+    # A value referenced twice is only counted once.
+    assert approximate_size([shared, shared]) < 2 * approximate_size(shared)
+
+
+@pytest.mark.asyncio
+async def test_bounded_memory_cache_evicts_expired_entries_before_lru() -> None:
+    """Test that expired entries are evicted first and stale expiry times are skipped."""
+    value_size = approximate_size("x" * 1000)
+    cache = BoundedMemoryCacheProvider(max_size_bytes=value_size * 3, ttl_seconds=None)
+
+    await cache.set("lru", "x" * 1000)
+    await cache.set("expiring", "x" * 1000, ttl=0.05)
+    # Overwriting leaves the old expiry time behind, which must not evict "renewed".
+    await cache.set("renewed", "x" * 1000, ttl=0.05)
+    await cache.set("renewed", "x" * 1000, ttl=60)
+    await asyncio.sleep(0.1)
+    await cache.set("new", "x" * 1000)
+
+    assert await cache.get("expiring") is None
+    for key in ("lru", "renewed", "new"):
+        assert await cache.get(key) is not None
+    assert cache.stats.expirations == 1
+    assert cache.stats.evictions == 0
+
+
+@pytest.mark.asyncio
+async def test_bounded_memory_cache_keeps_expiry_times_proportional() -> None:
+    """Test that overwriting keys does not grow the expiry times without bound."""
+    cache = BoundedMemoryCacheProvider(max_size_bytes=1024 * 1024, ttl_seconds=60)
+
+    for i in range(1000):
+        await cache.set(f"key_{i % 10}", i)
+
+    assert len(cache) == 10
+    assert len(cache._expiries) <= 2 * len(cache) + 17
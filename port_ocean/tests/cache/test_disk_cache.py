@@ -1,3 +1,4 @@
+import asyncio
 import os
 import pytest
 from pathlib import Path
@@ -90,3 +91,85 @@ async def test_disk_cache_write_error(
 
     # Restore permissions
     os.chmod(tmp_path, 0o755)
+
+
+async def _read_all(disk_cache: DiskCacheProvider, key: str) -> list[object] | None:
+    chunks = await disk_cache.read_chunks(key)
+    if chunks is None:
+        return None
+    return [chunk async for chunk in chunks]
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_chunks_round_trip(disk_cache: DiskCacheProvider) -> None:
+    """Test writing a chunked entry and reading it back lazily."""
+    assert await _read_all(disk_cache, "chunked") is None
+
+    writer = await disk_cache.open_chunk_writer("chunked")
+    for i in range(3):
+        await writer.append([{"id": i}])
+    await writer.commit()
+
+    assert await _read_all(disk_cache, "chunked") == [
+        [{"id": 0}],
+        [{"id": 1}],
+        [{"id": 2}],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_chunks_abort(
+    disk_cache: DiskCacheProvider, tmp_path: Path
+) -> None:
+    """Test that an aborted chunked entry is not cached and fails its readers."""
+    writer = await disk_cache.open_chunk_writer("chunked")
+    await writer.append([1])
+    reader = await disk_cache.read_chunks("chunked")
+    assert reader is not None
+    assert await reader.__anext__() == [1]
+
+    await writer.abort()
+
+    with pytest.raises(FailedToReadCacheFileError):
+        await reader.__anext__()
+    assert await _read_all(disk_cache, "chunked") is None
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_chunks_follow_writer(disk_cache: DiskCacheProvider) -> None:
+    """Test that a reader started mid-write receives every chunk."""
+    writer = await disk_cache.open_chunk_writer("chunked")
+    reading = asyncio.create_task(_read_all(disk_cache, "chunked"))
+    await asyncio.sleep(0)
+
+    for i in range(5):
+        await writer.append(i)
+        await asyncio.sleep(0)
+    await writer.commit()
+
+    assert await reading == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_chunks_corrupted_file(
+    disk_cache: DiskCacheProvider, tmp_path: Path
+) -> None:
+    """Test that a corrupted chunked entry raises and is dropped."""
+    (tmp_path / "chunked.chunks").write_bytes(b"invalid pickle data")
+
+    with pytest.raises(FailedToReadCacheFileError):
+        await _read_all(disk_cache, "chunked")
+    assert await _read_all(disk_cache, "chunked") is None
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_clear_removes_chunks(disk_cache: DiskCacheProvider) -> None:
+    """Test that clear removes chunked entries."""
+    writer = await disk_cache.open_chunk_writer("chunked")
+    await writer.append([1])
+    await writer.commit()
+
+    await disk_cache.clear()
+
+    assert await _read_all(disk_cache, "chunked") is None
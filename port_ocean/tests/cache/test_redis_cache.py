@@ -0,0 +1,172 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from port_ocean.cache.redis_cache import (
+    FailedToReadCacheRedisError,
+    FailedToWriteCacheRedisError,
+    RedisCacheProvider,
+)
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def redis_server() -> Any:
+    """Fixture that provides an in-process Redis server shared by its clients."""
+    return fakeredis.FakeServer()
+
+
+def _provider(redis_server: Any, **kwargs: Any) -> RedisCacheProvider:
+    return RedisCacheProvider(
+        client=fakeredis.FakeAsyncRedis(server=redis_server), **kwargs
+    )
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_set_get(redis_server: Any) -> None:
+    """Test setting and getting values from the Redis cache."""
+    cache = _provider(redis_server)
+    test_data = {
+        "string": "hello",
+        "int": 42,
+        "list": [1, 2, 3],
+        "dict": {"a": 1, "b": [{"c": None}]},
+    }
+
+    for key, value in test_data.items():
+        await cache.set(key, value)
+    for key, value in test_data.items():
+        assert await cache.get(key) == value
+    assert await cache.get("nonexistent_key") is None
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_compresses_large_values(redis_server: Any) -> None:
+    """Test that values above the threshold are stored compressed."""
+    cache = _provider(redis_server, compression_threshold_bytes=100)
+    large_value = [{"name": "item", "description": "x" * 100}] * 100
+
+    await cache.set("small", "x")
+    await cache.set("large", large_value)
+
+    redis = fakeredis.FakeAsyncRedis(server=redis_server)
+    stored_large = await redis.get("ocean:cache:0:large")
+    assert stored_large.startswith(b"z")
+    assert len(stored_large) < 1000
+    assert (await redis.get("ocean:cache:0:small")).startswith(b"r")
+    assert await cache.get("large") == large_value
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_ttl(redis_server: Any) -> None:
+    """Test that entries expire after their TTL."""
+    cache = _provider(redis_server, ttl_seconds=60)
+    await cache.set("short", "value", ttl=0.05)
+    await cache.set("long", "value")
+
+    await asyncio.sleep(0.1)
+
+    assert await cache.get("short") is None
+    assert await cache.get("long") == "value"
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_is_shared_between_replicas(redis_server: Any) -> None:
+    """Test that replicas see each other's writes and clears."""
+    first, second = _provider(redis_server), _provider(redis_server)
+
+    await first.set("key", "value")
+    assert await second.get("key") == "value"
+
+    await second.clear()
+    assert await first.get("key") is None
+    await first.set("key", "new_value")
+    assert await second.get("key") == "new_value"
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_key_prefix_isolates_integrations(
+    redis_server: Any,
+) -> None:
+    """Test that providers with different prefixes do not share entries."""
+    first = _provider(redis_server, key_prefix="ocean:cache:first")
+    second = _provider(redis_server, key_prefix="ocean:cache:second")
+
+    await first.set("key", "value")
+    await second.clear()
+
+    assert await second.get("key") is None
+    assert await first.get("key") == "value"
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_single_flight_across_replicas(redis_server: Any) -> None:
+    """Test that concurrent misses on different replicas make one upstream call."""
+    replicas = [_provider(redis_server) for _ in range(5)]
+    upstream_calls = 0
+
+    async def fetch(cache: RedisCacheProvider) -> str:
+        nonlocal upstream_calls
+        async with cache.single_flight("members"):
+            if (cached := await cache.get("members")) is not None:
+                return cached
+            upstream_calls += 1
+            await asyncio.sleep(0.05)
+            await cache.set("members", "fetched")
+            return "fetched"
+
+    results = await asyncio.gather(*(fetch(cache) for cache in replicas))
+
+    assert results == ["fetched"] * 5
+    assert upstream_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_single_flight_gives_up_waiting(redis_server: Any) -> None:
+    """Test that a caller proceeds once it waited lock_wait_seconds for the lock."""
+    holder = _provider(redis_server)
+    waiter = _provider(redis_server, lock_wait_seconds=0.1)
+
+    async with holder.single_flight("key"):
+        entered = False
+        async with waiter.single_flight("key"):
+            entered = True
+    assert entered
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_single_flight_extends_lock_while_held(
+    redis_server: Any,
+) -> None:
+    """Test that the lock outlives its timeout while the holder still runs."""
+    holder = _provider(redis_server, lock_timeout_seconds=0.3)
+    redis = fakeredis.FakeAsyncRedis(server=redis_server)
+
+    async with holder.single_flight("key"):
+        await asyncio.sleep(0.7)
+        assert await redis.exists("ocean:cache:lock:key")
+        waiter_lock = redis.lock("ocean:cache:lock:key", timeout=1)
+        assert not await waiter_lock.acquire(blocking=False)
+
+    assert not await redis.exists("ocean:cache:lock:key")
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_errors() -> None:
+    """Test that Redis failures surface as cache errors."""
+    client = AsyncMock()
+    client.get.side_effect = ConnectionError("connection refused")
+    client.set.side_effect = ConnectionError("connection refused")
+    client.incr.side_effect = ConnectionError("connection refused")
+    cache = RedisCacheProvider(client=client)
+
+    with pytest.raises(FailedToReadCacheRedisError):
+        await cache.get("key")
+    with pytest.raises(FailedToWriteCacheRedisError):
+        await cache.set("key", "value")
+    # Clearing is best effort.
+    await cache.clear()
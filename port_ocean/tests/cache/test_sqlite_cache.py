@@ -0,0 +1,156 @@
+import asyncio
+import sqlite3
+import threading
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import AsyncIterator
+
+import pytest
+
+from port_ocean.cache.sqlite import (
+    FailedToReadCacheDatabaseError,
+    FailedToWriteCacheDatabaseError,
+    SQLiteCacheProvider,
+)
+from port_ocean.cache.serialization import deserialize, serialize
+
+
+@pytest.fixture
+async def sqlite_cache(tmp_path: Path) -> AsyncIterator[SQLiteCacheProvider]:
+    """Fixture that provides a SQLiteCacheProvider in a temporary directory."""
+    cache = SQLiteCacheProvider(path=str(tmp_path / "cache.sqlite3"))
+    yield cache
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_set_get(sqlite_cache: SQLiteCacheProvider) -> None:
+    """Test setting and getting values from the sqlite cache."""
+    test_data = {
+        "string": "hello",
+        "int": 42,
+        "float": 3.14,
+        "list": [1, 2, 3],
+        "dict": {"a": 1, "b": [{"c": None}]},
+        "set": {1, 2},
+    }
+
+    for key, value in test_data.items():
+        await sqlite_cache.set(key, value)
+    for key, value in test_data.items():
+        assert await sqlite_cache.get(key) == value
+    assert await sqlite_cache.get("nonexistent_key") is None
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_ttl(sqlite_cache: SQLiteCacheProvider) -> None:
+    """Test that entries expire after their TTL."""
+    await sqlite_cache.set("short", "value", ttl=0.05)
+    await sqlite_cache.set("long", "value")
+
+    await asyncio.sleep(0.1)
+
+    assert await sqlite_cache.get("short") is None
+    assert await sqlite_cache.get("long") == "value"
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_clear(
+    sqlite_cache: SQLiteCacheProvider, tmp_path: Path
+) -> None:
+    """Test that clear hides every entry and purges them in the background."""
+    for i in range(5):
+        await sqlite_cache.set(f"key_{i}", f"value_{i}")
+
+    await sqlite_cache.clear()
+
+    for i in range(5):
+        assert await sqlite_cache.get(f"key_{i}") is None
+    await sqlite_cache.set("key_0", "new_value")
+    assert await sqlite_cache.get("key_0") == "new_value"
+
+    # The purge runs on the cache thread, so it is done once a later call is.
+    with sqlite3.connect(tmp_path / "cache.sqlite3") as connection:
+        (count,) = connection.execute("SELECT COUNT(*) FROM cache_entries").fetchone()
+    assert count == 1
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_is_shared_between_providers(tmp_path: Path) -> None:
+    """Test that providers on the same database see each other's writes and clears."""
+    path = str(tmp_path / "cache.sqlite3")
+    first, second = SQLiteCacheProvider(path=path), SQLiteCacheProvider(path=path)
+
+    await first.set("key", "value")
+    assert await second.get("key") == "value"
+    await second.clear()
+    assert await first.get("key") is None
+
+    await first.close()
+    await second.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_runs_off_the_event_loop(
+    sqlite_cache: SQLiteCacheProvider,
+) -> None:
+    """Test that database work does not run on the event loop thread."""
+    threads: list[threading.Thread] = []
+
+    def _get(key: str) -> None:
+        threads.append(threading.current_thread())
+
+    sqlite_cache._get = _get  # type: ignore[method-assign]
+    await sqlite_cache.get("key")
+
+    assert threads and threads[0] is not threading.current_thread()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_corrupted_entry(
+    sqlite_cache: SQLiteCacheProvider, tmp_path: Path
+) -> None:
+    """Test that an entry that cannot be deserialized raises a read error."""
+    await sqlite_cache.set("key", "value")
+    with sqlite3.connect(tmp_path / "cache.sqlite3") as connection:
+        connection.execute("UPDATE cache_entries SET value = ?", (b"p-invalid",))
+
+    with pytest.raises(FailedToReadCacheDatabaseError):
+        await sqlite_cache.get("key")
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_unserializable_value(
+    sqlite_cache: SQLiteCacheProvider,
+) -> None:
+    """Test that a value that cannot be serialized raises a write error."""
+    with pytest.raises(FailedToWriteCacheDatabaseError):
+        await sqlite_cache.set("key", lambda: None)
+
+
+def test_serialize_round_trip() -> None:
+    """Test that values survive serialization."""
+    value = {"items": [{"id": 1, "name": "a"}], "total": 1}
+    assert deserialize(serialize(value)) == value
+    assert deserialize(serialize({1, 2})) == {1, 2}
+
+
+def test_serialize_keeps_types_that_json_would_change() -> None:
+    """Test that values JSON cannot represent exactly come back unchanged."""
+    for value in (
+        (1, 2),
+        {"created": datetime(2024, 1, 1, tzinfo=timezone.utc)},
+        [uuid.UUID(int=1)],
+        {1: "int key"},
+        float("nan"),
+    ):
+        restored = deserialize(serialize(value))
+        assert type(restored) is type(value)
+        assert repr(restored) == repr(value)
+
+
+def test_deserialize_rejects_unknown_formats() -> None:
+    """Test that entries in a format this version doesn't write are rejected."""
+    with pytest.raises(ValueError):
+        deserialize(b'j{"a": 1}')
@@ -1,4 +1,5 @@
 from io import StringIO
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -7,9 +8,14 @@ from loguru import logger
 
 from port_ocean.clients.port.utils import (
     OCEAN_INFO_PREFIX,
+    get_entities_concurrency,
     get_event_context_params,
+    get_port_http_limits,
     handle_port_status_code,
+    _warn_http2_unavailable,
+    resolve_http2_enabled,
 )
+from port_ocean.config.settings import PortSettings
 from port_ocean.context.event import EventType, event_context
 
 
@@ -235,3 +241,56 @@ class TestGetEventContextParams:
         assert result[f"{OCEAN_INFO_PREFIX}event_type"] == EventType.RESYNC
         assert f"{OCEAN_INFO_PREFIX}resync_id" in result
         assert result[f"{OCEAN_INFO_PREFIX}resync_id"] == event_id
+
+
+def _port_settings(**overrides: Any) -> PortSettings:
+    return PortSettings(client_id="id", client_secret="secret", **overrides)
+
+
+class TestPortHttpSettings:
+    def test_limits_follow_settings(self) -> None:
+        limits = get_port_http_limits(
+            _port_settings(
+                http_max_connections=20,
+                http_max_keepalive_connections=10,
+                http_keepalive_expiry_seconds=30,
+            )
+        )
+
+        assert limits.max_connections == 20
+        assert limits.max_keepalive_connections == 10
+        assert limits.keepalive_expiry == 30
+
+    def test_http2_falls_back_when_h2_is_missing(self) -> None:
+        with patch(
+            "port_ocean.clients.port.utils.is_http2_available", return_value=False
+        ):
+            assert resolve_http2_enabled(_port_settings(http2_enabled=True)) is False
+
+    def test_http2_fallback_is_reported_once(self) -> None:
+        _warn_http2_unavailable.cache_clear()
+        with (
+            patch(
+                "port_ocean.clients.port.utils.is_http2_available", return_value=False
+            ),
+            patch("port_ocean.clients.port.utils.logger") as mock_logger,
+        ):
+            settings = _port_settings(http2_enabled=True, http_max_connections=40)
+            assert get_entities_concurrency(settings) == 20
+            assert resolve_http2_enabled(settings) is False
+
+        mock_logger.warning.assert_called_once()
+
+    def test_entities_concurrency_defaults_to_half_the_pool(self) -> None:
+        assert get_entities_concurrency(_port_settings(http_max_connections=40)) == 20
+
+    def test_entities_concurrency_uses_full_pool_over_http2(self) -> None:
+        with patch(
+            "port_ocean.clients.port.utils.is_http2_available", return_value=True
+        ):
+            settings = _port_settings(http_max_connections=40, http2_enabled=True)
+            assert get_entities_concurrency(settings) == 40
+
+    def test_entities_concurrency_override(self) -> None:
+        settings = _port_settings(entities_concurrency=7)
+        assert get_entities_concurrency(settings) == 7
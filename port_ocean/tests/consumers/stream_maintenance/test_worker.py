@@ -14,7 +14,7 @@ from port_ocean.consumers.stream_maintenance.settings import (
 )
 from port_ocean.consumers.redis_stream_utils import (
     ACK_AND_FINALIZE_STREAM_ENTRY_SCRIPT,
-    REQUEUE_STREAM_ENTRY_SCRIPT,
+    REQUEUE_STREAM_ENTRIES_SCRIPT,
 )
 
 # ---------------------------------------------------------------------------
@@ -44,7 +44,8 @@ def _make_redis() -> AsyncMock:
 
 
 def _fields_from_requeue_eval_call(eval_call: Any) -> dict[str, str]:
-    field_pairs = eval_call.args[5:]
+    field_count = int(eval_call.args[5])
+    field_pairs = eval_call.args[6 : 6 + field_count]
     return dict(zip(field_pairs[0::2], field_pairs[1::2], strict=True))
 
 
@@ -82,12 +83,12 @@ class TestPELHandleStuckMessage:
             "headers": "{}",
             "requeue_count": "1",
         }
-        await worker._handle_stuck_message("1700000000000-0", fields)
+        await worker._handle_stuck_messages([("1700000000000-0", fields)])
 
         redis.eval.assert_awaited_once()
         eval_call = redis.eval.await_args
         assert eval_call is not None
-        assert eval_call.args[0] == REQUEUE_STREAM_ENTRY_SCRIPT
+        assert eval_call.args[0] == REQUEUE_STREAM_ENTRIES_SCRIPT
         assert eval_call.args[2] == worker._stream_key
         assert eval_call.args[3] == worker._consumer_group
         assert eval_call.args[4] == "1700000000000-0"
@@ -101,12 +102,12 @@ class TestPELHandleStuckMessage:
         worker = _make_worker(redis, pel_max_requeue_count=3)
 
         fields = {"webhookPath": "/webhook", "payload": "{}", "headers": "{}"}
-        await worker._handle_stuck_message("1700000000000-0", fields)
+        await worker._handle_stuck_messages([("1700000000000-0", fields)])
 
         redis.eval.assert_awaited_once()
         eval_call = redis.eval.await_args
         assert eval_call is not None
-        assert eval_call.args[0] == REQUEUE_STREAM_ENTRY_SCRIPT
+        assert eval_call.args[0] == REQUEUE_STREAM_ENTRIES_SCRIPT
         assert eval_call.args[2] == worker._stream_key
         assert eval_call.args[3] == worker._consumer_group
         assert eval_call.args[4] == "1700000000000-0"
@@ -120,7 +121,7 @@ class TestPELHandleStuckMessage:
         worker = _make_worker(redis, pel_max_requeue_count=3)
 
         fields = {"webhookPath": "/webhook", "payload": "{}", "headers": "{}"}
-        await worker._handle_stuck_message("1700000000000-0", fields)
+        await worker._handle_stuck_messages([("1700000000000-0", fields)])
 
         eval_call = redis.eval.await_args
         assert eval_call is not None
@@ -138,7 +139,7 @@ class TestPELHandleStuckMessage:
             "headers": "{}",
             "requeue_count": "3",
         }
-        await worker._handle_stuck_message("1700000000000-0", fields)
+        await worker._handle_stuck_messages([("1700000000000-0", fields)])
 
         redis.xadd.assert_not_awaited()
         redis.eval.assert_awaited_once_with(
@@ -155,7 +156,7 @@ class TestPELHandleStuckMessage:
         worker = _make_worker(redis, pel_max_requeue_count=3)
 
         fields = {"requeue_count": "10"}
-        await worker._handle_stuck_message("1700000000000-0", fields)
+        await worker._handle_stuck_messages([("1700000000000-0", fields)])
 
         redis.xadd.assert_not_awaited()
         redis.eval.assert_awaited_once()
@@ -215,7 +216,52 @@ class TestPELScanAndRequeue:
         worker = _make_worker(redis)
         await worker._scan_and_requeue()
 
+        redis.eval.assert_awaited_once()
+        eval_call = redis.eval.await_args
+        assert eval_call is not None
+        assert eval_call.args[0] == REQUEUE_STREAM_ENTRIES_SCRIPT
+        assert eval_call.args[4] == "1700000000001-0"
+        assert "1700000000002-0" in eval_call.args
+
+    @pytest.mark.asyncio
+    async def test_batches_discards_and_requeues_per_page(self) -> None:
+        redis = _make_redis()
+        messages = [
+            ("1700000000001-0", None),
+            ("1700000000002-0", {"requeue_count": "3"}),
+            ("1700000000003-0", {"webhookPath": "/w"}),
+            ("1700000000004-0", {"webhookPath": "/w", "requeue_count": "1"}),
+        ]
+        redis.xautoclaim = AsyncMock(return_value=("0-0", messages, []))
+
+        worker = _make_worker(redis, pel_max_requeue_count=3)
+        await worker._scan_and_requeue()
+
         assert redis.eval.await_count == 2
+        finalize_call, requeue_call = redis.eval.await_args_list
+        assert finalize_call.args == (
+            ACK_AND_FINALIZE_STREAM_ENTRY_SCRIPT,
+            1,
+            worker._stream_key,
+            worker._consumer_group,
+            "1700000000001-0",
+            "1700000000002-0",
+        )
+        assert requeue_call.args[3:] == (
+            worker._consumer_group,
+            "1700000000003-0",
+            "4",
+            "webhookPath",
+            "/w",
+            "requeue_count",
+            "1",
+            "1700000000004-0",
+            "4",
+            "webhookPath",
+            "/w",
+            "requeue_count",
+            "2",
+        )
 
     @pytest.mark.asyncio
     async def test_paginates_through_non_zero_cursor_with_empty_batch(self) -> None:
@@ -245,7 +291,7 @@ class TestPELScanAndRequeue:
         redis.eval.assert_awaited_once()
         eval_call = redis.eval.await_args
         assert eval_call is not None
-        assert eval_call.args[0] == REQUEUE_STREAM_ENTRY_SCRIPT
+        assert eval_call.args[0] == REQUEUE_STREAM_ENTRIES_SCRIPT
         assert eval_call.args[4] == "1700000000002-0"
         sent_fields = _fields_from_requeue_eval_call(eval_call)
         assert sent_fields["requeue_count"] == "1"
@@ -344,7 +390,7 @@ class TestPELScanAndRequeue:
             redis.eval.await_args_list[0].args[0]
             == ACK_AND_FINALIZE_STREAM_ENTRY_SCRIPT
         )
-        assert redis.eval.await_args_list[1].args[0] == REQUEUE_STREAM_ENTRY_SCRIPT
+        assert redis.eval.await_args_list[1].args[0] == REQUEUE_STREAM_ENTRIES_SCRIPT
 
     @pytest.mark.asyncio
     async def test_continues_scan_when_one_message_fails(self) -> None:
@@ -397,9 +443,18 @@ class TestStreamMaintenanceWorkerLoop:
         assert worker._lifecycle_task is None
 
     @pytest.mark.asyncio
-    async def test_all_pods_scan_independently(self) -> None:
-        """Multiple workers sharing the same Redis instance should each scan."""
+    async def test_only_lease_holder_scans(self) -> None:
+        """Workers sharing the same Redis instance scan only while holding the lease."""
         redis = _make_redis()
+        leases: dict[str, str] = {}
+
+        async def fake_set(key: str, value: str, nx: bool, px: int) -> bool:
+            if nx and key in leases:
+                return False
+            leases[key] = value
+            return True
+
+        redis.set = AsyncMock(side_effect=fake_set)
         scan_counts: dict[str, int] = {"a": 0, "b": 0}
 
         worker_a = _make_worker(redis, stream_maintenance_scan_interval_seconds=0.05)
@@ -414,6 +469,43 @@ class TestStreamMaintenanceWorkerLoop:
         worker_a._scan_and_requeue = fake_scan_a  # type: ignore[method-assign]
         worker_b._scan_and_requeue = fake_scan_b  # type: ignore[method-assign]
 
+        await worker_a.start()
+        await worker_b.start()
+        await asyncio.sleep(0.2)
+        await worker_a.stop()
+        await worker_b.stop()
+
+        assert scan_counts == {"a": 1, "b": 0}
+        assert redis.set.await_args is not None
+        assert redis.set.await_args.args[0] == f"{_STREAM_KEY}:maintenance-scan-lease"
+        assert redis.set.await_args.kwargs == {"nx": True, "px": 50}
+
+    @pytest.mark.asyncio
+    async def test_all_pods_scan_when_leader_election_disabled(self) -> None:
+        """Without leader election every worker scans on its own interval."""
+        redis = _make_redis()
+        scan_counts: dict[str, int] = {"a": 0, "b": 0}
+
+        worker_a = _make_worker(
+            redis,
+            stream_maintenance_scan_interval_seconds=0.05,
+            stream_maintenance_leader_election_enabled=False,
+        )
+        worker_b = _make_worker(
+            redis,
+            stream_maintenance_scan_interval_seconds=0.05,
+            stream_maintenance_leader_election_enabled=False,
+        )
+
+        async def fake_scan_a() -> None:
+            scan_counts["a"] += 1
+
+        async def fake_scan_b() -> None:
+            scan_counts["b"] += 1
+
+        worker_a._scan_and_requeue = fake_scan_a  # type: ignore[method-assign]
+        worker_b._scan_and_requeue = fake_scan_b  # type: ignore[method-assign]
+
         await worker_a.start()
         await worker_b.start()
         await asyncio.sleep(0.25)
@@ -560,7 +652,7 @@ class TestStreamMaintenanceRecoverMissingStream:
 
         worker = _make_worker(redis, pel_max_requeue_count=3)
         fields = {"webhookPath": "/webhook", "payload": "{}", "headers": "{}"}
-        await worker._handle_stuck_message("1700000000000-0", fields)
+        await worker._handle_stuck_messages([("1700000000000-0", fields)])
 
         redis.xgroup_create.assert_awaited_once()
         redis.eval.assert_awaited_once()
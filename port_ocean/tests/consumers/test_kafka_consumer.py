@@ -0,0 +1,101 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from port_ocean.consumers.kafka_consumer import KafkaConsumer, KafkaConsumerConfig
+
+
+def _config(**overrides: object) -> KafkaConsumerConfig:
+    values: dict[str, object] = {
+        "brokers": "localhost:9092",
+        "security_protocol": "PLAINTEXT",
+        "authentication_mechanism": "PLAIN",
+        "kafka_security_enabled": False,
+        "consumer_poll_timeout": 1,
+    }
+    values.update(overrides)
+    return KafkaConsumerConfig.parse_obj(values)
+
+
+def _message(offset: int, value: bytes = b"{}") -> MagicMock:
+    msg = MagicMock()
+    msg.error.return_value = None
+    msg.value.return_value = value
+    msg.topic.return_value = "org.change.log"
+    msg.partition.return_value = 0
+    msg.offset.return_value = offset
+    return msg
+
+
+def _build_consumer(
+    raw_consumer: MagicMock,
+    msg_process: AsyncMock,
+    **config_overrides: object,
+) -> KafkaConsumer:
+    with patch(
+        "port_ocean.consumers.kafka_consumer.Consumer", return_value=raw_consumer
+    ):
+        return KafkaConsumer(
+            msg_process=msg_process,
+            config=_config(**config_overrides),
+            org_id="org",
+            msg_filter=lambda msg: msg.value() != b"skip",
+        )
+
+
+@pytest.mark.asyncio
+async def test_consumes_in_batches_and_commits_asynchronously() -> None:
+    raw_consumer = MagicMock()
+    msg_process = AsyncMock()
+    batches = [
+        [_message(0), _message(1, b"skip"), _message(2)],
+        [_message(3)],
+    ]
+
+    def consume(num_messages: int, timeout: int) -> list[MagicMock]:
+        assert num_messages == 50
+        if batches:
+            return batches.pop(0)
+        consumer.running = False
+        return []
+
+    raw_consumer.consume.side_effect = consume
+    consumer = _build_consumer(
+        raw_consumer,
+        msg_process,
+        consumer_batch_size=50,
+        consumer_commit_interval_seconds=0,
+    )
+
+    await consumer.start()
+    await asyncio.sleep(0)
+
+    assert msg_process.await_count == 3
+    raw_consumer.poll.assert_not_called()
+    assert raw_consumer.commit.call_args_list[0].kwargs == {"asynchronous": True}
+    assert raw_consumer.commit.call_count == 2
+    raw_consumer.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_commits_pending_offsets_synchronously_on_close() -> None:
+    raw_consumer = MagicMock()
+    msg_process = AsyncMock()
+    batches = [[_message(0)]]
+
+    def consume(num_messages: int, timeout: int) -> list[MagicMock]:
+        if batches:
+            return batches.pop(0)
+        consumer.running = False
+        return []
+
+    raw_consumer.consume.side_effect = consume
+    consumer = _build_consumer(
+        raw_consumer, msg_process, consumer_commit_interval_seconds=3600
+    )
+
+    await consumer.start()
+
+    raw_consumer.commit.assert_called_once_with(asynchronous=False)
+    raw_consumer.close.assert_called_once()
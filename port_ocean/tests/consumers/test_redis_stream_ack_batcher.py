@@ -0,0 +1,101 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import ResponseError
+
+from port_ocean.consumers.redis_stream_ack_batcher import RedisStreamAckBatcher
+from port_ocean.consumers.redis_stream_utils import (
+    ACK_AND_FINALIZE_STREAM_ENTRY_SCRIPT,
+)
+
+
+def _make_batcher(
+    redis: AsyncMock,
+    *,
+    max_batch_size: int = 10,
+    flush_interval_seconds: float = 60,
+) -> RedisStreamAckBatcher:
+    return RedisStreamAckBatcher(
+        redis,
+        stream_key="stream",
+        consumer_group="test.integration",
+        max_batch_size=max_batch_size,
+        flush_interval_seconds=flush_interval_seconds,
+    )
+
+
+class TestRedisStreamAckBatcher:
+    @pytest.mark.asyncio
+    async def test_flushes_when_batch_size_reached(self) -> None:
+        redis = AsyncMock()
+        batcher = _make_batcher(redis, max_batch_size=2)
+
+        await batcher.add("1-0")
+        redis.eval.assert_not_awaited()
+
+        await batcher.add("2-0")
+
+        redis.eval.assert_awaited_once_with(
+            ACK_AND_FINALIZE_STREAM_ENTRY_SCRIPT,
+            1,
+            "stream",
+            "test.integration",
+            "1-0",
+            "2-0",
+        )
+        assert batcher.pending_count == 0
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_flushes_after_interval(self) -> None:
+        redis = AsyncMock()
+        batcher = _make_batcher(redis, flush_interval_seconds=0.01)
+
+        await batcher.add("1-0")
+        await asyncio.sleep(0.05)
+
+        redis.eval.assert_awaited_once()
+        assert batcher.pending_count == 0
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending(self) -> None:
+        redis = AsyncMock()
+        batcher = _make_batcher(redis)
+
+        await batcher.add("1-0")
+        await batcher.close()
+
+        redis.eval.assert_awaited_once()
+        assert batcher.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_keeps_ids_on_connection_error(self) -> None:
+        redis = AsyncMock()
+        redis.eval = AsyncMock(side_effect=[RedisConnectionError("down"), 2])
+        batcher = _make_batcher(redis)
+
+        await batcher.add("1-0")
+        await batcher.add("2-0")
+        await batcher.flush()
+        assert batcher.pending_count == 2
+
+        await batcher.flush()
+        assert batcher.pending_count == 0
+        assert redis.eval.await_args is not None
+        assert redis.eval.await_args.args[4:] == ("1-0", "2-0")
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_drops_ids_on_unexpected_error(self) -> None:
+        redis = AsyncMock()
+        redis.eval = AsyncMock(side_effect=ResponseError("WRONGTYPE"))
+        batcher = _make_batcher(redis)
+
+        await batcher.add("1-0")
+        await batcher.flush()
+
+        assert batcher.pending_count == 0
+        await batcher.close()
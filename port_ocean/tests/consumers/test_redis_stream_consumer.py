@@ -3,6 +3,7 @@ import base64
 import json
 import os
 from datetime import datetime, timezone
+from typing import Any
 from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
@@ -22,7 +23,7 @@ from port_ocean.consumers.stream_maintenance import RedisStreamMaintenanceWorker
 from port_ocean.consumers.redis_stream_consumer import RedisStreamConsumer
 from port_ocean.consumers.redis_stream_utils import (
     ACK_AND_FINALIZE_STREAM_ENTRY_SCRIPT,
-    REQUEUE_STREAM_ENTRY_SCRIPT,
+    REQUEUE_STREAM_ENTRIES_SCRIPT,
     ensure_consumer_group,
 )
 from port_ocean.core.handlers.webhook.webhook_event import WebhookRequestAdapter
@@ -596,6 +597,7 @@ class TestRedisStreamConsumerAck:
             )
             consumer._redis = mock_redis
             await consumer._ack("1700000000000-0")
+            await consumer._flush_acks()
 
         mock_redis.eval.assert_awaited_once_with(
             ACK_AND_FINALIZE_STREAM_ENTRY_SCRIPT,
@@ -627,6 +629,7 @@ class TestRedisStreamConsumerAck:
             )
             consumer._redis = mock_redis
             await consumer._ack("1700000000000-0")
+            await consumer._flush_acks()
 
         mock_redis.eval.assert_awaited_once_with(
             ACK_AND_FINALIZE_STREAM_ENTRY_SCRIPT,
@@ -664,9 +667,50 @@ class TestRedisStreamConsumerAck:
             )
             consumer._redis = mock_redis
             await consumer._ack("1700000000000-0")
+            await consumer._flush_acks()
 
         mock_redis.xgroup_create.assert_not_awaited()
 
+    @pytest.mark.asyncio
+    async def test_ack_batches_entries_into_single_call(
+        self,
+        mock_ocean_config: MagicMock,
+    ) -> None:
+        settings = LiveEventsRedisSettings(
+            url="redis://localhost:6379",
+            ack_batch_size=3,
+            ack_flush_interval_seconds=60,
+        )
+        mock_redis = self._mock_redis_for_ack()
+
+        with patch(
+            "port_ocean.consumers.redis_stream_consumer.ocean", mock_ocean_config
+        ):
+            consumer = RedisStreamConsumer(
+                redis_settings=settings,
+                stream_key="stream",
+                on_message=AsyncMock(),
+            )
+            consumer._redis = mock_redis
+            for message_id in ("1-0", "2-0", "3-0", "4-0"):
+                await consumer._ack(message_id)
+
+            mock_redis.eval.assert_awaited_once_with(
+                ACK_AND_FINALIZE_STREAM_ENTRY_SCRIPT,
+                1,
+                "stream",
+                "test.integration",
+                "1-0",
+                "2-0",
+                "3-0",
+            )
+
+            await consumer.stop()
+
+        assert mock_redis.eval.await_count == 2
+        assert mock_redis.eval.await_args is not None
+        assert mock_redis.eval.await_args.args[3:] == ("test.integration", "4-0")
+
 
 class TestRedisStreamConsumerMaintenanceWorkerLifecycle:
     @pytest.mark.asyncio
@@ -811,8 +855,8 @@ class TestRedisStreamConsumerMaintenanceWorkerLifecycle:
 
             mock_redis.eval.assert_awaited_once()
             assert mock_redis.eval.await_args is not None
-            assert mock_redis.eval.await_args.args[0] == REQUEUE_STREAM_ENTRY_SCRIPT
-            field_pairs = mock_redis.eval.await_args.args[5:]
+            assert mock_redis.eval.await_args.args[0] == REQUEUE_STREAM_ENTRIES_SCRIPT
+            field_pairs = mock_redis.eval.await_args.args[6:]
             requeued_fields = dict(
                 zip(field_pairs[0::2], field_pairs[1::2], strict=True)
             )
@@ -1212,3 +1256,185 @@ class TestRedisStreamConsumer:
         assert on_message.await_args is not None
         event = on_message.await_args.args[1]
         assert event._original_request is None
+
+
+class TestRedisStreamConsumerConcurrency:
+    @staticmethod
+    def _fields(event_id: str, repository: str) -> dict[str, str]:
+        return {
+            "payload": json.dumps({"repository": {"full_name": repository}}),
+            "headers": json.dumps({}),
+            "webhookPath": "integration/webhook",
+            "eventId": event_id,
+        }
+
+    def test_resolve_group_id_uses_webhook_path_by_default(
+        self,
+        redis_settings: LiveEventsRedisSettings,
+        mock_ocean_config: MagicMock,
+    ) -> None:
+        with patch(
+            "port_ocean.consumers.redis_stream_consumer.ocean", mock_ocean_config
+        ):
+            consumer = RedisStreamConsumer(
+                redis_settings=redis_settings,
+                stream_key="stream",
+                on_message=AsyncMock(),
+            )
+
+        assert consumer._resolve_group_id(self._fields("e1", "org/a")) == "/webhook"
+
+    def test_resolve_group_id_appends_jq_group_key(
+        self,
+        mock_ocean_config: MagicMock,
+    ) -> None:
+        settings = LiveEventsRedisSettings(
+            url="redis://localhost:6379",
+            message_group_key_jq=".repository.full_name",
+        )
+        with patch(
+            "port_ocean.consumers.redis_stream_consumer.ocean", mock_ocean_config
+        ):
+            consumer = RedisStreamConsumer(
+                redis_settings=settings,
+                stream_key="stream",
+                on_message=AsyncMock(),
+            )
+
+        assert (
+            consumer._resolve_group_id(self._fields("e1", "org/a")) == "/webhook:org/a"
+        )
+        assert (
+            consumer._resolve_group_id({"webhookPath": "webhook", "payload": "{}"})
+            == "/webhook"
+        )
+        assert (
+            consumer._resolve_group_id({"webhookPath": "webhook", "payload": "nope"})
+            == "/webhook"
+        )
+
+    @pytest.mark.asyncio
+    async def test_read_loop_processes_groups_concurrently_in_order(
+        self,
+        mock_ocean_config: MagicMock,
+    ) -> None:
+        settings = LiveEventsRedisSettings(
+            url="redis://localhost:6379",
+            block_ms=100,
+            worker_count=4,
+            message_group_key_jq=".repository.full_name",
+        )
+        messages = [
+            ("1-0", self._fields("a-1", "org/a")),
+            ("2-0", self._fields("b-1", "org/b")),
+            ("3-0", self._fields("a-2", "org/a")),
+            ("4-0", self._fields("c-1", "org/c")),
+            ("5-0", self._fields("a-3", "org/a")),
+        ]
+        processed: list[str] = []
+        running = 0
+        max_running = 0
+        all_done = asyncio.Event()
+
+        async def on_message(path: str, event: Any) -> None:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.02)
+            processed.append(event.trace_id)
+            running -= 1
+            if len(processed) == len(messages):
+                all_done.set()
+
+        read_calls = 0
+
+        async def read_side_effect(**_kwargs: object) -> list[object]:
+            nonlocal read_calls
+            read_calls += 1
+            if read_calls == 1:
+                return [("stream", messages)]
+            await all_done.wait()
+            consumer._is_running = False
+            return []
+
+        mock_redis = AsyncMock()
+        mock_redis.xreadgroup = AsyncMock(side_effect=read_side_effect)
+
+        with patch(
+            "port_ocean.consumers.redis_stream_consumer.ocean", mock_ocean_config
+        ):
+            consumer = RedisStreamConsumer(
+                redis_settings=settings,
+                stream_key="stream",
+                on_message=on_message,
+                registered_paths={"/webhook"},
+            )
+            consumer._redis = mock_redis
+            consumer._ack = AsyncMock()  # type: ignore[method-assign]
+            consumer._is_running = True
+
+            await asyncio.wait_for(consumer._read_loop(), timeout=5)
+            await consumer._stop_message_workers()
+
+        assert sorted(processed) == sorted(fields["eventId"] for _, fields in messages)
+        assert [e for e in processed if e.startswith("a-")] == ["a-1", "a-2", "a-3"]
+        assert max_running > 1
+        assert consumer._ack.await_count == len(messages)
+        assert consumer._worker_tasks == []
+
+    @pytest.mark.asyncio
+    async def test_message_worker_survives_handler_errors(
+        self,
+        mock_ocean_config: MagicMock,
+    ) -> None:
+        settings = LiveEventsRedisSettings(
+            url="redis://localhost:6379",
+            block_ms=100,
+            worker_count=2,
+        )
+        messages = [
+            ("1-0", {"webhookPath": "/webhook"}),
+            ("2-0", {"webhookPath": "/webhook"}),
+            ("3-0", self._fields("a-1", "org/a")),
+        ]
+        processed = asyncio.Event()
+
+        async def on_message(path: str, event: Any) -> None:
+            processed.set()
+
+        read_calls = 0
+
+        async def read_side_effect(**_kwargs: object) -> list[object]:
+            nonlocal read_calls
+            read_calls += 1
+            if read_calls == 1:
+                return [("stream", messages)]
+            await processed.wait()
+            consumer._is_running = False
+            return []
+
+        mock_redis = AsyncMock()
+        mock_redis.xreadgroup = AsyncMock(side_effect=read_side_effect)
+
+        with patch(
+            "port_ocean.consumers.redis_stream_consumer.ocean", mock_ocean_config
+        ):
+            consumer = RedisStreamConsumer(
+                redis_settings=settings,
+                stream_key="stream",
+                on_message=on_message,
+                registered_paths={"/webhook"},
+            )
+            consumer._redis = mock_redis
+            consumer._ack = AsyncMock()  # type: ignore[method-assign]
+            consumer._is_running = True
+
+            # Messages without an eventId make _handle_message raise.
+            await asyncio.wait_for(consumer._read_loop(), timeout=5)
+            worker_tasks = list(consumer._worker_tasks)
+            assert not any(task.done() for task in worker_tasks)
+            await consumer._stop_message_workers()
+
+        assert processed.is_set()
+        # The failed messages stay pending for the maintenance worker.
+        assert consumer._ack.await_count == 1
@@ -8,11 +8,14 @@ from redis.exceptions import TimeoutError as RedisTimeoutError
 
 from port_ocean.consumers.redis_stream_utils import (
     ACK_AND_FINALIZE_STREAM_ENTRY_SCRIPT,
+    REQUEUE_STREAM_ENTRIES_SCRIPT,
+    ack_and_finalize_stream_entries,
     ack_and_finalize_stream_entry,
     cleanup_idle_consumers_from_group,
     ensure_consumer_group,
     is_missing_stream_or_group_error,
     is_redis_connection_error,
+    requeue_stream_entries,
 )
 
 
@@ -80,6 +83,87 @@ class TestAckAndFinalizeStreamEntry:
         redis.eval.assert_awaited_once()
 
 
+class TestAckAndFinalizeStreamEntries:
+    @pytest.mark.asyncio
+    async def test_acks_and_deletes_all_entries_in_one_call(self) -> None:
+        redis = _make_redis_for_ack_finalize()
+
+        await ack_and_finalize_stream_entries(
+            redis,
+            stream_key="stream",
+            consumer_group="test.integration",
+            message_ids=["1-0", "2-0"],
+        )
+
+        redis.eval.assert_awaited_once_with(
+            ACK_AND_FINALIZE_STREAM_ENTRY_SCRIPT,
+            1,
+            "stream",
+            "test.integration",
+            "1-0",
+            "2-0",
+        )
+
+    @pytest.mark.asyncio
+    async def test_skips_call_when_no_entries(self) -> None:
+        redis = _make_redis_for_ack_finalize()
+
+        await ack_and_finalize_stream_entries(
+            redis,
+            stream_key="stream",
+            consumer_group="test.integration",
+            message_ids=[],
+        )
+
+        redis.eval.assert_not_awaited()
+
+
+class TestRequeueStreamEntries:
+    @pytest.mark.asyncio
+    async def test_encodes_entries_with_field_counts(self) -> None:
+        redis = _make_redis_for_ack_finalize()
+
+        await requeue_stream_entries(
+            redis,
+            stream_key="stream",
+            consumer_group="test.integration",
+            entries=[
+                ("1-0", {"webhookPath": "/w", "requeue_count": "1"}),
+                ("2-0", {"requeue_count": "2"}),
+            ],
+        )
+
+        redis.eval.assert_awaited_once_with(
+            REQUEUE_STREAM_ENTRIES_SCRIPT,
+            1,
+            "stream",
+            "test.integration",
+            "1-0",
+            "4",
+            "webhookPath",
+            "/w",
+            "requeue_count",
+            "1",
+            "2-0",
+            "2",
+            "requeue_count",
+            "2",
+        )
+
+    @pytest.mark.asyncio
+    async def test_skips_call_when_no_entries(self) -> None:
+        redis = _make_redis_for_ack_finalize()
+
+        await requeue_stream_entries(
+            redis,
+            stream_key="stream",
+            consumer_group="test.integration",
+            entries=[],
+        )
+
+        redis.eval.assert_not_awaited()
+
+
 class TestEnsureConsumerGroup:
     @pytest.mark.asyncio
     async def test_sets_ttl_when_stream_is_created(self) -> None:
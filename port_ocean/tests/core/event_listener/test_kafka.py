@@ -148,3 +148,47 @@ def test_should_not_process_integration_resync_requests_topic_for_other_integrat
         )
         is False
     )
+
+
+def _raw_message(value: bytes | None) -> MagicMock:
+    raw_msg = MagicMock()
+    raw_msg.value.return_value = value
+    return raw_msg
+
+
+def test_prefilter_skips_messages_without_integration_identifier() -> None:
+    listener = _build_listener()
+
+    assert (
+        listener._may_be_relevant(
+            _raw_message(b'{"diff": {"after": {"identifier": "integration-12"}}}')
+        )
+        is False
+    )
+    assert listener._may_be_relevant(_raw_message(None)) is False
+
+
+def test_prefilter_keeps_messages_with_integration_identifier() -> None:
+    listener = _build_listener()
+
+    assert (
+        listener._may_be_relevant(
+            _raw_message(b'{"context": {"integrationId":"integration-1"}}')
+        )
+        is True
+    )
+
+
+def test_prefilter_is_disabled_for_identifiers_json_may_escape() -> None:
+    async def on_resync(_: dict[object, object]) -> bool:
+        return True
+
+    listener = KafkaEventListener(
+        events={"on_resync": on_resync},
+        event_listener_config=KafkaEventListenerSettings(type=EventListenerType.KAFKA),
+        org_id="org-1",
+        integration_identifier="my/integration",
+        integration_type="test-type",
+    )
+
+    assert listener._may_be_relevant(_raw_message(b"{}")) is True
@@ -0,0 +1,71 @@
+import asyncio
+from dataclasses import dataclass
+
+import pytest
+
+from port_ocean.core.handlers.queue.group_queue import GroupQueue
+
+
+@dataclass
+class BenchmarkItem:
+    group_id: str
+    value: int
+
+
+async def _drain(queue: GroupQueue[BenchmarkItem], num_workers: int) -> int:
+    processed = 0
+
+    async def worker() -> None:
+        nonlocal processed
+        while await queue.size() > 0:
+            try:
+                await asyncio.wait_for(queue.get(), timeout=0.5)
+            except asyncio.TimeoutError:
+                return
+            processed += 1
+            await queue.commit()
+
+    await asyncio.gather(*(worker() for _ in range(num_workers)))
+    return processed
+
+
+@pytest.mark.timeout(60)
+async def test_group_queue_throughput_100k_groups() -> None:
+    """
+    This test is to check that scheduling stays O(1) per item with 100k active groups:
+    a scan of every group per get would not drain them within the timeout.
+    """
+    num_groups = 100_000
+    num_workers = 16
+    queue: GroupQueue[BenchmarkItem] = GroupQueue(group_key="group_id")
+
+    for i in range(num_groups):
+        await queue.put(BenchmarkItem(group_id=f"group_{i}", value=i))
+
+    processed = await _drain(queue, num_workers)
+    await queue.teardown()
+
+    assert processed == num_groups
+    assert not queue._locked
+
+
+@pytest.mark.timeout(60)
+async def test_group_queue_throughput_hot_groups() -> None:
+    """
+    This test is to check throughput when many items share a few groups and
+    workers must keep handing groups back to the ready deque.
+    """
+    num_groups = 100
+    items_per_group = 200
+    num_workers = 16
+    queue: GroupQueue[BenchmarkItem] = GroupQueue(group_key="group_id")
+
+    for i in range(items_per_group):
+        for g in range(num_groups):
+            await queue.put(BenchmarkItem(group_id=f"group_{g}", value=i))
+
+    processed = await _drain(queue, num_workers)
+    await queue.teardown()
+
+    assert processed == num_groups * items_per_group
+    assert not queue._locked
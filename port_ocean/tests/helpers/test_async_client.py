@@ -5,6 +5,11 @@ import pytest
 
 from port_ocean.helpers.async_client import OceanAsyncClient
 from port_ocean.helpers.ip_blocker import IPBlockerTransport
+from port_ocean.helpers.rate_limit import (
+    FixedWindowStrategy,
+    RateLimiter,
+    RateLimitTransport,
+)
 from port_ocean.helpers.retry import RetryTransport
 
 
@@ -29,3 +34,18 @@ def test_init_transport_wraps_with_ip_blocker_based_on_config(
         transport = client._transport
 
     assert isinstance(transport, expected_outer_transport)
+
+
+def test_init_transport_wraps_connection_transport_with_rate_limiter() -> None:
+    mock_config = MagicMock()
+    mock_config.disable_ip_outbound_blocker = True
+    mock_config.ssl.third_party = MagicMock(verify=True)
+    limiter = RateLimiter(lambda: FixedWindowStrategy(10, 1))
+
+    with patch("port_ocean.helpers.async_client.ocean") as mock_ocean:
+        mock_ocean.config = mock_config
+        client = OceanAsyncClient(rate_limiter=limiter)
+        transport = client._transport
+
+    assert isinstance(transport, RetryTransport)
+    assert isinstance(transport._wrapped_transport, RateLimitTransport)
@@ -0,0 +1,75 @@
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from port_ocean.helpers.connection_pool_metrics import ConnectionPoolMetricsTransport
+
+
+class _TracingTransport(httpx.AsyncBaseTransport):
+    """Emits the httpcore trace events of a new or a reused connection."""
+
+    def __init__(self, events: list[str]) -> None:
+        self.events = events
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        trace = request.extensions["trace"]
+        for event_name in self.events:
+            await trace(event_name, {})
+        return httpx.Response(200)
+
+
+NEW_CONNECTION_EVENTS = [
+    "connection.connect_tcp.started",
+    "connection.connect_tcp.complete",
+    "connection.start_tls.started",
+    "connection.start_tls.complete",
+    "http11.send_request_headers.started",
+]
+REUSED_CONNECTION_EVENTS = ["http2.send_request_headers.started"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("events", "connection"),
+    [(NEW_CONNECTION_EVENTS, "new"), (REUSED_CONNECTION_EVENTS, "reused")],
+)
+async def test_reports_pool_wait_and_connection_reuse(
+    events: list[str], connection: str
+) -> None:
+    transport = ConnectionPoolMetricsTransport(_TracingTransport(events), "port")
+
+    with patch("port_ocean.helpers.connection_pool_metrics.ocean") as mock_ocean:
+        mock_ocean.initialized = True
+        await transport.handle_async_request(
+            httpx.Request("GET", "https://api.getport.io")
+        )
+
+    wait_call, requests_call = mock_ocean.metrics.inc_metric.call_args_list
+    assert wait_call.args[:2] == ("http_pool_wait_seconds", ["port"])
+    assert wait_call.args[2] >= 0
+    assert requests_call.args == ("http_pool_requests", ["port", connection], 1)
+
+
+@pytest.mark.asyncio
+async def test_keeps_existing_trace_extension() -> None:
+    seen: list[str] = []
+
+    async def existing_trace(event_name: str, info: dict[str, Any]) -> None:
+        seen.append(event_name)
+
+    transport = ConnectionPoolMetricsTransport(
+        _TracingTransport(REUSED_CONNECTION_EVENTS), "port"
+    )
+    request = httpx.Request(
+        "GET", "https://api.getport.io", extensions={"trace": existing_trace}
+    )
+
+    with patch("port_ocean.helpers.connection_pool_metrics.ocean") as mock_ocean:
+        mock_ocean.initialized = False
+        await transport.handle_async_request(request)
+
+    assert seen == REUSED_CONNECTION_EVENTS
+    assert request.extensions["trace"] is existing_trace
+    mock_ocean.metrics.inc_metric.assert_not_called()
@@ -0,0 +1,79 @@
+"""Tests for the event loop watchdog."""
+
+import asyncio
+import json
+import sys
+import time
+from types import FrameType
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from port_ocean.helpers.monitor.watchdog import EventLoopWatchdog, blocking_location
+
+
+def _block_event_loop(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+def test_blocking_location_skips_library_frames() -> None:
+    captured: list[FrameType] = []
+
+    def capture_frame(value: Any) -> str:
+        frame = sys._getframe().f_back
+        assert frame is not None
+        captured.append(frame)
+        return "captured"
+
+    json.dumps({"value": object()}, default=capture_frame)
+
+    # The innermost frame is the json encoder; the stall belongs to this test.
+    assert captured[0].f_code.co_filename.endswith("json/encoder.py")
+    location = blocking_location(captured[0])
+    assert location.startswith("test_blocking_location_skips_library_frames (")
+    assert "test_event_loop_watchdog.py:" in location
+
+
+@pytest.mark.asyncio
+async def test_reports_stalls_by_blocking_location() -> None:
+    watchdog = EventLoopWatchdog(threshold_ms=50, report_interval_seconds=3600)
+
+    with patch(
+        "port_ocean.helpers.monitor.watchdog.ocean", new_callable=MagicMock
+    ) as mock_ocean:
+        mock_ocean.initialized = True
+        watchdog.start()
+        try:
+            await asyncio.sleep(0.1)
+            _block_event_loop(0.3)
+            await asyncio.sleep(0.1)
+            _block_event_loop(0.2)
+            await asyncio.sleep(0.1)
+        finally:
+            watchdog.stop()
+
+    (offender,) = watchdog.offenders()
+    assert offender.location.startswith("_block_event_loop (")
+    assert offender.stalls == 2
+    assert 0.4 <= offender.total_seconds < 1
+    assert "_block_event_loop" in offender.stack
+
+    calls = mock_ocean.metrics.observe_metric.call_args_list
+    assert [call.args[:2] for call in calls] == [
+        ("event_loop_stall_seconds", [offender.location])
+    ] * 2
+
+
+@pytest.mark.asyncio
+async def test_ignores_a_loop_that_keeps_ticking() -> None:
+    watchdog = EventLoopWatchdog(threshold_ms=100)
+    watchdog.start()
+    try:
+        for _ in range(10):
+            _block_event_loop(0.01)
+            await asyncio.sleep(0.01)
+    finally:
+        watchdog.stop()
+
+    assert watchdog.offenders() == []
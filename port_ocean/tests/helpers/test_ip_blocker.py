@@ -1,14 +1,22 @@
 """Tests for IP blocker: SSRF protection, DNS rebinding prevention, port.io bypass."""
 
+import asyncio
+import socket
+import traceback
+
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpcore
 import httpx
 
 from port_ocean.exceptions.clients import BlockedIPError
 from port_ocean.helpers.ip_blocker import (
     IPBlockerTransport,
+    _AllowedIPNetworkBackend,
+    _DNSCache,
     _is_blocked,
+    pin_to_allowed_ip_addresses,
 )
 
 
@@ -58,45 +66,33 @@ class TestIPBlockerTransport:
         )
         sent: httpx.Request = wrapped.handle_async_request.call_args[0][0]
         assert sent.url.host == "api.github.com"
-        """URL is rewritten to validated IP (rebinding mitigation); Host + sni_hostname keep TLS working."""
-        with patch(
-            "port_ocean.helpers.ip_blocker._resolve_to_ip_addresses",
-            return_value=["93.184.216.34"],
-        ):
-            wrapped = AsyncMock(spec=httpx.AsyncBaseTransport)
-            wrapped.handle_async_request.return_value = httpx.Response(
-                200, request=httpx.Request("GET", "https://example.com/")
-            )
-            transport = IPBlockerTransport(wrapped=wrapped)
 
-            await transport.handle_async_request(
-                httpx.Request("GET", "https://example.com/foo?q=1")
-            )
+    @pytest.mark.asyncio
+    async def test_request_is_passed_through_unchanged(self) -> None:
+        """The checked request keeps its URL and Host, non-default port included."""
 
-            sent = wrapped.handle_async_request.call_args[0][0]
-            assert sent.url.host == "93.184.216.34"
-            assert sent.headers.get("host") == "example.com"
-            assert sent.extensions.get("sni_hostname") == "example.com"
-            assert str(sent.url) == "https://93.184.216.34/foo?q=1"
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/old":
+                return httpx.Response(302, headers={"location": "/new"})
+            return httpx.Response(200)
 
-    @pytest.mark.asyncio
-    async def test_https_sni_hostname_extension_set(self) -> None:
-        """sni_hostname extension is set so TLS verifies cert against original hostname."""
         with patch(
             "port_ocean.helpers.ip_blocker._resolve_to_ip_addresses",
             return_value=["93.184.216.34"],
         ):
-            wrapped = AsyncMock(spec=httpx.AsyncBaseTransport)
-            wrapped.handle_async_request.return_value = httpx.Response(
-                200, request=httpx.Request("GET", "https://example.com/")
-            )
+            wrapped = httpx.MockTransport(handler)
             transport = IPBlockerTransport(wrapped=wrapped)
-            await transport.handle_async_request(
-                httpx.Request("GET", "https://example.com/")
-            )
-            sent: httpx.Request = wrapped.handle_async_request.call_args[0][0]
-            assert sent.url.host == "93.184.216.34"
-            assert sent.extensions.get("sni_hostname") == "example.com"
+            async with httpx.AsyncClient(
+                transport=transport, follow_redirects=True
+            ) as client:
+                response = await client.get("https://example.com:8443/old?q=1")
+
+        assert str(response.url) == "https://example.com:8443/new"
+        assert response.request.headers["host"] == "example.com:8443"
+        assert [str(r.url) for r in response.history] == [
+            "https://example.com:8443/old?q=1"
+        ]
+        assert "sni_hostname" not in response.request.extensions
 
     @pytest.mark.asyncio
     async def test_ip_literal_passed_through(self) -> None:
@@ -140,3 +136,216 @@ class TestIPBlockerTransport:
                 )
             assert "could not resolve" in str(exc_info.value).lower()
             wrapped.handle_async_request.assert_not_awaited()
+
+
+class TestAllowedIPNetworkBackend:
+    @pytest.mark.asyncio
+    async def test_connects_to_the_next_allowed_address_on_failure(self) -> None:
+        stream = MagicMock(spec=httpcore.AsyncNetworkStream)
+        wrapped = AsyncMock(spec=httpcore.AsyncNetworkBackend)
+        wrapped.connect_tcp.side_effect = [httpcore.ConnectError("refused"), stream]
+        backend = _AllowedIPNetworkBackend(wrapped)
+        with patch(
+            "port_ocean.helpers.ip_blocker._resolve_to_ip_addresses",
+            return_value=["93.184.216.34", "93.184.216.35"],
+        ):
+            assert await backend.connect_tcp("example.com", 443) is stream
+
+        assert [call.args[:2] for call in wrapped.connect_tcp.await_args_list] == [
+            ("93.184.216.34", 443),
+            ("93.184.216.35", 443),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_raises_when_every_address_fails(self) -> None:
+        wrapped = AsyncMock(spec=httpcore.AsyncNetworkBackend)
+        wrapped.connect_tcp.side_effect = httpcore.ConnectError("refused")
+        backend = _AllowedIPNetworkBackend(wrapped)
+        with patch(
+            "port_ocean.helpers.ip_blocker._resolve_to_ip_addresses",
+            return_value=["93.184.216.34", "93.184.216.35"],
+        ):
+            with pytest.raises(httpcore.ConnectError):
+                await backend.connect_tcp("example.com", 443)
+
+        assert wrapped.connect_tcp.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_never_connects_to_a_blocked_address(self) -> None:
+        wrapped = AsyncMock(spec=httpcore.AsyncNetworkBackend)
+        backend = _AllowedIPNetworkBackend(wrapped)
+        with patch(
+            "port_ocean.helpers.ip_blocker._resolve_to_ip_addresses",
+            return_value=["169.254.169.254"],
+        ):
+            with pytest.raises(BlockedIPError):
+                await backend.connect_tcp("rebound.example.com", 80)
+
+        wrapped.connect_tcp.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_trusted_hosts_connect_by_name(self) -> None:
+        wrapped = AsyncMock(spec=httpcore.AsyncNetworkBackend)
+        backend = _AllowedIPNetworkBackend(wrapped)
+        await backend.connect_tcp("api.github.com", 443)
+        assert wrapped.connect_tcp.await_args.args[:2] == ("api.github.com", 443)
+
+    @pytest.mark.asyncio
+    async def test_pinned_transport_keeps_the_hostname_on_the_wire(self) -> None:
+        received: list[bytes] = []
+
+        async def serve(
+            reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+        ) -> None:
+            received.append(await reader.readuntil(b"\r\n\r\n"))
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+            await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_server(serve, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        transport = httpx.AsyncHTTPTransport()
+        pin_to_allowed_ip_addresses(transport)
+        # Nothing listens on 127.0.0.2, so the first address is refused.
+        with (
+            patch(
+                "port_ocean.helpers.ip_blocker._resolve_to_ip_addresses",
+                return_value=["127.0.0.2", "127.0.0.1"],
+            ),
+            patch("port_ocean.helpers.ip_blocker._is_blocked", return_value=False),
+        ):
+            async with server, httpx.AsyncClient(transport=transport) as client:
+                response = await client.get(f"http://service.test:{port}/items")
+
+        assert response.text == "ok"
+        assert str(response.request.url) == f"http://service.test:{port}/items"
+        assert f"host: service.test:{port}".encode() in received[0].lower()
+
+
+class TestDNSCache:
+    @pytest.mark.asyncio
+    async def test_caches_resolved_hosts(self) -> None:
+        cache = _DNSCache(ttl=60, negative_ttl=5, max_size=10)
+        with patch(
+            "port_ocean.helpers.ip_blocker._getaddrinfo",
+            AsyncMock(return_value=["93.184.216.34"]),
+        ) as lookup:
+            assert await cache.resolve("example.com") == ["93.184.216.34"]
+            assert await cache.resolve("example.com") == ["93.184.216.34"]
+
+        lookup.assert_awaited_once_with("example.com")
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_resolved_again(self) -> None:
+        cache = _DNSCache(ttl=0, negative_ttl=0, max_size=10)
+        with patch(
+            "port_ocean.helpers.ip_blocker._getaddrinfo",
+            AsyncMock(return_value=["93.184.216.34"]),
+        ) as lookup:
+            await cache.resolve("example.com")
+            await cache.resolve("example.com")
+
+        assert lookup.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_resolution(self) -> None:
+        cache = _DNSCache(ttl=60, negative_ttl=5, max_size=10)
+
+        async def slow_lookup(hostname: str) -> list[str]:
+            await asyncio.sleep(0.01)
+            return ["93.184.216.34"]
+
+        with patch(
+            "port_ocean.helpers.ip_blocker._getaddrinfo",
+            AsyncMock(side_effect=slow_lookup),
+        ) as lookup:
+            results = await asyncio.gather(
+                *(cache.resolve("example.com") for _ in range(20))
+            )
+
+        assert results == [["93.184.216.34"]] * 20
+        lookup.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_lookups_are_cached_negatively(self) -> None:
+        cache = _DNSCache(ttl=60, negative_ttl=5, max_size=10)
+        with patch(
+            "port_ocean.helpers.ip_blocker._getaddrinfo",
+            AsyncMock(side_effect=socket.gaierror("Name or service not known")),
+        ) as lookup:
+            for _ in range(3):
+                with pytest.raises(socket.gaierror):
+                    await cache.resolve("nonexistent.invalid")
+
+        lookup.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cached_failures_are_raised_without_growing_tracebacks(
+        self,
+    ) -> None:
+        cache = _DNSCache(ttl=60, negative_ttl=5, max_size=10)
+        with patch(
+            "port_ocean.helpers.ip_blocker._getaddrinfo",
+            AsyncMock(side_effect=socket.gaierror(-2, "Name or service not known")),
+        ):
+            errors = []
+            for _ in range(3):
+                with pytest.raises(socket.gaierror) as exc_info:
+                    await cache.resolve("nonexistent.invalid")
+                errors.append(exc_info.value)
+
+        assert errors[1] is not errors[2]
+        assert errors[2].errno == -2
+        assert errors[2].strerror == "Name or service not known"
+        depth = [len(traceback.extract_tb(error.__traceback__)) for error in errors]
+        assert depth[1] == depth[2]
+
+    @pytest.mark.asyncio
+    async def test_followers_resolve_again_when_the_lookup_task_is_cancelled(
+        self,
+    ) -> None:
+        cache = _DNSCache(ttl=60, negative_ttl=5, max_size=10)
+        first_lookup_started = asyncio.Event()
+
+        async def lookup(hostname: str) -> list[str]:
+            if not first_lookup_started.is_set():
+                first_lookup_started.set()
+                await asyncio.sleep(10)
+            return ["93.184.216.34"]
+
+        with patch(
+            "port_ocean.helpers.ip_blocker._getaddrinfo",
+            AsyncMock(side_effect=lookup),
+        ):
+            leader = asyncio.create_task(cache.resolve("example.com"))
+            await first_lookup_started.wait()
+            followers = [
+                asyncio.create_task(cache.resolve("example.com")) for _ in range(3)
+            ]
+            await asyncio.sleep(0)
+            leader.cancel()
+
+            assert await asyncio.gather(*followers) == [["93.184.216.34"]] * 3
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_host(self) -> None:
+        cache = _DNSCache(ttl=60, negative_ttl=5, max_size=2)
+        with patch(
+            "port_ocean.helpers.ip_blocker._getaddrinfo",
+            AsyncMock(return_value=["93.184.216.34"]),
+        ) as lookup:
+            await cache.resolve("a.example.com")
+            await cache.resolve("b.example.com")
+            await cache.resolve("a.example.com")
+            await cache.resolve("c.example.com")
+            await cache.resolve("a.example.com")
+            await cache.resolve("b.example.com")
+
+        assert [call.args[0] for call in lookup.await_args_list] == [
+            "a.example.com",
+            "b.example.com",
+            "c.example.com",
+            "b.example.com",
+        ]
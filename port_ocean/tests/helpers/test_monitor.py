@@ -159,10 +159,10 @@ class TestPerformanceMonitor:
         assert monitor._current_tracking_kind == "test-kind-0"
         tracking = monitor._kind_tracking["test-kind-0"]
         assert "start_time" in tracking
-        assert tracking["cpu_samples"] == []
-        assert tracking["memory_samples"] == []
-        assert tracking["latency_samples"] == []
-        assert tracking["response_sizes"] == []
+        assert len(tracking["cpu_samples"]) == 0
+        assert len(tracking["memory_samples"]) == 0
+        assert len(tracking["latency_samples"]) == 0
+        assert len(tracking["response_sizes"]) == 0
 
     def test_stop_kind_tracking(self, monitor: PerformanceMonitor) -> None:
         """Test stopping kind tracking."""
@@ -190,7 +190,7 @@ class TestPerformanceMonitor:
         monitor.record_response_size(2048)
 
         tracking = monitor._kind_tracking["test-kind-0"]
-        assert tracking["response_sizes"] == [1024, 2048]
+        assert list(tracking["response_sizes"]) == [1024, 2048]
 
     def test_record_response_size_no_active_kind(
         self, monitor: PerformanceMonitor
@@ -226,10 +226,10 @@ class TestPerformanceMonitor:
 
         # Manually add samples
         tracking = monitor._kind_tracking["test-kind-0"]
-        tracking["cpu_samples"] = [10.0, 20.0, 30.0, 40.0, 50.0]
-        tracking["memory_samples"] = [100, 200, 300, 400, 500]
-        tracking["latency_samples"] = [1.0, 2.0, 3.0, 4.0, 5.0]
-        tracking["response_sizes"] = [1000, 2000, 3000]
+        tracking["cpu_samples"].extend([10.0, 20.0, 30.0, 40.0, 50.0])
+        tracking["memory_samples"].extend([100, 200, 300, 400, 500])
+        tracking["latency_samples"].extend([1.0, 2.0, 3.0, 4.0, 5.0])
+        tracking["response_sizes"].extend([1000, 2000, 3000])
 
         stats = monitor.get_kind_stats("test-kind-0")
 
@@ -0,0 +1,137 @@
+"""Tests for the performance monitor's process sampler and sample buffers."""
+
+import multiprocessing
+import random
+import statistics
+import time
+from unittest.mock import patch
+
+import pytest
+
+from port_ocean.helpers.monitor.sampling import (
+    _CLOCK_TICKS,
+    _PAGE_SIZE,
+    P2Quantile,
+    ProcessTreeSampler,
+    SampleBuffer,
+)
+
+
+class TestSampleBuffer:
+    def test_statistics_cover_samples_past_capacity(self) -> None:
+        buffer = SampleBuffer(capacity=4)
+        buffer.extend([5.0, 1.0, 9.0, 3.0, 7.0, 2.0])
+
+        assert len(buffer) == 6
+        assert buffer.max == 9.0
+        assert buffer.total == 27.0
+        assert buffer.mean == 4.5
+        assert list(buffer) == [9.0, 3.0, 7.0, 2.0]
+
+    def test_empty_buffer(self) -> None:
+        buffer = SampleBuffer()
+
+        assert len(buffer) == 0
+        assert list(buffer) == []
+        assert buffer.mean == 0.0
+        assert buffer.median == 0.0
+
+    @pytest.mark.parametrize(
+        "values", [[4.0], [4.0, 1.0], [4.0, 1.0, 3.0, 2.0], [5.0, 3.0, 1.0, 4.0, 2.0]]
+    )
+    def test_median_is_exact_for_few_samples(self, values: list[float]) -> None:
+        buffer = SampleBuffer()
+        buffer.extend(values)
+
+        assert buffer.median == statistics.median(values)
+
+
+class TestP2Quantile:
+    @pytest.mark.parametrize("quantile", [0.5, 0.9, 0.99])
+    def test_estimate_is_close_to_exact_quantile(self, quantile: float) -> None:
+        rng = random.Random(42)
+        values = [rng.lognormvariate(0, 1) for _ in range(20_000)]
+        estimate = P2Quantile(quantile)
+        for value in values:
+            estimate.add(value)
+
+        exact = sorted(values)[int(quantile * (len(values) - 1))]
+        assert estimate.value == pytest.approx(exact, rel=0.05)
+
+
+class TestProcessTreeSampler:
+    def test_totals_include_child_processes(self) -> None:
+        sampler = ProcessTreeSampler()
+        _, rss_alone = sampler.sample()
+
+        context = multiprocessing.get_context("fork")
+        child = context.Process(target=time.sleep, args=(1.0,))
+        child.start()
+        try:
+            time.sleep(0.2)
+            _, rss = sampler.sample()
+            sampled_pids = set(sampler._previous) if sampler.use_proc else None
+        finally:
+            child.join()
+
+        assert rss > rss_alone
+        if sampled_pids is not None:
+            assert child.pid in sampled_pids
+
+    def test_cpu_percent_totals_tick_deltas_of_the_tree(self) -> None:
+        sampler = ProcessTreeSampler()
+        sampler.use_proc = True
+        sampler._lists_children = True
+        parent, child = sampler.pid, 2**22 + 1
+        # pid -> (cpu ticks, start time in ticks, rss pages)
+        stats = {parent: (100, 0, 1000), child: (50, 0, 500)}
+        now = [10.0]
+
+        with (
+            patch.object(
+                ProcessTreeSampler,
+                "_children",
+                lambda self, pid: [child] if pid == parent else [],
+            ),
+            patch(
+                "port_ocean.helpers.monitor.sampling._read_stat",
+                lambda pid: stats.get(pid),
+            ),
+            patch(
+                "port_ocean.helpers.monitor.sampling._uptime_seconds",
+                lambda: 1000.0,
+            ),
+            patch(
+                "port_ocean.helpers.monitor.sampling.time.monotonic",
+                lambda: now[0],
+            ),
+        ):
+            sampler.sample()
+            now[0] += 2.0
+            # Half a CPU in the parent and a full CPU in the child.
+            stats[parent] = (100 + _CLOCK_TICKS, 0, 1000)
+            stats[child] = (50 + 2 * _CLOCK_TICKS, 0, 500)
+            cpu_percent, rss = sampler.sample()
+
+        assert cpu_percent == pytest.approx(150)
+        assert rss == 1500 * _PAGE_SIZE
+
+    def test_psutil_fallback(self) -> None:
+        sampler = ProcessTreeSampler()
+        sampler.use_proc = False
+
+        sampler.sample()
+        cpu_percent, rss = sampler.sample()
+
+        assert cpu_percent >= 0
+        assert rss > 0
+
+    @pytest.mark.parametrize("use_proc", [True, False])
+    def test_rss_leaves_the_cpu_baseline_alone(self, use_proc: bool) -> None:
+        sampler = ProcessTreeSampler()
+        sampler.use_proc = sampler.use_proc and use_proc
+        sampler.sample()
+        baseline = dict(sampler._previous), dict(sampler._psutil_children)
+
+        assert sampler.rss() > 0
+        assert (sampler._previous, sampler._psutil_children) == baseline
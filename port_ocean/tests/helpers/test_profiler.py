@@ -0,0 +1,141 @@
+"""Tests for the sampling profiler."""
+
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from port_ocean.config.settings import ProfilerSettings
+from port_ocean.helpers.monitor import profiler
+from port_ocean.helpers.monitor.profiler import (
+    MAIN_PROCESS_ROOT,
+    WORKER_PROCESS_ROOT,
+    ProfilerBusyError,
+    capture_profile,
+    create_profiler_router,
+)
+
+
+def _busy_in_worker(seconds: float) -> None:
+    ends_at = time.monotonic() + seconds
+    while time.monotonic() < ends_at:
+        pass
+
+
+def _block_event_loop(seconds: float) -> None:
+    ends_at = time.monotonic() + seconds
+    while time.monotonic() < ends_at:
+        pass
+
+
+def _stacks(collapsed: str) -> dict[str, int]:
+    return {
+        stack: int(count)
+        for stack, _, count in (line.rpartition(" ") for line in collapsed.splitlines())
+    }
+
+
+@pytest.mark.asyncio
+async def test_samples_blocked_event_loop_and_executor_threads() -> None:
+    loop = asyncio.get_running_loop()
+
+    async def block_soon() -> None:
+        await asyncio.sleep(0.05)
+        _block_event_loop(0.2)
+
+    profile, _, _ = await asyncio.gather(
+        capture_profile(0.4, interval=0.005),
+        block_soon(),
+        loop.run_in_executor(None, _busy_in_worker, 0.3),
+    )
+
+    stacks = _stacks(profile)
+    assert all(stack.startswith(f"{MAIN_PROCESS_ROOT};") for stack in stacks)
+    assert any(
+        "_block_event_loop" in stack and ";MainThread;" in stack for stack in stacks
+    )
+    assert any(
+        "_busy_in_worker" in stack and ";MainThread;" not in stack for stack in stacks
+    )
+    # Waiting threads are left out unless asked for.
+    assert not any(stack.endswith("select (selectors.py)") for stack in stacks)
+
+
+@pytest.mark.asyncio
+async def test_samples_forked_worker_processes() -> None:
+    loop = asyncio.get_running_loop()
+
+    async def run_in_forked_worker() -> None:
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("fork")
+        ) as pool:
+            await loop.run_in_executor(pool, _busy_in_worker, 0.3)
+
+    profile, _ = await asyncio.gather(
+        capture_profile(1, interval=0.005), run_in_forked_worker()
+    )
+
+    assert any(
+        stack.startswith(f"{WORKER_PROCESS_ROOT};") and "_busy_in_worker" in stack
+        for stack in _stacks(profile)
+    )
+
+
+@pytest.mark.asyncio
+async def test_one_profile_at_a_time() -> None:
+    running = asyncio.create_task(capture_profile(0.1))
+    await asyncio.sleep(0)
+    with pytest.raises(ProfilerBusyError):
+        await capture_profile(0.1)
+    await running
+    assert not profiler.is_profiling()
+
+
+def test_profile_endpoint() -> None:
+    app = FastAPI()
+    app.include_router(
+        create_profiler_router(ProfilerSettings(enabled=True, max_seconds=1)),
+        prefix="/debug/profile",
+    )
+    client = TestClient(app)
+
+    response = client.get("/debug/profile", params={"seconds": 0.05, "idle": True})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/plain; charset=utf-8"
+    assert response.text.startswith(f"{MAIN_PROCESS_ROOT};")
+
+    assert client.get("/debug/profile", params={"seconds": 5}).status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_latency_capture_writes_profile(tmp_path: Path) -> None:
+    profiler.configure_latency_capture(
+        ProfilerSettings(
+            latency_threshold_ms=100,
+            latency_capture_seconds=0.05,
+            latency_capture_cooldown_seconds=60,
+            output_dir=str(tmp_path),
+        )
+    )
+    try:
+        capture = profiler._latency_capture
+        assert capture is not None
+        profiler.capture_on_latency(50)
+        assert capture.task is None
+
+        profiler.capture_on_latency(150)
+        first_task = capture.task
+        assert first_task is not None
+        path = await first_task
+        profiler.capture_on_latency(150)  # cooling down
+    finally:
+        profiler.configure_latency_capture(ProfilerSettings())
+
+    assert capture.task is first_task
+    assert path is not None and path.parent == tmp_path
+    assert path.exists()
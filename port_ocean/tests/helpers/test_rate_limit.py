@@ -0,0 +1,476 @@
+import asyncio
+import time
+from http import HTTPStatus
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from port_ocean.config.settings import SharedRateLimitSettings
+from port_ocean.helpers.rate_limit import (
+    AdaptiveHeaderStrategy,
+    CircuitBreaker,
+    CircuitState,
+    FixedWindowStrategy,
+    HostRateLimitConfig,
+    HostRateLimiter,
+    RateLimiter,
+    RateLimitTransport,
+    SlidingWindowStrategy,
+    TokenBucket,
+    get_host_rate_limiter,
+    parse_rate_limit_reset,
+)
+from port_ocean.helpers.retry import RetryConfig, RetryTransport
+
+
+def _parse_seconds(value: str) -> float | None:
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _limiter(**config: object) -> HostRateLimiter:
+    return HostRateLimiter(
+        "api.example.com",
+        HostRateLimitConfig(jitter_ratio=0.0, **config),  # type: ignore[arg-type]
+        _parse_seconds,
+    )
+
+
+class TestTokenBucket:
+    def test_unlimited_bucket_never_waits(self) -> None:
+        bucket = TokenBucket()
+        assert all(bucket.reserve() == 0.0 for _ in range(1000))
+
+    def test_reservations_are_spaced_by_rate(self) -> None:
+        bucket = TokenBucket(rate=10, capacity=1)
+
+        waits = [bucket.reserve() for _ in range(4)]
+
+        assert waits[0] == 0.0
+        for previous, current in zip(waits, waits[1:]):
+            assert current - previous == pytest.approx(0.1, abs=0.01)
+
+    def test_drain_holds_refill_until_timestamp(self) -> None:
+        bucket = TokenBucket(rate=10, capacity=5)
+        bucket.drain(0.0, refill_from=time.monotonic() + 1.0)
+
+        assert bucket.reserve() == pytest.approx(1.1, abs=0.02)
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold(self) -> None:
+        circuit = CircuitBreaker(failure_threshold=3, recovery_timeout=10)
+
+        assert circuit.record_failure() is False
+        assert circuit.record_failure() is False
+        assert circuit.record_failure() is True
+        assert circuit.state is CircuitState.OPEN
+
+    def test_success_resets_failure_count(self) -> None:
+        circuit = CircuitBreaker(failure_threshold=2, recovery_timeout=10)
+
+        circuit.record_failure()
+        circuit.record_success()
+        circuit.record_failure()
+
+        assert circuit.state is CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_half_open_lets_a_single_probe_through(self) -> None:
+        circuit = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+        circuit.record_failure()
+        passed: list[int] = []
+
+        async def request(index: int) -> None:
+            await circuit.wait_until_closed()
+            passed.append(index)
+
+        tasks = [asyncio.create_task(request(i)) for i in range(3)]
+        await asyncio.sleep(0.1)
+
+        assert len(passed) == 1
+        assert circuit.state is CircuitState.HALF_OPEN
+
+        circuit.record_success()
+        await asyncio.gather(*tasks)
+
+        assert len(passed) == 3
+        assert circuit.state is CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_failed_probe_reopens_circuit(self) -> None:
+        circuit = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+        circuit.record_failure()
+
+        await circuit.wait_until_closed()
+        assert circuit.state is CircuitState.HALF_OPEN
+
+        assert circuit.record_failure() is True
+        assert circuit.state is CircuitState.OPEN
+
+
+class TestHostRateLimiter:
+    @pytest.mark.asyncio
+    async def test_rate_limited_probe_lets_the_next_caller_probe(self) -> None:
+        limiter = _limiter(failure_threshold=1, recovery_timeout=0.05)
+        limiter.record_error()
+        await limiter.circuit.wait_until_closed()
+        assert limiter.circuit.state is CircuitState.HALF_OPEN
+        waiter = asyncio.create_task(limiter.circuit.wait_until_closed())
+        await asyncio.sleep(0)
+
+        limiter.record_response(httpx.Response(HTTPStatus.TOO_MANY_REQUESTS))
+
+        # Released right away, not after the 50ms recovery timeout.
+        await asyncio.wait_for(waiter, timeout=0.01)
+        assert limiter.circuit.state is CircuitState.HALF_OPEN
+
+    def test_learns_rate_from_headers(self) -> None:
+        limiter = _limiter()
+
+        limiter.record_response(
+            httpx.Response(
+                HTTPStatus.OK,
+                headers={"x-ratelimit-remaining": "20", "x-ratelimit-reset": "10"},
+            )
+        )
+
+        assert limiter.bucket.rate == pytest.approx(2.0)
+
+    def test_exhausted_quota_pauses_until_reset(self) -> None:
+        limiter = _limiter()
+
+        limiter.record_response(
+            httpx.Response(
+                HTTPStatus.OK,
+                headers={"x-ratelimit-remaining": "0", "x-ratelimit-reset": "5"},
+            )
+        )
+
+        assert limiter.paused_until - time.monotonic() == pytest.approx(5, abs=0.1)
+
+    def test_too_many_requests_pauses_and_halves_rate(self) -> None:
+        limiter = _limiter(requests_per_second=8.0)
+
+        limiter.record_response(
+            httpx.Response(HTTPStatus.TOO_MANY_REQUESTS, headers={"Retry-After": "3"})
+        )
+
+        assert limiter.paused_until - time.monotonic() == pytest.approx(3, abs=0.1)
+        assert limiter.bucket.rate == 4.0
+
+    def test_successes_raise_rate_back_to_configured(self) -> None:
+        limiter = _limiter(requests_per_second=1.2)
+        limiter.record_response(httpx.Response(HTTPStatus.TOO_MANY_REQUESTS))
+        assert limiter.bucket.rate == 1.0
+
+        for _ in range(5):
+            limiter.record_response(httpx.Response(HTTPStatus.OK))
+
+        assert limiter.bucket.rate == 1.2
+
+    def test_sustained_server_errors_open_circuit(self) -> None:
+        limiter = _limiter(failure_threshold=2)
+
+        limiter.record_response(httpx.Response(HTTPStatus.BAD_GATEWAY))
+        limiter.record_error()
+
+        assert limiter.circuit.state is CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_limiter_is_shared_per_host(self) -> None:
+        config = HostRateLimitConfig()
+
+        first = get_host_rate_limiter("shared.example.com", config, _parse_seconds)
+        second = get_host_rate_limiter("shared.example.com", config, _parse_seconds)
+        other = get_host_rate_limiter("other.example.com", config, _parse_seconds)
+
+        assert first is second
+        assert first is not other
+
+
+class _SequenceTransport(httpx.AsyncBaseTransport):
+    def __init__(self, responses: list[httpx.Response]) -> None:
+        self.responses = responses
+        self.sent_at: list[float] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.sent_at.append(time.monotonic())
+        if len(self.responses) > 1:
+            return self.responses.pop(0)
+        return self.responses[0]
+
+
+class TestRetryTransportSharedRateLimit:
+    @pytest.mark.asyncio
+    async def test_rate_limited_retries_do_not_stampede(self) -> None:
+        wrapped = _SequenceTransport(
+            [
+                httpx.Response(
+                    HTTPStatus.TOO_MANY_REQUESTS, headers={"Retry-After": "0"}
+                )
+                for _ in range(5)
+            ]
+            + [httpx.Response(HTTPStatus.OK)]
+        )
+        config = RetryConfig(
+            shared_rate_limit=True,
+            base_delay=0.0,
+            jitter_ratio=0.0,
+            rate_limit_requests_per_second=20.0,
+        )
+        transport = RetryTransport(wrapped_transport=wrapped, retry_config=config)
+
+        async def get(index: int) -> int:
+            request = httpx.Request("GET", f"https://stampede.example.com/{index}")
+            response = await transport.handle_async_request(request)
+            return response.status_code
+
+        results = await asyncio.gather(*(get(i) for i in range(5)))
+
+        assert results == [HTTPStatus.OK] * 5
+        # After the 429 the host is throttled to 10 requests/s, so the retries
+        # leave one by one instead of in a single burst.
+        retries = wrapped.sent_at[5:]
+        gaps = [b - a for a, b in zip(retries, retries[1:])]
+        assert gaps and min(gaps) >= 0.08
+
+    @pytest.mark.asyncio
+    async def test_transport_errors_are_recorded(self) -> None:
+        class _FailingTransport(httpx.AsyncBaseTransport):
+            async def handle_async_request(
+                self, request: httpx.Request
+            ) -> httpx.Response:
+                raise httpx.ConnectError("boom", request=request)
+
+        config = RetryConfig(
+            shared_rate_limit=True, max_attempts=0, circuit_breaker_failure_threshold=1
+        )
+        transport = RetryTransport(
+            wrapped_transport=_FailingTransport(), retry_config=config
+        )
+        request = httpx.Request("GET", "https://failing.example.com")
+
+        with pytest.raises(httpx.ConnectError):
+            await transport.handle_async_request(request)
+
+        limiter = transport._get_host_rate_limiter(request)
+        assert limiter.circuit.state is CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self) -> None:
+        transport = RetryTransport(
+            wrapped_transport=_SequenceTransport([httpx.Response(HTTPStatus.OK)]),
+            retry_config=RetryConfig(),
+        )
+
+        with patch(
+            "port_ocean.helpers.retry.get_host_rate_limiter"
+        ) as get_host_rate_limiter_mock:
+            await transport.handle_async_request(
+                httpx.Request("GET", "https://default.example.com")
+            )
+
+        get_host_rate_limiter_mock.assert_not_called()
+
+    def test_enabled_from_settings_without_a_retry_config(self) -> None:
+        mock_ocean = MagicMock()
+        mock_ocean.config.shared_rate_limit = SharedRateLimitSettings(
+            enabled=True, requests_per_second=5, circuit_breaker_failure_threshold=3
+        )
+
+        with (
+            patch("port_ocean.helpers.retry.ocean", mock_ocean),
+            patch("port_ocean.helpers.retry._RETRY_CONFIG_CALLBACK", None),
+        ):
+            configured = RetryTransport(wrapped_transport=_SequenceTransport([]))
+            explicit = RetryTransport(
+                wrapped_transport=_SequenceTransport([]), retry_config=RetryConfig()
+            )
+
+        assert configured._retry_config.shared_rate_limit is True
+        assert configured._retry_config.host_rate_limit_config() == (
+            HostRateLimitConfig(
+                requests_per_second=5,
+                failure_threshold=3,
+                recovery_timeout=30.0,
+                jitter_ratio=0.1,
+            )
+        )
+        assert explicit._retry_config.shared_rate_limit is False
+
+
+class TestFixedWindowStrategy:
+    def test_full_window_rolls_into_the_next(self) -> None:
+        strategy = FixedWindowStrategy(max_requests=2, period=1.0)
+
+        waits = [strategy.reserve() for _ in range(5)]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(1.0, abs=0.01)
+        assert waits[3] == pytest.approx(1.0, abs=0.01)
+        assert waits[4] == pytest.approx(2.0, abs=0.01)
+        assert strategy.available == 0.0
+
+    def test_rejects_invalid_quota(self) -> None:
+        with pytest.raises(ValueError):
+            FixedWindowStrategy(max_requests=0, period=1.0)
+
+
+class TestSlidingWindowStrategy:
+    def test_never_exceeds_quota_in_any_window(self) -> None:
+        strategy = SlidingWindowStrategy(max_requests=3, period=1.0)
+
+        slots = [strategy.reserve() for _ in range(7)]
+
+        for index in range(len(slots) - 3):
+            assert slots[index + 3] - slots[index] >= 1.0 - 1e-3
+        assert strategy.available == 0.0
+
+    def test_available_counts_free_slots(self) -> None:
+        strategy = SlidingWindowStrategy(max_requests=3, period=1.0)
+        strategy.reserve()
+
+        assert strategy.available == 2.0
+
+
+class TestAdaptiveHeaderStrategy:
+    def test_unlimited_until_headers_arrive(self) -> None:
+        strategy = AdaptiveHeaderStrategy()
+
+        assert strategy.rate is None
+        assert strategy.reserve() == 0.0
+
+    def test_spreads_remaining_quota_until_reset(self) -> None:
+        strategy = AdaptiveHeaderStrategy(parse_reset=_parse_seconds)
+
+        strategy.observe(
+            httpx.Response(
+                HTTPStatus.OK,
+                headers={"x-ratelimit-remaining": "50", "x-ratelimit-reset": "10"},
+            )
+        )
+
+        assert strategy.rate == pytest.approx(5.0)
+
+    def test_reserve_ratio_keeps_part_of_the_quota(self) -> None:
+        strategy = AdaptiveHeaderStrategy(reserve_ratio=0.5, parse_reset=_parse_seconds)
+
+        strategy.observe(
+            httpx.Response(
+                HTTPStatus.OK,
+                headers={
+                    "x-ratelimit-limit": "100",
+                    "x-ratelimit-remaining": "40",
+                    "x-ratelimit-reset": "10",
+                },
+            )
+        )
+
+        assert strategy.pause_remaining() == pytest.approx(10, abs=0.1)
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_response_holds_reserved_slots(self) -> None:
+        strategy = AdaptiveHeaderStrategy(initial_rate=1000, parse_reset=_parse_seconds)
+        assert strategy.reserve() == 0.0
+
+        strategy.observe(
+            httpx.Response(
+                HTTPStatus.TOO_MANY_REQUESTS, headers={"Retry-After": "0.05"}
+            )
+        )
+
+        start = time.monotonic()
+        waited = await strategy.acquire()
+        assert waited >= 0.04
+        assert time.monotonic() - start >= 0.04
+
+
+class TestParseRateLimitReset:
+    def test_parses_seconds_and_epoch(self) -> None:
+        from datetime import datetime
+
+        now = datetime.fromtimestamp(1_700_000_000)
+
+        assert parse_rate_limit_reset("30", now) == 30.0
+        assert parse_rate_limit_reset("1700000005", now) == 5.0
+        assert parse_rate_limit_reset("1699999000", now) == 0.0
+        assert parse_rate_limit_reset("soon", now) is None
+
+
+class TestRateLimiter:
+    @pytest.mark.asyncio
+    async def test_keys_get_independent_buckets(self) -> None:
+        limiter = RateLimiter(lambda: FixedWindowStrategy(1, 60))
+
+        async with limiter.limit("a"):
+            pass
+        async with limiter.limit("b"):
+            pass
+
+        assert sorted(limiter.keys()) == ["a", "b"]
+        assert limiter.strategy("a") is not limiter.strategy("b")
+        assert limiter.strategy("a").available == 0.0
+
+    @pytest.mark.asyncio
+    async def test_max_concurrent_caps_requests_in_flight(self) -> None:
+        limiter = RateLimiter(lambda: TokenBucket(), max_concurrent=2)
+        in_flight = 0
+        peak = 0
+
+        async def request() -> None:
+            nonlocal in_flight, peak
+            async with limiter.limit("key"):
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.gather(*(request() for _ in range(10)))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_reports_gauges(self) -> None:
+        limiter = RateLimiter(lambda: SlidingWindowStrategy(5, 60), name="jira")
+
+        with patch("port_ocean.helpers.rate_limit.limiter.ocean") as mock_ocean:
+            mock_ocean.initialized = True
+            async with limiter.limit("project"):
+                pass
+
+        calls = mock_ocean.metrics.set_metric.call_args_list
+        assert calls[-1].args == (
+            "rate_limit_available_requests",
+            ["jira", "project"],
+            4.0,
+        )
+        assert calls[-2].args == ("rate_limit_waiting_requests", ["jira", "project"], 0)
+
+
+class TestRateLimitTransport:
+    @pytest.mark.asyncio
+    async def test_limits_by_host_and_observes_responses(self) -> None:
+        wrapped = _SequenceTransport(
+            [
+                httpx.Response(
+                    HTTPStatus.OK,
+                    headers={"x-ratelimit-remaining": "10", "x-ratelimit-reset": "1"},
+                )
+            ]
+        )
+        limiter = RateLimiter(
+            lambda: AdaptiveHeaderStrategy(parse_reset=_parse_seconds)
+        )
+        transport = RateLimitTransport(wrapped, limiter)
+
+        await transport.handle_async_request(
+            httpx.Request("GET", "https://api.example.com/a")
+        )
+
+        strategy = limiter.strategy("api.example.com")
+        assert isinstance(strategy, AdaptiveHeaderStrategy)
+        assert strategy.rate == pytest.approx(10.0)
@@ -0,0 +1,105 @@
+import asyncio
+from contextlib import ExitStack
+from typing import Callable
+from unittest.mock import patch
+
+import pytest
+
+from port_ocean.helpers.rate_limit import (
+    AdaptiveHeaderStrategy,
+    FixedWindowStrategy,
+    RateLimiter,
+    RateLimitStrategy,
+    SlidingWindowStrategy,
+    TokenBucket,
+)
+
+STRATEGIES: dict[str, Callable[[], RateLimitStrategy]] = {
+    "fixed_window": lambda: FixedWindowStrategy(max_requests=1_000_000, period=60),
+    "sliding_window": lambda: SlidingWindowStrategy(max_requests=1_000_000, period=60),
+    "token_bucket": lambda: TokenBucket(rate=1_000_000, capacity=1_000_000),
+    "adaptive": lambda: AdaptiveHeaderStrategy(),
+}
+
+
+class _FrozenClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+def _freeze_time(clock: _FrozenClock) -> ExitStack:
+    stack = ExitStack()
+    for module in ("fixed_window", "sliding_window", "token_bucket", "adaptive"):
+        stack.enter_context(
+            patch(f"port_ocean.helpers.rate_limit.{module}.time", clock)
+        )
+    return stack
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("strategy_name", list(STRATEGIES))
+async def test_unsaturated_rate_limiter_never_waits(strategy_name: str) -> None:
+    """
+    This test is to check that a limiter well under its limits hands every request a
+    slot right away: on a frozen clock, 5k concurrent acquisitions over 10 keys report
+    no wait at all.
+    """
+    num_requests = 5_000
+    num_workers = 50
+    waits: list[float] = []
+    with (
+        _freeze_time(_FrozenClock()),
+        patch.object(
+            RateLimiter,
+            "_report_wait",
+            lambda self, key, waited: waits.append(waited),
+        ),
+    ):
+        limiter = RateLimiter(STRATEGIES[strategy_name], name=strategy_name)
+        acquired = 0
+
+        async def worker(worker_id: int) -> None:
+            nonlocal acquired
+            key = f"key_{worker_id % 10}"
+            for _ in range(num_requests // num_workers):
+                async with limiter.limit(key):
+                    acquired += 1
+
+        await asyncio.gather(*(worker(i) for i in range(num_workers)))
+
+    assert acquired == num_requests
+    assert waits == []
+
+
+@pytest.mark.parametrize(
+    ("strategy_factory", "max_per_span"),
+    [
+        # A fixed window may let two full windows through around a boundary.
+        (lambda: FixedWindowStrategy(max_requests=20, period=0.1), 40),
+        (lambda: SlidingWindowStrategy(max_requests=20, period=0.1), 20),
+        # A full bucket's burst plus what refills during the span.
+        (lambda: TokenBucket(rate=200, capacity=20), 40),
+    ],
+    ids=["fixed_window", "sliding_window", "token_bucket"],
+)
+def test_rate_limiter_saturated_throughput(
+    strategy_factory: Callable[[], RateLimitStrategy], max_per_span: int
+) -> None:
+    """
+    This test is to check that a saturated limiter releases requests at its configured
+    rate (200/s here) rather than in bursts, and without falling behind. The clock is
+    frozen, so each request is sent exactly after the wait its reservation returned.
+    """
+    num_requests = 200
+    with _freeze_time(_FrozenClock()):
+        strategy = strategy_factory()
+        sent_at = sorted(strategy.reserve() for _ in range(num_requests))
+
+    # The last 20 requests go out 0.9s in, in the tenth 0.1s span.
+    assert sent_at[-1] == pytest.approx(0.9)
+    # No 0.1s span lets through more than the strategy allows.
+    for index in range(len(sent_at) - max_per_span):
+        assert sent_at[index + max_per_span] - sent_at[index] >= 0.1 - 1e-9
@@ -0,0 +1,338 @@
+import asyncio
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterator
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from port_ocean.config.settings import ResyncRecorderSettings
+from port_ocean.helpers.ip_blocker import IPBlockerTransport
+from port_ocean.helpers.replay_recorder import (
+    ResyncRecordingTransport,
+    configure_resync_recorder,
+    get_active_recording,
+    resync_recording,
+)
+from port_ocean.integration_testing.replay import (
+    RecordedCall,
+    ReplayTransport,
+    ResyncRecordingFile,
+    load_recording,
+)
+from port_ocean.integration_testing.transport import UnmatchedRequestError
+from port_ocean.log.sensetive import sensitive_log_filter
+
+SECRET = "s3cr3t-api-token-1234"
+
+
+def _third_party(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/broken":
+        raise httpx.ConnectError("connection refused", request=request)
+    return httpx.Response(
+        200,
+        json={"path": request.url.path, "token": SECRET},
+        headers={"x-request-id": "abc"},
+    )
+
+
+@pytest.fixture
+def recording_dir(tmp_path: Path) -> Iterator[Path]:
+    patterns = list(sensitive_log_filter.compiled_patterns)
+    sensitive_log_filter.hide_sensitive_strings(SECRET)
+    configure_resync_recorder(
+        ResyncRecorderSettings(enabled=True, output_dir=str(tmp_path)),
+        "http://port.test",
+    )
+    yield tmp_path
+    configure_resync_recorder(ResyncRecorderSettings(), "http://port.test")
+    sensitive_log_filter.compiled_patterns = patterns
+
+
+def _client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        transport=ResyncRecordingTransport(httpx.MockTransport(_third_party))
+    )
+
+
+def _recorder_settings(recording_dir: Path, **kwargs: Any) -> ResyncRecorderSettings:
+    return ResyncRecorderSettings(enabled=True, output_dir=str(recording_dir), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_nothing_is_recorded_outside_a_resync(recording_dir: Path) -> None:
+    async with _client() as client:
+        await client.get("http://api.test/items")
+    assert get_active_recording() is None
+    assert list(recording_dir.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_resync_is_recorded_masked_and_without_port_calls(
+    recording_dir: Path,
+) -> None:
+    async with _client() as client:
+        async with resync_recording("resync-1", "github") as recording:
+            assert recording is not None
+            recording.record_port_app_config({"resources": [{"kind": "repo"}]})
+            await client.get(f"http://api.test/items?token={SECRET}")
+            await client.post("http://api.test/search", json={"q": SECRET})
+            await client.get("http://port.test/v1/blueprints")
+            with pytest.raises(httpx.ConnectError):
+                await client.get("http://api.test/broken")
+
+    assert get_active_recording() is None
+    [path] = recording_dir.iterdir()
+    assert path.name.endswith("-resync-1.jsonl.gz")
+    assert SECRET.encode() not in path.read_bytes()
+
+    loaded = load_recording(path)
+    assert loaded.header["integration_type"] == "github"
+    assert loaded.port_app_config == {"resources": [{"kind": "repo"}]}
+    assert [(call.method, call.url) for call in loaded.calls] == [
+        ("GET", "http://api.test/items?token=[REDACTED]"),
+        ("POST", "http://api.test/search"),
+        ("GET", "http://api.test/broken"),
+    ]
+    items, search, broken = loaded.calls
+    assert items.status == 200
+    assert items.headers["x-request-id"] == "abc"
+    assert b"[REDACTED]" in items.body and SECRET.encode() not in items.body
+    assert search.request_body == b'{"q":"[REDACTED]"}'
+    assert broken.status is None and broken.error == "ConnectError"
+    assert all(call.duration >= 0 for call in loaded.calls)
+
+
+@pytest.mark.asyncio
+async def test_only_calls_from_the_resync_context_are_recorded(
+    recording_dir: Path,
+) -> None:
+    resync_started = asyncio.Event()
+    outside_done = asyncio.Event()
+
+    async with _client() as client:
+
+        async def outside_the_resync() -> None:
+            await resync_started.wait()
+            await client.get("http://api.test/webhook")
+            outside_done.set()
+
+        outside = asyncio.create_task(outside_the_resync())
+        async with resync_recording("resync-6", "github"):
+            resync_started.set()
+            await outside_done.wait()
+            await asyncio.create_task(client.get("http://api.test/in-a-task"))
+            await client.get("http://api.test/items")
+        await outside
+        await client.get("http://api.test/after")
+
+    [path] = recording_dir.iterdir()
+    assert [call.url for call in load_recording(path).calls] == [
+        "http://api.test/in-a-task",
+        "http://api.test/items",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_calls_are_recorded_with_the_original_host(
+    recording_dir: Path,
+) -> None:
+    transport = IPBlockerTransport(
+        ResyncRecordingTransport(httpx.MockTransport(_third_party))
+    )
+    with patch(
+        "port_ocean.helpers.ip_blocker._resolve_to_ip_addresses",
+        return_value=["93.184.216.34"],
+    ):
+        async with httpx.AsyncClient(transport=transport) as client:
+            async with resync_recording("resync-7", "github"):
+                await client.get("https://api.test:8443/items")
+
+    [path] = recording_dir.iterdir()
+    [call] = load_recording(path).calls
+    assert call.url == "https://api.test:8443/items"
+
+
+@pytest.mark.asyncio
+async def test_recording_stops_recording_calls_at_max_size(
+    recording_dir: Path,
+) -> None:
+    configure_resync_recorder(
+        _recorder_settings(recording_dir, max_size_bytes=1), "http://port.test"
+    )
+    async with _client() as client:
+        async with resync_recording("resync-2", "github") as recording:
+            assert recording is not None
+            await client.get("http://api.test/first")
+            while not recording.truncated:
+                time.sleep(0.01)
+            await client.get("http://api.test/second")
+
+    [path] = recording_dir.iterdir()
+    assert [call.url for call in load_recording(path).calls] == [
+        "http://api.test/first"
+    ]
+
+
+class _ChunkStream(httpx.AsyncByteStream):
+    def __init__(self, chunks: list[bytes]) -> None:
+        self.chunks = chunks
+        self.chunks_read = 0
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self.chunks:
+            self.chunks_read += 1
+            yield chunk
+
+
+class _StreamingTransport(httpx.AsyncBaseTransport):
+    def __init__(self, chunks: list[bytes]) -> None:
+        self.stream = _ChunkStream(chunks)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, headers={"content-type": "text/plain"}, stream=self.stream
+        )
+
+
+@pytest.mark.asyncio
+async def test_streamed_responses_are_recorded_as_they_are_read(
+    recording_dir: Path,
+) -> None:
+    wrapped = _StreamingTransport([b"line 1\n", b"line 2\n"])
+    transport = ResyncRecordingTransport(wrapped)
+    async with httpx.AsyncClient(transport=transport) as client:
+        async with resync_recording("resync-3", "github"):
+            async with client.stream("GET", "http://api.test/export") as response:
+                # The recorder reads nothing on the caller's behalf.
+                assert wrapped.stream.chunks_read == 0
+                assert [line async for line in response.aiter_lines()] == [
+                    "line 1",
+                    "line 2",
+                ]
+
+    [path] = recording_dir.iterdir()
+    [call] = load_recording(path).calls
+    assert call.body == b"line 1\nline 2\n"
+
+
+@pytest.mark.asyncio
+async def test_large_bodies_are_recorded_without_content(
+    recording_dir: Path,
+) -> None:
+    configure_resync_recorder(
+        _recorder_settings(recording_dir, max_body_bytes=10), "http://port.test"
+    )
+    wrapped = _StreamingTransport([b"0123456789", b"0123456789"])
+    async with httpx.AsyncClient(transport=ResyncRecordingTransport(wrapped)) as client:
+        async with resync_recording("resync-4", "github"):
+            response = await client.post("http://api.test/items", content=b"x" * 20)
+            assert response.content == b"0123456789" * 2
+
+    [path] = recording_dir.iterdir()
+    [call] = load_recording(path).calls
+    assert call.body_omitted and call.body == b""
+    assert call.request_body == b""
+
+    transport = ReplayTransport(load_recording(path))
+    async with httpx.AsyncClient(transport=transport) as client:
+        replayed = await client.post("http://api.test/items", content=b"x" * 20)
+    assert replayed.status_code == 200 and replayed.content == b""
+
+
+@pytest.mark.asyncio
+async def test_recording_stops_when_the_writer_falls_behind(
+    recording_dir: Path,
+) -> None:
+    # Any call with a body is over a queue that only fits a call's overhead.
+    configure_resync_recorder(
+        _recorder_settings(recording_dir, max_queued_bytes=1024), "http://port.test"
+    )
+    async with _client() as client:
+        async with resync_recording("resync-5", "github") as recording:
+            assert recording is not None
+            await client.get("http://api.test/first")
+            assert recording.truncated
+
+    [path] = recording_dir.iterdir()
+    assert load_recording(path).calls == []
+
+
+def _recording(*calls: RecordedCall) -> ResyncRecordingFile:
+    return ResyncRecordingFile(header={"version": 1}, calls=list(calls))
+
+
+def _call(
+    url: str,
+    body: bytes,
+    duration: float = 0.0,
+    status: int | None = 200,
+    error: str | None = None,
+) -> RecordedCall:
+    return RecordedCall(
+        method="GET",
+        url=url,
+        request_body=b"",
+        status=status,
+        headers={"content-type": "application/json"},
+        body=body,
+        offset=0.0,
+        duration=duration,
+        error=error,
+    )
+
+
+@pytest.mark.asyncio
+async def test_replay_answers_in_recorded_order() -> None:
+    transport = ReplayTransport(
+        _recording(
+            _call("http://api.test/items?page=1", b'{"page":1}'),
+            _call("http://api.test/items?page=2", b'{"page":2}'),
+            _call("http://api.test/items?page=1", b'{"page":"1 again"}'),
+        )
+    )
+    async with httpx.AsyncClient(transport=transport) as client:
+        second = await client.get("http://api.test/items?page=2")
+        first = await client.get("http://api.test/items?page=1")
+        again = await client.get("http://api.test/items?page=1")
+        with pytest.raises(UnmatchedRequestError):
+            await client.get("http://api.test/items?page=1")
+
+    assert (first.json(), second.json(), again.json()) == (
+        {"page": 1},
+        {"page": 2},
+        {"page": "1 again"},
+    )
+    assert transport.unused_calls == []
+    transport.reset()
+    assert len(transport.unused_calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_replay_falls_back_to_the_path_and_404s_when_not_strict() -> None:
+    transport = ReplayTransport(
+        _recording(_call("http://api.test/items?cursor=abc", b"[]")), strict=False
+    )
+    async with httpx.AsyncClient(transport=transport) as client:
+        fallback = await client.get("http://api.test/items?cursor=xyz")
+        unmatched = await client.get("http://api.test/other")
+    assert fallback.status_code == 200
+    assert unmatched.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_replay_raises_recorded_errors_and_keeps_latency() -> None:
+    transport = ReplayTransport(
+        _recording(
+            _call("http://api.test/slow", b"{}", duration=0.2),
+            _call("http://api.test/broken", b"", status=None, error="ReadTimeout"),
+        ),
+        speed=2.0,
+    )
+    async with httpx.AsyncClient(transport=transport) as client:
+        started_at = time.monotonic()
+        await client.get("http://api.test/slow")
+        assert time.monotonic() - started_at >= 0.1
+        with pytest.raises(httpx.ReadTimeout):
+            await client.get("http://api.test/broken")
@@ -0,0 +1,116 @@
+from unittest.mock import MagicMock, Mock, patch
+
+import httpx
+import pytest
+from prometheus_client import generate_latest
+
+from port_ocean.helpers.metric.metric import Metrics
+from port_ocean.helpers.request_metrics import (
+    PORT_REQUEST_DURATION,
+    THIRD_PARTY_REQUEST_DURATION,
+    RequestDurationMetricsTransport,
+    port_endpoint,
+)
+
+
+class _StaticTransport(httpx.AsyncBaseTransport):
+    def __init__(self, response: httpx.Response | Exception) -> None:
+        self.response = response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if isinstance(self.response, Exception):
+            raise self.response
+        return self.response
+
+
+@pytest.mark.parametrize(
+    ("method", "url", "endpoint"),
+    [
+        (
+            "POST",
+            "https://api.getport.io/v1/blueprints/service/entities/bulk",
+            "POST /v1/blueprints/{id}/entities/bulk",
+        ),
+        (
+            "DELETE",
+            "https://api.getport.io/v1/blueprints/service/entities/my%20service",
+            "DELETE /v1/blueprints/{id}/entities/{id}",
+        ),
+        (
+            "GET",
+            "https://api.getport.io/v1/integration/my-integration?q=1",
+            "GET /v1/integration/{id}",
+        ),
+    ],
+)
+def test_port_endpoint_replaces_identifiers(
+    method: str, url: str, endpoint: str
+) -> None:
+    assert port_endpoint(httpx.Request(method, url)) == endpoint
+
+
+@pytest.mark.asyncio
+async def test_reports_request_duration_with_status() -> None:
+    transport = RequestDurationMetricsTransport(
+        _StaticTransport(httpx.Response(201)), PORT_REQUEST_DURATION
+    )
+
+    with patch(
+        "port_ocean.helpers.request_metrics.ocean", new_callable=MagicMock
+    ) as mock_ocean:
+        mock_ocean.initialized = True
+        await transport.handle_async_request(
+            httpx.Request("POST", "https://api.getport.io/v1/blueprints/svc/entities")
+        )
+
+    (call,) = mock_ocean.metrics.observe_metric.call_args_list
+    assert call.args[:2] == (
+        "port_request_duration_seconds",
+        ["POST /v1/blueprints/{id}/entities", "201"],
+    )
+    assert call.args[2] >= 0
+
+
+@pytest.mark.asyncio
+async def test_reports_request_duration_with_error_type() -> None:
+    transport = RequestDurationMetricsTransport(
+        _StaticTransport(httpx.ConnectTimeout("timed out")),
+        THIRD_PARTY_REQUEST_DURATION,
+    )
+
+    with patch(
+        "port_ocean.helpers.request_metrics.ocean", new_callable=MagicMock
+    ) as mock_ocean:
+        mock_ocean.initialized = True
+        with pytest.raises(httpx.ConnectTimeout):
+            await transport.handle_async_request(
+                httpx.Request("GET", "https://api.github.com/repos")
+            )
+
+    (call,) = mock_ocean.metrics.observe_metric.call_args_list
+    assert call.args[:2] == (
+        "third_party_request_duration_seconds",
+        ["api.github.com", "ConnectTimeout"],
+    )
+
+
+def test_histograms_and_counters_are_exposed() -> None:
+    metrics_settings = Mock()
+    metrics_settings.enabled = True
+    metrics = Metrics(
+        metrics_settings=metrics_settings,
+        integration_configuration=Mock(),
+        port_client=Mock(),
+    )
+
+    metrics.observe_metric("transform_batch_duration_seconds", ["repository"], 0.2)
+    metrics.inc_metric("transform_items", ["repository"], 100)
+
+    exposed = generate_latest(metrics.registry).decode()
+    assert (
+        'transform_batch_duration_seconds_bucket{kind="repository",le="0.25"} 1.0'
+        in exposed
+    )
+    assert 'transform_items_total{kind="repository"} 100.0' in exposed
+    assert "transform_items" in metrics.counters
+    assert "transform_items" not in metrics.metrics
@@ -0,0 +1,203 @@
+import json
+import os
+from pathlib import Path
+from typing import Any, AsyncIterator
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from port_ocean.helpers.stream import Stream
+
+
+def _streamed_response(payload: bytes, chunk_size: int = 7) -> httpx.Response:
+    async def content() -> AsyncIterator[bytes]:
+        for start in range(0, len(payload), chunk_size):
+            yield payload[start : start + chunk_size]
+
+    return httpx.Response(200, content=content())
+
+
+def _mock_ocean(tmp_path: Path, spool_mode: str) -> MagicMock:
+    mock_ocean = MagicMock()
+    mock_ocean.config.streaming.chunk_size = 16
+    mock_ocean.config.streaming.location = str(tmp_path)
+    mock_ocean.config.streaming.max_buffer_size_mb = 1024 * 1024
+    mock_ocean.config.streaming.max_batch_items = 1000
+    mock_ocean.config.streaming.spool_mode = spool_mode
+    return mock_ocean
+
+
+PAYLOAD = json.dumps(
+    {"results": [{"id": i, "name": f"item-{i}"} for i in range(50)]}
+).encode()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("spool_mode", ["encrypted", "plain", "passthrough"])
+async def test_byte_stream_round_trips_response(
+    tmp_path: Path, spool_mode: str
+) -> None:
+    stream = Stream(_streamed_response(PAYLOAD))
+
+    with patch(
+        "port_ocean.helpers.stream.ocean_context.ocean",
+        _mock_ocean(tmp_path, spool_mode),
+    ):
+        data = b"".join([chunk async for chunk in stream._byte_stream()])
+
+    assert data == PAYLOAD
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.asyncio
+async def test_encrypted_spool_does_not_store_plaintext(tmp_path: Path) -> None:
+    stream = Stream(_streamed_response(PAYLOAD))
+    spooled: list[bytes] = []
+
+    with patch(
+        "port_ocean.helpers.stream.ocean_context.ocean",
+        _mock_ocean(tmp_path, "encrypted"),
+    ):
+        async for _ in stream._byte_stream():
+            if not spooled:
+                (spool_file,) = tmp_path.iterdir()
+                spooled.append(spool_file.read_bytes())
+
+    assert len(spooled[0]) == len(PAYLOAD)
+    assert b"item-" not in spooled[0]
+
+
+@pytest.mark.asyncio
+async def test_passthrough_yields_before_download_completes(tmp_path: Path) -> None:
+    downloaded: list[int] = []
+
+    async def content() -> AsyncIterator[bytes]:
+        for start in range(0, len(PAYLOAD), 16):
+            downloaded.append(start)
+            yield PAYLOAD[start : start + 16]
+
+    stream = Stream(httpx.Response(200, content=content()))
+
+    with patch(
+        "port_ocean.helpers.stream.ocean_context.ocean",
+        _mock_ocean(tmp_path, "passthrough"),
+    ):
+        byte_stream = stream._byte_stream()
+        await byte_stream.__anext__()
+        assert len(downloaded) == 1
+        await byte_stream.aclose()
+
+    assert stream.response.is_closed
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("spool_mode", ["encrypted", "passthrough"])
+async def test_get_json_stream_parses_items(tmp_path: Path, spool_mode: str) -> None:
+    stream = Stream(_streamed_response(PAYLOAD))
+
+    with patch(
+        "port_ocean.helpers.stream.ocean_context.ocean",
+        _mock_ocean(tmp_path, spool_mode),
+    ):
+        items: list[dict[str, Any]] = []
+        async for batch in stream.get_json_stream("results.item"):
+            items.extend(batch)
+
+    assert items == json.loads(PAYLOAD)["results"]
+
+
+@pytest.mark.asyncio
+async def test_get_json_stream_bounds_batch_item_count(tmp_path: Path) -> None:
+    stream = Stream(_streamed_response(PAYLOAD, chunk_size=256))
+
+    with patch(
+        "port_ocean.helpers.stream.ocean_context.ocean",
+        _mock_ocean(tmp_path, "passthrough"),
+    ):
+        batches = [
+            batch
+            async for batch in stream.get_json_stream("results.item", max_batch_items=8)
+        ]
+
+    assert [len(batch) for batch in batches] == [8] * 6 + [2]
+    assert [item for batch in batches for item in batch] == json.loads(PAYLOAD)[
+        "results"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_json_stream_bounds_batch_size_by_item_size(
+    tmp_path: Path,
+) -> None:
+    small_items = [{"id": i} for i in range(8)]
+    large_item = {"id": 8, "blob": "x" * 1000, "score": 0.5}
+    payload = json.dumps({"results": [*small_items, large_item, {"id": 9}]}).encode()
+    stream = Stream(_streamed_response(payload, chunk_size=4096))
+    mock_ocean = _mock_ocean(tmp_path, "passthrough")
+    mock_ocean.config.streaming.chunk_size = 4096
+
+    with patch("port_ocean.helpers.stream.ocean_context.ocean", mock_ocean):
+        # A single chunk holds the whole body, so only the items' own sizes can
+        # split it into batches.
+        batches = [
+            batch
+            async for batch in stream.get_json_stream(
+                "results.item", max_buffer_size_mb=1000
+            )
+        ]
+
+    assert [len(batch) for batch in batches] == [9, 1]
+    assert batches[0][-1]["blob"] == large_item["blob"]
+
+
+@pytest.mark.asyncio
+async def test_get_json_stream_yields_independent_batches(tmp_path: Path) -> None:
+    stream = Stream(_streamed_response(PAYLOAD))
+
+    with patch(
+        "port_ocean.helpers.stream.ocean_context.ocean",
+        _mock_ocean(tmp_path, "plain"),
+    ):
+        batches = [
+            batch
+            async for batch in stream.get_json_stream("results.item", max_batch_items=5)
+        ]
+
+    assert len(batches) == 10
+    assert [batch[0]["id"] for batch in batches] == list(range(0, 50, 5))
+    batches[0].clear()
+    assert [len(batch) for batch in batches[1:]] == [5] * 9
+
+
+@pytest.mark.asyncio
+async def test_get_json_stream_yields_nothing_for_no_items(tmp_path: Path) -> None:
+    stream = Stream(_streamed_response(b'{"results": []}'))
+
+    with patch(
+        "port_ocean.helpers.stream.ocean_context.ocean",
+        _mock_ocean(tmp_path, "passthrough"),
+    ):
+        batches = [batch async for batch in stream.get_json_stream("results.item")]
+
+    assert batches == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("spool_mode", ["plain", "passthrough"])
+async def test_closing_json_stream_early_releases_the_body(
+    tmp_path: Path, spool_mode: str
+) -> None:
+    stream = Stream(_streamed_response(PAYLOAD))
+
+    with patch(
+        "port_ocean.helpers.stream.ocean_context.ocean",
+        _mock_ocean(tmp_path, spool_mode),
+    ):
+        json_stream = stream.get_json_stream("results.item", max_batch_items=5)
+        await json_stream.__anext__()
+        await json_stream.aclose()
+
+    assert stream.response.is_closed
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,161 @@
+import asyncio
+import json
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from fastapi import Request
+
+from port_ocean.config.settings import TracingSettings
+from port_ocean.core.handlers.webhook.webhook_event import WebhookEvent
+from port_ocean.helpers import tracing
+from port_ocean.helpers.tracing import (
+    NON_RECORDING_SPAN,
+    InMemorySpanExporter,
+    SpanKind,
+    StatusCode,
+    Tracer,
+    current_span,
+    parent_span_id_from_headers,
+    start_span,
+    to_trace_id,
+    trace_id_from_headers,
+    traced,
+)
+
+TRACEPARENT_TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+
+
+@pytest.fixture
+def exporter() -> Iterator[InMemorySpanExporter]:
+    exporter = InMemorySpanExporter()
+    previous = tracing.get_tracer()
+    tracing.set_tracer(Tracer(exporter, batch_size=1))
+    yield exporter
+    tracing.set_tracer(previous)
+
+
+def test_spans_are_not_recorded_by_default() -> None:
+    with start_span("resync.kind") as span:
+        assert span is NON_RECORDING_SPAN
+        assert current_span() is NON_RECORDING_SPAN
+
+
+async def test_spans_started_in_child_tasks_share_the_trace(
+    exporter: InMemorySpanExporter,
+) -> None:
+    async def page(number: int) -> None:
+        with start_span("resync.page", attributes={"ocean.page": number}):
+            await asyncio.sleep(0)
+
+    with start_span("resync") as root:
+        await asyncio.gather(page(1), page(2))
+
+    pages = [span for span in exporter.spans if span.name == "resync.page"]
+    assert len(pages) == 2
+    assert {span.trace_id for span in pages} == {root.trace_id}
+    assert {span.parent_span_id for span in pages} == {root.span_id}
+    assert root.parent_span_id is None
+    assert current_span() is NON_RECORDING_SPAN
+
+
+async def test_traced_records_errors(exporter: InMemorySpanExporter) -> None:
+    @traced("port.upsert_entities_bulk", SpanKind.CLIENT)
+    async def upsert() -> None:
+        current_span().set_attribute("port.entities", 3)
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        await upsert()
+
+    [span] = exporter.spans
+    assert span.kind == SpanKind.CLIENT
+    assert span.attributes == {"port.entities": 3}
+    assert span.status_code == StatusCode.ERROR
+    assert span.events[0][0] == "exception"
+
+
+async def test_end_of_pages_is_not_an_error(exporter: InMemorySpanExporter) -> None:
+    async def pages() -> None:
+        with start_span("resync.page"):
+            raise StopAsyncIteration
+
+    with pytest.raises(StopAsyncIteration):
+        await pages()
+
+    assert exporter.spans[0].status_code == StatusCode.UNSET
+
+
+def test_file_exporter_writes_otlp_json(tmp_path: Path) -> None:
+    output_path = tmp_path / "traces" / "traces.jsonl"
+    tracer = tracing.configure_tracing(
+        TracingSettings(enabled=True, output_path=str(output_path)), "github"
+    )
+    try:
+        with tracer.start_span("resync", trace_id="a-redis-stream-id"):
+            with tracer.start_span("resync.kind", attributes={"ocean.kind": "repo"}):
+                pass
+    finally:
+        tracing.shutdown_tracing()
+        tracing.set_tracer(Tracer())
+
+    [line] = output_path.read_text().splitlines()
+    [resource_spans] = json.loads(line)["resourceSpans"]
+    assert {"key": "service.name", "value": {"stringValue": "github"}} in (
+        resource_spans["resource"]["attributes"]
+    )
+    kind_span, root_span = resource_spans["scopeSpans"][0]["spans"]
+    assert root_span["traceId"] == to_trace_id("a-redis-stream-id")
+    assert kind_span["traceId"] == root_span["traceId"]
+    assert kind_span["parentSpanId"] == root_span["spanId"]
+    assert kind_span["attributes"] == [
+        {"key": "ocean.kind", "value": {"stringValue": "repo"}}
+    ]
+
+
+def test_trace_ids() -> None:
+    assert to_trace_id("4bf92f35-77b3-4da6-a3ce-929d0e0e4736") == TRACEPARENT_TRACE_ID
+    assert len(to_trace_id("1700000000000-0")) == 32
+    assert (
+        trace_id_from_headers(
+            {"traceparent": f"00-{TRACEPARENT_TRACE_ID}-00f067aa0ba902b7-01"}
+        )
+        == TRACEPARENT_TRACE_ID
+    )
+    assert trace_id_from_headers({"traceparent": "garbage"}) is None
+    assert trace_id_from_headers({}) is None
+
+
+def test_parent_span_ids() -> None:
+    headers = {"traceparent": f"00-{TRACEPARENT_TRACE_ID}-00f067aa0ba902b7-01"}
+    assert (
+        parent_span_id_from_headers(headers, "4bf92f35-77b3-4da6-a3ce-929d0e0e4736")
+        == "00f067aa0ba902b7"
+    )
+    # The event was given a trace of its own, e.g. with tracing off on receipt.
+    assert parent_span_id_from_headers(headers, "other-trace") is None
+    invalid = {"traceparent": f"00-{TRACEPARENT_TRACE_ID}-{'0' * 16}-01"}
+    assert parent_span_id_from_headers(invalid, TRACEPARENT_TRACE_ID) is None
+
+
+async def test_webhook_event_continues_the_sender_trace(
+    exporter: InMemorySpanExporter,
+) -> None:
+    traceparent = f"00-{TRACEPARENT_TRACE_ID}-00f067aa0ba902b7-01"
+    request = Request(
+        {"type": "http", "headers": [(b"traceparent", traceparent.encode())]}
+    )
+    request._json = {}
+
+    webhook_event = await WebhookEvent.from_request(request)
+
+    assert to_trace_id(webhook_event.trace_id) == TRACEPARENT_TRACE_ID
+    with start_span(
+        "webhook.process",
+        trace_id=webhook_event.trace_id,
+        parent_span_id=parent_span_id_from_headers(
+            webhook_event.headers, webhook_event.trace_id
+        ),
+    ) as span:
+        assert span.trace_id == TRACEPARENT_TRACE_ID
+        assert span.parent_span_id == "00f067aa0ba902b7"
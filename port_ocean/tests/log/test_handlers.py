@@ -1,13 +1,20 @@
+import gzip
+import json
+import logging
 import sys
+import time
 from collections import namedtuple
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
-from port_ocean.log.handlers import _serialize_record
+import pytest
+
+from port_ocean.log.handlers import HTTPMemoryHandler, _serialize_record
 from port_ocean.log.logger_setup import _extract_traceback
 from loguru import logger
 from logging import LogRecord
 from queue import Queue
 from logging.handlers import QueueHandler
-from typing import Callable, Any
+from typing import Callable, Any, Iterator
 
 # Matches the shape of loguru's internal RecordException namedtuple
 _RecordException = namedtuple("_RecordException", ["type", "value", "traceback"])
@@ -115,3 +122,132 @@ def log_record(cb: Callable[[], None]) -> LogRecord:
     logger.remove(logger_id)
     record = queue.get()
     return record
+
+
+def _record(message: str, level: int = logging.INFO) -> LogRecord:
+    record = LogRecord("test", level, __file__, 0, message, None, None)
+    record.extra = {}
+    return record
+
+
+@pytest.fixture
+def ingest_logs() -> Iterator[AsyncMock]:
+    """Fixture that sends the HTTP handler's batches to a mock Port client."""
+    fake_ocean = MagicMock()
+    fake_ocean.port_client.ingest_integration_logs_batch = AsyncMock()
+    with patch.object(
+        HTTPMemoryHandler, "ocean", new_callable=PropertyMock, return_value=fake_ocean
+    ):
+        yield fake_ocean.port_client.ingest_integration_logs_batch
+
+
+def _sent_batches(ingest_logs: AsyncMock) -> list[bytes]:
+    batches = []
+    for call in ingest_logs.await_args_list:
+        body = call.args[0]
+        if call.kwargs["content_encoding"] == "gzip":
+            body = gzip.decompress(body)
+        batches.append(body)
+    return batches
+
+
+def test_http_handler_ships_byte_bounded_batches_from_one_thread(
+    ingest_logs: AsyncMock,
+) -> None:
+    handler = HTTPMemoryHandler(
+        flush_interval=60, flush_size=10**9, max_batch_size=1000, compress=True
+    )
+    messages = [f"message {index} " + "x" * 100 for index in range(20)]
+    for message in messages[:10]:
+        handler.handle(_record(message))
+    shipper = handler._shipper
+    handler.flush()
+    for message in messages[10:]:
+        handler.handle(_record(message))
+    handler.shutdown()
+
+    assert shipper is not None and handler._shipper is shipper
+    assert not shipper.is_alive()
+    batches = _sent_batches(ingest_logs)
+    assert len(batches) > 1
+    assert all(len(batch) <= 1000 for batch in batches)
+    sent = [log["message"] for batch in batches for log in json.loads(batch)["logs"]]
+    assert sent == messages
+    assert handler.buffered_bytes == 0
+
+
+def test_http_handler_wakes_once_flush_size_is_buffered(
+    ingest_logs: AsyncMock,
+) -> None:
+    handler = HTTPMemoryHandler(flush_interval=60, flush_size=500)
+    handler.handle(_record("x" * 600))
+    try:
+        for _ in range(200):
+            if ingest_logs.await_count:
+                break
+            time.sleep(0.01)
+        assert ingest_logs.await_count == 1
+    finally:
+        handler.shutdown()
+
+
+def test_http_handler_samples_and_drops_when_port_falls_behind() -> None:
+    handler = HTTPMemoryHandler(
+        max_buffer_size=2000, sampling_threshold=0.5, sampling_rate=4
+    )
+    handler._stopping.set()  # keep the shipper from starting
+    for index in range(40):
+        handler.handle(_record(f"info {index} " + "x" * 80))
+    handler.handle(_record("warning", logging.WARNING))
+
+    assert handler.buffered_bytes <= 2000
+    summary, *logs = [json.loads(log) for log in handler._take_batch()]
+    assert summary["level"] == "WARNING"
+    assert summary["extra"]["dropped"] > 0
+    assert summary["extra"]["sampled_out"] > 0
+    assert logs[-1]["message"] == "warning"
+    assert handler._take_batch() == []
+
+
+def test_http_handler_resends_a_failed_batch(ingest_logs: AsyncMock) -> None:
+    ingest_logs.side_effect = [RuntimeError("Port is down"), None]
+    handler = HTTPMemoryHandler(flush_interval=0.05, flush_size=10**9)
+    messages = [f"message {index}" for index in range(5)]
+    for message in messages:
+        handler.handle(_record(message))
+    try:
+        for _ in range(200):
+            if ingest_logs.await_count == 2:
+                break
+            time.sleep(0.01)
+    finally:
+        handler.shutdown()
+
+    failed, resent = _sent_batches(ingest_logs)
+    assert failed == resent
+    assert [log["message"] for log in json.loads(resent)["logs"]] == messages
+    assert handler.buffered_bytes == 0
+
+
+def test_http_handler_puts_a_failed_batch_back_within_max_buffer_size() -> None:
+    handler = HTTPMemoryHandler()
+    handler._stopping.set()  # keep the shipper from starting
+    for index in range(4):
+        handler.handle(_record(f"old {index} " + "x" * 80))
+    batch = handler._take_batch()
+    for index in range(2):
+        handler.handle(_record(f"new {index} " + "x" * 80))
+    # Room for four of the six records.
+    handler.max_buffer_size = handler.buffered_bytes * 2
+
+    handler._put_back(batch)
+
+    assert handler.buffered_bytes == handler.max_buffer_size
+    summary, *logs = [json.loads(log) for log in handler._take_batch()]
+    assert summary["extra"]["dropped"] == 2
+    assert [log["message"].split()[:2] for log in logs] == [
+        ["old", "2"],
+        ["old", "3"],
+        ["new", "0"],
+        ["new", "1"],
+    ]
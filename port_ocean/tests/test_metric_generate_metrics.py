@@ -1,11 +1,15 @@
 """Tests for Metrics.generate_metrics, especially kindIndex derivation from kindIdentifier."""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
 
 from port_ocean.helpers.metric.metric import (
     MetricPhase,
     MetricType,
     Metrics,
+    _metrics_registry,
+    register_metric,
 )
 
 
@@ -88,3 +92,67 @@ def test_generate_metrics_kind_index_multiple_kinds() -> None:
     assert by_kind_id["name-12"]["kindIndex"] == 12
     assert by_kind_id["repository-1"]["kind"] == "repository"
     assert by_kind_id["repository-1"]["kindIndex"] == 1
+
+
+def test_generate_metrics_nests_kind_gauges_by_label() -> None:
+    """Per-kind gauges are nested by their labels; other metrics are left out."""
+    metrics = _make_metrics()
+    metrics.set_metric(MetricType.DURATION_NAME, ["repo-0", MetricPhase.EXTRACT], 2.5)
+    metrics.set_metric(
+        MetricType.OBJECT_COUNT_NAME,
+        ["repo-0", MetricPhase.LOAD, MetricPhase.LoadResult.LOADED],
+        10,
+    )
+    metrics.set_metric(MetricType.DURATION_NAME, ["team-1", MetricPhase.EXTRACT], 1)
+    metrics.inc_metric(MetricType.TRANSFORM_ITEMS_NAME, ["repo-0"], 10)
+    metrics.observe_metric(MetricType.TRANSFORM_BATCH_DURATION_NAME, ["repo-0"], 0.1)
+
+    (event,) = metrics.generate_metrics(kind="repo-0")
+
+    assert event["metrics"] == {
+        "phase": {
+            MetricPhase.EXTRACT: {MetricType.DURATION_NAME: 2.5},
+            MetricPhase.LOAD: {
+                "object_count_type": {
+                    MetricPhase.LoadResult.LOADED: {MetricType.OBJECT_COUNT_NAME: 10.0}
+                }
+            },
+        }
+    }
+    assert [e["kindIdentifier"] for e in metrics.generate_metrics()] == [
+        "repo-0",
+        "team-1",
+    ]
+    assert metrics.generate_metrics(MetricType.SUCCESS_NAME) == []
+
+
+def test_generate_metrics_skips_gauges_registered_after_loading() -> None:
+    """A gauge registered after the metrics were loaded has no samples yet."""
+    metrics = _make_metrics()
+    metrics.set_metric(MetricType.DURATION_NAME, ["repo-0", MetricPhase.EXTRACT], 1)
+    register_metric("late_gauge", "registered after loading", ["kind"])
+    try:
+        assert [e["kindIdentifier"] for e in metrics.generate_metrics()] == ["repo-0"]
+    finally:
+        del _metrics_registry["late_gauge"]
+
+
+@pytest.mark.asyncio
+async def test_send_metrics_to_webhook_reuses_client() -> None:
+    """Every webhook POST goes through one pooled client, closed on shutdown."""
+    metrics = _make_metrics()
+    metrics.metrics_settings.webhook_url = "http://webhook.local/metrics"
+    metrics.set_metric(MetricType.DURATION_NAME, ["repo-0", MetricPhase.RESYNC], 1)
+    metrics.set_metric(MetricType.DURATION_NAME, ["team-1", MetricPhase.RESYNC], 1)
+
+    with patch("port_ocean.helpers.metric.metric.AsyncClient") as client_class:
+        client_class.return_value.is_closed = False
+        client_class.return_value.post = AsyncMock()
+        client_class.return_value.aclose = AsyncMock()
+        await metrics.send_metrics_to_webhook()
+        await metrics.send_metrics_to_webhook(kind="repo-0")
+        await metrics.close_webhook_client()
+
+    client_class.assert_called_once()
+    assert client_class.return_value.post.await_count == 3
+    client_class.return_value.aclose.assert_awaited_once()
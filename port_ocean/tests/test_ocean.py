@@ -1,7 +1,7 @@
 import pytest
 from unittest.mock import MagicMock, mock_open, patch
 from port_ocean.ocean import Ocean
-from port_ocean.config.settings import IntegrationConfiguration
+from port_ocean.config.settings import IntegrationConfiguration, ProfilerSettings
 
 
 @pytest.fixture
@@ -110,6 +110,7 @@ class TestInitializeAppRoutes:
         expected_health_path: str,
     ) -> None:
         mock_ocean.config.path_prefix = path_prefix
+        mock_ocean.config.profiler = ProfilerSettings()
         mock_ocean.fast_api_app = MagicMock()
         mock_ocean.integration_router = MagicMock()
         mock_ocean.metrics = MagicMock()
@@ -121,6 +122,21 @@ class TestInitializeAppRoutes:
         assert calls[0].kwargs["prefix"] == expected_integration_path
         assert calls[1].kwargs["prefix"] == expected_metrics_path
         assert calls[2].kwargs["prefix"] == expected_health_path
+        assert len(calls) == 3
+
+    def test_initialize_app_registers_profiler_route_when_enabled(
+        self, mock_ocean: Ocean
+    ) -> None:
+        mock_ocean.config.path_prefix = "my-prefix"
+        mock_ocean.config.profiler = ProfilerSettings(enabled=True)
+        mock_ocean.fast_api_app = MagicMock()
+        mock_ocean.integration_router = MagicMock()
+        mock_ocean.metrics = MagicMock()
+
+        mock_ocean.initialize_app()
+
+        calls = mock_ocean.fast_api_app.include_router.call_args_list
+        assert calls[-1].kwargs["prefix"] == "/my-prefix/debug/profile"
 
 
 # base_url property tests
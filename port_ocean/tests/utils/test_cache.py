@@ -1,10 +1,13 @@
 from typing import Any
 import asyncio
+import pickle
+from pathlib import Path
 from port_ocean.utils import cache
 import pytest
 from typing import AsyncGenerator, AsyncIterator, List, TypeVar
 from unittest.mock import AsyncMock
 from port_ocean.cache.errors import FailedToReadCacheError, FailedToWriteCacheError
+from port_ocean.cache.disk import DiskCacheProvider
 from port_ocean.cache.memory import InMemoryCacheProvider
 
 
@@ -642,3 +645,188 @@ async def test_cache_coroutine_result_concurrency(
     assert execution_count == 1
     for res in results:
         assert res == 20
+
+
+@pytest.fixture
+def disk_ocean(tmp_path: Path) -> Any:
+    return type(
+        "MockOcean",
+        (),
+        {
+            "app": type(
+                "MockApp",
+                (),
+                {"cache_provider": DiskCacheProvider(cache_dir=str(tmp_path))},
+            )()
+        },
+    )()
+
+
+@pytest.mark.asyncio
+async def test_cache_iterator_result_persists_chunks_as_produced(
+    disk_ocean: Any, monkeypatch: Any, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(cache, "ocean", disk_ocean)
+    spooled_sizes: list[int] = []
+    call_count = 0
+
+    @cache.cache_iterator_result()
+    async def chunked_iterator() -> AsyncGenerator[List[int], None]:
+        nonlocal call_count
+        call_count += 1
+        for i in range(3):
+            yield [i] * 100
+            (spool_file,) = tmp_path.iterdir()
+            spooled_sizes.append(spool_file.stat().st_size)
+
+    results1 = await async_gen_to_list(chunked_iterator())
+    results2 = await async_gen_to_list(chunked_iterator())
+
+    assert results1 == results2 == [[0] * 100, [1] * 100, [2] * 100]
+    assert call_count == 1
+    # Each chunk is on disk before the next one is produced.
+    assert spooled_sizes == sorted(spooled_sizes)
+    assert len(set(spooled_sizes)) == 3
+
+
+@pytest.mark.asyncio
+async def test_cache_iterator_result_concurrent_reader_streams_while_written(
+    disk_ocean: Any, monkeypatch: Any
+) -> None:
+    monkeypatch.setattr(cache, "ocean", disk_ocean)
+    release = asyncio.Event()
+    call_count = 0
+
+    @cache.cache_iterator_result()
+    async def slow_iterator() -> AsyncGenerator[List[int], None]:
+        nonlocal call_count
+        call_count += 1
+        yield [1]
+        await release.wait()
+        yield [2]
+
+    writer = slow_iterator()
+    assert await writer.__anext__() == [1]
+
+    reader = slow_iterator()
+    # The second caller gets the first chunk before the iterator finishes.
+    assert await asyncio.wait_for(reader.__anext__(), timeout=1) == [1]
+
+    release.set()
+    assert await async_gen_to_list(writer) == [[2]]
+    assert await async_gen_to_list(reader) == [[2]]
+    assert call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_iterator_result_does_not_cache_partial_iteration(
+    disk_ocean: Any, monkeypatch: Any, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(cache, "ocean", disk_ocean)
+    call_count = 0
+
+    @cache.cache_iterator_result()
+    async def failing_iterator() -> AsyncGenerator[List[int], None]:
+        nonlocal call_count
+        call_count += 1
+        yield [1]
+        if call_count == 1:
+            raise ValueError("upstream failed")
+        yield [2]
+
+    with pytest.raises(ValueError):
+        await async_gen_to_list(failing_iterator())
+    assert list(tmp_path.iterdir()) == []
+
+    assert await async_gen_to_list(failing_iterator()) == [[1], [2]]
+    assert call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_coroutine_result_with_shared_cache(monkeypatch: Any) -> None:
+    fakeredis = pytest.importorskip("fakeredis")
+    from port_ocean.cache.redis_cache import RedisCacheProvider
+
+    cache_provider = RedisCacheProvider(client=fakeredis.FakeAsyncRedis())
+    single_flight_keys: list[str] = []
+    original_single_flight = cache_provider.single_flight
+
+    def single_flight(key: str) -> Any:
+        single_flight_keys.append(key)
+        return original_single_flight(key)
+
+    monkeypatch.setattr(cache_provider, "single_flight", single_flight)
+    monkeypatch.setattr(
+        cache,
+        "ocean",
+        type(
+            "MockOcean",
+            (),
+            {"app": type("MockApp", (), {"cache_provider": cache_provider})()},
+        )(),
+    )
+    execution_count = 0
+
+    @cache.cache_coroutine_result()
+    async def slow_coroutine(x: int) -> int:
+        nonlocal execution_count
+        execution_count += 1
+        await asyncio.sleep(0.05)
+        return x * 2
+
+    results = await asyncio.gather(*(slow_coroutine(10) for _ in range(5)))
+
+    assert results == [20] * 5
+    assert execution_count == 1
+    assert single_flight_keys
+    assert len(set(single_flight_keys)) == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_iterator_result_recomputes_corrupt_chunk_file(
+    disk_ocean: Any, monkeypatch: Any, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(cache, "ocean", disk_ocean)
+    call_count = 0
+
+    @cache.cache_iterator_result()
+    async def chunked_iterator() -> AsyncGenerator[List[int], None]:
+        nonlocal call_count
+        call_count += 1
+        for i in range(3):
+            yield [i]
+
+    expected = [[0], [1], [2]]
+    assert await async_gen_to_list(chunked_iterator()) == expected
+    (chunk_file,) = tmp_path.iterdir()
+    chunk_file.write_bytes(b"not a pickle")
+
+    assert await async_gen_to_list(chunked_iterator()) == expected
+    assert call_count == 2
+    assert await async_gen_to_list(chunked_iterator()) == expected
+    assert call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_iterator_result_raises_when_chunk_fails_midway(
+    disk_ocean: Any, monkeypatch: Any, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(cache, "ocean", disk_ocean)
+
+    @cache.cache_iterator_result()
+    async def chunked_iterator() -> AsyncGenerator[List[int], None]:
+        for i in range(3):
+            yield [i]
+
+    await async_gen_to_list(chunked_iterator())
+    (chunk_file,) = tmp_path.iterdir()
+    with chunk_file.open("rb") as file:
+        pickle.load(file)
+        first_chunk_end = file.tell()
+    chunk_file.write_bytes(chunk_file.read_bytes()[: first_chunk_end + 3])
+
+    results: list[list[int]] = []
+    with pytest.raises(FailedToReadCacheError, match="incomplete"):
+        async for chunk in chunked_iterator():
+            results.append(chunk)
+    assert results == [[0]]
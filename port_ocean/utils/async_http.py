@@ -3,6 +3,7 @@ from werkzeug.local import LocalStack, LocalProxy
 
 from port_ocean.context.ocean import ocean
 from port_ocean.helpers.async_client import OceanAsyncClient
+from port_ocean.helpers.request_metrics import THIRD_PARTY_REQUEST_DURATION
 from port_ocean.helpers.retry import RetryTransport
 
 _http_client: LocalStack[httpx.AsyncClient] = LocalStack()
@@ -14,6 +15,7 @@ def _get_http_client_context() -> httpx.AsyncClient:
         client = OceanAsyncClient(
             RetryTransport,
             timeout=ocean.config.client_timeout,
+            request_duration_metric=THIRD_PARTY_REQUEST_DURATION,
         )
         _http_client.push(client)
 
@@ -2,8 +2,15 @@ import functools
 import hashlib
 import base64
 import asyncio
+from contextlib import AbstractAsyncContextManager, aclosing, nullcontext
 from weakref import WeakValueDictionary
-from typing import Callable, AsyncIterator, Awaitable, Any
+from typing import Callable, AsyncGenerator, AsyncIterator, Awaitable, Any
+from port_ocean.cache.base import (
+    CacheChunkWriter,
+    CacheProvider,
+    ChunkedCacheProvider,
+    SingleFlightCacheProvider,
+)
 from port_ocean.cache.errors import FailedToReadCacheError, FailedToWriteCacheError
 from port_ocean.context.ocean import ocean
 from loguru import logger
@@ -61,6 +68,126 @@ def hash_func(func: Callable[..., Any], *args: Any, **kwargs: Any) -> str:
     return f"{safe_func_id}_{short_hash}"
 
 
+def _single_flight(
+    cache_provider: CacheProvider, cache_key: str
+) -> AbstractAsyncContextManager[None]:
+    """Serialize misses across processes for providers shared between them."""
+    if isinstance(cache_provider, SingleFlightCacheProvider):
+        return cache_provider.single_flight(cache_key)
+    return nullcontext()
+
+
+class _CachedChunksUnavailable(Exception):
+    """The key has no readable cached chunks, so its results must be computed."""
+
+
+async def _stream_cached_chunks(
+    cache_provider: ChunkedCacheProvider, cache_key: str
+) -> AsyncGenerator[Any, None]:
+    """Yield the cached chunks of the key.
+
+    Raises _CachedChunksUnavailable when there are none or they fail to read
+    before the first chunk, e.g. a corrupt file or a writer that aborted, so
+    the caller can compute them instead. A failure after chunks were yielded
+    cannot be recovered from and is raised.
+    """
+    try:
+        chunks = await cache_provider.read_chunks(cache_key)
+    except FailedToReadCacheError as e:
+        logger.warning(f"Failed to read cache for {cache_key}: {str(e)}")
+        raise _CachedChunksUnavailable()
+    if chunks is None:
+        raise _CachedChunksUnavailable()
+
+    chunks_read = 0
+    try:
+        async with aclosing(chunks):
+            async for chunk in chunks:
+                chunks_read += 1
+                yield chunk
+    except FailedToReadCacheError as e:
+        if not chunks_read:
+            logger.warning(f"Failed to read cache for {cache_key}: {str(e)}")
+            raise _CachedChunksUnavailable()
+        logger.error(
+            f"Failed to read cache for {cache_key} after {chunks_read} chunks: {str(e)}"
+        )
+        raise FailedToReadCacheError(
+            f"Cache entry {cache_key} failed after {chunks_read} of its chunks "
+            f"were returned, so its results are incomplete: {str(e)}"
+        ) from e
+
+
+async def _open_chunk_writer(
+    cache_provider: ChunkedCacheProvider, cache_key: str
+) -> CacheChunkWriter | None:
+    try:
+        return await cache_provider.open_chunk_writer(cache_key)
+    except FailedToWriteCacheError as e:
+        logger.warning(f"Failed to write cache for {cache_key}: {str(e)}")
+        return None
+
+
+async def _iterate_with_chunked_cache(
+    cache_provider: ChunkedCacheProvider,
+    cache_key: str,
+    func: AsyncIteratorCallable,
+    *args: Any,
+    **kwargs: Any,
+) -> AsyncGenerator[Any, None]:
+    """Stream the cached chunks of the key, or stream the function's results while
+    persisting them chunk by chunk.
+
+    Callers that arrive while the results are being written read them back as they
+    are persisted instead of waiting for the iterator to finish.
+    """
+    try:
+        async with aclosing(_stream_cached_chunks(cache_provider, cache_key)) as chunks:
+            async for chunk in chunks:
+                yield chunk
+        return
+    except _CachedChunksUnavailable:
+        pass
+
+    async with _key_locks_guard:
+        lock = _locks.setdefault(cache_key, asyncio.Lock())
+
+    async with lock:
+        try:
+            async with aclosing(
+                _stream_cached_chunks(cache_provider, cache_key)
+            ) as chunks:
+                async for chunk in chunks:
+                    yield chunk
+            return
+        except _CachedChunksUnavailable:
+            pass
+
+        writer = await _open_chunk_writer(cache_provider, cache_key)
+        try:
+            async for result in func(*args, **kwargs):
+                if writer is not None:
+                    try:
+                        await writer.append(result)
+                    except FailedToWriteCacheError as e:
+                        logger.warning(
+                            f"Failed to write cache for {cache_key}: {str(e)}"
+                        )
+                        await writer.abort()
+                        writer = None
+                yield result
+        except BaseException:
+            if writer is not None:
+                await writer.abort()
+            raise
+
+        if writer is not None:
+            try:
+                await writer.commit()
+            except FailedToWriteCacheError as e:
+                logger.warning(f"Failed to write cache for {cache_key}: {str(e)}")
+
+
 def cache_iterator_result() -> Callable[[AsyncIteratorCallable], AsyncIteratorCallable]:
     """
     This decorator caches the results of an async iterator function. It checks if the result is already in the cache
@@ -77,6 +204,10 @@ def cache_iterator_result() -> Callable[[AsyncIteratorCallable], AsyncIteratorCa
 
     Concurrency is handled by using asyncio locks to prevent race conditions when multiple tasks try to access the same cache key.
 
+    Providers that support chunked entries (such as the disk provider) persist each chunk as it is produced and
+    stream it back lazily, so only one chunk is held in memory and concurrent callers start reading right away.
+    With a cache shared between processes (such as the Redis provider), misses are also serialized across processes.
+
     Usage:
     ```python
     @cache_iterator_result()
@@ -90,6 +221,17 @@ def cache_iterator_result() -> Callable[[AsyncIteratorCallable], AsyncIteratorCa
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             cache_key = hash_func(func, *args, **kwargs)
 
+            cache_provider = ocean.app.cache_provider
+            if isinstance(cache_provider, ChunkedCacheProvider):
+                async with aclosing(
+                    _iterate_with_chunked_cache(
+                        cache_provider, cache_key, func, *args, **kwargs
+                    )
+                ) as chunks:
+                    async for chunk in chunks:
+                        yield chunk
+                return
+
             try:
                 if cache := await ocean.app.cache_provider.get(cache_key):
                     for chunk in cache:
@@ -101,7 +243,7 @@ def cache_iterator_result() -> Callable[[AsyncIteratorCallable], AsyncIteratorCa
             async with _key_locks_guard:
                 lock = _locks.setdefault(cache_key, asyncio.Lock())
 
-            async with lock:
+            async with lock, _single_flight(cache_provider, cache_key):
                 try:
                     # Check cache again before writing because another task may have
                     # populated the cache while we were waiting for lock.
@@ -145,6 +287,7 @@ def cache_coroutine_result(
     If a database is configured, the cache will also be stored in the database.
 
     Concurrency is handled by using asyncio locks to prevent race conditions when multiple tasks try to access the same cache key.
+    With a cache shared between processes (such as the Redis provider), misses are also serialized across processes.
 
     Usage:
     ```python
@@ -185,7 +328,7 @@ def cache_coroutine_result(
             async with _key_locks_guard:
                 lock = _locks.setdefault(cache_key, asyncio.Lock())
 
-            async with lock:
+            async with lock, _single_flight(ocean.app.cache_provider, cache_key):
                 try:
                     if cache := await ocean.app.cache_provider.get(cache_key):
                         return cache